@@ -14,17 +14,17 @@
 # ==============================================================================
 
 from model_compression_toolkit.defaultdict import DefaultDict
-from model_compression_toolkit.target_platform_capabilities import target_platform
-from model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities import get_target_platform_capabilities
-from model_compression_toolkit import core
 from model_compression_toolkit.logger import set_log_folder
-from model_compression_toolkit import trainable_infrastructure
-from model_compression_toolkit import ptq
-from model_compression_toolkit import qat
-from model_compression_toolkit import exporter
-from model_compression_toolkit import gptq
-from model_compression_toolkit import data_generation
-from model_compression_toolkit import pruning
-from model_compression_toolkit.trainable_infrastructure.keras.load_model import keras_load_quantized_model
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
+
+# The subpackages (and the frameworks they use) are imported on their first access.
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    attributes={
+        'target_platform': 'model_compression_toolkit.target_platform_capabilities',
+        'get_target_platform_capabilities':
+            'model_compression_toolkit.target_platform_capabilities.tpc_models.get_target_platform_capabilities',
+        'keras_load_quantized_model': 'model_compression_toolkit.trainable_infrastructure.keras.load_model'},
+    submodules=['core', 'trainable_infrastructure', 'ptq', 'qat', 'exporter', 'gptq', 'data_generation', 'pruning'])
 
 __version__ = "2.2.0"
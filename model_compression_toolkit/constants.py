@@ -92,6 +92,11 @@ UPPER_FACTOR = 1.2
 DEC_RANGE_BOTTOM = 0.97
 DEC_RANGE_UPPER = 1.03
 
+# Maximal number of elements of a block of quantized candidates that are evaluated at once during the
+# per-channel quantization parameters search (small enough for the block to stay in the CPU cache).
+QPARAMS_SEARCH_BLOCK_ELEMENTS = 2 ** 15
+QPARAMS_SEARCH_GPU_BLOCK_ELEMENTS = 2 ** 24
+
 NUM_QPARAM_HESSIAN_SAMPLES = 16
 
 # Resource utilization computation parameters
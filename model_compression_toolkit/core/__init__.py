@@ -21,9 +21,17 @@ from model_compression_toolkit.core.common.mixed_precision import mixed_precisio
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig, QuantizationErrorMethod, DEFAULTCONFIG
 from model_compression_toolkit.core.common.quantization.bit_width_config import BitWidthConfig
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
+from model_compression_toolkit.core.common.hessian.hessian_cache_config import HessianCacheConfig
+from model_compression_toolkit.core.common.calibration_data.calibration_data_config import CalibrationDataConfig
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import MixedPrecisionQuantizationConfig
-from model_compression_toolkit.core.keras.resource_utilization_data_facade import keras_resource_utilization_data
-from model_compression_toolkit.core.pytorch.resource_utilization_data_facade import pytorch_resource_utilization_data
 from model_compression_toolkit.core.common.mixed_precision.distance_weighting import MpDistanceWeighting
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
+
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    attributes={'keras_resource_utilization_data': 'model_compression_toolkit.core.keras.resource_utilization_data_facade',
+                'pytorch_resource_utilization_data': 'model_compression_toolkit.core.pytorch.resource_utilization_data_facade',
+                'keras_mixed_precision_sweep': 'model_compression_toolkit.core.keras.mixed_precision_sweep_facade',
+                'pytorch_mixed_precision_sweep': 'model_compression_toolkit.core.pytorch.mixed_precision_sweep_facade'})
 
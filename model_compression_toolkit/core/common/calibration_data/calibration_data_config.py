@@ -0,0 +1,42 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class CalibrationDataConfig:
+    """
+    Configuration of the representative dataset handling.
+
+    The representative dataset generator is iterated many times during a single run (statistics collection,
+    Hessian-approximation scores, mixed precision sensitivity evaluation, statistics correction, GPTQ, etc.).
+    When materialize is set, the generator is iterated once, and its batches are saved to memory-mapped
+    files. All the stages then read the same batches from the files, instead of running the generator again.
+    This is useful when the generator is expensive (e.g., decodes and augments images).
+
+    Note: When materialized, the batches are yielded as Numpy arrays, and the same samples are yielded in every
+    iteration (a generator that yields different samples in each iteration, such as random augmentations, is
+    sampled once).
+
+    Args:
+        materialize (bool): Whether to materialize the representative dataset generator once into memory-mapped
+            files, and read the batches of all the stages from them.
+        store_dir (str): Directory to save the memory-mapped files in. If None, the system's temporary directory
+            is used. The files are removed when the run is done.
+    """
+
+    materialize: bool = False
+    store_dir: Optional[str] = None
@@ -0,0 +1,174 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Callable, Any, List, Iterator, Optional, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common.calibration_data.calibration_data_config import CalibrationDataConfig
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.logger import Logger
+
+
+class CalibrationDataStore:
+    """
+    A store of a representative dataset, materialized once from a representative dataset generator.
+
+    The batches of the generator are saved to memory-mapped files, a contiguous file per model input, that holds
+    the input's samples of all the batches. The store is a representative dataset generator by itself: calling it
+    returns a generator that yields the same batches (with the same batch sizes) as the materialized generator.
+    The batches are views of the memory-mapped files, so reading them does not copy the data. The files are
+    mapped copy-on-write for each iteration, so modifying the batches does not modify the store.
+
+    The files are removed when the store is closed or garbage collected.
+    """
+
+    def __init__(self,
+                 representative_data_gen: Callable,
+                 to_numpy: Callable[[Any], np.ndarray],
+                 store_dir: Optional[str] = None):
+        """
+        Args:
+            representative_data_gen: Representative dataset generator to materialize. The generator is expected to
+              yield lists of tensors, a tensor per model input, with the same batch size.
+            to_numpy: Function to convert the generator's tensors to Numpy arrays.
+            store_dir: Directory to save the memory-mapped files in. If None, the system's temporary directory is used.
+        """
+        self._dir = tempfile.mkdtemp(prefix='mct_calibration_data_', dir=store_dir)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self._dir, ignore_errors=True)
+
+        self.batch_sizes: List[int] = []
+        # Samples shapes and data types of the model inputs.
+        self._inputs_specs: List[Tuple[Tuple[int, ...], np.dtype]] = []
+        self._materialize(representative_data_gen, to_numpy)
+
+    @property
+    def num_samples(self) -> int:
+        """
+        The number of samples in the store.
+        """
+        return sum(self.batch_sizes)
+
+    def __call__(self) -> Iterator[List[np.ndarray]]:
+        """
+        Iterate over the store's batches, with the batch sizes of the materialized generator.
+
+        Returns:
+            A generator of batches (lists of arrays, an array per model input).
+        """
+        inputs = self._map_inputs()
+        start = 0
+        for batch_size in self.batch_sizes:
+            yield [x[start: start + batch_size] for x in inputs]
+            start += batch_size
+
+    def close(self):
+        """
+        Close the store and remove its files.
+        """
+        self.batch_sizes = []
+        self._inputs_specs = []
+        self._finalizer()
+
+    def _get_input_path(self, input_index: int) -> str:
+        """
+        Get the path of the file of a model input.
+
+        Args:
+            input_index: Index of the model input.
+
+        Returns:
+            The path of the input's file.
+        """
+        return os.path.join(self._dir, f'input_{input_index}.bin')
+
+    def _map_inputs(self) -> List[np.memmap]:
+        """
+        Map the files of the model inputs to memory (copy-on-write).
+
+        Returns:
+            A list of the memory-mapped arrays of the model inputs samples.
+        """
+        return [np.memmap(self._get_input_path(i), dtype=dtype, mode='c', shape=(self.num_samples,) + shape)
+                for i, (shape, dtype) in enumerate(self._inputs_specs)]
+
+    def _materialize(self,
+                     representative_data_gen: Callable,
+                     to_numpy: Callable[[Any], np.ndarray]):
+        """
+        Iterate the representative dataset generator once, and save its batches to the store's files.
+
+        Args:
+            representative_data_gen: Representative dataset generator to materialize.
+            to_numpy: Function to convert the generator's tensors to Numpy arrays.
+        """
+        files, samples_shapes, dtypes = [], None, None
+        try:
+            for batch in representative_data_gen():
+                if not isinstance(batch, (list, tuple)):
+                    Logger.critical(f"Representative dataset generator is expected to yield a list of tensors, "
+                                    f"but got {type(batch)}.")
+                arrays = [np.ascontiguousarray(to_numpy(x)) for x in batch]
+                if samples_shapes is None:
+                    samples_shapes = [a.shape[1:] for a in arrays]
+                    dtypes = [a.dtype for a in arrays]
+                    files = [open(self._get_input_path(i), 'wb') for i in range(len(arrays))]
+                elif [a.shape[1:] for a in arrays] != samples_shapes or [a.dtype for a in arrays] != dtypes:
+                    Logger.critical(f"Representative dataset generator is expected to yield batches of tensors with "
+                                    f"the same samples shapes and types, but got a batch with samples shapes "
+                                    f"{[a.shape[1:] for a in arrays]} and types {[a.dtype for a in arrays]}, while "
+                                    f"previous batches have samples shapes {samples_shapes} and types {dtypes}.")
+
+                batch_sizes = set(a.shape[0] for a in arrays)
+                if len(batch_sizes) != 1:
+                    Logger.critical(f"Representative dataset generator is expected to yield tensors with the same batch "
+                                    f"size for all inputs, but got batch sizes {batch_sizes}.")
+                for f, a in zip(files, arrays):
+                    f.write(a.tobytes())
+                self.batch_sizes.append(arrays[0].shape[0])
+        finally:
+            for f in files:
+                f.close()
+
+        if len(self.batch_sizes) == 0:
+            Logger.critical("Representative dataset generator yielded no batches.")
+
+        self._inputs_specs = list(zip(samples_shapes, dtypes))
+
+
+def get_calibration_data_gen(representative_data_gen: Callable,
+                             calibration_data_config: CalibrationDataConfig,
+                             fw_impl: FrameworkImplementation) -> Callable:
+    """
+    Get the representative dataset generator to use in all the stages of a run.
+    If the configuration is set to materialize the representative dataset, a CalibrationDataStore is created
+    from the generator, and is returned as the representative dataset generator to use.
+
+    Args:
+        representative_data_gen: Representative dataset generator.
+        calibration_data_config: CalibrationDataConfig with the representative dataset handling configuration.
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+
+    Returns:
+        The representative dataset generator to use.
+    """
+    if calibration_data_config is None or not calibration_data_config.materialize:
+        return representative_data_gen
+    return CalibrationDataStore(representative_data_gen,
+                                to_numpy=fw_impl.to_numpy,
+                                store_dir=calibration_data_config.store_dir)
@@ -86,11 +86,22 @@ class MeanCollector(BaseCollector):
         Args:
             x: Tensor that goes through the mean collector and needs to be considered in the mean computation.
         """
-        self.i += 1  # Update the iteration index
         axis = (len(x.shape) - 1) if self.axis == LAST_AXIS else self.axis
         n = x.shape[axis]
         transpose_index = [axis, *[i for i in range(len(x.shape)) if i != axis]]
         mu = np.mean(np.reshape(np.transpose(x, transpose_index), [n, -1]), axis=-1) # mean per channel for a batch
+        self.update_mean(mu)
+
+    def update_mean(self,
+                    mu: np.ndarray):
+        """
+        Update the mean using the per channel mean of a new tensor to consider
+        (for example, a mean that was computed by the framework).
+
+        Args:
+            mu: Mean per channel of a new tensor.
+        """
+        self.i += 1  # Update the iteration index
         self.current_sum += mu # sum of all batches
         self.current_mean = self.current_sum / self.i # mean of all batches
 
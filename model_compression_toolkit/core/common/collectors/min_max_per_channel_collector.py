@@ -134,10 +134,20 @@ class MinMaxPerChannelCollector(BaseCollector):
         n = x.shape[axis]
         transpose_index = [axis, *[i for i in range(len(x.shape)) if i != axis]]
         x_reshape = np.reshape(np.transpose(x, transpose_index), [n, -1])
-        if self.state is None:
-            x_max = np.max(x_reshape, axis=-1)
-            x_min = np.min(x_reshape, axis=-1)
-        else:
-            x_max = np.maximum(np.max(x_reshape, axis=-1), self.state[:, 0])
-            x_min = np.minimum(np.min(x_reshape, axis=-1), self.state[:, 1])
+        self.update_min_max(np.max(x_reshape, axis=-1), np.min(x_reshape, axis=-1))
+
+    def update_min_max(self,
+                       x_max: np.ndarray,
+                       x_min: np.ndarray):
+        """
+        Update the min/max values the collector holds using the per channel min/max values of a new tensor
+        to consider (for example, min/max values that were computed by the framework).
+
+        Args:
+            x_max: Maximal values per channel of a new tensor.
+            x_min: Minimal values per channel of a new tensor.
+        """
+        if self.state is not None:
+            x_max = np.maximum(x_max, self.state[:, 0])
+            x_min = np.minimum(x_min, self.state[:, 1])
         self.state = np.stack([x_max, x_min], axis=-1)
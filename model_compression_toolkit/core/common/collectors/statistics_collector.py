@@ -16,7 +16,7 @@
 
 import math
 from copy import deepcopy
-from typing import Any, Tuple
+from typing import Any, Tuple, NamedTuple
 
 import numpy as np
 
@@ -26,6 +26,25 @@ from model_compression_toolkit.core.common.collectors.mean_collector import Mean
 from model_compression_toolkit.core.common.collectors.min_max_per_channel_collector import MinMaxPerChannelCollector
 
 
+class ReducedStatistics(NamedTuple):
+    """
+    Statistics of a tensor, reduced by the framework (on the tensor's device) before they are passed to the
+    collectors of a StatsCollector.
+
+    Args:
+        histogram_counts: Counts of the tensor's histogram.
+        histogram_bins: Bins edges of the tensor's histogram.
+        mean_per_channel: Mean of the tensor per channel.
+        max_per_channel: Maximal value of the tensor per channel.
+        min_per_channel: Minimal value of the tensor per channel.
+    """
+    histogram_counts: np.ndarray
+    histogram_bins: np.ndarray
+    mean_per_channel: np.ndarray
+    max_per_channel: np.ndarray
+    min_per_channel: np.ndarray
+
+
 class BaseStatsCollector(object):
     """
     Base class for statistics collection (contains multiple collectors such as mean collector,
@@ -70,6 +89,7 @@ class StatsCollector(BaseStatsCollector):
         """
 
         super().__init__()
+        self.out_channel_axis = out_channel_axis
         self.hc = HistogramCollector()
         self.mc = MeanCollector(axis=out_channel_axis)
         self.mpcc = MinMaxPerChannelCollector(init_min_value=init_min_value,
@@ -89,6 +109,18 @@ class StatsCollector(BaseStatsCollector):
         self.mc.update(x)
         self.mpcc.update(x)
 
+    def update_reduced_statistics(self, reduced_statistics: ReducedStatistics):
+        """
+        Update statistics in all collectors with the reduced statistics of a new tensor to consider.
+
+        Args:
+            reduced_statistics: Statistics of the tensor, reduced by the framework.
+        """
+
+        self.hc.update_histogram(reduced_statistics.histogram_counts, reduced_statistics.histogram_bins)
+        self.mc.update_mean(reduced_statistics.mean_per_channel)
+        self.mpcc.update_min_max(reduced_statistics.max_per_channel, reduced_statistics.min_per_channel)
+
     def get_mean(self) -> np.ndarray:
         """
         Get mean per-channel from mean collector. When its accessed from outside the tensor,
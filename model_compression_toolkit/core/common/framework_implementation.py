@@ -21,7 +21,8 @@ from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
 from model_compression_toolkit.core import MixedPrecisionQuantizationConfig
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode
-from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
+from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector, \
+    ReducedStatistics
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.graph.base_graph import Graph
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianInfoService
@@ -30,7 +31,10 @@ from model_compression_toolkit.core.common.model_builder_mode import ModelBuilde
 from model_compression_toolkit.core.common.node_prior_info import NodePriorInfo
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QparamsSearchBackend
 from model_compression_toolkit.core.common.user_info import UserInformation
+from model_compression_toolkit.logger import Logger
 
 
 class FrameworkImplementation(ABC):
@@ -93,6 +97,26 @@ class FrameworkImplementation(ABC):
         raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s to_tensor method.')  # pragma: no cover
 
+    @abstractmethod
+    def reduce_statistics(self,
+                          tensor: Any,
+                          channel_axis: int,
+                          n_bins: int) -> ReducedStatistics:
+        """
+        Reduce a framework's tensor to the statistics that are collected by a StatsCollector (histogram,
+        mean per channel and min/max per channel), on the tensor's device.
+
+        Args:
+            tensor: Framework's tensor to reduce.
+            channel_axis: Index of the channels axis.
+            n_bins: Number of bins in the histogram.
+
+        Returns:
+            The reduced statistics of the tensor.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s reduce_statistics method.')  # pragma: no cover
+
     @abstractmethod
     def model_reader(self,
                      model: Any,
@@ -439,6 +463,57 @@ class FrameworkImplementation(ABC):
         raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
                              f'framework\'s sensitivity_eval_inference method.')  # pragma: no cover
 
+    def get_sensitivity_eval_prefix_cache(self,
+                                          model: Any,
+                                          inputs: Any,
+                                          resume_nodes_names: List[str]) -> Any:
+        """
+        Run a model inference during mixed precision sensitivity evaluation and cache the intermediate tensors
+        that are required in order to resume the inference from just before each of the given nodes.
+        Frameworks that cannot resume an inference from intermediate tensors return None, in which case the
+        sensitivity evaluation runs a full inference for every configuration.
+
+        Args:
+            model: A model to run inference for.
+            inputs: Input tensors to run inference on.
+            resume_nodes_names: Names of nodes from which the inference may be resumed.
+
+        Returns:
+            A framework-specific prefix cache, or None if incremental inference is not supported.
+        """
+        return None
+
+    def sensitivity_eval_inference_from_prefix_cache(self,
+                                                     model: Any,
+                                                     prefix_cache: Any,
+                                                     changed_nodes_names: List[str]):
+        """
+        Resume a model inference during mixed precision sensitivity evaluation from a prefix cache
+        (see get_sensitivity_eval_prefix_cache), recomputing only the part of the model that is affected by the
+        given changed nodes.
+
+        Args:
+            model: A model to run inference for.
+            prefix_cache: A prefix cache that was built for the model.
+            changed_nodes_names: Names of nodes that were re-configured since the prefix cache was built.
+
+        Returns:
+            The output of the model inference.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
+                             f'framework\'s sensitivity_eval_inference_from_prefix_cache method.')  # pragma: no cover
+
+    def get_qparams_search_backend(self) -> QparamsSearchBackend:
+        """
+        Returns a backend that evaluates the weights quantization parameters search candidates with the framework
+        (see QuantizationConfig.qparams_search_framework_backend).
+
+        Returns:
+            A framework quantization parameters search backend.
+        """
+        Logger.critical(f'Running the quantization parameters search with the framework is not supported by '
+                        f'{self.__class__.__name__}.')  # pragma: no cover
+
     def get_inferable_quantizers(self, node: BaseNode):
         """
         Returns sets of framework compatible weights and activation quantizers for the given node.
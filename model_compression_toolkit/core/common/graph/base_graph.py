@@ -15,7 +15,7 @@
 from collections import namedtuple
 
 from copy import copy, deepcopy
-from typing import List, Tuple, Any
+from typing import List, Tuple, Any, Set
 
 import networkx as nx
 import numpy as np
@@ -27,6 +27,7 @@ from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX, ED
 from model_compression_toolkit.core.common.graph.edge import Edge, convert_to_edge
 from model_compression_toolkit.core.common.graph.graph_searches import GraphSearches
 from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.graph.node_type_index import NodeTypeIndex
 from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
 from model_compression_toolkit.core.common.collectors.statistics_collector import scale_statistics, shift_statistics
 from model_compression_toolkit.core.common.pruning.pruning_section import PruningSection
@@ -67,6 +68,8 @@ class Graph(nx.MultiDiGraph, GraphSearches):
         self.output_nodes = output_nodes
         self.node_to_out_stats_collector = dict()
         self.node_to_in_stats_collector = dict()
+        self.node_type_index = NodeTypeIndex()
+        self._edits_records = []
         self.add_nodes_from(nodes)
         for e in edge_list:
             self.add_edge(e.source_node,
@@ -285,6 +288,118 @@ class Graph(nx.MultiDiGraph, GraphSearches):
 
         return [n for n in self.nodes if n.name == name]
 
+    def add_node(self, node_for_adding: BaseNode, **attr):
+        """
+        Add a node to the graph and to the graph's node type index.
+
+        Args:
+            node_for_adding: Node to add.
+            **attr: Attributes to set to the node as key=value pairs.
+        """
+        super().add_node(node_for_adding, **attr)
+        self.node_type_index.add(node_for_adding)
+        self._record_edit(node_for_adding)
+
+    def add_nodes_from(self, nodes_for_adding: List[BaseNode], **attr):
+        """
+        Add nodes to the graph and to the graph's node type index.
+
+        Args:
+            nodes_for_adding: Nodes to add (or tuples of a node and a dictionary of its attributes).
+            **attr: Attributes to set to the nodes as key=value pairs.
+        """
+        nodes_for_adding = list(nodes_for_adding)
+        super().add_nodes_from(nodes_for_adding, **attr)
+        for n in nodes_for_adding:
+            n = n[0] if isinstance(n, tuple) else n
+            self.node_type_index.add(n)
+            self._record_edit(n)
+
+    def add_edge(self, u_for_edge: BaseNode, v_for_edge: BaseNode, key: Any = None, **attr) -> Any:
+        """
+        Add an edge to the graph. Nodes of the edge that are not in the graph yet are added as well.
+
+        Args:
+            u_for_edge: Source node of the edge.
+            v_for_edge: Sink node of the edge.
+            key: Key to distinguish between multiple edges between the same pair of nodes.
+            **attr: Attributes to set to the edge as key=value pairs.
+
+        Returns:
+            The key of the added edge.
+        """
+        key = super().add_edge(u_for_edge, v_for_edge, key, **attr)
+        self.node_type_index.add(u_for_edge)
+        self.node_type_index.add(v_for_edge)
+        self._record_edit(u_for_edge, v_for_edge)
+        return key
+
+    def remove_edge(self, u: BaseNode, v: BaseNode, key: Any = None):
+        """
+        Remove an edge from the graph.
+
+        Args:
+            u: Source node of the edge.
+            v: Sink node of the edge.
+            key: Key of the edge to remove. If None, an arbitrary edge between u and v is removed.
+        """
+        super().remove_edge(u, v, key)
+        self._record_edit(u, v)
+
+    def reindex_node(self, node: BaseNode):
+        """
+        Update the graph's node type index after the type of a node in the graph was changed in place
+        (for example, when a substitution replaces the layer class of a node).
+
+        Args:
+            node: Node whose type was changed.
+        """
+        self.node_type_index.update(node)
+        self._record_edit(node)
+
+    def get_nodes_by_types(self, node_types: List[Any]) -> List[BaseNode]:
+        """
+        Get the nodes in the graph that match one of a list of node types, using the graph's node type index.
+
+        Args:
+            node_types: List of node types to look for.
+
+        Returns:
+            List of the nodes that match one of the types, in the graph's nodes order.
+        """
+        return self.node_type_index.get_nodes(node_types)
+
+    def start_recording_edits(self) -> Set[BaseNode]:
+        """
+        Start recording the nodes that are touched by edits of the graph (added or removed nodes,
+        nodes of added or removed edges and re-indexed nodes).
+
+        Returns:
+            A set that the touched nodes are added to, until stop_recording_edits is called with it.
+        """
+        record = set()
+        self._edits_records.append(record)
+        return record
+
+    def stop_recording_edits(self, record: Set[BaseNode]):
+        """
+        Stop recording the nodes that are touched by edits of the graph.
+
+        Args:
+            record: A set that was returned by start_recording_edits.
+        """
+        self._edits_records = [r for r in self._edits_records if r is not record]
+
+    def _record_edit(self, *nodes: BaseNode):
+        """
+        Add nodes that were touched by an edit of the graph to all active edits records.
+
+        Args:
+            *nodes: Touched nodes.
+        """
+        for record in self._edits_records:
+            record.update(nodes)
+
     def get_next_nodes(self,
                        node_obj: BaseNode) -> List[BaseNode]:
         """
@@ -464,6 +579,8 @@ class Graph(nx.MultiDiGraph, GraphSearches):
                                                          f'before deleting the node from the graph.'
         #  Remove node
         super().remove_node(node_to_remove)
+        self.node_type_index.remove(node_to_remove)
+        self._record_edit(node_to_remove)
 
     def incoming_edges(self,
                        n: BaseNode,
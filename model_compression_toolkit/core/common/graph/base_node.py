@@ -81,6 +81,30 @@ class BaseNode:
         self.has_activation = has_activation
         self.is_custom = is_custom
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'BaseNode':
+        """
+        Deep copy the node, except for its weights arrays which are shared with the copy (copy-on-write),
+        so copying a graph doesn't copy all of the model's weights.
+        The shared arrays are set to read-only, so they can't be modified in place by any of the nodes that
+        share them. To modify the weights of a node, set new arrays using set_weights_by_keys, which only
+        affects that node.
+
+        Args:
+            memo: Dictionary of the objects that were already copied (see copy.deepcopy).
+
+        Returns:
+            A copy of the node.
+        """
+        node_copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = node_copy
+        for attr_name, attr_value in self.__dict__.items():
+            if attr_name == 'weights' and isinstance(attr_value, dict):
+                attr_value = {k: share_weights_array(w, memo) for k, w in attr_value.items()}
+            else:
+                attr_value = copy.deepcopy(attr_value, memo)
+            setattr(node_copy, attr_name, attr_value)
+        return node_copy
+
     @property
     def type(self):
         """
@@ -696,3 +720,23 @@ class BaseNode:
             else:
                 self.candidates_quantization_cfg.sort(key=lambda c: c.activation_quantization_cfg.activation_n_bits,
                                                       reverse=True)
+
+
+def share_weights_array(weights: Any, memo: Dict[int, Any]) -> Any:
+    """
+    Prepare a weights array to be shared between a node and its deep copy: numpy arrays are set to read-only
+    and returned as is (and registered in the deep copy memo, so other references to them in the copied
+    object share them as well), while other objects are deep copied.
+
+    Args:
+        weights: Weights array (or any other object held in a node's weights dictionary).
+        memo: Dictionary of the objects that were already copied (see copy.deepcopy).
+
+    Returns:
+        The weights to set in the node's copy.
+    """
+    if not isinstance(weights, np.ndarray) or weights.dtype == object:
+        return copy.deepcopy(weights, memo)
+    weights.flags.writeable = False
+    memo[id(weights)] = weights
+    return weights
@@ -50,6 +50,13 @@ class NodeOperationMatcher(node_matcher.BaseNodeMatcher):
         if input_node_object.is_match_type(self.operation):
             return True
 
+    def get_node_types(self) -> List[Any]:
+        """
+        Returns:
+            A list with the layer the NodeOperationMatcher holds.
+        """
+        return [self.operation]
+
 
 class NodeFrameworkAttrMatcher(node_matcher.BaseNodeMatcher):
     """
@@ -14,19 +14,44 @@
 # ==============================================================================
 
 from abc import ABC
-from typing import List, Any
+from typing import Dict, List, Any, Set
 
 from model_compression_toolkit.core.common.graph.base_node import BaseNode
-from model_compression_toolkit.core.common.matchers import node_matcher, base_graph_filter, edge_matcher
+from model_compression_toolkit.core.common.matchers import node_matcher, base_graph_filter, edge_matcher, function, \
+    base_matcher
 from model_compression_toolkit.core.common.matchers.walk_matcher import WalkMatcherList
 
 
 class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
     """
     Apply searches on graphs.
-    The graph needs to have 'nodes' and 'edges' attributes, and a 'get_next_nodes' method.
+    The graph needs to have 'nodes' and 'edges' attributes, and 'get_next_nodes', 'get_prev_nodes' and
+    'get_nodes_by_types' methods.
     """
 
+    def _get_candidate_nodes(self, matcher: base_matcher.BaseMatcher) -> List[BaseNode]:
+        """
+        Get the nodes in the graph that a match of a matcher may start with (the matched node, the source node of
+        the matched edge or the first node of the matched walk). If the match can only start with nodes of specific
+        types, only nodes of these types are returned (using the graph's node type index).
+
+        Args:
+            matcher: Node, edge or walk matcher to get its candidate nodes.
+
+        Returns:
+            List of candidate nodes, in the graph's nodes order.
+        """
+
+        if function.is_edge_matcher(matcher):
+            node_types = matcher.get_source_node_types()
+        elif function.is_walk_matcher(matcher):
+            node_types = get_walk_matcher_list(matcher)[0].get_node_types()
+        else:
+            node_types = matcher.get_node_types()
+        if node_types is None:
+            return list(self.nodes)
+        return self.get_nodes_by_types(node_types)
+
     def _node_filter(self, node_matcher: node_matcher.BaseNodeMatcher) -> list:
         """
         Iterate over nodes and returns the nodes in the graph that matches the matcher object.
@@ -38,7 +63,7 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
             List of nodes that match the node_matcher.
         """
 
-        return [n for n in self.nodes if node_matcher.apply(n)]
+        return [n for n in self._get_candidate_nodes(node_matcher) if node_matcher.apply(n)]
 
     def _edge_filter(self, edge_matcher: edge_matcher.BaseEdgeMatcher) -> list:
         """
@@ -53,12 +78,25 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
         """
 
         edge_list = []
-        for e in self.edges:
-            if edge_matcher.apply(e) and len(self.edges(e[0])):
-                edge_list.append(e)
+        for n in self._get_candidate_nodes(edge_matcher):
+            edge_list.extend(self._edge_matches_from(n, edge_matcher))
 
         return edge_list
 
+    def _edge_matches_from(self, node: BaseNode, edge_matcher: edge_matcher.BaseEdgeMatcher) -> list:
+        """
+        Returns the outgoing edges of a node that match the edge_matcher object.
+
+        Args:
+            node: Node to check its outgoing edges.
+            edge_matcher: Matcher object to apply on edge.
+
+        Returns:
+            List of edges that match.
+        """
+
+        return [e for e in self.edges(node, keys=True) if edge_matcher.apply(e)]
+
     def _walk_filter(self, walk_matcher: WalkMatcherList) -> List[BaseNode]:
         """
         Search for a list of nodes which match the list in walk_matcher.
@@ -72,6 +110,37 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
             A list of nodes which match the list in walk_matcher.
         """
 
+        matcher_list = get_walk_matcher_list(walk_matcher)
+        next_nodes_cache = {}
+        result = []
+
+        # Walk the graph only from nodes that may match the first matcher in the list
+        for n in self._get_candidate_nodes(walk_matcher):
+            result.extend(self._walk_matches_from(n, matcher_list, next_nodes_cache))
+        return result
+
+    def _walk_matches_from(self,
+                           node: BaseNode,
+                           matcher_list: list,
+                           next_nodes_cache: Dict[BaseNode, List[BaseNode]]) -> List[List[BaseNode]]:
+        """
+        Search for the lists of nodes which match the list of matchers and start with a specific node.
+
+        Args:
+            node: Node the matched lists should start with.
+            matcher_list: List of node matchers to search for.
+            next_nodes_cache: Dictionary from nodes to their next nodes, which is filled during the search
+                to avoid querying the next nodes of a node more than once.
+
+        Returns:
+            A list of the lists of nodes which match the list of matchers and start with the node.
+        """
+
+        def get_next_nodes(n: BaseNode) -> List[BaseNode]:
+            if n not in next_nodes_cache:
+                next_nodes_cache[n] = self.get_next_nodes(n)
+            return next_nodes_cache[n]
+
         def walk_match(node: BaseNode,
                        node_list: List[BaseNode],
                        index: int,
@@ -96,10 +165,10 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
                     return [node_list]
                 result_list = [
                     walk_match(nn, node_list.copy(), index + 1, node_matcher_list) for
-                    nn in self.get_next_nodes(node) if
+                    nn in get_next_nodes(node) if
                     # Exclude patterns with an intermediate node with multiple outputs. If it's the last
                     # node in the matcher list, it is a valid pattern and should be checked.
-                    len(self.get_next_nodes(nn)) == 1 or (index + 2) == len(node_matcher_list)]
+                    len(get_next_nodes(nn)) == 1 or (index + 2) == len(node_matcher_list)]
                 result_filter = [r for r_list in result_list if r_list is not None for r in r_list if
                                  r is not None and len(r) == len(node_matcher_list)]
                 if len(result_filter) == 1:
@@ -111,12 +180,127 @@ class GraphSearches(base_graph_filter.BaseGraphFilter, ABC):
             else:
                 return None
 
-        matcher_list = walk_matcher.matcher_list if isinstance(walk_matcher, WalkMatcherList) else [
-            walk_matcher]
-        result = []
+        if len(get_next_nodes(node)) != 1:
+            return []
+        matches = walk_match(node, [], 0, matcher_list)
+        return [] if matches is None else matches
 
-        # Walk the entire graph, node by node
-        result_match_list = [walk_match(n, [], 0, matcher_list) for n in self.nodes if len(self.get_next_nodes(n)) == 1]
-        # Flatten lists
-        result.extend([r for r_list in result_match_list if r_list is not None for r in r_list])
-        return result
+
+def get_walk_matcher_list(walk_matcher: WalkMatcherList) -> list:
+    """
+    Get the list of node matchers of a walk matcher.
+
+    Args:
+        walk_matcher: WalkMatcherList, or a single node matcher to treat as a walk of one node.
+
+    Returns:
+        List of node matchers.
+    """
+    return walk_matcher.matcher_list if isinstance(walk_matcher, WalkMatcherList) else [walk_matcher]
+
+
+class GraphMatchesTracker:
+    """
+    Keep the matches of a matcher (node, edge or walk matcher) in a graph up to date while the graph is edited
+    (e.g., by substitutions). Instead of filtering the entire graph again after every edit, only the
+    neighborhood of the nodes that were touched by the edits is matched again.
+
+    Use as a context manager, for the tracker to record the graph's edits only while it's in use.
+    """
+
+    def __init__(self, graph: GraphSearches, matcher: base_matcher.BaseMatcher):
+        """
+        Args:
+            graph: Graph to track the matches in.
+            matcher: Matcher to track its matches.
+        """
+        self.graph = graph
+        self.matcher = matcher
+        if function.is_walk_matcher(matcher):
+            self._walk_matcher_list = get_walk_matcher_list(matcher)
+            # A walk that starts with a node depends on the nodes up to len(walk) - 1 steps after it
+            self._match_depth = len(self._walk_matcher_list) - 1
+        else:
+            self._walk_matcher_list = None
+            self._match_depth = 1 if function.is_edge_matcher(matcher) else 0
+        self._edits = None
+        self._matches = {}
+        for n in graph._get_candidate_nodes(matcher):
+            self._match_from(n)
+
+    def __enter__(self):
+        self._edits = self.graph.start_recording_edits()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.graph.stop_recording_edits(self._edits)
+        self._edits = None
+
+    def get_matches(self) -> list:
+        """
+        Match again the neighborhood of the nodes that were touched since the last call, and return the matches.
+
+        Returns:
+            List of matches, in the same order graph.filter(matcher) returns them.
+        """
+        touched_nodes = set(self._edits)
+        self._edits.clear()
+        for n in self._get_affected_nodes(touched_nodes):
+            self._matches.pop(n, None)
+            if n in self.graph:
+                self._match_from(n)
+
+        matches = []
+        for n in sorted(self._matches, key=self.graph.node_type_index.get_order):
+            matches.extend(self._matches[n])
+        return matches
+
+    def mark_touched(self, match: Any):
+        """
+        Mark the nodes of a match as touched, for their neighborhood to be matched again (e.g., after a
+        substitution was applied on the match and may have changed the nodes without editing the graph).
+
+        Args:
+            match: A match that get_matches returned (a node, an edge or a list of nodes).
+        """
+        if isinstance(match, tuple):
+            # An edge match is a tuple of its source node, sink node and key
+            self._edits.update(match[:2])
+        elif isinstance(match, list):
+            self._edits.update(match)
+        else:
+            self._edits.add(match)
+
+    def _match_from(self, node: BaseNode):
+        """
+        Find the matches that start with a node and store them.
+
+        Args:
+            node: Node to find the matches that start with it.
+        """
+        if self._walk_matcher_list is not None:
+            matches = self.graph._walk_matches_from(node, self._walk_matcher_list, {})
+        elif function.is_edge_matcher(self.matcher):
+            matches = self.graph._edge_matches_from(node, self.matcher)
+        else:
+            matches = [node] if self.matcher.apply(node) else []
+        if len(matches) > 0:
+            self._matches[node] = matches
+
+    def _get_affected_nodes(self, touched_nodes: Set[BaseNode]) -> Set[BaseNode]:
+        """
+        Get the nodes whose matches may have been changed by touching nodes, which are the touched nodes
+        and the nodes up to the match depth steps before them.
+
+        Args:
+            touched_nodes: Nodes that were touched by the graph's edits.
+
+        Returns:
+            Set of the nodes to match again.
+        """
+        affected = set(touched_nodes)
+        frontier = [n for n in touched_nodes if n in self.graph]
+        for _ in range(self._match_depth):
+            frontier = [p for n in frontier for p in self.graph.get_prev_nodes(n) if p not in affected]
+            affected.update(frontier)
+        return affected
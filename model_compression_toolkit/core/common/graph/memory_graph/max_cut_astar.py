@@ -13,7 +13,9 @@
 # limitations under the License.
 # ==============================================================================
 import copy
-from typing import List, Tuple, Dict
+import heapq
+import itertools
+from typing import List, Tuple, Dict, Iterator, Optional
 
 from model_compression_toolkit.core.common import BaseNode
 from model_compression_toolkit.constants import DUMMY_TENSOR, DUMMY_NODE
@@ -72,6 +74,36 @@ class DummyActivationMemoryTensorGenerator:
             self.counter += 1
 
 
+class _RouteNode:
+    """
+    A node in a search route: a cut and a pointer to the route node it was expanded from.
+    Routes to different cuts share their common prefix.
+    """
+    __slots__ = ('cut', 'parent', 'depth')
+
+    def __init__(self, cut: Cut, parent: Optional['_RouteNode'], depth: int):
+        """
+        Args:
+            cut: The route's last cut.
+            parent: The route node of the cut that the cut was expanded from (None for the source cut).
+            depth: The number of cuts in the route.
+        """
+        self.cut = cut
+        self.parent = parent
+        self.depth = depth
+
+    def get_route_cuts(self) -> List[Cut]:
+        """
+        Returns: The cuts of the route, from the last cut to the source cut.
+        """
+        cuts = []
+        route = self
+        while route is not None:
+            cuts.append(route.cut)
+            route = route.parent
+        return cuts
+
+
 class MaxCutAstar:
     """
     Implements the AStar solver and all the relevant utility methods to run a search for schedule and max cut
@@ -118,6 +150,9 @@ class MaxCutAstar:
         self.memory_graph.update_sources_a()
         self.memory_graph.update_sinks_b()
 
+        # A bit per memory element, to represent cuts by a bitset of their memory elements.
+        self.mem_elements_bits = {elm: 1 << i for i, elm in enumerate(self.memory_graph.b_nodes)}
+
         self.src_cut = Cut([src_dummy_a], {src_dummy_a}, MemoryElements(elements={src_dummy_b}, total_size=0))
         self.target_cut = Cut([], set(), MemoryElements(elements={target_dummy_b, target_dummy_b2},
                                                         total_size=0))
@@ -139,95 +174,110 @@ class MaxCutAstar:
 
         """
 
-        open_list = [self.src_cut]
-        closed_list = []
-        costs = {self.src_cut: self.src_cut.memory_size()}
-        routes = {self.src_cut: [self.src_cut]}
+        # The open list is a priority queue of (priority, counter, route node) entries. The counter breaks ties by
+        # the order in which cuts were added to the open list. A cut that is closed, or re-added with an improved cost,
+        # is not removed from the queue, but its previous entries are skipped when popped (lazy deletion).
+        # Cuts are identified by a bitset of their memory elements (see _get_cut_key).
+        src_route = _RouteNode(self.src_cut, parent=None, depth=1)
+        counter = itertools.count()
+        open_heap = [self._get_open_list_entry(src_route, self.src_cut.memory_size(), estimate_factor, counter)]
+        open_entries = {self._get_cut_key(self.src_cut): (open_heap[0][1], self.src_cut.memory_size())}
+        closed_keys = set()
 
         expansion_count = 0
 
-        while expansion_count < iter_limit and len(open_list) > 0:
+        while expansion_count < iter_limit and len(open_entries) > 0:
             # Choose next node to expand
-            next_cut = self._get_cut_to_expand(open_list, costs, routes, estimate_factor)
-
-            cut_cost = costs[next_cut]
-            cut_route = routes[next_cut]
+            cut_route, cut_cost = self._pop_cut_to_expand(open_heap, open_entries)
+            next_cut = cut_route.cut
 
             if next_cut == self.target_cut:
-                return self._remove_dummys_from_path(cut_route[0].op_order), cut_cost,\
-                       list(set([self._remove_dummys_from_cut(self.clean_memory_for_next_step(c)) for c in cut_route]))
+                route_cuts = cut_route.get_route_cuts()
+                return self._remove_dummys_from_path(next_cut.op_order), cut_cost,\
+                       list(set([self._remove_dummys_from_cut(self.clean_memory_for_next_step(c)) for c in route_cuts]))
 
             if self.is_pivot(next_cut):
                 # Can clear all search history
-                open_list = []
-                closed_list = []
-                routes = {}
+                open_heap = []
+                open_entries = {}
+                closed_keys = set()
             else:
-                # Can remove only next_cut and put it in closed_list
-                open_list.remove(next_cut)
-                del routes[next_cut]
-                closed_list.append(next_cut)
+                # Can remove only next_cut and put it in the closed list (it was already popped from the open list)
+                closed_keys.add(self._get_cut_key(next_cut))
 
             # Expand the chosen cut
             expanded_cuts = self.expand(next_cut)
             expansion_count += 1
 
-            # Only consider nodes that where not already visited
-            expanded_cuts = list(filter(lambda _c: _c not in closed_list, expanded_cuts))
             for c in expanded_cuts:
+                c_key = self._get_cut_key(c)
+                # Only consider nodes that where not already visited
+                if c_key in closed_keys:
+                    continue
                 cost = self.accumulate(cut_cost, c.memory_size())
-                if c not in open_list:
-                    self._update_expanded_node(c, cost, cut_route, open_list, costs, routes)
-                elif self.ordering(cost, costs[c]):
-                    # If we already saw this cut during the search with a larger cost, then we want to update the order
-                    # of the schedule in the cut
-                    # Remove call - removes the cut with the same memory elements but different ordering from open
-                    # Then - adds the cut with the improved ordering from open
-                    open_list.remove(c)
-                    self._update_expanded_node(c, cost, cut_route, open_list, costs, routes)
+                # If we already saw this cut during the search with a larger cost, then we want to update the order
+                # of the schedule in the cut, so the cut with the improved ordering replaces it in the open list.
+                if c_key not in open_entries or self.ordering(cost, open_entries[c_key][1]):
+                    entry = self._get_open_list_entry(_RouteNode(c, cut_route, cut_route.depth + 1), cost,
+                                                      estimate_factor, counter)
+                    heapq.heappush(open_heap, entry)
+                    open_entries[c_key] = (entry[1], cost)
 
         # Halt or No Solution
         return None, 0, None
 
-    @staticmethod
-    def _update_expanded_node(cut: Cut, cost: float, route: List[Cut], open_list: List[Cut],
-                              costs: Dict[Cut, float], routes: Dict[Cut, List[Cut]]):
+    def _get_open_list_entry(self, route: '_RouteNode', cost: float, estimate_factor: float,
+                             counter: Iterator[int]) -> Tuple[Tuple[float, int], int, '_RouteNode']:
         """
-        An auxiliary method for updating search data structures according to an expanded node.
+        An auxiliary method for creating an entry of a cut in the search open list.
+        Cuts are ordered by their estimated cost, and then by the length of their route.
 
         Args:
-            cut: A cut to expand the search to.
+            route: The route to the cut.
             cost: The cost of the cut.
-            route: The rout to the cut.
-            open_list: The search open list.
-            costs: The search utility mapping between cuts and their cost.
-            routes: The search utility mapping between cuts and their routes.
+            estimate_factor: A multiplication factor to set extended boundaries on the potential cuts to expand.
+            counter: A counter of the entries that are added to the open list.
+
+        Returns: An open list entry.
 
         """
-        open_list.append(cut)
-        costs.update({cut: cost})
-        routes.update({cut: [cut] + route})
+        priority = (self.accumulate(cost, self.estimate(route.cut, estimate_factor)), route.depth)
+        return priority, next(counter), route
 
-    def _get_cut_to_expand(self, open_list: List[Cut], costs: Dict[Cut, float], routes: Dict[Cut, List[Cut]],
-                           estimate_factor: float) -> Cut:
+    def _pop_cut_to_expand(self, open_heap: List[Tuple[Tuple[float, int], int, '_RouteNode']],
+                           open_entries: Dict[int, Tuple[int, float]]) -> Tuple['_RouteNode', float]:
         """
-        An auxiliary method for finding a cut for expanding the search out of a set of potential cuts for expansion.
+        An auxiliary method for popping the cut with the lowest estimated cost from the search open list.
+        Entries of cuts that were closed or re-added to the open list are skipped.
 
         Args:
-            open_list: The search open list.
-            costs: The search utility mapping between cuts and their cost.
-            routes: The search utility mapping between cuts and their routes.
-            estimate_factor: A multiplication factor to set extended boundaries on the potential cuts to exapand.
+            open_heap: The search open list priority queue.
+            open_entries: The search utility mapping between cuts keys in the open list to their valid entry counter
+              and their cost.
 
-        Returns: A sorted list of potential cuts for expansion (ordered by lowest cost first).
+        Returns: The route to the cut to expand, and the cut's cost.
 
         """
-        ordered_cuts_list = sorted(open_list,
-                                   key=lambda c: (self.accumulate(costs[c], self.estimate(c, estimate_factor)), len(routes[c])),
-                                   reverse=False)
+        while True:
+            _, entry_counter, route = heapq.heappop(open_heap)
+            cut_key = self._get_cut_key(route.cut)
+            entry = open_entries.get(cut_key)
+            if entry is not None and entry[0] == entry_counter:
+                del open_entries[cut_key]
+                return route, entry[1]
 
-        assert len(ordered_cuts_list) > 0
-        return ordered_cuts_list[0]
+    def _get_cut_key(self, cut: Cut) -> int:
+        """
+        Get a key that identifies a cut in the search: a bitset of the cut's memory elements (the cut equality
+        is defined by its memory elements).
+
+        Args:
+            cut: A cut to get its key.
+
+        Returns: The cut's key.
+
+        """
+        return sum([self.mem_elements_bits[elm] for elm in cut.mem_elements.elements])
 
     def clean_memory_for_next_step(self, cut: Cut) -> Cut:
         """
@@ -241,8 +291,7 @@ class MaxCutAstar:
 
         """
 
-        cut_records_names = cut.get_record_names()
-        filtered_memory_elements = set(filter(lambda elm: not all(child.name in cut_records_names for child in
+        filtered_memory_elements = set(filter(lambda elm: not all(child in cut.op_record for child in
                                                                   self.memory_graph.activation_tensor_children(elm)),
                                               cut.mem_elements.elements))
 
@@ -262,8 +311,22 @@ class MaxCutAstar:
         Returns: Whether the cut can be expanded by expanding the op_node.
         """
 
-        clean_cut = self.clean_memory_for_next_step(cut)
-        return op_node not in cut.op_record and len(cut.mem_elements.elements) > 0 and \
+        return self._can_expand_clean_cut(op_node, self.clean_memory_for_next_step(cut)) and \
+               len(cut.mem_elements.elements) > 0
+
+    def _can_expand_clean_cut(self, op_node: BaseNode, clean_cut: Cut) -> bool:
+        """
+        Checks whether a cut, which irrelevant memory elements were already removed from, can be expanded by
+        adding an operation node to it.
+
+        Args:
+            op_node: An operation node to check if it can expand the cut.
+            clean_cut: A cut without irrelevant memory elements.
+
+        Returns: Whether the cut can be expanded by expanding the op_node.
+        """
+
+        return op_node not in clean_cut.op_record and \
                all([parent_mem_element in clean_cut.mem_elements.elements for parent_mem_element in self.memory_graph.operation_node_parents(op_node)])
 
     def expand(self, cut: Cut) -> List[Cut]:
@@ -280,10 +343,12 @@ class MaxCutAstar:
 
         # candidates for expansion are children of the memory elements from the cleaned cut that can be expanded
         candidates = []
+        candidates_set = set()
         for mem_element in clean_cut.mem_elements.elements:
-            child_ops = self.memory_graph.activation_tensor_children(mem_element)
-            ops_to_expand = list(filter(lambda op: self.can_expand(op, clean_cut) and op not in candidates, child_ops))
-            candidates.extend(ops_to_expand)
+            for op in self.memory_graph.activation_tensor_children(mem_element):
+                if op not in candidates_set and self._can_expand_clean_cut(op, clean_cut):
+                    candidates.append(op)
+                    candidates_set.add(op)
 
         # for each candidate a cut is returned with the candidate expanded
         # (operation is added to record / order and resulting memory elements added to memory elements)
@@ -0,0 +1,114 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from typing import Any, Dict, List, Set
+
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+
+
+class NodeTypeIndex:
+    """
+    Index of the nodes of a graph by their type, which allows finding the nodes a matcher may match without
+    applying the matcher on every node in the graph.
+    The index keeps the order the nodes were added to the graph in, so lookups return nodes in the same order
+    as iterating over the graph's nodes.
+    """
+
+    def __init__(self):
+        self._node_order: Dict[BaseNode, int] = {}
+        self._node_type: Dict[BaseNode, Any] = {}
+        self._nodes_by_type: Dict[Any, Set[BaseNode]] = {}
+        self._next_order = 0
+
+    def add(self, node: BaseNode):
+        """
+        Add a node to the index. A node that is already in the index keeps its position.
+
+        Args:
+            node: Node to add.
+        """
+        if node in self._node_order:
+            return
+        self._node_order[node] = self._next_order
+        self._next_order += 1
+        self._node_type[node] = node.type
+        self._nodes_by_type.setdefault(node.type, set()).add(node)
+
+    def remove(self, node: BaseNode):
+        """
+        Remove a node from the index.
+
+        Args:
+            node: Node to remove.
+        """
+        if node not in self._node_order:
+            return
+        self._discard_from_type(node)
+        del self._node_order[node]
+
+    def update(self, node: BaseNode):
+        """
+        Re-index a node after its type was changed in place.
+
+        Args:
+            node: Node to re-index.
+        """
+        if node not in self._node_order:
+            self.add(node)
+        elif self._node_type[node] != node.type:
+            self._discard_from_type(node)
+            self._node_type[node] = node.type
+            self._nodes_by_type.setdefault(node.type, set()).add(node)
+
+    def get_nodes(self, node_types: List[Any]) -> List[BaseNode]:
+        """
+        Get the nodes that match one of the node types (see BaseNode.is_match_type).
+
+        Args:
+            node_types: List of node types to look up.
+
+        Returns:
+            List of the nodes matching one of the types, in the order they were added to the graph.
+        """
+        nodes = set()
+        for indexed_type, typed_nodes in self._nodes_by_type.items():
+            # All nodes under an indexed type have the same type, so checking one of them is enough.
+            representative = next(iter(typed_nodes))
+            if any(representative.is_match_type(t) for t in node_types):
+                nodes.update(typed_nodes)
+        return sorted(nodes, key=self._node_order.__getitem__)
+
+    def get_order(self, node: BaseNode) -> int:
+        """
+        Args:
+            node: Node in the index.
+
+        Returns:
+            The position of the node in the order the nodes were added to the graph.
+        """
+        return self._node_order[node]
+
+    def _discard_from_type(self, node: BaseNode):
+        """
+        Remove a node from the set of nodes of the type it is indexed under.
+
+        Args:
+            node: Node to remove.
+        """
+        node_type = self._node_type.pop(node)
+        typed_nodes = self._nodes_by_type[node_type]
+        typed_nodes.discard(node)
+        if len(typed_nodes) == 0:
+            del self._nodes_by_type[node_type]
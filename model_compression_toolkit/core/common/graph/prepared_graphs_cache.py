@@ -0,0 +1,103 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from model_compression_toolkit.core.common.graph.base_graph import Graph
+
+
+class PreparedGraphsCache:
+    """
+    Cache of the graphs prepared from a model, so a graph that is prepared more than once for the same model in a
+    single run (e.g., for the mixed precision check and then for the quantization) is built once. A cache is created
+    per run, so its graphs are released when the run ends.
+
+    The cache holds the graphs of a single model (the last model it was used with), and is cleared when the model
+    is deleted or when the cache is used with another model. Since the model and the representative dataset don't
+    change during a run, a graph is cached under a key that describes the configurations it was prepared with.
+    The objects that are identified in a key by their id are kept by the cache, so their ids are not reused.
+    Graphs are cloned when they are cached and when they are fetched, so the cached graphs are never modified.
+    """
+
+    def __init__(self, max_entries: int = 4):
+        """
+        Args:
+            max_entries: Maximal number of graphs to cache. When exceeded, the least recently used graph is removed.
+        """
+        self.max_entries = max_entries
+        self._model_ref: Optional[weakref.ref] = None
+        self._entries: OrderedDict = OrderedDict()
+        self._kept_objects: Dict[int, Any] = {}
+
+    def get_or_build(self,
+                     model: Any,
+                     key: Hashable,
+                     build_fn: Callable[[], Graph],
+                     kept_objects: List[Any] = None) -> Graph:
+        """
+        Get a clone of the graph cached for a model under a key, or build it and cache a clone of it.
+
+        Args:
+            model: The model the graph is prepared from.
+            key: Key of the graph.
+            build_fn: Function that builds the graph (with no arguments).
+            kept_objects: Objects that are identified in the key by their id.
+
+        Returns:
+            The graph. The caller may modify it.
+        """
+        if not self._set_model(model):
+            return build_fn()
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return copy.deepcopy(self._entries[key])
+
+        graph = build_fn()
+        self._entries[key] = copy.deepcopy(graph)
+        self._kept_objects.update({id(o): o for o in kept_objects or []})
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return graph
+
+    def clear(self):
+        """
+        Remove all the cached graphs.
+        """
+        self._model_ref = None
+        self._entries.clear()
+        self._kept_objects.clear()
+
+    def _set_model(self, model: Any) -> bool:
+        """
+        Set the model the cache holds graphs for. If it's not the model the cache currently holds graphs for, the
+        cache is cleared.
+
+        Args:
+            model: The model the graphs are prepared from.
+
+        Returns:
+            Whether graphs of the model can be cached (the model supports weak references).
+        """
+        if self._model_ref is not None and self._model_ref() is model:
+            return True
+        self.clear()
+        try:
+            self._model_ref = weakref.ref(model, lambda _: self.clear())
+        except TypeError:
+            return False
+        return True
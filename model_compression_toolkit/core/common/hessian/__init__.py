@@ -15,5 +15,6 @@
 from model_compression_toolkit.core.common.hessian.hessian_scores_request import (
     HessianScoresRequest, HessianMode, HessianScoresGranularity
 )
+from model_compression_toolkit.core.common.hessian.hessian_cache_config import HessianCacheConfig
 from model_compression_toolkit.core.common.hessian.hessian_info_service import HessianInfoService
 import model_compression_toolkit.core.common.hessian.hessian_info_utils as hessian_utils
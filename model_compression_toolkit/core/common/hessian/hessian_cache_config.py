@@ -0,0 +1,36 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class HessianCacheConfig:
+    """
+    Configuration of the cache of the computed Hessian-approximation scores.
+
+    By default, the scores are cached in memory for a single run. When a cache directory is set, the scores are
+    also saved to the directory, so runs on the same float model and representative dataset (for example, with
+    different mixed precision targets or GPTQ configurations) can reuse them instead of computing them again.
+
+    Args:
+        cache_dir (str): Directory to save the Hessian-approximation scores in. If None, the scores are only
+            cached in memory.
+        max_size_mb (float): Maximal size (in MB) of the scores saved in the cache directory. When exceeded, the
+            least recently used scores are removed. If None, the size is not limited.
+    """
+
+    cache_dir: Optional[str] = None
+    max_size_mb: Optional[float] = None
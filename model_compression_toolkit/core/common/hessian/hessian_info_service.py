@@ -13,16 +13,18 @@
 # limitations under the License.
 # ==============================================================================
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, TYPE_CHECKING
+from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
 
 import numpy as np
 
 from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
+from model_compression_toolkit.core.common.hessian.hessian_cache_config import HessianCacheConfig
 from model_compression_toolkit.core.common.hessian.hessian_scores_request import HessianScoresRequest, HessianMode, \
     HessianScoresGranularity
 
 if TYPE_CHECKING:    # pragma: no cover
     from model_compression_toolkit.core.common import BaseNode
+    from model_compression_toolkit.core.common.hessian.hessian_scores_calculator import HessianScoresCalculator
 
 
 # type hints aliases
@@ -103,6 +105,10 @@ class HessianCache:
 
         return result, missing
 
+    def flush(self):
+        """ Persist the cache updates. The in-memory cache has nothing to persist. """
+        pass
+
     def clear(self):
         """ Clear the cache. """
         self._data.clear()
@@ -126,17 +132,28 @@ class HessianInfoService:
     def __init__(self,
                  graph,
                  fw_impl,
-                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                 cache_config: Optional[HessianCacheConfig] = None):
         """
         Args:
             graph: Float graph.
             fw_impl: Framework-specific implementation for Hessian approximation scores computation.
             num_iterations_for_approximation: the number of iterations for hessian estimation.
+            cache_config: Configuration of the hessians cache. If None, hessians are cached in memory.
         """
         self.graph = graph
         self.fw_impl = fw_impl
         self.num_iterations_for_approximation = num_iterations_for_approximation
-        self.cache = HessianCache()
+        if cache_config is not None and cache_config.cache_dir is not None:
+            # Imported here since the persistent cache extends the cache defined in this module.
+            from model_compression_toolkit.core.common.hessian.persistent_hessian_cache import PersistentHessianCache
+            self.cache = PersistentHessianCache(cache_dir=cache_config.cache_dir,
+                                                graph=graph,
+                                                to_numpy=fw_impl.to_numpy,
+                                                num_iterations_for_approximation=num_iterations_for_approximation,
+                                                max_size_mb=cache_config.max_size_mb)
+        else:
+            self.cache = HessianCache()
 
     def fetch_hessian(self, request: HessianScoresRequest,
                       force_compute: bool = False) -> Dict[LayerName, Tensor]:
@@ -234,13 +251,25 @@ class HessianInfoService:
 
         n_samples = 0
         hess_per_layer = []
+        fw_hessian_calculator = None
         for batch in request.data_loader:
-            batch_hess_per_layer = self._compute_hessian_for_batch(request, batch, n_iterations)
+            # The calculator is created once per request, and reused for all batches.
+            if fw_hessian_calculator is None:
+                fw_hessian_calculator = self.fw_impl.get_hessian_scores_calculator(
+                    graph=self.graph,
+                    input_images=batch,
+                    hessian_scores_request=request,
+                    num_iterations_for_approximation=n_iterations
+                )
+            else:
+                fw_hessian_calculator.set_input_images(batch)
+            batch_hess_per_layer = self._compute_hessian_for_batch(request, fw_hessian_calculator)
             hess_per_layer.append(batch_hess_per_layer)
             min_count = self.cache.update(batch_hess_per_layer, request)
             n_samples = min_count if count_by_cache else (n_samples + batch[0].shape[0])
             if request.n_samples and n_samples >= request.n_samples:
                 break
+        self.cache.flush()
 
         hess_per_layer = {
             layer.name: np.concatenate([hess[layer.name] for hess in hess_per_layer], axis=0)
@@ -260,26 +289,18 @@ class HessianInfoService:
 
     def _compute_hessian_for_batch(self,
                                    request: HessianScoresRequest,
-                                   inputs_batch: List[Tensor],
-                                   n_iterations: int) -> Dict[LayerName, Tensor]:
+                                   fw_hessian_calculator: 'HessianScoresCalculator') -> Dict[LayerName, Tensor]:
         """
         Use hessian score calculator to compute hessian approximations for a batch of inputs.
 
         Args:
             request: hessian estimation request.
-            inputs_batch: a batch of inputs to estimate hessians on.
-            n_iterations: the number of iterations for hessian estimation.
+            fw_hessian_calculator: hessian scores calculator of the request, set with the batch of inputs to
+              estimate hessians on.
 
         Returns:
             A dictionary from layers (by name) to their hessians.
         """
-        fw_hessian_calculator = self.fw_impl.get_hessian_scores_calculator(
-            graph=self.graph,
-            input_images=inputs_batch,
-            hessian_scores_request=request,
-            num_iterations_for_approximation=n_iterations
-        )
-
         hessian_scores: list = fw_hessian_calculator.compute()
 
         layers_hessian_scores = {
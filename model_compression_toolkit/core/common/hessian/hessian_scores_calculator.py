@@ -52,15 +52,25 @@ class HessianScoresCalculator(ABC):
             if not fw_impl.is_output_node_compatible_for_hessian_score_computation(output_node.node):
                 Logger.critical(f"All graph outputs must support Hessian score computation. Incompatible node: {output_node.node}, layer type: {output_node.node.type}. Consider disabling Hessian info computation.")
 
-        self.input_images = fw_impl.to_tensor(input_images)
+        self.fw_impl = fw_impl
         self.num_iterations_for_approximation = num_iterations_for_approximation
+        self.hessian_request = hessian_scores_request
+        self.set_input_images(input_images)
 
-        # Validate representative dataset has same inputs as graph
-        if len(self.input_images) != len(graph.get_inputs()):  # pragma: no cover
-            Logger.critical(f"The graph requires {len(graph.get_inputs())} inputs, but the provided representative dataset contains {len(self.input_images)} inputs.")
+    def set_input_images(self, input_images: List[Any]):
+        """
+        Set the input images to compute the scores on. This allows reusing the calculator (and any model
+        it builds for the computation) for multiple batches of the same request.
 
-        self.fw_impl = fw_impl
-        self.hessian_request = hessian_scores_request
+        Args:
+            input_images: List of input images for the computation.
+
+        """
+        self.input_images = self.fw_impl.to_tensor(input_images)
+
+        # Validate representative dataset has same inputs as graph
+        if len(self.input_images) != len(self.graph.get_inputs()):  # pragma: no cover
+            Logger.critical(f"The graph requires {len(self.graph.get_inputs())} inputs, but the provided representative dataset contains {len(self.input_images)} inputs.")
 
     @abstractmethod
     def compute(self) -> List[float]:
@@ -0,0 +1,264 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+import os
+import tempfile
+from typing import Dict, Tuple, Callable, Any, Optional, Iterable
+
+import numpy as np
+
+from model_compression_toolkit.core.common.hessian.hessian_info_service import HessianCache, Query, LayerName, \
+    Tensor
+from model_compression_toolkit.core.common.hessian.hessian_scores_request import HessianScoresRequest
+from model_compression_toolkit.logger import Logger
+
+SHARD_FILE_SUFFIX = '.npy'
+
+
+def update_hash(hash_obj, x: Any):
+    """
+    Update a hash object with the content of a (possibly nested) value.
+
+    Args:
+        hash_obj: Hash object to update.
+        x: Value to hash. Can be an array (or a tensor that converts to a Numpy array), a list, tuple or dict of
+          values, or any value with a deterministic string representation.
+    """
+    if isinstance(x, (list, tuple)):
+        hash_obj.update(f'{type(x).__name__}{len(x)}'.encode())
+        for v in x:
+            update_hash(hash_obj, v)
+    elif isinstance(x, dict):
+        hash_obj.update(f'dict{len(x)}'.encode())
+        for k in sorted(x.keys(), key=str):
+            hash_obj.update(str(k).encode())
+            update_hash(hash_obj, x[k])
+    elif isinstance(x, np.ndarray):
+        hash_obj.update(f'{x.dtype}{x.shape}'.encode())
+        hash_obj.update(np.ascontiguousarray(x).tobytes())
+    else:
+        hash_obj.update(str(x).encode())
+
+
+def get_graph_fingerprint(graph) -> str:
+    """
+    Compute a fingerprint of a graph: its nodes (names, types and weights) and the edges between them.
+
+    Args:
+        graph: Graph to compute its fingerprint.
+
+    Returns:
+        The graph's fingerprint.
+    """
+    hash_obj = hashlib.sha256()
+    for node in graph.get_topo_sorted_nodes():
+        update_hash(hash_obj, [node.name, getattr(node.type, '__name__', node.type),
+                                {k: np.asarray(w) for k, w in node.weights.items()}])
+        update_hash(hash_obj, [(e.sink_node.name, e.source_index, e.sink_index) for e in graph.out_edges(node)])
+    return hash_obj.hexdigest()
+
+
+def get_data_fingerprint(batches: Iterable,
+                         to_numpy: Callable[[Any], np.ndarray],
+                         n_samples: Optional[int] = None) -> str:
+    """
+    Compute a fingerprint of the samples of a dataset: all the batches it yields, up to n_samples samples (the
+    last batch is truncated to the remaining number of samples).
+
+    Args:
+        batches: Iterable of batches. Each batch is a list of tensors, with the samples on the first axis.
+        to_numpy: Function to convert the batches' tensors to Numpy arrays.
+        n_samples: Number of samples to compute the fingerprint of. If None, all the batches are used.
+
+    Returns:
+        The dataset's fingerprint.
+    """
+    hash_obj = hashlib.sha256()
+    samples_count = 0
+    for batch in batches:
+        if n_samples is not None and samples_count >= n_samples:
+            break
+        batch = [to_numpy(x) for x in batch]
+        if n_samples is not None:
+            batch = [x[:n_samples - samples_count] for x in batch]
+        update_hash(hash_obj, batch)
+        samples_count += batch[0].shape[0] if batch else 0
+    return hash_obj.hexdigest()
+
+
+class PersistentHessianCache(HessianCache):
+    """
+    Hessian cache that also saves the hessians to a cache directory, so they can be reused by later runs on the
+    same float model and data.
+
+    The hessians of each query are saved as a shard (a '.npy' file), which is memory-mapped when it's loaded.
+    A shard is keyed by a fingerprint of the graph (see get_graph_fingerprint), of the data loader it was
+    computed on (all its batches, up to the number of samples of the request), and of the request parameters
+    (mode, granularity, node and the number of iterations for the approximation). Thus, when the model, the data or the parameters change,
+    the saved hessians are no longer used. Shards that are no longer used are removed by the size eviction
+    policy: when the cache directory exceeds its maximal size, the least recently used shards are removed.
+
+    Note: hessians are only loaded and saved for requests with a data loader.
+    """
+
+    def __init__(self,
+                 cache_dir: str,
+                 graph,
+                 to_numpy: Callable[[Any], np.ndarray],
+                 num_iterations_for_approximation: int,
+                 max_size_mb: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Directory to save the hessians in.
+            graph: Float graph the hessians are computed for.
+            to_numpy: Function to convert the data loader's tensors to Numpy arrays.
+            num_iterations_for_approximation: the number of iterations for hessian estimation.
+            max_size_mb: Maximal size (in MB) of the cache directory. If None, the size is not limited.
+        """
+        super().__init__()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.to_numpy = to_numpy
+        self.num_iterations_for_approximation = num_iterations_for_approximation
+        self.max_size_bytes = None if max_size_mb is None else max_size_mb * 2 ** 20
+        self.graph_fingerprint = get_graph_fingerprint(graph)
+
+        # Data loaders fingerprints by the data loader's id and the number of samples. The data loader is kept to
+        # make sure its id is not reused.
+        self._data_loaders_fingerprints: Dict[Tuple[int, Optional[int]], Tuple[Iterable, str]] = {}
+        # Shards that were updated since the last flush, and the query they save.
+        self._dirty_shards: Dict[str, Query] = {}
+
+    def update(self, layers_hessians: Dict[str, np.ndarray], request: HessianScoresRequest) -> int:
+        """
+        Updates the cache with new hessians estimations. The updated hessians are saved to the cache directory
+        on the next flush.
+
+        Args:
+            layers_hessians: a dictionary from layer names to their hessian score tensors.
+            request: request per which hessians were computed.
+
+        Returns:
+            Minimal samples count after update (among updated layers).
+
+        """
+        min_count = super().update(layers_hessians, request)
+        if request.data_loader is not None:
+            for node_name in layers_hessians:
+                query = Query(request.mode, request.granularity, node_name)
+                self._dirty_shards[self._get_shard_path(query, request)] = query
+        return min_count
+
+    def fetch_hessian(self, request: HessianScoresRequest) -> Tuple[Dict[LayerName, Tensor], Dict[LayerName, int]]:
+        """
+        Fetch available hessians per request and identify missing samples. Hessians that are not in memory are
+        loaded from the cache directory, if they were saved.
+
+        Args:
+            request: hessians fetch request.
+
+        Returns:
+            A tuple of two dictionaries:
+            - A dictionary from layer name to a tensor of its hessian.
+            - A dictionary from layer name to a number of missing samples.
+        """
+        if request.data_loader is not None:
+            for node in request.target_nodes:
+                query = Query(request.mode, request.granularity, node.name)
+                if query not in self._data:
+                    self._load_shard(query, self._get_shard_path(query, request))
+        return super().fetch_hessian(request)
+
+    def flush(self):
+        """
+        Save the hessians that were updated since the last flush to the cache directory, and evict the least
+        recently used shards if the cache directory exceeds its maximal size.
+        """
+        for shard_path, query in self._dirty_shards.items():
+            # Write to a temporary file and replace, so a shard is never partially written.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, self._data[query])
+            os.replace(tmp_path, shard_path)
+        self._dirty_shards.clear()
+        self._evict()
+
+    def _load_shard(self, query: Query, shard_path: str):
+        """
+        Load a saved shard of a query's hessians (memory-mapped) to the cache, if it exists.
+
+        Args:
+            query: Query of the shard's hessians.
+            shard_path: Path of the shard.
+        """
+        if not os.path.isfile(shard_path):
+            return
+        try:
+            self._data[query] = np.load(shard_path, mmap_mode='r')
+        except (OSError, ValueError):  # pragma: no cover
+            Logger.warning(f'Failed to load cached hessians from {shard_path}, the hessians will be recomputed.')
+            return
+        # Mark the shard as recently used for the eviction policy.
+        os.utime(shard_path)
+
+    def _evict(self):
+        """
+        Remove the least recently used shards until the cache directory does not exceed its maximal size.
+        """
+        if self.max_size_bytes is None:
+            return
+        shards = [e for e in os.scandir(self.cache_dir) if e.is_file() and e.name.endswith(SHARD_FILE_SUFFIX)]
+        shards_stats = sorted([(e.path, e.stat()) for e in shards], key=lambda s: s[1].st_mtime)
+        total_size = sum(s.st_size for _, s in shards_stats)
+        for path, stat in shards_stats:
+            if total_size <= self.max_size_bytes:
+                break
+            os.remove(path)
+            total_size -= stat.st_size
+
+    def _get_data_loader_fingerprint(self, data_loader: Iterable, n_samples: Optional[int]) -> str:
+        """
+        Compute a fingerprint of the samples of a data loader that the hessians are computed on.
+
+        Args:
+            data_loader: Data loader to compute its fingerprint.
+            n_samples: Number of samples the hessians are computed on. If None, all the data loader's samples.
+
+        Returns:
+            The data loader's fingerprint.
+        """
+        key = (id(data_loader), n_samples)
+        if key not in self._data_loaders_fingerprints:
+            self._data_loaders_fingerprints[key] = (data_loader,
+                                                    get_data_fingerprint(data_loader, self.to_numpy, n_samples))
+        return self._data_loaders_fingerprints[key][1]
+
+    def _get_shard_path(self, query: Query, request: HessianScoresRequest) -> str:
+        """
+        Get the path of the shard that saves the hessians of a query computed on the data loader of a request.
+
+        Args:
+            query: Query of the hessians.
+            request: Request with the data loader and the number of samples the hessians are computed on.
+
+        Returns:
+            Path of the shard.
+        """
+        hash_obj = hashlib.sha256()
+        data_fingerprint = self._get_data_loader_fingerprint(request.data_loader, request.n_samples)
+        update_hash(hash_obj, [self.graph_fingerprint, data_fingerprint,
+                                query.mode.name, query.granularity.name, query.node,
+                                self.num_iterations_for_approximation])
+        return os.path.join(self.cache_dir, hash_obj.hexdigest() + SHARD_FILE_SUFFIX)
@@ -14,6 +14,8 @@
 # ==============================================================================
 
 
+from typing import Any, List
+
 from model_compression_toolkit.core.common.matchers.node_matcher import BaseNodeMatcher
 from . import base_matcher
 
@@ -64,6 +66,17 @@ class BaseEdgeMatcher(base_matcher.BaseMatcher):
         else:
             return False
 
+    def get_source_node_types(self) -> List[Any]:
+        """
+        Return the node types the source of a matched edge can have, so graphs can look up the candidate
+        edges by the type of their source node instead of applying the matcher on all of their edges.
+
+        Returns:
+            List of node types the source node of a matched edge must match one of, or None if the source
+            node may be of any type.
+        """
+        return self.source_matcher.get_node_types()
+
 
 class EdgeAndMatcher(BaseEdgeMatcher):
     """
@@ -77,6 +90,10 @@ class EdgeAndMatcher(BaseEdgeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) and self.matcher_b.apply(input_object)
 
+    def get_source_node_types(self) -> List[Any]:
+        types_a = self.matcher_a.get_source_node_types()
+        return self.matcher_b.get_source_node_types() if types_a is None else types_a
+
 
 class EdgeOrMatcher(BaseEdgeMatcher):
     """
@@ -90,6 +107,13 @@ class EdgeOrMatcher(BaseEdgeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) or self.matcher_b.apply(input_object)
 
+    def get_source_node_types(self) -> List[Any]:
+        types_a = self.matcher_a.get_source_node_types()
+        types_b = self.matcher_b.get_source_node_types()
+        if types_a is None or types_b is None:
+            return None
+        return types_a + types_b
+
 
 class EdgeAnyMatcher(BaseEdgeMatcher):
     """
@@ -99,6 +123,9 @@ class EdgeAnyMatcher(BaseEdgeMatcher):
     def apply(self, input_object) -> bool:
         return True
 
+    def get_source_node_types(self) -> List[Any]:
+        return None
+
 
 class EdgeNotMatcher(BaseEdgeMatcher):
     """
@@ -110,3 +137,6 @@ class EdgeNotMatcher(BaseEdgeMatcher):
 
     def apply(self, input_object) -> bool:
         return not self.matcher_a.apply(input_object)
+
+    def get_source_node_types(self) -> List[Any]:
+        return None
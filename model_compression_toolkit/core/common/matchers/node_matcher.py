@@ -14,6 +14,8 @@
 # ==============================================================================
 
 
+from typing import Any, List
+
 from . import base_matcher
 
 
@@ -41,6 +43,17 @@ class BaseNodeMatcher(base_matcher.BaseMatcher):
         """
         return NodeNotMatcher(self)
 
+    def get_node_types(self) -> List[Any]:
+        """
+        Return the node types the matcher can match, so graphs can look up the candidate nodes
+        by their type instead of applying the matcher on all of their nodes.
+
+        Returns:
+            List of node types a matched node must match one of, or None if the matcher may match
+            nodes of any type.
+        """
+        return None
+
 
 class NodeAndMatcher(BaseNodeMatcher):
     """
@@ -54,6 +67,10 @@ class NodeAndMatcher(BaseNodeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) and self.matcher_b.apply(input_object)
 
+    def get_node_types(self) -> List[Any]:
+        types_a = self.matcher_a.get_node_types()
+        return self.matcher_b.get_node_types() if types_a is None else types_a
+
 
 class NodeOrMatcher(BaseNodeMatcher):
     """
@@ -67,6 +84,13 @@ class NodeOrMatcher(BaseNodeMatcher):
     def apply(self, input_object) -> bool:
         return self.matcher_a.apply(input_object) or self.matcher_b.apply(input_object)
 
+    def get_node_types(self) -> List[Any]:
+        types_a = self.matcher_a.get_node_types()
+        types_b = self.matcher_b.get_node_types()
+        if types_a is None or types_b is None:
+            return None
+        return types_a + types_b
+
 
 class NodeAnyMatcher(BaseNodeMatcher):
     """
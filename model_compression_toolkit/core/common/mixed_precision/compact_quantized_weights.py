@@ -0,0 +1,146 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Optional
+
+import numpy as np
+
+# Maximal number of bits of the codes of compact quantized weights (codes are stored in bytes before packing).
+MAX_COMPACT_N_BITS = 8
+
+
+def _pack_codes(codes: np.ndarray, n_bits: int) -> np.ndarray:
+    """
+    Pack integer codes to a bytes array, with n_bits bits per code.
+
+    Args:
+        codes: An array of codes (uint8) in the range [0, 2 ** n_bits).
+        n_bits: Number of bits of each code.
+
+    Returns:
+        A flat uint8 array of the packed codes.
+    """
+    if n_bits == 8:
+        return codes.ravel().copy()
+    bits = np.unpackbits(codes.reshape(-1, 1), axis=1)[:, 8 - n_bits:]
+    return np.packbits(bits)
+
+
+def _unpack_codes(packed_codes: np.ndarray, n_bits: int, n_codes: int) -> np.ndarray:
+    """
+    Unpack codes that were packed with _pack_codes.
+
+    Args:
+        packed_codes: A flat uint8 array of the packed codes.
+        n_bits: Number of bits of each code.
+        n_codes: Number of packed codes.
+
+    Returns:
+        A flat uint8 array of the codes.
+    """
+    if n_bits == 8:
+        return packed_codes
+    bits = np.unpackbits(packed_codes, count=n_codes * n_bits).reshape(n_codes, n_bits)
+    return np.packbits(np.pad(bits, ((0, 0), (8 - n_bits, 0))), axis=1)[:, 0]
+
+
+class CompactQuantizedWeights:
+    """
+    Quantized (fake-quantized) weights stored as bit-packed integer codes and a codebook of the quantized values per
+    output channel, instead of a float tensor. Since a tensor quantized with n bits has at most 2 ** n different
+    values in each output channel (for uniform, power-of-two, symmetric and LUT quantizers alike), the codes take
+    n bits per weight, and decoding restores the exact quantized values.
+    """
+
+    def __init__(self,
+                 packed_codes: np.ndarray,
+                 codebooks: np.ndarray,
+                 n_bits: int,
+                 shape: tuple,
+                 channel_axis: Optional[int]):
+        """
+        Use CompactQuantizedWeights.from_quantized_weights to create a CompactQuantizedWeights.
+
+        Args:
+            packed_codes: Bit-packed codes of the weights, ordered with the channel axis first.
+            codebooks: The quantized values of each output channel (shape: [channels, values]).
+            n_bits: Number of bits of each code.
+            shape: Shape of the quantized weights.
+            channel_axis: Output channel axis of the weights. If None, a single codebook is used for all the weights.
+        """
+        self.packed_codes = packed_codes
+        self.codebooks = codebooks
+        self.n_bits = n_bits
+        self.shape = shape
+        self.channel_axis = channel_axis
+
+    @classmethod
+    def from_quantized_weights(cls,
+                               quantized_weights: np.ndarray,
+                               n_bits: int,
+                               channel_axis: Optional[int]) -> Optional['CompactQuantizedWeights']:
+        """
+        Encode quantized weights.
+
+        Args:
+            quantized_weights: Quantized weights to encode.
+            n_bits: Number of bits the weights were quantized with.
+            channel_axis: Output channel axis of the weights. If None, a single codebook is used for all the weights.
+
+        Returns:
+            The encoded weights, or None if they can't be encoded (more than MAX_COMPACT_N_BITS bits or more than
+            2 ** n_bits different values in a channel).
+        """
+        if n_bits > MAX_COMPACT_N_BITS:
+            return None
+
+        channels_first = quantized_weights.reshape(1, -1) if channel_axis is None else \
+            np.moveaxis(quantized_weights, channel_axis, 0).reshape(quantized_weights.shape[channel_axis], -1)
+        codes = np.empty(channels_first.shape, dtype=np.uint8)
+        channels_values = []
+        for c, channel_weights in enumerate(channels_first):
+            values, inverse = np.unique(channel_weights, return_inverse=True)
+            if len(values) > 2 ** n_bits:
+                return None
+            codes[c] = inverse.reshape(-1)
+            channels_values.append(values)
+
+        codebooks = np.zeros((len(channels_values), max(len(v) for v in channels_values)),
+                             dtype=quantized_weights.dtype)
+        for c, values in enumerate(channels_values):
+            codebooks[c, :len(values)] = values
+
+        return cls(_pack_codes(codes, n_bits), codebooks, n_bits, quantized_weights.shape, channel_axis)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Number of bytes of the encoded weights.
+        """
+        return self.packed_codes.nbytes + self.codebooks.nbytes
+
+    def decode(self) -> np.ndarray:
+        """
+        Decode the quantized weights.
+
+        Returns:
+            The quantized weights.
+        """
+        n_channels = self.codebooks.shape[0]
+        codes = _unpack_codes(self.packed_codes, self.n_bits, int(np.prod(self.shape))).reshape(n_channels, -1)
+        channels_first = np.take_along_axis(self.codebooks, codes.astype(np.intp), axis=1)
+        if self.channel_axis is None:
+            return channels_first.reshape(self.shape)
+        moved_shape = (self.shape[self.channel_axis],) + tuple(np.delete(self.shape, self.channel_axis))
+        return np.moveaxis(channels_first.reshape(moved_shape), 0, self.channel_axis)
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List, Callable, Any
+from typing import List, Callable, Any, Union
 
 import numpy as np
 
+from model_compression_toolkit.core.common.mixed_precision.compact_quantized_weights import CompactQuantizedWeights
+
 from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
     CandidateNodeQuantizationConfig
 
@@ -59,9 +61,12 @@ def verify_candidates_descending_order(node_q_cfg: List[CandidateNodeQuantizatio
 def init_quantized_weights(node_q_cfg: List[CandidateNodeQuantizationConfig],
                            float_weights: Any,
                            fw_tensor_convert_func: Callable,
-                           kernel_attr: str) -> List:
+                           kernel_attr: str) -> List[Union[CompactQuantizedWeights, Any]]:
     """
     Initilizes quantized weights tensors according to the given quantization configuration candidates.
+    The quantized weights of a candidate are kept as CompactQuantizedWeights (integer codes and per-channel
+    codebooks) when they can be encoded and the encoding is smaller than the tensor, so the configurable quantizer
+    does not hold a float tensor for each candidate.
 
     Args:
         node_q_cfg: Quantization configuration candidates of the node that generated the layer that will
@@ -70,7 +75,8 @@ def init_quantized_weights(node_q_cfg: List[CandidateNodeQuantizationConfig],
         fw_tensor_convert_func: A function that converts a tensor to a framework specific tensor type.
         kernel_attr: The kernel attribute name of the node. Only layers with kernel op can be configured.
 
-    Returns: A list with the quantized weights for each candidate.
+    Returns: A list with the quantized weights for each candidate: CompactQuantizedWeights (to decode and convert
+    with fw_tensor_convert_func) or a framework tensor.
 
     """
 
@@ -85,7 +91,18 @@ def init_quantized_weights(node_q_cfg: List[CandidateNodeQuantizationConfig],
                                                            qc_weights_attr.weights_channels_axis[
                                                                0])  # output channel axis
 
-        quantized_weights.append(fw_tensor_convert_func(q_weight))
+        compact_weights = None
+        if qc_weights_attr.enable_weights_quantization:
+            # The framework tensors are float32, so the float32 values are encoded.
+            q_weight = np.asarray(q_weight, dtype=np.float32)
+            compact_weights = CompactQuantizedWeights.from_quantized_weights(
+                q_weight,
+                qc_weights_attr.weights_n_bits,
+                qc_weights_attr.weights_channels_axis[0] if qc_weights_attr.weights_per_channel_threshold else None)
+        if compact_weights is not None and compact_weights.nbytes < q_weight.nbytes:
+            quantized_weights.append(compact_weights)
+        else:
+            quantized_weights.append(fw_tensor_convert_func(q_weight))
 
     return quantized_weights
 
@@ -35,6 +35,8 @@ class MixedPrecisionQuantizationConfig:
         refine_mp_solution (bool): Whether to try to improve the final mixed-precision configuration using a greedy algorithm that searches layers to increase their bit-width, or not.
         metric_normalization_threshold (float): A threshold for checking the mixed precision distance metric values, In case of values larger than this threshold, the metric will be scaled to prevent numerical issues.
         hessian_batch_size (int): The Hessian computation batch size. used only if using mixed precision with Hessian-based objective.
+        incremental_sensitivity_evaluation (bool): Whether to cache the MP model's intermediate tensors of the baseline configuration, and resume the inference from just before the changed layer when evaluating the sensitivity of a configuration that differs from the baseline in a single layer. Reduces the sensitivity evaluation time at the cost of keeping the cached tensors in memory (supported for PyTorch models only).
+        sensitivity_cache_dir (str): Directory to save the computed sensitivity of the mixed precision configurations in, so runs on the same model, candidates and representative dataset with different target resource utilizations can reuse it instead of computing it again. If None, the sensitivity is not saved, and it is not saved either if compute_distance_fn is a lambda, a local function or a closure.
     """
 
     compute_distance_fn: Optional[Callable] = None
@@ -47,6 +49,8 @@ class MixedPrecisionQuantizationConfig:
     refine_mp_solution: bool = True
     metric_normalization_threshold: float = 1e10
     hessian_batch_size: int = ACT_HESSIAN_DEFAULT_BATCH_SIZE
+    incremental_sensitivity_evaluation: bool = False
+    sensitivity_cache_dir: Optional[str] = None
     _is_mixed_precision_enabled: bool = field(init=False, default=False)
 
     def __post_init__(self):
@@ -0,0 +1,273 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import dataclasses
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.hessian.persistent_hessian_cache import get_graph_fingerprint, update_hash, \
+    get_data_fingerprint
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import \
+    MixedPrecisionQuantizationConfig
+from model_compression_toolkit.logger import Logger
+
+SENSITIVITY_FILE_SUFFIX = '.json'
+
+# MixedPrecisionQuantizationConfig fields that don't affect the sensitivity of the configurations.
+_NON_SENSITIVITY_MP_CONFIG_FIELDS = ['configuration_overwrite', 'refine_mp_solution', 'sensitivity_cache_dir',
+                                     '_is_mixed_precision_enabled']
+
+
+def _get_value_description(x: Any) -> Optional[str]:
+    """
+    Get a description of a configuration value that is the same between runs. A function is described by the name
+    it can be imported by and a hash of its code, rather than by its default representation, which includes its
+    address. Lambdas, local functions, closures and other callable objects can't be identified between runs (they
+    can't be imported by name, or their behavior depends on state that isn't part of their code).
+
+    Args:
+        x: A configuration value.
+
+    Returns:
+        The value's description, or None if the value can't be identified between runs.
+    """
+    if isinstance(x, Enum) or not callable(x):
+        return str(x)
+
+    module_name, qualname = getattr(x, '__module__', None), getattr(x, '__qualname__', None)
+    if module_name is None or qualname is None or getattr(x, '__closure__', None):
+        return None
+    importable = sys.modules.get(module_name)
+    for name in qualname.split('.'):
+        importable = getattr(importable, name, None)
+    if importable is not x:
+        return None
+
+    code = getattr(x, '__code__', None)
+    code_hash = '' if code is None else hashlib.sha256(marshal.dumps(code)).hexdigest()
+    return f'{module_name}.{qualname}:{code_hash}'
+
+
+class MixedPrecisionSearchCache:
+    """
+    Cache of the mixed precision search data that doesn't depend on the target resource utilization, so searches
+    with different targets can reuse it.
+
+    The sensitivity matrix (the layer-to-metrics mapping the search is solved with) is cached under a fingerprint
+    of the searched graph (nodes, weights and quantization candidates), of the mixed precision configuration and of
+    the representative dataset (all the batches the sensitivity evaluation uses, up to the configuration's
+    num_of_images samples). When a cache directory is set, the sensitivity matrices are also
+    saved to the directory (as '.json' files), so later runs on the same model, candidates and data can reuse them.
+    The per-node resource utilization tables of the search are cached in memory under the same fingerprint.
+    A sensitivity matrix is only cached in memory when the mixed precision configuration has a function that can't be
+    identified between runs (a lambda, a local function, a closure or another callable object).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Directory to save the sensitivity matrices in. If None, they are only cached in memory.
+        """
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._layer_to_metrics_mappings: Dict[str, Dict[int, Dict[int, float]]] = {}
+        self._ru_tables: Dict[str, Tuple[Dict, Dict]] = {}
+        # Data loaders fingerprints by the data loader's id and the number of samples. The data loader is kept to
+        # make sure its id is not reused.
+        self._data_loaders_fingerprints: Dict[Tuple[int, int], Tuple[Iterable, str]] = {}
+        # Configuration values that can't be identified between runs, by their id. The values are kept to make sure
+        # their ids are not reused.
+        self._non_persistent_values: Dict[int, Any] = {}
+        # Keys of search data of configurations with such values, which are not saved to the cache directory.
+        self._non_persistent_keys = set()
+
+    def get_key(self,
+                graph: Graph,
+                fw_info: FrameworkInfo,
+                mp_config: MixedPrecisionQuantizationConfig,
+                representative_data_gen: Callable,
+                to_numpy: Callable[[Any], Any],
+                disable_activation_for_metric: bool) -> str:
+        """
+        Compute the key of the search data of a graph.
+
+        Args:
+            graph: The graph to search a mixed precision configuration for (after the candidates were filtered for
+                the target resource utilization).
+            fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+            mp_config: Mixed-precision quantization configuration.
+            representative_data_gen: Dataset used for the sensitivity evaluation.
+            to_numpy: Function to convert the dataset's tensors to Numpy arrays.
+            disable_activation_for_metric: Whether activation quantization is disabled in the sensitivity evaluation.
+
+        Returns:
+            The key of the graph's search data.
+        """
+        hash_obj = hashlib.sha256()
+        update_hash(hash_obj, [get_graph_fingerprint(graph),
+                               self._get_data_loader_fingerprint(representative_data_gen, to_numpy,
+                                                                 mp_config.num_of_images),
+                               disable_activation_for_metric])
+
+        non_persistent_fields = []
+        for f in dataclasses.fields(mp_config):
+            if f.name not in _NON_SENSITIVITY_MP_CONFIG_FIELDS:
+                value = getattr(mp_config, f.name)
+                description = _get_value_description(value)
+                if description is None:
+                    # The value is identified by its id, which is only valid in this run.
+                    self._non_persistent_values[id(value)] = value
+                    description = f'{type(value).__name__}@{id(value)}'
+                    non_persistent_fields.append(f.name)
+                update_hash(hash_obj, [f.name, description])
+
+        for node in graph.get_topo_sorted_nodes():
+            kernel_attr = fw_info.get_kernel_op_attributes(node.type)[0]
+            for c in node.candidates_quantization_cfg:
+                activation_cfg = c.activation_quantization_cfg
+                candidate_data = [node.name, activation_cfg.enable_activation_quantization,
+                                  activation_cfg.activation_n_bits, activation_cfg.activation_quantization_params]
+                if kernel_attr is not None and c.weights_quantization_cfg.has_attribute_config(kernel_attr):
+                    kernel_cfg = c.weights_quantization_cfg.get_attr_config(kernel_attr)
+                    candidate_data.extend([kernel_cfg.enable_weights_quantization, kernel_cfg.weights_n_bits,
+                                           kernel_cfg.weights_quantization_params])
+                update_hash(hash_obj, candidate_data)
+
+        key = hash_obj.hexdigest()
+        if non_persistent_fields and self.cache_dir is not None and key not in self._non_persistent_keys:
+            Logger.warning(f'The sensitivity matrix is not saved to the cache directory, since the mixed precision '
+                           f'configuration fields {non_persistent_fields} have functions that can\'t be identified '
+                           f'between runs (a lambda, a local function, a closure or another callable object). Use '
+                           f'functions that are defined at the top level of a module to reuse the sensitivity in '
+                           f'later runs.')
+        if non_persistent_fields:
+            self._non_persistent_keys.add(key)
+        return key
+
+    def get_layer_to_metrics_mapping(self, key: str) -> Optional[Dict[int, Dict[int, float]]]:
+        """
+        Get the cached sensitivity matrix of a key, loading it from the cache directory if it's not in memory.
+
+        Args:
+            key: Key of the search data (see get_key).
+
+        Returns:
+            A mapping from each configurable node's index to a mapping from its candidates' indices to the sensitivity
+            of the model, or None if it is not cached.
+        """
+        if key not in self._layer_to_metrics_mappings and self._is_persistent(key):
+            path = self._get_path(key)
+            if os.path.isfile(path):
+                try:
+                    with open(path, 'r') as f:
+                        saved_mapping = json.load(f)
+                    self._layer_to_metrics_mappings[key] = {
+                        int(layer): {int(candidate_idx): metric for candidate_idx, metric in metrics.items()}
+                        for layer, metrics in saved_mapping.items()}
+                except (OSError, ValueError):  # pragma: no cover
+                    Logger.warning(f'Failed to load cached sensitivity matrix from {path}, '
+                                   f'the sensitivity will be recomputed.')
+
+        mapping = self._layer_to_metrics_mappings.get(key)
+        return None if mapping is None else {layer: dict(metrics) for layer, metrics in mapping.items()}
+
+    def set_layer_to_metrics_mapping(self, key: str, layer_to_metrics_mapping: Dict[int, Dict[int, float]]):
+        """
+        Cache the sensitivity matrix of a key, and save it to the cache directory (if set).
+
+        Args:
+            key: Key of the search data (see get_key).
+            layer_to_metrics_mapping: A mapping from each configurable node's index to a mapping from its candidates'
+                indices to the sensitivity of the model.
+        """
+        mapping = {layer: {candidate_idx: float(metric) for candidate_idx, metric in metrics.items()}
+                   for layer, metrics in layer_to_metrics_mapping.items()}
+        self._layer_to_metrics_mappings[key] = mapping
+
+        if self._is_persistent(key):
+            # Write to a temporary file and replace, so a saved matrix is never partially written.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(mapping, f)
+            os.replace(tmp_path, self._get_path(key))
+
+    def get_ru_tables(self, key: str) -> Tuple[Dict, Dict]:
+        """
+        Get the (possibly empty) dictionaries of the per-node resource utilization tables of a key, which the search
+        manager fills when it computes the tables.
+
+        Args:
+            key: Key of the search data (see get_key).
+
+        Returns:
+            The resource utilization tables of the searched graph and of the original graph, by resource target.
+        """
+        if key not in self._ru_tables:
+            self._ru_tables[key] = ({}, {})
+        return self._ru_tables[key]
+
+    def _get_data_loader_fingerprint(self,
+                                     data_loader: Callable,
+                                     to_numpy: Callable[[Any], Any],
+                                     num_of_images: int) -> str:
+        """
+        Compute a fingerprint of the samples of a representative dataset that the sensitivity evaluation uses.
+
+        Args:
+            data_loader: Representative dataset to compute its fingerprint.
+            to_numpy: Function to convert the dataset's tensors to Numpy arrays.
+            num_of_images: Number of samples the sensitivity evaluation uses.
+
+        Returns:
+            The dataset's fingerprint.
+        """
+        key = (id(data_loader), num_of_images)
+        if key not in self._data_loaders_fingerprints:
+            self._data_loaders_fingerprints[key] = (data_loader,
+                                                    get_data_fingerprint(data_loader(), to_numpy, num_of_images))
+        return self._data_loaders_fingerprints[key][1]
+
+    def _is_persistent(self, key: str) -> bool:
+        """
+        Check whether the sensitivity matrix of a key is saved to the cache directory.
+
+        Args:
+            key: Key of the search data.
+
+        Returns:
+            True if there is a cache directory and the key's configuration can be identified between runs.
+        """
+        return self.cache_dir is not None and key not in self._non_persistent_keys
+
+    def _get_path(self, key: str) -> str:
+        """
+        Get the path of the file that saves the sensitivity matrix of a key.
+
+        Args:
+            key: Key of the search data.
+
+        Returns:
+            Path of the file.
+        """
+        return os.path.join(self.cache_dir, key + SENSITIVITY_FILE_SUFFIX)
@@ -24,6 +24,7 @@ from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization, RUTarget
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_functions_mapping import ru_functions_mapping
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_cache import MixedPrecisionSearchCache
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_manager import MixedPrecisionSearchManager
 from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
     mp_integer_programming_search
@@ -51,7 +52,8 @@ def search_bit_width(graph_to_search_cfg: Graph,
                      mp_config: MixedPrecisionQuantizationConfig,
                      representative_data_gen: Callable,
                      search_method: BitWidthSearchMethod = BitWidthSearchMethod.INTEGER_PROGRAMMING,
-                     hessian_info_service: HessianInfoService = None) -> List[int]:
+                     hessian_info_service: HessianInfoService = None,
+                     search_cache: MixedPrecisionSearchCache = None) -> List[int]:
     """
     Search for an MP configuration for a given graph. Given a search_method method (by default, it's linear
     programming), we use the sensitivity_evaluator object that provides a function to compute an
@@ -69,6 +71,9 @@ def search_bit_width(graph_to_search_cfg: Graph,
         representative_data_gen: Dataset to use for retrieving images for the models inputs.
         search_method: BitWidthSearchMethod to define which searching method to use.
         hessian_info_service: HessianInfoService to fetch Hessian-approximation information.
+        search_cache: MixedPrecisionSearchCache to reuse the sensitivity and resource utilization data of previous
+            searches from. If None, a cache is created if the mixed precision configuration sets a sensitivity cache
+            directory.
 
     Returns:
         A MP configuration for the graph (list of integers, where the index in the list, is the node's
@@ -94,15 +99,29 @@ def search_bit_width(graph_to_search_cfg: Graph,
                                      target_resource_utilization.total_memory == np.inf and
                                      target_resource_utilization.bops == np.inf)) or graph_to_search_cfg.is_single_activation_cfg()
 
+    # The sensitivity of the configurations and the nodes' resource utilization don't depend on the target
+    # resource utilization, so they are reused from previous searches of an identical graph when they are cached.
+    if search_cache is None and mp_config.sensitivity_cache_dir is not None:
+        search_cache = MixedPrecisionSearchCache(mp_config.sensitivity_cache_dir)
+    search_cache_key, layer_to_metrics_mapping, ru_tables = None, None, None
+    if search_cache is not None:
+        search_cache_key = search_cache.get_key(graph, fw_info, mp_config, representative_data_gen,
+                                                fw_impl.to_numpy, disable_activation_for_metric)
+        layer_to_metrics_mapping = search_cache.get_layer_to_metrics_mapping(search_cache_key)
+        ru_tables = search_cache.get_ru_tables(search_cache_key)
+
     # Set Sensitivity Evaluator for MP search. It should always work with the original MP graph,
-    # even if a virtual graph was created (and is used only for BOPS utilization computation purposes)
-    se = fw_impl.get_sensitivity_evaluator(
-        graph_to_search_cfg,
-        mp_config,
-        representative_data_gen=representative_data_gen,
-        fw_info=fw_info,
-        disable_activation_for_metric=disable_activation_for_metric,
-        hessian_info_service=hessian_info_service)
+    # even if a virtual graph was created (and is used only for BOPS utilization computation purposes).
+    # It is not needed if the sensitivity was already computed.
+    se = None
+    if layer_to_metrics_mapping is None:
+        se = fw_impl.get_sensitivity_evaluator(
+            graph_to_search_cfg,
+            mp_config,
+            representative_data_gen=representative_data_gen,
+            fw_info=fw_info,
+            disable_activation_for_metric=disable_activation_for_metric,
+            hessian_info_service=hessian_info_service)
 
     # Each pair of (resource utilization method, resource utilization aggregation) should match to a specific
     # provided target resource utilization
@@ -115,7 +134,9 @@ def search_bit_width(graph_to_search_cfg: Graph,
                                                  se,
                                                  ru_functions,
                                                  target_resource_utilization,
-                                                 original_graph=graph_to_search_cfg)
+                                                 original_graph=graph_to_search_cfg,
+                                                 layer_to_metrics_mapping=layer_to_metrics_mapping,
+                                                 ru_tables=ru_tables)
 
     if search_method in search_methods:  # Get a specific search function
         search_method_fn = search_methods.get(search_method)
@@ -126,6 +147,10 @@ def search_bit_width(graph_to_search_cfg: Graph,
     result_bit_cfg = search_method_fn(search_manager,
                                       target_resource_utilization)
 
+    if search_cache is not None and layer_to_metrics_mapping is None \
+            and search_manager.layer_to_metrics_mapping is not None:
+        search_cache.set_layer_to_metrics_mapping(search_cache_key, search_manager.layer_to_metrics_mapping)
+
     if mp_config.refine_mp_solution:
         result_bit_cfg = greedy_solution_refinement_procedure(result_bit_cfg, search_manager, target_resource_utilization)
 
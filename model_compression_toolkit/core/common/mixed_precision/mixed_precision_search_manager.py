@@ -14,7 +14,7 @@
 # ==============================================================================
 
 from typing import Callable, Tuple
-from typing import Dict, List
+from typing import Dict, List, Optional
 import numpy as np
 
 from model_compression_toolkit.core.common import BaseNode
@@ -25,7 +25,10 @@ from model_compression_toolkit.core.common.graph.virtual_activation_weights_node
     VirtualSplitWeightsNode, VirtualSplitActivationNode
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import RUTarget, ResourceUtilization
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_aggregation_methods import MpRuAggregation
-from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_methods import MpRuMetric
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_methods import MpRuMetric, \
+    ru_metric_node_functions
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_table import MpRuTable, \
+    MpConfigRuTracker
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluation import SensitivityEvaluation
 
@@ -42,7 +45,9 @@ class MixedPrecisionSearchManager:
                  sensitivity_evaluator: SensitivityEvaluation,
                  ru_functions: Dict[RUTarget, Tuple[MpRuMetric, MpRuAggregation]],
                  target_resource_utilization: ResourceUtilization,
-                 original_graph: Graph = None):
+                 original_graph: Graph = None,
+                 layer_to_metrics_mapping: Dict[int, Dict[int, float]] = None,
+                 ru_tables: Tuple[Dict[RUTarget, Optional[MpRuTable]], Dict[RUTarget, Optional[MpRuTable]]] = None):
         """
 
         Args:
@@ -56,6 +61,11 @@ class MixedPrecisionSearchManager:
             target_resource_utilization: Target Resource Utilization to bound our feasible solution space s.t the configuration does not violate it.
             original_graph: In case we have a search over a virtual graph (if we have BOPS utilization target), then this argument
                 will contain the original graph (for config reconstruction purposes).
+            layer_to_metrics_mapping: A precomputed sensitivity matrix of the search (a mapping between a node index to
+                a mapping between a bitwidth index to a distance value). If None, it is computed by the search method
+                using the sensitivity evaluator (which can be None only if the mapping is given).
+            ru_tables: A pair of dictionaries to store the per-node resource utilization tables of the graph and of the
+                original graph in, which may already contain tables that were computed for an identical graph.
         """
 
         self.graph = graph
@@ -64,10 +74,13 @@ class MixedPrecisionSearchManager:
         self.fw_impl = fw_impl
         self.sensitivity_evaluator = sensitivity_evaluator
         self.layer_to_bitwidth_mapping = self.get_search_space()
-        self.compute_metric_fn = self.get_sensitivity_metric()
+        self.compute_metric_fn = None if sensitivity_evaluator is None else self.get_sensitivity_metric()
+        self.layer_to_metrics_mapping = layer_to_metrics_mapping
 
         self.compute_ru_functions = ru_functions
         self.target_resource_utilization = target_resource_utilization
+        # Per-node resource utilization tables of the search graph and of the original graph (built on demand)
+        self._ru_tables, self._config_ru_tables = ({}, {}) if ru_tables is None else ru_tables
         self.min_ru_config = self.graph.get_min_candidates_config(fw_info)
         self.max_ru_config = self.graph.get_max_candidates_config(fw_info)
         self.min_ru = self.compute_min_ru()
@@ -121,10 +134,66 @@ class MixedPrecisionSearchManager:
         for ru_target, ru_fns in self.compute_ru_functions.items():
             # ru_fns is a pair of resource utilization computation method and 
             # resource utilization aggregation method (in this method we only need the first one)
-            min_ru[ru_target] = ru_fns[0](self.min_ru_config, self.graph, self.fw_info, self.fw_impl)
+            ru_table = self.get_ru_table(ru_target)
+            if ru_table is None:
+                min_ru[ru_target] = ru_fns[0](self.min_ru_config, self.graph, self.fw_info, self.fw_impl)
+            else:
+                min_ru[ru_target] = ru_table.get_ru_vector(self.min_ru_config)
 
         return min_ru
 
+    def get_ru_table(self, target: RUTarget) -> Optional[MpRuTable]:
+        """
+        Returns the per-node resource utilization table of a target's metric over the searched graph.
+        The table is computed once, on the first call for the target.
+
+        Args:
+            target: The resource target for which the resource utilization is calculated (a RUTarget value).
+
+        Returns: An MpRuTable, or None if the target's metric can't be computed per node.
+
+        """
+        if target not in self._ru_tables:
+            self._ru_tables[target] = self._build_ru_table(target, self.graph)
+        return self._ru_tables[target]
+
+    def _get_config_ru_table(self, target: RUTarget) -> Optional[MpRuTable]:
+        """
+        Returns the per-node resource utilization table that matches the computation of a target's resource utilization
+        for a configuration of the original graph (see compute_resource_utilization_for_config).
+
+        Args:
+            target: The resource target for which the resource utilization is calculated (a RUTarget value).
+
+        Returns: An MpRuTable, or None if the target's resource utilization can't be computed per node.
+
+        """
+        if target == RUTarget.BOPS:
+            # BOPS of a configuration are computed on the original graph, where a node's BOPS count depends on
+            # its input activation node's candidate as well.
+            return None
+        if self.original_graph is self.graph:
+            return self.get_ru_table(target)
+        if target not in self._config_ru_tables:
+            self._config_ru_tables[target] = self._build_ru_table(target, self.original_graph)
+        return self._config_ru_tables[target]
+
+    def _build_ru_table(self, target: RUTarget, graph: Graph) -> Optional[MpRuTable]:
+        """
+        Builds a per-node resource utilization table of a target's metric over a given graph.
+
+        Args:
+            target: The resource target for which the resource utilization is calculated (a RUTarget value).
+            graph: The graph to compute the table for.
+
+        Returns: An MpRuTable, or None if the target's metric can't be computed per node.
+
+        """
+        ru_metric = self.compute_ru_functions[target][0]
+        if ru_metric not in ru_metric_node_functions:
+            return None
+        return MpRuTable(ru_metric, graph, self.fw_info, self.fw_impl)
+
     def compute_resource_utilization_matrix(self, target: RUTarget) -> np.ndarray:
         """
         Computes and builds a resource utilization matrix, to be used for the mixed-precision search problem formalization.
@@ -145,6 +214,10 @@ class MixedPrecisionSearchManager:
 
         configurable_sorted_nodes = self.graph.get_configurable_sorted_nodes(self.fw_info)
 
+        ru_table = self.get_ru_table(target)
+        if ru_table is not None:
+            return self._compute_resource_utilization_matrix_from_table(target, ru_table, configurable_sorted_nodes)
+
         ru_matrix = []
         for c, c_n in enumerate(configurable_sorted_nodes):
             for candidate_idx in range(len(c_n.candidates_quantization_cfg)):
@@ -164,6 +237,38 @@ class MixedPrecisionSearchManager:
         np_ru_matrix = np.array(ru_matrix)
         return np.moveaxis(np_ru_matrix, source=0, destination=len(np_ru_matrix.shape) - 1)
 
+    def _compute_resource_utilization_matrix_from_table(self,
+                                                        target: RUTarget,
+                                                        ru_table: MpRuTable,
+                                                        configurable_sorted_nodes: List[BaseNode]) -> np.ndarray:
+        """
+        Builds the resource utilization matrix of a target (see compute_resource_utilization_matrix) from its
+        per-node resource utilization table.
+        Changing a single node's candidate only changes the node's own entry in the target's resource utilization
+        vector, so each column has at most one non-zero entry, which is taken from the table.
+
+        Args:
+            target: The resource target for which the resource utilization is calculated (a RUTarget value).
+            ru_table: The per-node resource utilization table of the target's metric.
+            configurable_sorted_nodes: The graph's sorted configurable nodes.
+
+        Returns: A resource utilization matrix.
+
+        """
+        min_ru = self.min_ru[target]
+        num_configurations = sum([len(n.candidates_quantization_cfg) for n in configurable_sorted_nodes])
+        ru_matrix = np.zeros(shape=np.shape(min_ru) + (num_configurations,))
+
+        column = 0
+        for c, c_n in enumerate(configurable_sorted_nodes):
+            row = ru_table.get_conf_node_row(c)
+            for candidate_idx in range(len(c_n.candidates_quantization_cfg)):
+                if row is not None and candidate_idx != self.min_ru_config[c]:
+                    ru_matrix[row, ..., column] = ru_table.get_candidate_ru(row, candidate_idx) - min_ru[row]
+                column += 1
+
+        return ru_matrix
+
     def compute_candidate_relative_ru(self,
                                       conf_node_idx: int,
                                       candidate_idx: int,
@@ -211,14 +316,12 @@ class MixedPrecisionSearchManager:
         Returns: Node's resource utilization vector.
 
         """
-        return self.compute_ru_functions[target][0](
-            self.replace_config_in_index(
-                self.min_ru_config,
-                conf_node_idx,
-                candidate_idx),
-            self.graph,
-            self.fw_info,
-            self.fw_impl)
+        mp_cfg = self.replace_config_in_index(self.min_ru_config, conf_node_idx, candidate_idx)
+        ru_table = self.get_ru_table(target)
+        if ru_table is not None:
+            return ru_table.get_ru_vector(mp_cfg)
+
+        return self.compute_ru_functions[target][0](mp_cfg, self.graph, self.fw_info, self.fw_impl)
 
     @staticmethod
     def replace_config_in_index(mp_cfg: List[int], idx: int, value: int) -> List[int]:
@@ -271,28 +374,64 @@ class MixedPrecisionSearchManager:
 
         """
 
-        ru_dict = {}
-
-        for ru_target, ru_fns in self.compute_ru_functions.items():
-            # Passing False to ru methods and aggregations to indicates that the computations
-            # are not for constraints setting
-            if ru_target == RUTarget.BOPS:
-                configurable_nodes_ru_vector = ru_fns[0](config, self.original_graph, self.fw_info, self.fw_impl, False)
-            else:
-                configurable_nodes_ru_vector = ru_fns[0](config, self.original_graph, self.fw_info, self.fw_impl)
-            non_configurable_nodes_ru_vector = self.non_conf_ru_dict.get(ru_target)
-            if non_configurable_nodes_ru_vector is None or len(non_configurable_nodes_ru_vector) == 0:
-                ru_ru = self.compute_ru_functions[ru_target][1](configurable_nodes_ru_vector, False)
-            else:
-                ru_ru = self.compute_ru_functions[ru_target][1](
-                    np.concatenate([configurable_nodes_ru_vector, non_configurable_nodes_ru_vector]), False)
-
-            ru_dict[ru_target] = ru_ru[0]
+        ru_dict = {ru_target: self._compute_target_resource_utilization_for_config(ru_target, config)
+                   for ru_target in self.compute_ru_functions.keys()}
 
         config_ru = ResourceUtilization()
         config_ru.set_resource_utilization_by_target(ru_dict)
         return config_ru
 
+    def _compute_target_resource_utilization_for_config(self, ru_target: RUTarget, config: List[int]) -> float:
+        """
+        Computes the resource utilization value of a single target for a given mixed-precision configuration.
+
+        Args:
+            ru_target: The resource target for which the resource utilization is calculated (a RUTarget value).
+            config: A mixed-precision configuration (list of candidates indices)
+
+        Returns: The target's resource utilization value when the model is quantized with the given config.
+
+        """
+        ru_fns = self.compute_ru_functions[ru_target]
+        # Passing False to ru methods and aggregations to indicates that the computations
+        # are not for constraints setting
+        if ru_target == RUTarget.BOPS:
+            configurable_nodes_ru_vector = ru_fns[0](config, self.original_graph, self.fw_info, self.fw_impl, False)
+        else:
+            configurable_nodes_ru_vector = ru_fns[0](config, self.original_graph, self.fw_info, self.fw_impl)
+        non_configurable_nodes_ru_vector = self.non_conf_ru_dict.get(ru_target)
+        if non_configurable_nodes_ru_vector is None or len(non_configurable_nodes_ru_vector) == 0:
+            ru_ru = ru_fns[1](configurable_nodes_ru_vector, False)
+        else:
+            ru_ru = ru_fns[1](np.concatenate([configurable_nodes_ru_vector, non_configurable_nodes_ru_vector]), False)
+
+        return ru_ru[0]
+
+    def get_config_ru_tracker(self, config: List[int]) -> MpConfigRuTracker:
+        """
+        Creates a tracker of the resource utilization of a mixed-precision configuration, which computes the resource
+        utilization of configurations that differ from it in a single node's candidate, without computing the
+        resource utilization over the entire graph (as compute_resource_utilization_for_config does).
+
+        Targets that can't be computed per node and are not constrained by the target resource utilization are not
+        tracked, and their value is not set in the tracker's ResourceUtilization objects.
+
+        Args:
+            config: A mixed-precision configuration (list of candidates indices) to track.
+
+        Returns: An MpConfigRuTracker of the given config.
+
+        """
+        target_ru_dict = self.target_resource_utilization.get_resource_utilization_dict()
+        ru_tables = {ru_target: self._get_config_ru_table(ru_target) for ru_target in self.compute_ru_functions.keys()}
+        tracked_ru_functions = {ru_target: ru_fns for ru_target, ru_fns in self.compute_ru_functions.items()
+                                if ru_tables[ru_target] is not None or target_ru_dict.get(ru_target, np.inf) < np.inf}
+        return MpConfigRuTracker(config,
+                                 tracked_ru_functions,
+                                 ru_tables,
+                                 self.non_conf_ru_dict,
+                                 self._compute_target_resource_utilization_for_config)
+
     def finalize_distance_metric(self, layer_to_metrics_mapping: Dict[int, Dict[int, float]]):
         """
         Finalizing the distance metric building.
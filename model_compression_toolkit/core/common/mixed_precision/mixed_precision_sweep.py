@@ -0,0 +1,136 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+from typing import Any, Callable, Dict, List
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.hessian.hessian_info_service import HessianInfoService
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_candidates_filter import \
+    filter_candidates_for_mixed_precision
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_cache import MixedPrecisionSearchCache
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import search_bit_width
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import \
+    ResourceUtilization
+from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
+from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.target_platform_capabilities.target_platform import TargetPlatformCapabilities
+
+
+def mixed_precision_sweep(in_model: Any,
+                          representative_data_gen: Callable,
+                          core_config: CoreConfig,
+                          target_resource_utilizations: List[ResourceUtilization],
+                          fw_info: FrameworkInfo,
+                          fw_impl: FrameworkImplementation,
+                          tpc: TargetPlatformCapabilities) -> List[List[int]]:
+    """
+    Search mixed precision configurations of a model for several target resource utilizations.
+    The model's graph is prepared once, and the sensitivity of the configurations and the nodes' resource utilization,
+    which don't depend on the target, are computed once for all the targets that search the same candidates.
+
+    Args:
+        in_model: Model to search mixed precision configurations for.
+        representative_data_gen: Dataset used for calibration and for the sensitivity evaluation.
+        core_config: CoreConfig containing parameters of how the model should be quantized.
+        target_resource_utilizations: ResourceUtilization objects to search a configuration for.
+        fw_info: Information needed for quantization about the specific framework.
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        tpc: TargetPlatformCapabilities object that models the inference target platform and
+            the attached framework operator's information.
+
+    Returns:
+        A mixed precision configuration for each target resource utilization (a list of candidate indices of the
+        model's configurable nodes, sorted topologically). Each configuration can be set as the configuration_overwrite
+        of a MixedPrecisionQuantizationConfig to quantize the model with it.
+    """
+    mp_config = core_config.mixed_precision_config
+    if mp_config is None:
+        Logger.critical("Mixed precision sweep requires a MixedPrecisionQuantizationConfig, "
+                        "but the provided MixedPrecisionQuantizationConfig is None.")
+    mp_config.set_mixed_precision_enable()
+
+    graph = graph_preparation_runner(in_model,
+                                     representative_data_gen,
+                                     core_config.quantization_config,
+                                     fw_info,
+                                     fw_impl,
+                                     tpc,
+                                     core_config.bit_width_config,
+                                     mixed_precision_enable=core_config.is_mixed_precision_enabled)
+
+    hessian_info_service = HessianInfoService(graph=graph, fw_impl=fw_impl,
+                                              cache_config=core_config.hessian_cache_config)
+
+    tg = quantization_preparation_runner(graph=graph,
+                                         representative_data_gen=representative_data_gen,
+                                         core_config=core_config,
+                                         fw_info=fw_info,
+                                         fw_impl=fw_impl,
+                                         hessian_info_service=hessian_info_service)
+
+    search_cache = MixedPrecisionSearchCache(mp_config.sensitivity_cache_dir)
+    bit_widths_configs = []
+    for target_resource_utilization in target_resource_utilizations:
+        # The candidates are filtered according to the target, so each target is searched on a copy of the graph.
+        target_graph = copy.deepcopy(tg)
+        candidates_ids = {n.name: [id(c) for c in n.candidates_quantization_cfg] for n in target_graph.nodes}
+        filter_candidates_for_mixed_precision(target_graph, target_resource_utilization, fw_info, tpc)
+        bit_widths_config = search_bit_width(target_graph,
+                                             fw_info,
+                                             fw_impl,
+                                             target_resource_utilization,
+                                             mp_config,
+                                             representative_data_gen,
+                                             hessian_info_service=hessian_info_service,
+                                             search_cache=search_cache)
+        bit_widths_configs.append(_get_unfiltered_config(tg, target_graph, bit_widths_config, candidates_ids, fw_info))
+
+    return bit_widths_configs
+
+
+def _get_unfiltered_config(graph: Graph,
+                           filtered_graph: Graph,
+                           filtered_config: List[int],
+                           candidates_ids: Dict[str, List[int]],
+                           fw_info: FrameworkInfo) -> List[int]:
+    """
+    Translate a mixed precision configuration of a graph whose candidates were filtered to a configuration of the graph
+    before the filtering (which is the graph a configuration_overwrite is applied to).
+
+    Args:
+        graph: The graph before the candidates filtering.
+        filtered_graph: A copy of the graph after the candidates filtering.
+        filtered_config: The configuration of the filtered graph's configurable nodes.
+        candidates_ids: Ids of the filtered graph's candidates before the filtering, by node name.
+        fw_info: Information needed for quantization about the specific framework.
+
+    Returns:
+        The configuration of the graph's configurable nodes.
+    """
+    filtered_nodes = {n.name: n for n in filtered_graph.nodes}
+    filtered_config_by_name = {n.name: c for n, c in
+                               zip(filtered_graph.get_configurable_sorted_nodes(fw_info), filtered_config)}
+
+    config = []
+    for n in graph.get_configurable_sorted_nodes(fw_info):
+        filtered_node = filtered_nodes[n.name]
+        # A node with a single candidate left after the filtering is not configurable in the filtered graph.
+        candidate = filtered_node.candidates_quantization_cfg[filtered_config_by_name.get(n.name, 0)]
+        config.append(candidates_ids[n.name].index(id(candidate)))
+    return config
@@ -22,6 +22,7 @@ from model_compression_toolkit.core import FrameworkInfo, ResourceUtilization, C
 from model_compression_toolkit.core.common import Graph
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
+from model_compression_toolkit.core.common.graph.prepared_graphs_cache import PreparedGraphsCache
 from model_compression_toolkit.core.graph_prep_runner import graph_preparation_runner
 from model_compression_toolkit.target_platform_capabilities.target_platform import TargetPlatformCapabilities, \
     QuantizationConfigOptions
@@ -203,7 +204,8 @@ def requires_mixed_precision(in_model: Any,
                              core_config: CoreConfig,
                              tpc: TargetPlatformCapabilities,
                              fw_info: FrameworkInfo,
-                             fw_impl: FrameworkImplementation) -> bool:
+                             fw_impl: FrameworkImplementation,
+                             prepared_graphs_cache: PreparedGraphsCache = None) -> bool:
     """
     The function checks whether the model requires mixed precision to meet the requested target resource utilization.
     This is determined by whether the target memory usage of the weights is less than the available memory,
@@ -220,6 +222,7 @@ def requires_mixed_precision(in_model: Any,
                                               the attached framework operator's information.
         fw_info: Information needed for quantization about the specific framework.
         fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        prepared_graphs_cache: Cache of the prepared graphs to reuse (e.g., for the quantization of the same run).
 
     Returns: A boolean indicating if mixed precision is needed.
     """
@@ -233,7 +236,8 @@ def requires_mixed_precision(in_model: Any,
                                                  fw_impl,
                                                  tpc,
                                                  bit_width_config=core_config.bit_width_config,
-                                                 mixed_precision_enable=False)
+                                                 mixed_precision_enable=False,
+                                                 prepared_graphs_cache=prepared_graphs_cache)
     # Compute max weights memory in bytes
     weights_memory_by_layer_bytes, _ = compute_nodes_weights_params(transformed_graph, fw_info)
     total_weights_memory_bytes = 0 if len(weights_memory_by_layer_bytes) == 0 else sum(weights_memory_by_layer_bytes)
@@ -74,15 +74,8 @@ def weights_size_utilization(mp_cfg: List[int],
         # Go over configurable all nodes that should be taken into consideration when computing the weights
         # resource utilization.
         for n in graph.get_sorted_weights_configurable_nodes(fw_info):
-            # Only nodes with kernel op can be considered configurable
-            kernel_attr = fw_info.get_kernel_op_attributes(n.type)[0]
             node_idx = mp_nodes.index(n.name)
-            node_qc = n.candidates_quantization_cfg[mp_cfg[node_idx]]
-            node_nbits = node_qc.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits
-
-            node_weights_memory_in_bytes = _compute_node_weights_memory(n, node_nbits, fw_info)
-
-            weights_memory.append(node_weights_memory_in_bytes)
+            weights_memory.append(weights_size_node_utilization(n, mp_cfg[node_idx], fw_info, fw_impl))
 
     return np.array(weights_memory)
 
@@ -126,12 +119,7 @@ def activation_output_size_utilization(mp_cfg: List[int],
         # Go over all nodes that should be taken into consideration when computing the weights memory utilization.
         for n in graph.get_sorted_activation_configurable_nodes():
             node_idx = mp_nodes.index(n.name)
-            node_qc = n.candidates_quantization_cfg[mp_cfg[node_idx]]
-            node_nbits = node_qc.activation_quantization_cfg.activation_n_bits
-
-            node_activation_memory_in_bytes = _compute_node_activation_memory(n, node_nbits)
-
-            activation_memory.append(node_activation_memory_in_bytes)
+            activation_memory.append(activation_output_size_node_utilization(n, mp_cfg[node_idx], fw_info, fw_impl))
 
     return np.array(activation_memory)
 
@@ -199,26 +187,8 @@ def total_weights_activation_utilization(mp_cfg: List[int],
         # Go over all nodes that should be taken into consideration when computing the weights or
         # activation memory utilization (all configurable nodes).
         for node_idx, n in enumerate(graph.get_configurable_sorted_nodes(fw_info)):
-            # TODO: currently considering only kernel attributes in weights memory utilization. When enabling multi-attribute
-            #  quantization we need to modify this method to count all attributes.
-
-            node_qc = n.candidates_quantization_cfg[mp_cfg[node_idx]]
-
-            # Compute node's weights memory (if no weights to quantize then set to 0)
-            node_weights_memory_in_bytes = 0
-            kernel_attr = fw_info.get_kernel_op_attributes(n.type)[0]
-            if kernel_attr is not None:
-                if n.is_weights_quantization_enabled(kernel_attr) and not n.is_all_weights_candidates_equal(kernel_attr):
-                    node_weights_nbits = node_qc.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits
-                    node_weights_memory_in_bytes = _compute_node_weights_memory(n, node_weights_nbits, fw_info)
-
-            # Compute node's activation memory (if node's activation are not being quantized then set to 0)
-            node_activation_nbits = node_qc.activation_quantization_cfg.activation_n_bits
-            node_activation_memory_in_bytes = 0
-            if n.is_activation_quantization_enabled() and not n.is_all_activation_candidates_equal():
-                node_activation_memory_in_bytes = _compute_node_activation_memory(n, node_activation_nbits)
-
-            weights_activation_memory.append(np.array([node_weights_memory_in_bytes, node_activation_memory_in_bytes]))
+            weights_activation_memory.append(
+                total_weights_activation_node_utilization(n, mp_cfg[node_idx], fw_info, fw_impl))
 
     return np.array(weights_activation_memory)
 
@@ -254,10 +224,11 @@ def bops_utilization(mp_cfg: List[int],
     # BOPs utilization method considers non-configurable nodes, therefore, it doesn't need separate implementation
     # for non-configurable nodes for setting a constraint (no need for separate implementation for len(mp_cfg) = 0).
 
-    virtual_bops_nodes = [n for n in graph.get_topo_sorted_nodes() if isinstance(n, VirtualActivationWeightsNode)]
+    virtual_bops_nodes = _get_bops_nodes(graph, fw_info)
 
     mp_nodes = graph.get_configurable_sorted_nodes_names(fw_info)
-    bops = [n.get_bops_count(fw_impl, fw_info, candidate_idx=_get_node_cfg_idx(n, mp_cfg, mp_nodes)) for n in virtual_bops_nodes]
+    bops = [bops_node_utilization(n, _get_node_cfg_idx(n, mp_cfg, mp_nodes), fw_info, fw_impl)
+            for n in virtual_bops_nodes]
 
     return np.array(bops)
 
@@ -313,6 +284,138 @@ def _bops_utilization(mp_cfg: List[int],
     return np.array(bops)
 
 
+def weights_size_node_utilization(n: BaseNode,
+                                  candidate_idx: int,
+                                  fw_info: FrameworkInfo,
+                                  fw_impl: FrameworkImplementation) -> float:
+    """
+    Computes the entry of a weights configurable node in the weights_size_utilization vector.
+
+    Args:
+        n: A weights configurable node.
+        candidate_idx: The index of the node's quantization configuration candidate.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation (not used in this method).
+
+    Returns: The node's weights memory size when quantized with the given candidate.
+
+    """
+    # Only nodes with kernel op can be considered configurable
+    kernel_attr = fw_info.get_kernel_op_attributes(n.type)[0]
+    node_qc = n.candidates_quantization_cfg[candidate_idx]
+    node_nbits = node_qc.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits
+
+    return _compute_node_weights_memory(n, node_nbits, fw_info)
+
+
+def activation_output_size_node_utilization(n: BaseNode,
+                                            candidate_idx: int,
+                                            fw_info: FrameworkInfo,
+                                            fw_impl: FrameworkImplementation) -> float:
+    """
+    Computes the entry of an activation configurable node in the activation_output_size_utilization vector.
+
+    Args:
+        n: An activation configurable node.
+        candidate_idx: The index of the node's quantization configuration candidate.
+        fw_info: FrameworkInfo object about the specific framework (not used in this method).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation (not used in this method).
+
+    Returns: The node's activation memory size when quantized with the given candidate.
+
+    """
+    node_qc = n.candidates_quantization_cfg[candidate_idx]
+    node_nbits = node_qc.activation_quantization_cfg.activation_n_bits
+
+    return _compute_node_activation_memory(n, node_nbits)
+
+
+def total_weights_activation_node_utilization(n: BaseNode,
+                                              candidate_idx: int,
+                                              fw_info: FrameworkInfo,
+                                              fw_impl: FrameworkImplementation) -> np.ndarray:
+    """
+    Computes the entry of a configurable node in the total_weights_activation_utilization tensor.
+
+    Args:
+        n: A configurable node.
+        candidate_idx: The index of the node's quantization configuration candidate.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation (not used in this method).
+
+    Returns: A vector with the node's weights memory size and activation memory size when quantized with the
+    given candidate (a size is 0 if the respective part of the node is not configurable).
+
+    """
+    # TODO: currently considering only kernel attributes in weights memory utilization. When enabling multi-attribute
+    #  quantization we need to modify this method to count all attributes.
+
+    node_qc = n.candidates_quantization_cfg[candidate_idx]
+
+    # Compute node's weights memory (if no weights to quantize then set to 0)
+    node_weights_memory_in_bytes = 0
+    kernel_attr = fw_info.get_kernel_op_attributes(n.type)[0]
+    if kernel_attr is not None:
+        if n.is_weights_quantization_enabled(kernel_attr) and not n.is_all_weights_candidates_equal(kernel_attr):
+            node_weights_nbits = node_qc.weights_quantization_cfg.get_attr_config(kernel_attr).weights_n_bits
+            node_weights_memory_in_bytes = _compute_node_weights_memory(n, node_weights_nbits, fw_info)
+
+    # Compute node's activation memory (if node's activation are not being quantized then set to 0)
+    node_activation_nbits = node_qc.activation_quantization_cfg.activation_n_bits
+    node_activation_memory_in_bytes = 0
+    if n.is_activation_quantization_enabled() and not n.is_all_activation_candidates_equal():
+        node_activation_memory_in_bytes = _compute_node_activation_memory(n, node_activation_nbits)
+
+    return np.array([node_weights_memory_in_bytes, node_activation_memory_in_bytes])
+
+
+def bops_node_utilization(n: BaseNode,
+                          candidate_idx: int,
+                          fw_info: FrameworkInfo,
+                          fw_impl: FrameworkImplementation) -> float:
+    """
+    Computes the entry of a virtual composed node in the bops_utilization vector (of a virtual graph).
+
+    Args:
+        n: A VirtualActivationWeightsNode.
+        candidate_idx: The index of the node's quantization configuration candidate.
+        fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+
+    Returns: The node's BOPS count when quantized with the given candidate.
+
+    """
+    return n.get_bops_count(fw_impl, fw_info, candidate_idx=candidate_idx)
+
+
+def _get_weights_size_nodes(graph: Graph, fw_info: FrameworkInfo) -> List[BaseNode]:
+    """
+    Returns the nodes of the weights_size_utilization vector of a configuration, in the vector's order.
+    """
+    return graph.get_sorted_weights_configurable_nodes(fw_info)
+
+
+def _get_activation_output_size_nodes(graph: Graph, fw_info: FrameworkInfo) -> List[BaseNode]:
+    """
+    Returns the nodes of the activation_output_size_utilization vector of a configuration, in the vector's order.
+    """
+    return graph.get_sorted_activation_configurable_nodes()
+
+
+def _get_total_weights_activation_nodes(graph: Graph, fw_info: FrameworkInfo) -> List[BaseNode]:
+    """
+    Returns the nodes of the total_weights_activation_utilization tensor of a configuration, in the tensor's order.
+    """
+    return graph.get_configurable_sorted_nodes(fw_info)
+
+
+def _get_bops_nodes(graph: Graph, fw_info: FrameworkInfo) -> List[BaseNode]:
+    """
+    Returns the nodes of the bops_utilization vector of a virtual graph, in the vector's order.
+    """
+    return [n for n in graph.get_topo_sorted_nodes() if isinstance(n, VirtualActivationWeightsNode)]
+
+
 def _get_node_cfg_idx(node: BaseNode, mp_cfg: List[int], sorted_configurable_nodes_names: List[str]) -> int:
     """
     Returns the index of a node's quantization configuration candidate according to the given
@@ -439,3 +542,16 @@ class MpRuMetric(Enum):
 
     def __call__(self, *args):
         return self.value(*args)
+
+
+# Node-level computation of the resource utilization metrics that are used for setting the LP constraints.
+# Each entry of such metric's vector depends only on the candidate of a single node, so each metric is mapped to a pair
+# of a function that returns the nodes of the metric's vector (in the vector's order) and a function that computes a
+# single node's entry for a given candidate. This allows to compute a metric for many configurations without going
+# over the entire graph for each of them (see MpRuTable).
+ru_metric_node_functions = {MpRuMetric.WEIGHTS_SIZE: (_get_weights_size_nodes, weights_size_node_utilization),
+                            MpRuMetric.ACTIVATION_OUTPUT_SIZE: (_get_activation_output_size_nodes,
+                                                                activation_output_size_node_utilization),
+                            MpRuMetric.TOTAL_WEIGHTS_ACTIVATION_SIZE: (_get_total_weights_activation_nodes,
+                                                                       total_weights_activation_node_utilization),
+                            MpRuMetric.BOPS_COUNT: (_get_bops_nodes, bops_node_utilization)}
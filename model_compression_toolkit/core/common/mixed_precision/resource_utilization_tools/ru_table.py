@@ -0,0 +1,295 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import \
+    RUTarget, ResourceUtilization
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_aggregation_methods import \
+    MpRuAggregation
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_methods import MpRuMetric, \
+    ru_metric_node_functions
+
+
+class MpRuTable:
+    """
+    A table of the entries of a resource utilization metric's vector, for each quantization candidate of the node that
+    each entry refers to.
+    The table is computed once for a graph, and then allows retrieving the metric's resource utilization vector of any
+    mixed-precision configuration, and the entry that changes when a single configurable node's candidate is changed,
+    without computing the metric over the entire graph.
+    """
+
+    def __init__(self,
+                 metric: MpRuMetric,
+                 graph: Graph,
+                 fw_info: FrameworkInfo,
+                 fw_impl: FrameworkImplementation):
+        """
+        Args:
+            metric: A resource utilization metric which has node-level functions (in ru_metric_node_functions).
+            graph: Graph to compute the metric for.
+            fw_info: FrameworkInfo object about the specific framework (e.g., attributes of different layers' weights to quantize).
+            fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        """
+        get_metric_nodes_fn, node_ru_fn = ru_metric_node_functions[metric]
+        conf_nodes_indices = {name: i for i, name in enumerate(graph.get_configurable_sorted_nodes_names(fw_info))}
+
+        # For each entry (row) of the metric's vector: the index of its node in the sorted configurable nodes list
+        # (None for a non-configurable node) and an array with the entry's value for each of the node's candidates.
+        self.rows_conf_node_idx = []
+        self.rows_candidates_ru = []
+        self.conf_node_idx_to_row = {}
+
+        for row, n in enumerate(get_metric_nodes_fn(graph, fw_info)):
+            conf_node_idx = conf_nodes_indices.get(n.name)
+            if conf_node_idx is None:
+                # A non-configurable node is always quantized with its first candidate
+                candidates_indices = [0]
+            else:
+                candidates_indices = range(len(n.candidates_quantization_cfg))
+                self.conf_node_idx_to_row[conf_node_idx] = row
+            self.rows_conf_node_idx.append(conf_node_idx)
+            self.rows_candidates_ru.append(np.array([node_ru_fn(n, c, fw_info, fw_impl) for c in candidates_indices]))
+
+    def __len__(self) -> int:
+        return len(self.rows_candidates_ru)
+
+    def get_ru_vector(self, mp_cfg: List[int]) -> np.ndarray:
+        """
+        Returns the metric's resource utilization vector for a given configuration.
+
+        Args:
+            mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node).
+
+        Returns: The metric's resource utilization vector (same as calling the metric on the graph with the config).
+
+        """
+        return np.array([self.get_row_ru(row, mp_cfg) for row in range(len(self))])
+
+    def get_row_ru(self, row: int, mp_cfg: List[int]) -> np.ndarray:
+        """
+        Returns a single entry of the metric's resource utilization vector for a given configuration.
+
+        Args:
+            row: Index of the entry in the metric's vector.
+            mp_cfg: A mixed-precision configuration (list of candidates index for each configurable node).
+
+        Returns: The entry's resource utilization value.
+
+        """
+        conf_node_idx = self.rows_conf_node_idx[row]
+        candidate_idx = 0 if conf_node_idx is None else mp_cfg[conf_node_idx]
+        return self.rows_candidates_ru[row][candidate_idx]
+
+    def get_conf_node_row(self, conf_node_idx: int) -> Optional[int]:
+        """
+        Returns the index of the entry that refers to a configurable node in the metric's vector.
+
+        Args:
+            conf_node_idx: The index of a node in the sorted configurable nodes list.
+
+        Returns: The entry's index, or None if the node's candidate doesn't affect the metric.
+
+        """
+        return self.conf_node_idx_to_row.get(conf_node_idx)
+
+    def get_candidate_ru(self, row: int, candidate_idx: int) -> np.ndarray:
+        """
+        Returns the value of an entry of the metric's vector when its node is quantized with a given candidate.
+
+        Args:
+            row: Index of the entry in the metric's vector.
+            candidate_idx: The index of the node's quantization configuration candidate.
+
+        Returns: The entry's resource utilization value.
+
+        """
+        return self.rows_candidates_ru[row][candidate_idx]
+
+
+class MpConfigRuTracker:
+    """
+    Tracks the resource utilization of a mixed-precision configuration while it is modified one node at a time,
+    and computes the resource utilization of configurations that differ from it in a single node's candidate.
+    For targets that have an MpRuTable, the aggregated value is updated from the changed entry alone (sum aggregations
+    keep a running sum, max aggregations keep the two largest entries). Other targets are recomputed using a given
+    fallback function.
+    """
+
+    def __init__(self,
+                 mp_cfg: List[int],
+                 ru_functions: Dict[RUTarget, Tuple[MpRuMetric, MpRuAggregation]],
+                 ru_tables: Dict[RUTarget, Optional[MpRuTable]],
+                 non_conf_ru_dict: Dict[RUTarget, np.ndarray],
+                 compute_target_ru_fn: Callable[[RUTarget, List[int]], float]):
+        """
+        Args:
+            mp_cfg: The initial mixed-precision configuration (list of candidates index for each configurable node).
+            ru_functions: A dictionary with pairs of (MpRuMethod, MpRuAggregationMethod) mapping a RUTarget to
+                a couple of resource utilization metric function and resource utilization aggregation function.
+            ru_tables: A mapping from a RUTarget to the MpRuTable of its metric (None if the target has no table).
+            non_conf_ru_dict: A mapping from a RUTarget to its non-configurable nodes' resource utilization vector.
+            compute_target_ru_fn: A function that computes a target's aggregated resource utilization value for a
+                given configuration, for targets that don't have a table.
+        """
+        self.mp_cfg = list(mp_cfg)
+        self.ru_functions = ru_functions
+        self.ru_tables = ru_tables
+        self.compute_target_ru_fn = compute_target_ru_fn
+
+        self._ru_vectors = {}
+        self._ru_values = {}
+        self._ru_sums = {}
+        self._max_entries = {}
+        for target in ru_functions.keys():
+            table = ru_tables.get(target)
+            if table is None:
+                self._ru_values[target] = compute_target_ru_fn(target, self.mp_cfg)
+                continue
+
+            # The non-configurable nodes' entries are appended after the table's entries
+            ru_vector = [table.get_row_ru(row, self.mp_cfg) for row in range(len(table))]
+            non_conf_ru_vector = non_conf_ru_dict.get(target)
+            if non_conf_ru_vector is not None:
+                ru_vector.extend(non_conf_ru_vector)
+            self._ru_vectors[target] = ru_vector
+            self._ru_values[target] = self.ru_functions[target][1](np.array(ru_vector), False)[0]
+            self._update_aggregation_state(target)
+
+    def get_resource_utilization(self) -> ResourceUtilization:
+        """
+        Returns: A ResourceUtilization object of the current configuration.
+        """
+        return self._to_resource_utilization(self._ru_values)
+
+    def compute_ru_with_candidate(self, conf_node_idx: int, candidate_idx: int) -> ResourceUtilization:
+        """
+        Computes the resource utilization of the current configuration with a single node's candidate replaced.
+
+        Args:
+            conf_node_idx: The index of a node in the sorted configurable nodes list.
+            candidate_idx: The index of the node's quantization configuration candidate.
+
+        Returns: A ResourceUtilization object of the modified configuration.
+
+        """
+        ru_dict = {}
+        for target in self.ru_functions.keys():
+            table = self.ru_tables.get(target)
+            if table is None:
+                updated_cfg = self.mp_cfg.copy()
+                updated_cfg[conf_node_idx] = candidate_idx
+                ru_dict[target] = self.compute_target_ru_fn(target, updated_cfg)
+                continue
+
+            row = table.get_conf_node_row(conf_node_idx)
+            if row is None:
+                ru_dict[target] = self._ru_values[target]
+            else:
+                ru_dict[target] = self._aggregate_with_entry(target, row, table.get_candidate_ru(row, candidate_idx))
+
+        return self._to_resource_utilization(ru_dict)
+
+    def update(self, conf_node_idx: int, candidate_idx: int):
+        """
+        Changes the candidate of a single node in the tracked configuration.
+
+        Args:
+            conf_node_idx: The index of a node in the sorted configurable nodes list.
+            candidate_idx: The index of the node's new quantization configuration candidate.
+
+        """
+        self.mp_cfg[conf_node_idx] = candidate_idx
+        for target in self.ru_functions.keys():
+            table = self.ru_tables.get(target)
+            if table is None:
+                self._ru_values[target] = self.compute_target_ru_fn(target, self.mp_cfg)
+                continue
+
+            row = table.get_conf_node_row(conf_node_idx)
+            if row is not None:
+                new_entry = table.get_candidate_ru(row, candidate_idx)
+                self._ru_values[target] = self._aggregate_with_entry(target, row, new_entry)
+                self._ru_vectors[target][row] = new_entry
+                self._update_aggregation_state(target)
+
+    def _aggregate_with_entry(self, target: RUTarget, row: int, entry: np.ndarray) -> float:
+        """
+        Computes the aggregated resource utilization of a target with a single entry of its vector replaced.
+        """
+        aggregation = self.ru_functions[target][1]
+        ru_vector = self._ru_vectors[target]
+        if aggregation == MpRuAggregation.SUM:
+            return self._ru_sums[target] - ru_vector[row] + entry
+        if aggregation == MpRuAggregation.MAX:
+            return max(self._get_max_excluding(target, row), entry)
+        if aggregation == MpRuAggregation.TOTAL:
+            weights_sum = self._ru_sums[target] - ru_vector[row][0] + entry[0]
+            return weights_sum + max(self._get_max_excluding(target, row), entry[1])
+
+        # Unknown aggregation, aggregate the entire modified vector
+        updated_vector = list(ru_vector)
+        updated_vector[row] = entry
+        return aggregation(np.array(updated_vector), False)[0]
+
+    def _update_aggregation_state(self, target: RUTarget):
+        """
+        Stores the sum of a target's vector (of the weights part, for a total aggregation) and its two largest
+        entries (of the activation part, for a total aggregation) with the index of the largest one, so the
+        aggregation with any single entry replaced can be computed in O(1).
+        A sum aggregation is updated incrementally, the other aggregations' state is rebuilt after each update.
+        """
+        aggregation = self.ru_functions[target][1]
+        ru_vector = self._ru_vectors[target]
+        if aggregation == MpRuAggregation.SUM:
+            self._ru_sums[target] = self._ru_values[target]
+            return
+        elif aggregation == MpRuAggregation.MAX:
+            entries = ru_vector
+        elif aggregation == MpRuAggregation.TOTAL:
+            self._ru_sums[target] = sum([ru[0] for ru in ru_vector])
+            entries = [ru[1] for ru in ru_vector]
+        else:
+            return
+
+        max_row, max_entry, second_max_entry = None, -np.inf, -np.inf
+        for row, entry in enumerate(entries):
+            if entry > max_entry:
+                max_row, max_entry, second_max_entry = row, entry, max_entry
+            elif entry > second_max_entry:
+                second_max_entry = entry
+        self._max_entries[target] = (max_row, max_entry, second_max_entry)
+
+    def _get_max_excluding(self, target: RUTarget, row: int) -> float:
+        """
+        Returns the largest entry of a target's vector (of the activation part, for a total aggregation) other than
+        the given row.
+        """
+        max_row, max_entry, second_max_entry = self._max_entries[target]
+        return second_max_entry if row == max_row else max_entry
+
+    @staticmethod
+    def _to_resource_utilization(ru_dict: Dict[RUTarget, float]) -> ResourceUtilization:
+        """
+        Builds a ResourceUtilization object from a mapping of targets to resource utilization values.
+        """
+        ru = ResourceUtilization()
+        ru.set_resource_utilization_by_target(ru_dict)
+        return ru
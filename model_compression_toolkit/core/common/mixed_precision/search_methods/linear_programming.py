@@ -258,6 +258,10 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
 
     """
 
+    if search_manager.layer_to_metrics_mapping is not None:
+        Logger.info('Using precomputed metrics')
+        return search_manager.layer_to_metrics_mapping
+
     Logger.info('Starting to evaluate metrics')
     layer_to_metrics_mapping = {}
 
@@ -307,5 +311,6 @@ def _build_layer_to_metrics_mapping(search_manager: MixedPrecisionSearchManager,
 
     # Finalize distance metric mapping
     search_manager.finalize_distance_metric(layer_to_metrics_mapping)
+    search_manager.layer_to_metrics_mapping = layer_to_metrics_mapping
 
     return layer_to_metrics_mapping
@@ -125,6 +125,13 @@ class SensitivityEvaluation:
         # Initiating baseline_tensors_list since it is not initiated in SensitivityEvaluationManager init.
         self._init_baseline_tensors_list()
 
+        # Prefix caches of the MP model for incremental sensitivity evaluation (one per images batch).
+        # The caches are built lazily for the baseline configuration of the first metric computation
+        # that changes specific nodes, and are rebuilt only if the baseline configuration changes.
+        self.use_prefix_cache = self.quant_config.incremental_sensitivity_evaluation
+        self.prefix_cache_configuration = None
+        self.prefix_caches_list = []
+
         # Computing Hessian-based scores for weighted average distance metric computation (only if requested),
         # and assigning distance_weighting method accordingly.
         self.interest_points_hessians = None
@@ -176,12 +183,20 @@ class SensitivityEvaluation:
             The sensitivity metric of the MP model for a given configuration.
         """
 
+        # When only specific nodes differ from the baseline configuration, the inference can be resumed
+        # from just before the first changed node, using the prefix cache of the baseline configuration.
+        changed_nodes_names = None
+        if self.use_prefix_cache and node_idx and baseline_mp_configuration is not None:
+            self._update_prefix_caches(baseline_mp_configuration)
+            if self.use_prefix_cache:
+                changed_nodes_names = [self.sorted_configurable_nodes_names[i] for i in node_idx]
+
         # Configure MP model with the given configuration.
         self._configure_bitwidths_model(mp_model_configuration,
                                         node_idx)
 
         # Compute the distance metric
-        ipts_distances, out_pts_distances = self._compute_distance()
+        ipts_distances, out_pts_distances = self._compute_distance(changed_nodes_names)
 
         # Configure MP model back to the same configuration as the baseline model if baseline provided
         if baseline_mp_configuration is not None:
@@ -200,6 +215,34 @@ class SensitivityEvaluation:
                                                                                                     images))
                                       for images in self.images_batches]
 
+    def _update_prefix_caches(self, baseline_mp_configuration: List[int]):
+        """
+        Builds the MP model's prefix caches for all images batches, for the given baseline configuration.
+        The caches are rebuilt only if they were not built for this configuration already.
+        If the framework does not support incremental inference, the incremental evaluation is disabled.
+
+        Args:
+            baseline_mp_configuration: A mixed-precision configuration to build the prefix caches for.
+        """
+        baseline_mp_configuration = list(baseline_mp_configuration)
+        if self.prefix_cache_configuration == baseline_mp_configuration:
+            return
+
+        self._configure_bitwidths_model(baseline_mp_configuration, None)
+        prefix_caches_list = [self.fw_impl.get_sensitivity_eval_prefix_cache(self.model_mp,
+                                                                             images,
+                                                                             self.sorted_configurable_nodes_names)
+                              for images in self.images_batches]
+
+        if any(prefix_cache is None for prefix_cache in prefix_caches_list):
+            Logger.warning("Incremental sensitivity evaluation is not supported for this framework, "
+                           "running a full inference for each mixed-precision configuration.")
+            self.use_prefix_cache = False
+            return
+
+        self.prefix_caches_list = prefix_caches_list
+        self.prefix_cache_configuration = baseline_mp_configuration
+
     def _build_models(self) -> Any:
         """
         Builds two models - an MP model with configurable layers and a baseline, float model.
@@ -329,11 +372,15 @@ class SensitivityEvaluation:
 
         return np.asarray(distance_v)
 
-    def _compute_distance(self) -> Tuple[np.ndarray, np.ndarray]:
+    def _compute_distance(self, changed_nodes_names: List[str] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Computing the interest points distance and the output points distance, and using them to build a
         unified distance vector.
 
+        Args:
+            changed_nodes_names: Names of the nodes that differ from the configuration of the prefix caches.
+                If None, a full inference of the MP model is used.
+
         Returns: A distance vector.
         """
 
@@ -341,9 +388,14 @@ class SensitivityEvaluation:
         out_pts_per_batch_distance = []
 
         # Compute the distance matrix for num_of_images images.
-        for images, baseline_tensors in zip(self.images_batches, self.baseline_tensors_list):
-            # when using model.predict(), it does not use the QuantizeWrapper functionality
-            mp_tensors = self.fw_impl.sensitivity_eval_inference(self.model_mp, images)
+        for batch_idx, (images, baseline_tensors) in enumerate(zip(self.images_batches, self.baseline_tensors_list)):
+            if changed_nodes_names is None:
+                # when using model.predict(), it does not use the QuantizeWrapper functionality
+                mp_tensors = self.fw_impl.sensitivity_eval_inference(self.model_mp, images)
+            else:
+                mp_tensors = self.fw_impl.sensitivity_eval_inference_from_prefix_cache(self.model_mp,
+                                                                                        self.prefix_caches_list[batch_idx],
+                                                                                        changed_nodes_names)
             mp_tensors = self.fw_impl.to_numpy(mp_tensors)
 
             # Compute distance: similarity between the baseline model to the float model
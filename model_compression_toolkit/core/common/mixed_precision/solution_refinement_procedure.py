@@ -54,6 +54,11 @@ def greedy_solution_refinement_procedure(mp_solution: List[int],
     new_solution = mp_solution.copy()
     changed = True
 
+    configurable_nodes = search_manager.graph.get_configurable_sorted_nodes(search_manager.fw_info)
+    # Tracks the resource utilization of the current solution, to compute the resource utilization of a single node's
+    # candidate change without going over the entire graph
+    ru_tracker = search_manager.get_config_ru_tracker(new_solution)
+
     while changed:
         changed = False
         nodes_ru = {}
@@ -64,7 +69,7 @@ def greedy_solution_refinement_procedure(mp_solution: List[int],
                 # layer has max config in the given solution, nothing to optimize
                 continue
 
-            current_node = search_manager.graph.get_configurable_sorted_nodes(search_manager.fw_info)[node_idx]
+            current_node = configurable_nodes[node_idx]
             node_candidates = current_node.candidates_quantization_cfg
 
             # only weights kernel attribute is quantized with weights mixed precision
@@ -73,11 +78,7 @@ def greedy_solution_refinement_procedure(mp_solution: List[int],
             valid_candidates = _get_valid_candidates_indices(node_candidates, new_solution[node_idx], kernel_attr)
 
             # Create a list of ru for the valid candidates.
-            updated_ru = []
-            for valid_idx in valid_candidates:
-                node_updated_ru = search_manager.compute_resource_utilization_for_config(
-                    config=search_manager.replace_config_in_index(new_solution, node_idx, valid_idx))
-                updated_ru.append(node_updated_ru)
+            updated_ru = [ru_tracker.compute_ru_with_candidate(node_idx, valid_idx) for valid_idx in valid_candidates]
 
             # filter out new configs that don't hold the resource utilization restrictions
             node_filtered_ru = [(node_idx, ru) for node_idx, ru in zip(valid_candidates, updated_ru) if
@@ -99,6 +100,7 @@ def greedy_solution_refinement_procedure(mp_solution: List[int],
 
             node_idx_to_upgrade = sorted_by_ru[0][0]
             new_solution[node_idx_to_upgrade] = nodes_next_candidate[node_idx_to_upgrade]
+            ru_tracker.update(node_idx_to_upgrade, new_solution[node_idx_to_upgrade])
             changed = True
 
     if any([mp_solution[i] != new_solution[i] for i in range(len(mp_solution))]):
@@ -15,7 +15,7 @@
 
 
 import numpy as np
-from typing import List
+from typing import List, Any
 
 from networkx.algorithms.dag import topological_sort
 from model_compression_toolkit.core import FrameworkInfo
@@ -152,7 +152,6 @@ class ModelCollector:
 
         """
 
-        # TODO: Thinking about delegating collections to framework
         # TODO: migrate datasets to framework datasets
         tensor_data = self.fw_impl.run_model_inference(self.model, inputs_list)
         for td, sc in zip(tensor_data, self.stats_containers_list):
@@ -162,6 +161,24 @@ class ModelCollector:
                 if len(sc) != len(td):
                     Logger.critical('\'tensor_data\' and \'stats_containers_list\' must have matching lengths') # pragma: no cover
                 for tdi, sci in zip(td, sc):
-                    sci.update_statistics(self.fw_impl.to_numpy(tdi))
+                    self._update_statistics(sci, tdi)
             else:
-                sc.update_statistics(self.fw_impl.to_numpy(td))
+                self._update_statistics(sc, td)
+
+    def _update_statistics(self, stats_collector: BaseStatsCollector, tensor: Any):
+        """
+        Update the statistics of a statistics collector with a new tensor.
+        The tensor is reduced by the framework on its device, so only the reduced statistics
+        (histogram, mean and min/max per channel) are copied to the host.
+
+        Args:
+            stats_collector: Statistics collector to update.
+            tensor: Framework's tensor to consider.
+        """
+        if isinstance(stats_collector, common.StatsCollector):
+            stats_collector.update_reduced_statistics(
+                self.fw_impl.reduce_statistics(tensor,
+                                               channel_axis=stats_collector.out_channel_axis,
+                                               n_bins=stats_collector.hc.n_bins))
+        elif stats_collector.require_collection():
+            stats_collector.update_statistics(self.fw_impl.to_numpy(tensor))  # pragma: no cover
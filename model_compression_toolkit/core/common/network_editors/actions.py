@@ -444,4 +444,5 @@ class ReplaceLayer(BaseAction):
         node.framework_attr = config
         node.weights = weights
         node.layer_class = self.layer_type
+        graph.reindex_node(node)
         Logger.warning(f'Layer {node.name} was replaced but quantization parameters were set by original layer')
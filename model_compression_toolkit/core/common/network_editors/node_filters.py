@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import Any
+from typing import Any, List
 from model_compression_toolkit.core.common.matchers.node_matcher import BaseNodeMatcher
 from model_compression_toolkit.core.common.graph.base_node import BaseNode
 
@@ -44,6 +44,13 @@ class NodeTypeFilter(BaseNodeMatcher):
         if input_object.is_match_type(self.node_type):
             return True
 
+    def get_node_types(self) -> List[Any]:
+        """
+        Returns:
+            A list with the node type the NodeTypeFilter holds.
+        """
+        return [self.node_type]
+
 
 class NodeNameFilter(BaseNodeMatcher):
     """
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import heapq
 
 import numpy as np
 from typing import List, Dict, Tuple
 
+from model_compression_toolkit.constants import FP32_BYTES_PER_PARAMETER
 from model_compression_toolkit.core.common import BaseNode, Graph
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
@@ -73,6 +75,10 @@ class GreedyMaskCalculator:
                                                   fw_info=fw_info,
                                                   fw_impl=fw_impl)
 
+        # Pruning sections by their entry nodes, and sections' entry nodes by their exit nodes.
+        self.pruning_sections = {section.entry_node: section for section in graph.get_pruning_sections(fw_impl)}
+        self.exit_to_entry_nodes = {section.exit_node: entry_node for entry_node, section in self.pruning_sections.items()}
+        self._simd_mask_nodes = list(self.oc_pruning_mask.get_mask_simd().keys())
 
     def get_mask(self) -> Dict[BaseNode, np.ndarray]:
         """
@@ -88,24 +94,29 @@ class GreedyMaskCalculator:
         Computes the pruning mask by iteratively adding SIMD groups to unpruned state
         based on their importance and the target resource utilization.
         """
-        # Iteratively unprune the graph while monitoring the memory footprint.
+        # Compute the memory footprint of the graph once. Then, since unpruning a SIMD group of a node only
+        # changes the number of parameters of the nodes in its pruning section, the memory footprint is updated
+        # by the difference in these nodes' number of parameters.
         current_memory = self.memory_calculator.get_pruned_graph_memory(masks=self.oc_pruning_mask.get_mask(),
                                                                         include_padded_channels=self.tpc.is_simd_padding)
         if current_memory > self.target_resource_utilization.weights_memory:
             Logger.critical(f"Insufficient memory for the target resource utilization: current memory {current_memory}, "
                             f"target memory {self.target_resource_utilization.weights_memory}.")
 
+        candidates_heap = self._init_simd_groups_candidates_heap()
+
         # Greedily unprune groups (by setting their mask to 1) until the memory target is met
         # or all channels unpruned.
-        while current_memory < self.target_resource_utilization.weights_memory and self.oc_pruning_mask.has_pruned_channel():
+        while current_memory < self.target_resource_utilization.weights_memory and len(candidates_heap) > 0:
             # Select the best SIMD group (best means highest score which means most sensitive group)
             # to add based on the scores.
-            node_to_remain, group_to_remain_idx = self._get_most_sensitive_simd_group_candidate()
+            node_to_remain, group_to_remain_idx = self._pop_most_sensitive_simd_group_candidate(candidates_heap)
+            nparams_before = self._get_section_num_params(node_to_remain)
             self.oc_pruning_mask.set_mask_value_for_simd_group(node=node_to_remain,
                                                                group_index=group_to_remain_idx,
                                                                mask_indicator=MaskIndicator.REMAINED)
-            current_memory = self.memory_calculator.get_pruned_graph_memory(masks=self.oc_pruning_mask.get_mask(),
-                                                                            include_padded_channels=self.tpc.is_simd_padding)
+            nparams_after = self._get_section_num_params(node_to_remain)
+            current_memory += (nparams_after - nparams_before) * FP32_BYTES_PER_PARAMETER
 
         # If the target memory is exceeded, revert the last addition.
         if current_memory > self.target_resource_utilization.weights_memory:
@@ -113,35 +124,76 @@ class GreedyMaskCalculator:
                                                                group_index=group_to_remain_idx,
                                                                mask_indicator=MaskIndicator.PRUNED)
 
-
-
-    def _get_most_sensitive_simd_group_candidate(self) -> Tuple[BaseNode, int]:
+    def _init_simd_groups_candidates_heap(self) -> List[Tuple[float, int, int]]:
         """
-        Identifies the most sensitive SIMD group for pruning based on the importance scores.
+        Initializes a heap of the SIMD groups candidates to unprune: the first pruned SIMD group of each
+        prunable node. The heap is ordered by the groups' scores (highest score first), and ties are broken
+        by the nodes' order.
 
         Returns:
-            Tuple[BaseNode, int]: The node and group index of the most sensitive SIMD group.
+            List[Tuple[float, int, int]]: A heap of (negative score, node index, group index) entries.
         """
-
-        best_score = -np.inf
-        best_node = None
-        best_group_idx = -1
-
-        for node, mask in self.oc_pruning_mask.get_mask_simd().items():
+        candidates_heap = []
+        for node_idx, (node, mask) in enumerate(self.oc_pruning_mask.get_mask_simd().items()):
             # Get the index of the first zero in the mask. A zero indicates a prunable channel group.
             group_idx = int(np.argmax(mask == 0))
 
-            # If group_idx is 0, it means there are no zeros in the mask, so this group is not prunable.
+            # If group_idx is 0, it means there are no zeros in the mask, so this node has no prunable group.
             if group_idx != 0:
-                score = self.simd_groups_scores[node][group_idx]
-                # If the score for this group is better than the best score found so far, update the best score.
-                if score > best_score:
-                    best_score = score
-                    best_node = node
-                    best_group_idx = group_idx
+                candidates_heap.append((-self.simd_groups_scores[node][group_idx], node_idx, group_idx))
+        heapq.heapify(candidates_heap)
+        return candidates_heap
 
-        if best_node is None:
-            Logger.error("No prunable SIMD group found.")
+    def _pop_most_sensitive_simd_group_candidate(self, candidates_heap: List[Tuple[float, int, int]]) -> Tuple[BaseNode, int]:
+        """
+        Pops the most sensitive SIMD group from the candidates heap, and pushes the next group of its
+        node (if it has one) as a new candidate.
 
-        return best_node, best_group_idx
+        Args:
+            candidates_heap (List[Tuple[float, int, int]]): A heap of the SIMD groups candidates.
 
+        Returns:
+            Tuple[BaseNode, int]: The node and group index of the most sensitive SIMD group.
+        """
+        _, node_idx, group_idx = heapq.heappop(candidates_heap)
+        node = self._simd_mask_nodes[node_idx]
+        next_group_idx = group_idx + 1
+        if next_group_idx < len(self.oc_pruning_mask.get_mask_simd()[node]):
+            heapq.heappush(candidates_heap, (-self.simd_groups_scores[node][next_group_idx], node_idx, next_group_idx))
+        return node, group_idx
+
+    def _get_section_num_params(self, entry_node: BaseNode) -> float:
+        """
+        Calculates the number of parameters of the nodes whose pruned size depends on the mask of a
+        pruning section's entry node: the entry node, the section's intermediate nodes and its exit node.
+
+        Args:
+            entry_node (BaseNode): Entry node of the pruning section.
+
+        Returns:
+            float: The number of parameters of the section's nodes under the current pruning mask.
+        """
+        masks = self.oc_pruning_mask.get_mask()
+        section = self.pruning_sections[entry_node]
+        entry_node_mask = masks[entry_node]
+        include_padded_channels = self.tpc.is_simd_padding
+
+        # If the entry node is the exit node of another section, its input channels are pruned by
+        # the mask of that section's entry node.
+        prev_entry_node = self.exit_to_entry_nodes.get(entry_node)
+        entry_node_input_mask = None if prev_entry_node is None else masks[prev_entry_node]
+
+        nparams = self.memory_calculator.get_pruned_node_num_params(entry_node,
+                                                                    entry_node_input_mask,
+                                                                    entry_node_mask,
+                                                                    include_padded_channels)
+        for inter_node in section.intermediate_nodes:
+            nparams += self.memory_calculator.get_pruned_node_num_params(inter_node,
+                                                                         entry_node_mask,
+                                                                         entry_node_mask,
+                                                                         include_padded_channels)
+        nparams += self.memory_calculator.get_pruned_node_num_params(section.exit_node,
+                                                                     entry_node_mask,
+                                                                     masks.get(section.exit_node),
+                                                                     include_padded_channels)
+        return nparams
@@ -298,13 +298,14 @@ class MemoryCalculator:
                 Logger.critical(f"Each weight must correspond to exactly one IO (Input/Output) axis; however, the current configuration has '{io_axis}' axes.")
             out_axis, in_axis = io_axis[0]
 
-            # Apply input and output masks to the weight tensor.
+            # Apply input and output masks to the weight tensor's shape.
+            w_shape = list(w.shape)
             if in_axis is not None and input_mask is not None:
-                w = self._prune_tensor(w, input_mask, in_axis)
+                w_shape[in_axis] = self._get_pruned_dim_size(w_shape[in_axis], input_mask)
             if out_axis is not None and output_mask is not None:
-                w = self._prune_tensor(w, output_mask, out_axis)
+                w_shape[out_axis] = self._get_pruned_dim_size(w_shape[out_axis], output_mask)
 
-            total_params += w.size
+            total_params += int(np.prod(w_shape))
 
         # Adjust the total parameter count if padded channels are to be included.
         if output_mask is not None:
@@ -331,26 +332,22 @@ class MemoryCalculator:
 
         return total_params
 
-    def _prune_tensor(self,
-                      w: np.ndarray,
-                      mask: np.ndarray,
-                      axis: int) -> np.ndarray:
+    def _get_pruned_dim_size(self,
+                             dim_size: int,
+                             mask: np.ndarray) -> int:
         """
-        Prunes a tensor along a specified axis using a provided mask.
+        Computes the size of a tensor's dimension after pruning it using a provided mask.
 
         Args:
-            w (np.ndarray): The weight tensor to be pruned.
+            dim_size (int): The size of the dimension to be pruned.
             mask (np.ndarray): The pruning mask to apply.
-            axis (int): The axis along which to apply the pruning mask.
 
         Returns:
-            np.ndarray: The pruned tensor.
+            int: The size of the pruned dimension.
         """
-        mask = np.ones(w.shape[axis], dtype=bool) if mask is None else mask.astype(bool)
-        if w.shape[axis] != len(mask):
-            Logger.critical(f"Expected a mask length of {len(mask)}, but got {w.shape[axis]}. Ensure the mask aligns with the tensor shape.")
-        pruned_w = np.take(w, np.where(mask)[0], axis=axis)
-        return pruned_w
+        if dim_size != len(mask):
+            Logger.critical(f"Expected a mask length of {len(mask)}, but got {dim_size}. Ensure the mask aligns with the tensor shape.")
+        return int(np.count_nonzero(mask))
 
     def get_node_nparams_with_padded_channels(self,
                                               node: BaseNode,
@@ -19,6 +19,8 @@ from model_compression_toolkit.core.common.quantization.bit_width_config import
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
 from model_compression_toolkit.core.common.quantization.debug_config import DebugConfig
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import MixedPrecisionQuantizationConfig
+from model_compression_toolkit.core.common.hessian.hessian_cache_config import HessianCacheConfig
+from model_compression_toolkit.core.common.calibration_data.calibration_data_config import CalibrationDataConfig
 
 
 @dataclass
@@ -32,12 +34,16 @@ class CoreConfig:
             If None, a default MixedPrecisionQuantizationConfig is used.
         bit_width_config (BitWidthConfig): Config for manual bit-width selection.
         debug_config (DebugConfig): Config for debugging and editing the network quantization process.
+        hessian_cache_config (HessianCacheConfig): Config for caching the Hessian-approximation scores.
+        calibration_data_config (CalibrationDataConfig): Config for handling the representative dataset.
     """
 
     quantization_config: QuantizationConfig = field(default_factory=QuantizationConfig)
     mixed_precision_config: MixedPrecisionQuantizationConfig = field(default_factory=MixedPrecisionQuantizationConfig)
     bit_width_config: BitWidthConfig = field(default_factory=BitWidthConfig)
     debug_config: DebugConfig = field(default_factory=DebugConfig)
+    hessian_cache_config: HessianCacheConfig = field(default_factory=HessianCacheConfig)
+    calibration_data_config: CalibrationDataConfig = field(default_factory=CalibrationDataConfig)
 
     @property
     def is_mixed_precision_enabled(self) -> bool:
@@ -64,6 +64,15 @@ class QuantizationConfig:
         The QuantizationConfig instance can then be used in the quantization workflow,
         such as with Keras in the function: :func:~model_compression_toolkit.ptq.keras_post_training_quantization`.
 
+        The weights quantization parameters search can run over several worker processes, by setting
+        qparams_search_num_workers (e.g., to the number of CPU cores). Note that the workers are spawned, so the
+        script that runs the quantization must be import-safe (guarded by ``if __name__ == '__main__':``).
+
+        The candidates of the per-channel weights quantization parameters search can be evaluated with the framework
+        on its working device (e.g., a GPU) instead of numpy, by setting qparams_search_framework_backend to True
+        (supported for PyTorch models). The searches then run in the main process, even if qparams_search_num_workers
+        is set.
+
     """
 
     activation_error_method: QuantizationErrorMethod = QuantizationErrorMethod.MSE
@@ -84,6 +93,8 @@ class QuantizationConfig:
     shift_negative_threshold_recalculation: bool = False
     shift_negative_params_search: bool = False
     concat_threshold_update: bool = False
+    qparams_search_num_workers: int = 1
+    qparams_search_framework_backend: bool = False
 
 
 # Default quantization configuration the library use.
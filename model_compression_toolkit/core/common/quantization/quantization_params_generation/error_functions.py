@@ -12,8 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from copy import deepcopy
-from typing import Tuple, Callable, List, Iterable, Optional
+from typing import Tuple, Callable, List, Iterable, Optional, Any
 import numpy as np
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianMode, HessianScoresGranularity, \
@@ -24,6 +23,8 @@ from model_compression_toolkit.target_platform_capabilities.target_platform impo
 from model_compression_toolkit.constants import FLOAT_32, NUM_QPARAM_HESSIAN_SAMPLES
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import uniform_quantize_tensor, \
     reshape_tensor_for_per_channel_search
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    get_qparams_search_backend
 
 
 def _mse_error_histogram(q_bins: np.ndarray,
@@ -92,60 +93,38 @@ def _lp_error_histogram(q_bins: np.ndarray,
     return np.sum((np.power(np.abs((q_bins - bins)[:-1]), p) * counts)) / np.sum(counts)
 
 
-def _kl_error_function(x: np.ndarray,
-                       range_min: np.ndarray,
-                       range_max: np.ndarray,
-                       n_bins: int = 2048,
-                       n_bits: int = 8) -> np.float32:
+def _get_histograms(x: np.ndarray, n_bins: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Compute the error function between a tensor to its quantized version.
-    The error is computed based on the KL-divergence the distributions have.
-    Number of bins to use when computing the histogram of the float tensor is passed.
-    The threshold and number of bits that were used to quantize the tensor are needed to compute the
-    histograms boundaries and the number of quantized bins.
+    Compute the histogram of each row of a 2D array at once. Each histogram has n_bins equal bins between the
+    minimal and maximal values of its row, as np.histogram computes for a single row.
 
     Args:
-        x: Float tensor.
-        range_min: min bound on the quantization range.
-        range_max: max bound on the quantization range.
-        n_bins: Number of bins for the float histogram.
-        n_bits: Number of bits the quantized tensor was quantized by.
+        x: 2D array to compute the histograms of its rows.
+        n_bins: Number of bins of each histogram.
 
     Returns:
-        The KL-divergence of the float histogram and the quantized histogram of the tensors.
-
+        Bins counts (shape: [rows, n_bins]) and bins values (shape: [rows, n_bins + 1]) of the histograms.
     """
-    if range_max <= range_min:
-        # invalid range
-        return np.inf
-
-    # Compute the float histogram
-    bc, bv = np.histogram(x, bins=n_bins)
+    n_rows = x.shape[0]
+    bins_dtype = x.dtype if np.issubdtype(x.dtype, np.floating) else np.float64
 
-    # If no bins are within the range return infinity.
-    if not _is_range_valid(bv, range_min, range_max):
-        return np.inf
+    first_edge, last_edge = x.min(axis=1), x.max(axis=1)
+    # Expand empty ranges to avoid division by zero.
+    empty_range = first_edge == last_edge
+    first_edge = np.where(empty_range, first_edge - 0.5, first_edge).astype(bins_dtype)
+    last_edge = np.where(empty_range, last_edge + 0.5, last_edge).astype(bins_dtype)
+    bins = np.linspace(first_edge, last_edge, n_bins + 1, axis=1, dtype=bins_dtype)
 
-    # Compute bins values of quantized histogram.
-    # TODO: note that we always do uniform quantization here, since we no longer have threshold, only range
-    q_bins = uniform_quantize_tensor(bv,
-                                     range_min,
-                                     range_max,
-                                     n_bits)
+    # Compute the bin index of each value assuming equal bins, and fix values that are within an ULP of a bin edge.
+    x = x.astype(bins_dtype, copy=False)
+    indices = ((x - first_edge[:, None]) / (last_edge - first_edge)[:, None] * n_bins).astype(np.intp)
+    indices = np.clip(indices, 0, n_bins - 1)
+    indices -= x < np.take_along_axis(bins, indices, axis=1)
+    indices += (x >= np.take_along_axis(bins, indices + 1, axis=1)) & (indices != n_bins - 1)
 
-    # Sum all quantized values to a single bin of that value. Other bins of the same value
-    # are zero.
-    bcq, _ = np.histogram(q_bins,
-                          bins=bv,
-                          weights=np.concatenate([bc.flatten(), np.array([0])]))
-
-    # compute error
-    return _kl_error_histogram(q_bins,
-                               bcq,
-                               bv,
-                               bc,
-                               range_min=range_min,
-                               range_max=range_max)
+    counts = np.bincount((indices + n_bins * np.arange(n_rows)[:, None]).ravel(),
+                         minlength=n_rows * n_bins).reshape(n_rows, n_bins)
+    return counts, bins
 
 
 def _kl_error_function_wrapper(x: np.ndarray,
@@ -159,6 +138,7 @@ def _kl_error_function_wrapper(x: np.ndarray,
     The error is based on the KL-divergence between the distributions.
     The function uses a specified number of bins to compute the histogram of the float tensor.
     It requires the threshold and number of bits used for quantization to determine the histogram's boundaries and the number of quantized bins.
+    The histograms of all channels and their errors are computed at once.
 
     Args:
         x: Float tensor.
@@ -172,14 +152,25 @@ def _kl_error_function_wrapper(x: np.ndarray,
         An array containing the KL-divergence between the float and quantized histograms of the tensor for each channel.
 
     """
+    x = np.reshape(x, (x.shape[0] if per_channel else 1, -1))
+    range_min = np.broadcast_to(np.reshape(range_min, -1), x.shape[0])
+    range_max = np.broadcast_to(np.reshape(range_max, -1), x.shape[0])
+
+    # Compute the float histograms
+    counts, bins = _get_histograms(x, n_bins)
+
+    # Compute bins values of quantized histograms.
+    # TODO: note that we always do uniform quantization here, since we no longer have threshold, only range
+    q_bins = uniform_quantize_tensor(bins,
+                                     range_min[:, None],
+                                     range_max[:, None],
+                                     n_bits)
 
-    error_list = []
-    if per_channel:
-        for j in range(x.shape[0]):  # iterate all channels of the tensor.
-            error_list.append(_kl_error_function(x[j], range_min[j], range_max[j], n_bins=n_bins, n_bits=n_bits))
-    else:
-        error_list.append(_kl_error_function(x, range_min, range_max, n_bins=n_bins, n_bits=n_bits))
-    return np.asarray(error_list)
+    return _kl_error_histograms(q_bins,
+                                bins,
+                                counts,
+                                range_min=range_min,
+                                range_max=range_max)
 
 
 def _kl_error_histogram(q_bins: np.ndarray,
@@ -206,173 +197,255 @@ def _kl_error_histogram(q_bins: np.ndarray,
         KL-divergence score between the two histograms.
     """
 
-    if not _is_range_valid(bins, range_min, range_max):
-        return np.inf
-
-    first_bin_idx, last_bin_idx = _get_bins_indices_from_range(bins, range_min, range_max)
-
-    if first_bin_idx == last_bin_idx:
-        return 0.0
-
-    bins_subset, counts_subset = _get_sliced_histogram(bins,
-                                                       counts,
-                                                       first_bin_idx,
-                                                       last_bin_idx)
-
-    q_bins_subset, q_counts_subset = _get_sliced_histogram(q_bins,
-                                                           q_count,
-                                                           first_bin_idx,
-                                                           last_bin_idx)
-
-    if not counts_subset.any():
-        return np.inf
-
-    counts_acc = _compute_clipped_counts(counts,
-                                         counts_subset,
-                                         first_bin_idx,
-                                         last_bin_idx)
-
-    qbc = np.zeros(q_counts_subset.shape)
-
-    for qbvui in np.unique(q_bins_subset):
-        q_status = q_bins_subset[:-1] == qbvui
-        positive_bins = (counts_subset[q_status] > 0).astype(FLOAT_32)
-        sum_relative = np.sum(counts_subset[q_status]) / (np.sum(positive_bins) + 1e-6)
-        qbc[q_status] = sum_relative * positive_bins
-
-    p_fxp = qbc / np.sum(qbc)
-    p_fxp = _smooth_distribution(p_fxp)
-
-    p_float = counts_acc / np.sum(counts_acc)
-    p_float = _smooth_distribution(p_float)
-
-    return np.sum(p_float * np.log(p_float / p_fxp))
-
-
-def _get_bins_indices_from_range(bins: np.ndarray,
-                                 range_min: np.ndarray,
-                                 range_max: np.ndarray) -> Tuple[int, int]:
-    """
-    For bins and a threshold, compute the first and last bins in between the threshold
-    ranges.
+    return _kl_error_histograms(q_bins[None],
+                                bins[None],
+                                counts[None],
+                                range_min=np.reshape(range_min, 1),
+                                range_max=np.reshape(range_max, 1))[0]
 
-    Args:
-        bins: Bins to look for its first and last bins in the range.
-        range_min: min bound on the quantization range.
-        range_max: max bound on the quantization range.
 
-    Returns:
-        First and last bins indices that are in a range.
+def _kl_error_histograms(q_bins: np.ndarray,
+                         bins: np.ndarray,
+                         counts: np.ndarray,
+                         range_min: np.ndarray,
+                         range_max: np.ndarray) -> np.ndarray:
     """
-    assert range_min < range_max
-    first_bin_idx = max(np.where(bins >= range_min)[0].min() - 1, 0)
-    last_bin_idx = np.where(bins < range_max)[0].max()
-    assert first_bin_idx <= last_bin_idx
-    return first_bin_idx, last_bin_idx
-
+    Compute the KL-divergence between histograms and their quantized versions, for a batch of histograms at once
+    (for example, the histograms of all channels of a tensor, or a histogram quantized by several candidate ranges).
+    For each histogram, the float distribution is the histogram clipped to the quantization range, and the quantized
+    distribution spreads the counts of the bins that are quantized to the same value evenly between its non-empty
+    bins.
 
-def _is_range_valid(bins: np.ndarray, range_min: np.ndarray, range_max: np.ndarray) -> bool:
-    """
-    Check whether there are some bins from a numpy array of bins that are in between
-    a threshold range or not.
     Args:
-        bins: Bins to check.
-        range_min: min bound on the quantization range.
-        range_max: max bound on the quantization range.
+        q_bins: Bins values of the quantized histograms (shape: [batch, n_bins + 1]).
+        bins: Bins values of the histograms (shape: [batch, n_bins + 1]).
+        counts: Bins counts of the histograms (shape: [batch, n_bins]).
+        range_min: min bound on the quantization range of each histogram (shape: [batch]).
+        range_max: max bound on the quantization range of each histogram (shape: [batch]).
 
     Returns:
-        Whether there are bins in the range or not.
+        KL-divergence score of each histogram (shape: [batch]).
     """
-    gt_range_bins = np.where(bins >= range_min)[0]
-    st_range_bins = np.where(bins < range_max)[0]
-    return not (len(gt_range_bins) == 0 or len(st_range_bins) == 0)
-
-
-def _smooth_distribution(probability: np.ndarray) -> np.ndarray:
+    n_hists, n_bins = counts.shape
+    rows = np.arange(n_hists)
+
+    # Find the first and last bins of the range of each histogram.
+    above_min = bins >= range_min[:, None]
+    below_max = bins < range_max[:, None]
+    is_valid = above_min.any(axis=1) & below_max.any(axis=1) & (range_min < range_max)
+    first_bin_idx = np.maximum(np.argmax(above_min, axis=1) - 1, 0)
+    last_bin_idx = n_bins - np.argmax(below_max[:, ::-1], axis=1)
+    in_range = (np.arange(n_bins) >= first_bin_idx[:, None]) & (np.arange(n_bins) < last_bin_idx[:, None])
+    in_range &= (is_valid & (first_bin_idx < last_bin_idx))[:, None]
+
+    counts_subset = np.where(in_range, counts, 0)
+    has_counts = counts_subset.any(axis=1)
+    in_range &= has_counts[:, None]
+
+    # Clip the histograms: counts out of the range are accumulated to the first and last bins of the range.
+    cumulative_counts = np.concatenate([np.zeros((n_hists, 1), dtype=counts.dtype), np.cumsum(counts, axis=1)], axis=1)
+    counts_acc = counts_subset.astype(np.float64)
+    counts_acc[rows, first_bin_idx] += cumulative_counts[rows, first_bin_idx]
+    counts_acc[rows, np.maximum(last_bin_idx - 1, 0)] += cumulative_counts[:, -1] - cumulative_counts[rows, last_bin_idx]
+    counts_acc *= in_range
+
+    # Group the bins of each histogram by their quantized values, and spread the counts of each group evenly between
+    # its non-empty bins. Bins out of the range are empty, so they don't affect the groups they join.
+    order = np.argsort(q_bins[:, :-1], axis=1, kind='stable')
+    sorted_q_bins = np.take_along_axis(q_bins[:, :-1], order, axis=1)
+    new_group = np.ones(sorted_q_bins.shape, dtype=bool)
+    new_group[:, 1:] = sorted_q_bins[:, 1:] != sorted_q_bins[:, :-1]
+    groups = np.empty(order.shape, dtype=np.intp)
+    np.put_along_axis(groups, order, np.cumsum(new_group).reshape(order.shape) - 1, axis=1)
+
+    positive_bins = (counts_subset > 0).astype(FLOAT_32)
+    groups_counts = np.bincount(groups.ravel(), weights=counts_subset.ravel())
+    groups_positive_bins = np.bincount(groups.ravel(), weights=positive_bins.ravel())
+    qbc = (groups_counts / (groups_positive_bins + 1e-6))[groups] * positive_bins
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_fxp = _smooth_distributions(qbc / np.sum(qbc, axis=1, keepdims=True), in_range)
+        p_float = _smooth_distributions(counts_acc / np.sum(counts_acc, axis=1, keepdims=True), in_range)
+        kl = np.sum(np.where(in_range, p_float * np.log(p_float / p_fxp), 0), axis=1)
+
+    return np.where(~is_valid, np.inf, np.where(first_bin_idx == last_bin_idx, 0.0, np.where(has_counts, kl, np.inf)))
+
+
+def _smooth_distributions(probabilities: np.ndarray, mask: np.ndarray) -> np.ndarray:
     """
-    Smooth distribution by decreasing non-zeros counts evenly, and increasing zeros counts
+    Smooth distributions by decreasing non-zeros counts evenly, and increasing zeros counts
     by the total amount that was decreased.
     More info: http://hanj.cs.illinois.edu/cs412/bk3/KL-divergence.pdf
 
     Args:
-        probability: A flatten Numpy array with probabilities.
+        probabilities: Numpy array with a distribution in each row.
+        mask: Boolean array of the entries of each row that belong to its distribution.
 
     Returns:
-        Numpy array of the smoothed distribution.
+        Numpy array of the smoothed distributions.
     """
 
-    # make sure the subtracted value is smaller than all current probabilities.
-    smoothing_term = np.min(probability[probability != 0]) / (2.0 * len(probability))
-    assert smoothing_term > 0
+    nonzeros_indices = (probabilities != 0) & mask
+    zeros_indices = (probabilities == 0) & mask
 
-    # Count the amount of zeros vs. nonzeros in the probability.
-    zeros_indices = (probability == 0).astype(FLOAT_32)
-    nonzeros_indices = (probability != 0).astype(FLOAT_32)
-    total_indices = probability.size
-    nonzero_count = nonzeros_indices.sum()
-    zero_counts = total_indices - nonzero_count
+    # make sure the subtracted value is smaller than all current probabilities.
+    smoothing_term = np.min(np.where(nonzeros_indices, probabilities, np.inf), axis=1) / (2.0 * mask.sum(axis=1))
 
-    assert nonzero_count > 0, 'Can not smooth distribution that is all zeros'
-    reduce_to_fix = smoothing_term * float(zero_counts) / float(nonzero_count)
+    # Count the amount of zeros vs. nonzeros in each distribution.
+    nonzero_count = nonzeros_indices.sum(axis=1)
+    reduce_to_fix = smoothing_term * zeros_indices.sum(axis=1) / nonzero_count
 
     # Compute correction term
-    hist = probability.astype(FLOAT_32)
-    correction_hist = smoothing_term * zeros_indices + (-reduce_to_fix) * nonzeros_indices
-
-    hist += correction_hist  # apply correction
-    assert (hist <= 0).sum() == 0  # Make sure all probabilities are positive
+    hist = probabilities.astype(FLOAT_32)
+    hist += smoothing_term[:, None] * zeros_indices - reduce_to_fix[:, None] * nonzeros_indices
 
     return hist
 
 
-def _compute_clipped_counts(counts: np.ndarray,
-                            counts_subset: np.ndarray,
-                            first_bin_idx: int,
-                            last_bin_idx: int) -> np.ndarray:
+class PerChannelErrorFunction:
     """
-    Compute a clipped Numpy array containing counts. All bins outside the range
-    between first_bin_idx and last_bin_idx are clipped.
-    A clipped histogram is a histogram where all bins that are out a given range
-    are accumulated to the first and last bins of the bins that are in that range.
-
-    Args:
-        counts: Counts array of a histogram.
-        counts_subset: Subset of the counts array of a histogram.
-        first_bin_idx: First bin index of the range.
-        last_bin_idx: Last bin index of the range.
-
-    Returns:
-        A clipped histogram.
+    Error function between the channels of a float tensor and the channels of its quantized version, for a tensor that
+    is reshaped for per-channel search (its channels are the rows, see reshape_tensor_for_per_channel_search).
+    The error of each channel is computed over the last axis with arithmetic operators only. Hence, the quantized
+    tensor can have leading dimensions (e.g., a block of candidates), and the error can be computed on the tensors of
+    any quantization parameters search backend.
     """
 
-    p_float_accumulated_edges = deepcopy(counts_subset)
-    p_float_accumulated_edges[0] += np.sum(counts[:first_bin_idx])
-    p_float_accumulated_edges[-1] += np.sum(counts[last_bin_idx:])
-
-    return p_float_accumulated_edges
+    def __init__(self,
+                 quant_error_method: qc.QuantizationErrorMethod,
+                 p: int = 2,
+                 norm: bool = False,
+                 norm_eps: float = 1e-8,
+                 weights: np.ndarray = None):
+        """
+        Args:
+            quant_error_method: Error method to compute (MSE, MAE, LP or HMSE).
+            p: P-norm to use for calculating the Lp-norm distance (used only with LP error method).
+            norm: Indicates whether to normalize the result of the error function.
+            norm_eps: Epsilon value for error normalization stability.
+            weights: Weights of the elements of each channel, which multiply the quantization error of the elements
+              (used with HMSE error method).
+        """
+        self.quant_error_method = quant_error_method
+        self.p = p
+        self.norm = norm
+        self.norm_eps = norm_eps
+        self.weights = weights
+        # The weights converted to the tensors of the last backend the error was computed on (backend, weights).
+        self._backend_weights = (None, None)
+
+    def _get_weights(self, fxp_tensor: Any) -> Any:
+        """
+        Get the weights of the error function, converted to the tensors type of the quantized tensor's backend.
+
+        Args:
+            fxp_tensor: Quantized tensor.
+
+        Returns:
+            The weights of the error function.
+        """
+        if self.weights is None or isinstance(fxp_tensor, np.ndarray):
+            return self.weights
+        backend = get_qparams_search_backend()
+        if self._backend_weights[0] is not backend:
+            self._backend_weights = (backend, backend.to_tensor(self.weights))
+        return self._backend_weights[1]
+
+    def __call__(self, float_tensor: Any, fxp_tensor: Any, threshold: Any = None) -> Any:
+        """
+        Compute the error of each channel.
+
+        Args:
+            float_tensor: Float tensor (channels, elements).
+            fxp_tensor: Quantized tensor (..., channels, elements).
+            threshold: Quantization params the tensor is quantized by (not used).
+
+        Returns:
+            The error of each channel (with the leading dimensions of the quantized tensor).
+        """
+        if self.quant_error_method == qc.QuantizationErrorMethod.MAE:
+            distance = abs
+        elif self.quant_error_method == qc.QuantizationErrorMethod.LP:
+            distance = lambda t: abs(t) ** self.p
+        else:
+            distance = lambda t: t ** 2
 
+        diff = float_tensor - fxp_tensor
+        weights = self._get_weights(fxp_tensor)
+        if weights is not None:
+            diff = weights * diff
+        error = distance(diff).mean(-1)
 
-def _get_sliced_histogram(bins: np.ndarray,
-                          counts: np.ndarray,
-                          first_bin_idx: int,
-                          last_bin_idx: int) -> Tuple[np.ndarray, np.ndarray]:
-    """
-    Get a subset of a histogram. First and last bins to consider are passed.
+        if self.norm:
+            error = error / (distance(float_tensor).mean(-1) + self.norm_eps)
+        return error
 
-    Args:
-        bins: Histogram's bins to create its subset bins.
-        counts: Histogram's counts to create its subset counts.
-        first_bin_idx: First bin index to consider.
-        last_bin_idx: Last bin index to consider.
 
-    Returns:
-        A sliced histogram.
+class KLHistogramErrorFunction:
+    """
+    KL-divergence error between a histogram and its quantized version, to be used in the threshold optimization
+    search for histogram quantization. Besides the error of a single quantized histogram, the errors of a histogram
+    that is quantized by a batch of candidate ranges can be computed at once (see candidates_errors), so the search
+    can evaluate all the candidates of an iteration with a single call.
     """
 
-    bins_subset = deepcopy(bins[first_bin_idx:last_bin_idx + 1])
-    counts_subset = deepcopy(counts[first_bin_idx:last_bin_idx])
-
-    return bins_subset, counts_subset
+    def __init__(self, quantization_method: QuantizationMethod):
+        """
+        Args:
+            quantization_method: Quantization method the histogram is quantized by.
+        """
+        self.quantization_method = quantization_method
+
+    def __call__(self,
+                 q_bins: np.ndarray,
+                 q_count: np.ndarray,
+                 bins: np.ndarray,
+                 counts: np.ndarray,
+                 threshold: np.ndarray,
+                 _range: np.ndarray) -> np.float32:
+        """
+        Compute the KL-divergence error of a single quantized histogram.
+
+        Args:
+            q_bins: Bins values of the quantized histogram.
+            q_count: Bins counts of the quantized histogram (not used).
+            bins: Bins values of the histogram.
+            counts: Bins counts of the histogram.
+            threshold: Threshold the histogram is quantized by (used for non-uniform quantization).
+            _range: Range the histogram is quantized by (used for uniform quantization).
+
+        Returns:
+            KL-divergence score.
+        """
+        if self.quantization_method == QuantizationMethod.UNIFORM:
+            return _kl_error_histogram(q_bins, q_count, bins, counts, _range[0], _range[1])
+        return _kl_error_histogram(q_bins, q_count, bins, counts, -threshold, threshold)
+
+    @staticmethod
+    def candidates_errors(q_bins: np.ndarray,
+                          bins: np.ndarray,
+                          counts: np.ndarray,
+                          range_min: np.ndarray,
+                          range_max: np.ndarray) -> np.ndarray:
+        """
+        Compute the KL-divergence errors of a histogram that is quantized by a batch of candidate ranges.
+
+        Args:
+            q_bins: Bins values of the histogram quantized by each candidate (shape: [candidates, n_bins + 1]).
+            bins: Bins values of the histogram (shape: [n_bins + 1], or one row per candidate).
+            counts: Bins counts of the histogram (shape: [n_bins]).
+            range_min: min bound of the range of each candidate (shape: [candidates]).
+            range_max: max bound of the range of each candidate (shape: [candidates]).
+
+        Returns:
+            KL-divergence score of each candidate (shape: [candidates]).
+        """
+        n_candidates = q_bins.shape[0]
+        return _kl_error_histograms(q_bins,
+                                    np.broadcast_to(bins, q_bins.shape),
+                                    np.broadcast_to(counts, (n_candidates, counts.shape[-1])),
+                                    np.broadcast_to(range_min, (n_candidates,)),
+                                    np.broadcast_to(range_max, (n_candidates,)))
 
 
 def _compute_hessian_for_hmse(node,
@@ -406,7 +479,8 @@ def _hmse_error_function_wrapper(float_tensor: np.ndarray,
                                  fxp_tensor: np.ndarray,
                                  axis: int,
                                  norm: bool,
-                                 hessian_scores: np.ndarray):
+                                 hessian_scores: np.ndarray,
+                                 channel_axis: int = None):
     """
     This function wraps the HMSE error method to enable using it during parameters selection.
 
@@ -416,14 +490,16 @@ def _hmse_error_function_wrapper(float_tensor: np.ndarray,
         axis: Axis along which the operation has been performed. If not None, then per-channel computation is expected.
         norm: Indicates whether to normalize the result of the error function.
         hessian_scores: A tensor with Hessian-based scores to use for Hessian-based MSE (HMSE) error computation.
+        channel_axis: Output channel axis of the original tensor, along which the tensors were reshaped for a
+            per-channel computation.
 
     Returns: The HMSE error between the float and fixed-point tensors.
 
     """
     if axis is not None:
-        hessian_scores = reshape_tensor_for_per_channel_search(hessian_scores, 0)
+        hessian_scores = reshape_tensor_for_per_channel_search(hessian_scores, 0 if channel_axis is None else channel_axis)
 
-    return compute_mse(float_tensor, fxp_tensor, axis, norm, weights=hessian_scores)
+    return compute_mse(float_tensor, fxp_tensor, norm=norm, axis=axis, weights=hessian_scores)
 
 
 def get_threshold_selection_tensor_error_function(quantization_method: QuantizationMethod,
@@ -435,7 +511,8 @@ def get_threshold_selection_tensor_error_function(quantization_method: Quantizat
                                                   signed: bool = True,
                                                   node=None,
                                                   hessian_info_service: HessianInfoService = None,
-                                                  num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES) -> Callable:
+                                                  num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES,
+                                                  channel_axis: int = None) -> Callable:
     """
     Returns the error function compatible to the provided threshold method,
     to be used in the threshold optimization search for tensor quantization.
@@ -450,6 +527,8 @@ def get_threshold_selection_tensor_error_function(quantization_method: Quantizat
         node: The node for which the quantization error is computed (used only with HMSE error method).
         hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (used only with HMSE error method).
         num_hessian_samples: Number of samples to approximate Hessian-based scores on (used only with HMSE error method).
+        channel_axis: Output channel axis of the tensor, used to match the Hessian-based scores to the channels of
+            the tensor in a per-channel search (used only with HMSE error method).
 
     Returns: a Callable method that calculates the error between a tensor and a quantized tensor.
     """
@@ -486,8 +565,18 @@ def get_threshold_selection_tensor_error_function(quantization_method: Quantizat
                             f"of length {len(node_hessian_scores)}.")
         node_hessian_scores = np.sqrt(np.mean(node_hessian_scores[node.name], axis=0))
 
+        if axis == -1:
+            return PerChannelErrorFunction(quant_error_method, norm=norm,
+                                           weights=reshape_tensor_for_per_channel_search(
+                                               node_hessian_scores, 0 if channel_axis is None else channel_axis))
         return lambda x, y, threshold: _hmse_error_function_wrapper(x, y, norm=norm, axis=axis,
-                                                                    hessian_scores=node_hessian_scores)
+                                                                    hessian_scores=node_hessian_scores,
+                                                                    channel_axis=channel_axis)
+
+    if axis == -1 and quant_error_method in [qc.QuantizationErrorMethod.MSE, qc.QuantizationErrorMethod.MAE,
+                                             qc.QuantizationErrorMethod.LP]:
+        # per-channel error of a tensor that is reshaped for per-channel search
+        return PerChannelErrorFunction(quant_error_method, p=p, norm=norm)
 
     quant_method_error_function_mapping = {
         qc.QuantizationErrorMethod.MSE: lambda x, y, threshold: compute_mse(x, y, norm=norm, axis=axis),
@@ -518,10 +607,7 @@ def get_threshold_selection_histogram_error_function(quantization_method: Quanti
         _mae_error_histogram(q_bins, q_count, bins, counts),
         qc.QuantizationErrorMethod.LP: lambda q_bins, q_count, bins, counts, threshold, _range:
         _lp_error_histogram(q_bins, q_count, bins, counts, p=p),
-        qc.QuantizationErrorMethod.KL:
-            lambda q_bins, q_count, bins, counts, threshold, _range: _kl_error_histogram(q_bins, q_count, bins, counts, _range[0], _range[1])
-            if quantization_method == QuantizationMethod.UNIFORM
-            else _kl_error_histogram(q_bins, q_count, bins, counts, -threshold, threshold)
+        qc.QuantizationErrorMethod.KL: KLHistogramErrorFunction(quantization_method)
     }
 
     return quant_method_error_function_mapping[quant_error_method]
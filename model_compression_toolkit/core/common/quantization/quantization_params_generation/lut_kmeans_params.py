@@ -15,7 +15,6 @@
 
 from typing import Dict, Tuple
 import numpy as np
-from sklearn.cluster import KMeans
 
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from model_compression_toolkit.constants import LUT_VALUES, MIN_THRESHOLD, SCALE_PER_CHANNEL, \
@@ -76,6 +75,8 @@ def lut_kmeans_tensor(tensor_data: np.ndarray,
         n_clusters = n_data_points
     else:
         n_clusters = 2 ** n_bits
+    # Imported here since sklearn is slow to import, and is only needed for LUT quantization.
+    from sklearn.cluster import KMeans
     kmeans = KMeans(n_clusters=n_clusters, n_init=10)
 
     threshold_selection_tensor = symmetric_selection_tensor if is_symmetric else power_of_two_selection_tensor
@@ -146,6 +147,8 @@ def lut_kmeans_histogram(bins: np.ndarray,
     else:
         n_clusters = 2 ** n_bits
 
+    # Imported here since sklearn is slow to import, and is only needed for LUT quantization.
+    from sklearn.cluster import KMeans
     kmeans = KMeans(n_clusters=n_clusters, n_init=10)
     tensor_max = np.max(bins_with_values)
     threshold = max_power_of_two(tensor_max, min_threshold)
@@ -84,7 +84,8 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
                                                                        quant_error_method, p, axis=axis, norm=False,
                                                                        n_bits=n_bits, signed=signed, node=node,
                                                                        hessian_info_service=hessian_info_service,
-                                                                       num_hessian_samples=num_hessian_samples)
+                                                                       num_hessian_samples=num_hessian_samples,
+                                                                       channel_axis=channel_axis)
         threshold, channel_axis = qparams_selection_tensor_search(error_function,
                                                                   tensor_data,
                                                                   n_bits,
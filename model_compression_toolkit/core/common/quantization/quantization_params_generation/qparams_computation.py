@@ -25,8 +25,8 @@ from model_compression_toolkit.core.common.hessian import HessianInfoService, He
     HessianScoresGranularity
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_activations_computation \
     import get_activations_qparams
-from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_weights_computation import \
-    get_weights_qparams
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.weights_qparams_search_scheduler \
+    import WeightsQparamsSearchScheduler
 from model_compression_toolkit.logger import Logger
 
 
@@ -60,7 +60,9 @@ def calculate_quantization_params(graph: Graph,
                                   repr_data_gen_fn: Callable[[], Generator],
                                   nodes: List[BaseNode] = None,
                                   hessian_info_service: HessianInfoService = None,
-                                  num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES):
+                                  num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES,
+                                  num_workers: int = 1,
+                                  use_framework_search_backend: bool = False):
     """
     For a graph, go over its nodes, compute quantization params (for both weights and activations according
     to the given framework info), and create and attach a NodeQuantizationConfig to each node (containing the
@@ -75,6 +77,9 @@ def calculate_quantization_params(graph: Graph,
         nodes: List of nodes to compute their thresholds instead of computing it for all nodes in the graph.
         hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (used only with HMSE error method).
         num_hessian_samples: Number of samples to approximate Hessian-based scores on (used only with HMSE error method).
+        num_workers: Number of worker processes to run the weights quantization parameters searches with.
+        use_framework_search_backend: Whether to evaluate the weights quantization parameters search candidates with
+          the framework's search backend (see FrameworkImplementation.get_qparams_search_backend).
     """
 
     Logger.info(f"\nRunning quantization parameters search. "
@@ -97,7 +102,14 @@ def calculate_quantization_params(graph: Graph,
                                        target_nodes=nodes_for_hmse)
         hessian_info_service.fetch_hessian(request)
 
-    for n in tqdm(nodes_list, "Calculating quantization parameters"):  # iterate only nodes that we should compute their thresholds
+    # Weights quantization parameters searches are scheduled first, such that each unique search is computed once
+    # (also for candidates that share the same attribute configuration), and the searches can run in parallel.
+    search_backend = fw_impl.get_qparams_search_backend() if use_framework_search_backend else None
+    weights_qparams_scheduler = WeightsQparamsSearchScheduler(num_workers=num_workers,
+                                                              hessian_info_service=hessian_info_service,
+                                                              num_hessian_samples=num_hessian_samples,
+                                                              search_backend=search_backend)
+    for n in nodes_list:  # iterate only nodes that we should compute their thresholds
         for candidate_qc in n.candidates_quantization_cfg:
             for attr in n.get_node_weights_attributes():
                 if n.is_weights_quantization_enabled(attr):
@@ -125,16 +137,16 @@ def calculate_quantization_params(graph: Graph,
                             mod_attr_cfg = copy.deepcopy(attr_cfg)
                             mod_attr_cfg.weights_error_method = QuantizationErrorMethod.MSE
 
-                    weights_params, output_channels_axis = get_weights_qparams(n.get_weights_by_keys(attr),
-                                                                               candidate_qc.weights_quantization_cfg,
-                                                                               mod_attr_cfg,
-                                                                               output_channels_axis,
-                                                                               node=n,
-                                                                               hessian_info_service=hessian_info_service,
-                                                                               num_hessian_samples=num_hessian_samples)
-                    attr_cfg.weights_channels_axis = (output_channels_axis, attr_cfg.weights_channels_axis[1])
-                    attr_cfg.set_weights_quantization_param(weights_params)
+                    weights_qparams_scheduler.add_search(node=n,
+                                                         attr=attr,
+                                                         weights_quant_config=candidate_qc.weights_quantization_cfg,
+                                                         attr_quant_config=mod_attr_cfg,
+                                                         target_attr_cfg=attr_cfg,
+                                                         output_channels_axis=output_channels_axis)
+    weights_qparams_scheduler.run()
 
+    for n in tqdm(nodes_list, "Calculating activation quantization parameters"):
+        for candidate_qc in n.candidates_quantization_cfg:
             if n.is_activation_quantization_enabled():
                 # If node's activations should be quantized as well, we compute its activation quantization parameters
                 activation_params = get_activations_qparams(
@@ -24,6 +24,10 @@ from model_compression_toolkit.constants import MIN_THRESHOLD, DEFAULT_TOL, DEFA
     UNIFORM_TENSOR_PER_CHANNEL_N_ITER, UNIFORM_TENSOR_N_ITER, SYMMETRIC_HISTOGRAM_DEC_FREQ, SYMMETRIC_HISTOGRAM_N_ITER, \
     SYMMETRIC_HISTOGRAM_N_INTERVALS, UNIFORM_HISTOGRAM_N_ITER, BOTTOM_FACTOR, UPPER_FACTOR, UNIFORM_TENSOR_N_SAMPLES, \
     UNIFORM_HISTOGRAM_N_SAMPLES, DEC_RANGE_UPPER, DEC_RANGE_BOTTOM
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
+    PerChannelErrorFunction, KLHistogramErrorFunction
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    get_qparams_search_backend, DEFAULT_QPARAMS_SEARCH_BACKEND
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor, \
     reshape_tensor_for_per_channel_search, uniform_quantize_tensor, get_output_shape
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, \
@@ -71,28 +75,23 @@ def qparams_selection_tensor_search(error_function: Callable,
         tensor_max = get_tensor_max(tensor_data, per_channel, _axis, n_bits)
         threshold = 2 * max_power_of_two(tensor_max, min_threshold)
 
-        # Rearrange the tensor such that each sub-tensor is flattened, and we iterate over each
-        # one of them when searching for the threshold.
+        # Each candidate threshold is half of the previous candidate threshold. The candidate with the minimal error
+        # is selected.
         if per_channel:
+            # Rearrange the tensor such that each sub-tensor is flattened, and evaluate all the candidates of all
+            # channels in blocks.
             tensor_data_r = reshape_tensor_for_per_channel_search(tensor_data, _axis)
-
-        error_list = []  # init an empty error list
-        # On each iteration a new constrained threshold which equal to half of the previous tested threshold
-        # is used for quantizing the tensor and computing the error. The error is appended to an error list, which
-        # eventually used to select the threshold with the minimal error.
-        for i in range(n_iter):
-            if per_channel:
-                threshold_hat = (threshold / (2 ** i)).reshape([-1, 1])
-                qt = quantize_tensor(tensor_data_r, threshold_hat, n_bits, signed)
-                per_channel_error = _error_function_wrapper(error_function, tensor_data_r, qt, threshold_hat)
-                error_list.append(per_channel_error)
-            else:  # quantize per-tensor
+            candidates = threshold.reshape([1, -1, 1]) / np.power(2, np.arange(n_iter)).reshape([-1, 1, 1])
+            err_mat = _get_per_channel_candidates_losses(error_function, tensor_data_r, candidates, n_bits,
+                                                         signed).T
+        else:  # quantize per-tensor
+            error_list = []
+            for i in range(n_iter):
                 qt = quantize_tensor(tensor_data, threshold / (2 ** i), n_bits, signed)
-                error = error_function(qt, tensor_data, threshold=threshold / (2 ** i))
-                error_list.append(error)
+                error_list.append(error_function(qt, tensor_data, threshold=threshold / (2 ** i)))
+            err_mat = np.stack(error_list, axis=-1)
 
         # Take the index of the minimal error, and use it compute the threshold which yielded it.
-        err_mat = np.stack(error_list, axis=-1)
         i = np.argmin(err_mat, axis=-1)
         th_list.append(np.maximum(np.reshape(threshold.flatten() / np.power(2, i), output_shape), min_threshold))
         total_error_list.append(err_mat.min(axis=-1).mean())
@@ -142,14 +141,19 @@ def qparams_selection_histogram_search(error_function: Callable,
     error_list = []
     threshold_list = threshold / np.power(2, np.linspace(0, n_iter - 1, n_iter))
 
-    # On each iteration a new constrained threshold which equal to half of the previous tested threshold
-    # is used for quantizing the histogram and computing the error. The error is appended to an error list, which
-    # eventually used to select the threshold with the minimal error.
-    for threshold in threshold_list:
-        q_bins = quantize_tensor(bins, threshold, n_bits, signed)  # compute the quantized values of the bins.
-        error = qparams_selection_histogram_search_error_function(error_function, bins, q_bins, counts,
-                                                                  threshold=threshold)
-        error_list.append(error)
+    if isinstance(error_function, KLHistogramErrorFunction):
+        # Quantize the histogram by all the candidate thresholds at once, and compute their errors in a single batch.
+        q_bins = quantize_tensor(bins, threshold_list.reshape([-1, 1]), n_bits, signed)
+        error_list = error_function.candidates_errors(q_bins, bins, counts, -threshold_list, threshold_list)
+    else:
+        # On each iteration a new constrained threshold which equal to half of the previous tested threshold
+        # is used for quantizing the histogram and computing the error. The error is appended to an error list, which
+        # eventually used to select the threshold with the minimal error.
+        for threshold in threshold_list:
+            q_bins = quantize_tensor(bins, threshold, n_bits, signed)  # compute the quantized values of the bins.
+            error = qparams_selection_histogram_search_error_function(error_function, bins, q_bins, counts,
+                                                                      threshold=threshold)
+            error_list.append(error)
 
     # Return the threshold with the minimal error.
     return np.maximum(threshold_list[np.argmin(error_list)], min_threshold), signed
@@ -167,7 +171,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
                                              dec_factor: Tuple = DEFAULT_DEC_FACTOR,
                                              dec_freq: int = SYMMETRIC_TENSOR_DEC_FREQ,
                                              tolerance: float = DEFAULT_TOL,
-                                             per_channel=False) -> Dict[str, np.ndarray]:
+                                             per_channel=False,
+                                             max_block_elements: int = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal threshold to for symmetric tensor quantization.
     The search starts with the no-clipping threshold the tensor has, and continues with
@@ -191,6 +196,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         dec_freq: Frequency for decreasing the multiplication factors.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        max_block_elements: Maximal number of elements of a block of quantized candidates that are evaluated at
+          once in a per-channel search. If None, the maximal block size of the backend is used.
 
     Returns:
         Dictionary with optimized threshold for symmetric tensor quantization (best obtained during the search),
@@ -214,7 +221,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         prev_best_loss = best['loss']
         new_range_bounds = curr_threshold * range_scale
 
-        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel)
+        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel,
+                                                max_block_elements)
         curr_threshold = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -243,7 +251,8 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
                                            n_bits: int,
                                            n_iter: int = UNIFORM_TENSOR_N_ITER,
                                            tolerance: float = DEFAULT_TOL,
-                                           per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                           per_channel: bool = False,
+                                           max_block_elements: int = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal quantization range for uniform tensor quantization.
     The search starts with the no-clipping range the tensor has, and continues with
@@ -259,6 +268,8 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
         n_iter: Number of searching iterations.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        max_block_elements: Maximal number of elements of a block of quantized candidates that are evaluated at
+          once in a per-channel search. If None, the maximal block size of the backend is used.
 
     Returns:
         Dictionary with optimized quantization range for uniform tensor quantization (best obtained during the search),
@@ -285,7 +296,8 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
     for n in range(n_iter):
         prev_best_loss = best['loss']
         curr_res = search_dynamic_range(base_range=curr_range_bounds, scalers=scalers, x=x, loss_fn=loss_fn,
-                                        n_bits=n_bits, per_channel=per_channel)
+                                        n_bits=n_bits, per_channel=per_channel,
+                                        max_block_elements=max_block_elements)
         curr_range_bounds = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -307,7 +319,8 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
                                  n_bits: int,
                                  signed: bool = True,
                                  n_intervals: int = 100,
-                                 per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                 per_channel: bool = False,
+                                 max_block_elements: int = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of n_intervals thresholds, taken from evenly-space intervales from the constructed range.
 
@@ -319,28 +332,19 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
         signed: Whether quantization range is signed or not.
         n_intervals: Number of locations to examine each iteration from the given range.
         per_channel: Whether the search is done per-channel or per-tensor.
+        max_block_elements: Maximal number of elements of a block of quantized candidates that are evaluated at
+          once in a per-channel search. If None, the maximal block size of the backend is used.
 
     Returns: Dictionary with best obtained threshold and the threshold's matching loss.
 
     """
     if per_channel:
-        # search per-channel
+        # search per-channel: the i'th threshold of each channel is the channel's i'th candidate
         intervals = np.linspace(start=range_bounds[:, 0], stop=range_bounds[:, 1], num=n_intervals, dtype=float)
-        # just the first interval values
-        first_interval_thresholds = intervals[0, :].reshape([-1, 1])
-        best = {"param": first_interval_thresholds,
-                "loss": _error_function_wrapper(loss_fn, x,
-                                                quantize_tensor(x, first_interval_thresholds, n_bits, signed),
-                                                first_interval_thresholds).reshape([-1, 1])}
-        for interval in range(1, n_intervals):
-            interval_thresholds = intervals[interval, :].reshape([-1, 1])  # takes the i'th threshold for each channel
-            interval_losses = _error_function_wrapper(loss_fn, x, quantize_tensor(x, interval_thresholds, n_bits, signed),
-                                                      interval_thresholds).reshape([-1, 1])
-
-            imp_losses = (interval_losses < best['loss']).reshape([-1, 1])
-
-            best = {"param": interval_thresholds * imp_losses + best['param'] * np.logical_not(imp_losses),
-                    "loss": interval_losses * imp_losses + best['loss'] * np.logical_not(imp_losses)}
+        candidates = intervals.reshape([n_intervals, -1, 1])
+        best = _get_per_channel_best_candidates(candidates,
+                                                _get_per_channel_candidates_losses(loss_fn, x, candidates, n_bits,
+                                                                                   signed, max_block_elements))
     else:
         # search per-tensor
         intervals = np.linspace(start=range_bounds[0], stop=range_bounds[1], num=n_intervals, dtype=float)
@@ -351,7 +355,7 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
 
 
 def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndarray, loss_fn: Callable, n_bits: int,
-                         per_channel: bool = False) -> Dict[str, np.ndarray]:
+                         per_channel: bool = False, max_block_elements: int = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of constructed quantization ranges.
 
@@ -362,6 +366,8 @@ def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndar
         loss_fn: Function to compute the error between the original and quantized tensors.
         n_bits: Number of bits to quantize the
         per_channel: Whether the search is done per-channel or per-tensor.
+        max_block_elements: Maximal number of elements of a block of quantized candidates that are evaluated at
+          once in a per-channel search. If None, the maximal block size of the backend is used.
 
     Returns: Dictionary with best obtained quantization range and the threshold's matching loss.
 
@@ -370,25 +376,11 @@ def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndar
         # search per-channel
         ranges = np.stack([np.multiply.outer(base_range[:, 0], scalers[:, 0]),
                            np.multiply.outer(base_range[:, 1], scalers[:, 1])], axis=2)
-        first_ranges_set = ranges[:, 0, :]
-        best = {"param": first_ranges_set,
-                "loss": _error_function_wrapper(loss_fn, x,
-                                                uniform_quantize_tensor(x,
-                                                                        first_ranges_set[:, 0].reshape([-1, 1]),
-                                                                        first_ranges_set[:, 1].reshape([-1, 1]),
-                                                                        n_bits),
-                                                first_ranges_set).reshape([-1, 1])}
-        for range_idx in range(1, ranges.shape[1]):  # iterate over sets of per-channel ranges
-            ranges_set = ranges[:, range_idx, :]  # takes the i'th range for each channel
-            ranges_losses = _error_function_wrapper(loss_fn, x,
-                                                    uniform_quantize_tensor(x,
-                                                                            ranges_set[:, 0].reshape([-1, 1]),
-                                                                            ranges_set[:, 1].reshape([-1, 1]),
-                                                                            n_bits),
-                                                    ranges_set).reshape([-1, 1])
-            imp_losses = ranges_losses < best['loss']
-            best = {"param": ranges_set * imp_losses + best['param'] * np.logical_not(imp_losses),
-                    "loss": ranges_losses * imp_losses + best['loss'] * np.logical_not(imp_losses)}
+        # the i'th range of each channel is the channel's i'th candidate
+        candidates = np.transpose(ranges, [1, 0, 2])
+        best = _get_per_channel_best_candidates(candidates,
+                                                _get_per_channel_candidates_losses(loss_fn, x, candidates, n_bits,
+                                                                                   max_block_elements=max_block_elements))
     else:
         # search per-tensor
         ranges = base_range * scalers
@@ -577,7 +569,7 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
     return max(min_threshold, res['param']), signed
 
 
-def kl_qparams_symmetric_selection_histogram_search(error_function: Callable,
+def kl_qparams_symmetric_selection_histogram_search(error_function: KLHistogramErrorFunction,
                                                     tensor_max: np.ndarray,
                                                     bins: np.ndarray,
                                                     counts: np.ndarray,
@@ -589,10 +581,11 @@ def kl_qparams_symmetric_selection_histogram_search(error_function: Callable,
     Search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a histogram,
     with KL-Divergence loss function (needs a separate search function
     since the error function needs additional arguments that are constructed from the input)
-    Using the iterative optimizer method for the search.
+    Using the iterative optimizer method for the search. The threshold candidates of each iteration are evaluated
+    in a single batch.
 
     Args:
-        error_function: Function to compute the error between the original and quantized histograms.
+        error_function: KL error function to compute the errors between the original and quantized histograms.
         tensor_max: The max value of the tensor.
         bins: Bins of the histogram to search_methods for an optimal threshold.
         counts: Number of elements in the bins to search_methods for a threshold.
@@ -605,24 +598,22 @@ def kl_qparams_symmetric_selection_histogram_search(error_function: Callable,
 
     """
     signed = np.any(bins[:-1][counts != 0] < 0) if is_signed is None else is_signed  # Whether histogram contains negative values or not.
-    res = qparams_symmetric_iterative_minimization(x0=get_init_threshold(min_threshold, tensor_max),
-                                                   x=bins,
+    # The histogram is searched as a tensor with a single channel, so all the candidates of an iteration are
+    # quantized together and their errors are computed with a single call.
+    res = qparams_symmetric_iterative_minimization(x0=np.asarray([get_init_threshold(min_threshold, tensor_max)]),
+                                                   x=bins.reshape([1, -1]),
                                                    loss_fn=lambda x, q_x, t:
-                                                   kl_qparams_selection_histogram_search_error_function(error_function,
-                                                                                                        bins,
-                                                                                                        q_x,
-                                                                                                        counts,
-                                                                                                        min_max_range=np.array(
-                                                                                                            [0,
-                                                                                                             t]) if not signed else np.array(
-                                                                                                            [-t, t])),
+                                                   error_function.candidates_errors(q_x, x, counts,
+                                                                                    -t.flatten() if signed else 0,
+                                                                                    t.flatten()),
                                                    n_bits=n_bits,
                                                    signed=signed,
                                                    n_intervals=SYMMETRIC_HISTOGRAM_N_INTERVALS,
                                                    n_iter=SYMMETRIC_HISTOGRAM_N_ITER,
                                                    dec_freq=SYMMETRIC_HISTOGRAM_DEC_FREQ,
-                                                   per_channel=False)
-    return max(min_threshold, res['param']), signed
+                                                   per_channel=True,
+                                                   max_block_elements=SYMMETRIC_HISTOGRAM_N_INTERVALS * bins.size)
+    return max(min_threshold, res['param'].item()), signed
 
 
 def qparams_uniform_selection_histogram_search(error_function: Callable,
@@ -651,6 +642,21 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
     alpha = np.linspace(BOTTOM_FACTOR, UPPER_FACTOR, UNIFORM_HISTOGRAM_N_SAMPLES)
     beta = np.linspace(BOTTOM_FACTOR, UPPER_FACTOR, UNIFORM_HISTOGRAM_N_SAMPLES)
     scalers = np.asarray(list(itertools.product(alpha, beta)))
+    if isinstance(error_function, KLHistogramErrorFunction):
+        # The histogram is searched as a tensor with a single channel, so all the candidates of an iteration are
+        # quantized together and their errors are computed with a single call.
+        res = iterative_uniform_dynamic_range_search(x0=np.reshape(tensor_min_max, [1, 2]),
+                                                     x=bins.reshape([1, -1]),
+                                                     scalers=scalers,
+                                                     loss_fn=lambda x, q_x, mm:
+                                                     error_function.candidates_errors(q_x, x, counts, mm[:, 0],
+                                                                                      mm[:, 1]),
+                                                     n_bits=n_bits,
+                                                     n_iter=UNIFORM_HISTOGRAM_N_ITER,
+                                                     per_channel=True,
+                                                     max_block_elements=len(scalers) * bins.size)
+        return res['param'][0]
+
     res = iterative_uniform_dynamic_range_search(x0=tensor_min_max,
                                                  x=bins,
                                                  scalers=scalers,
@@ -695,30 +701,6 @@ def qparams_selection_histogram_search_error_function(error_function: Callable,
     return error
 
 
-def kl_qparams_selection_histogram_search_error_function(error_function: Callable,
-                                                         bins: np.ndarray,
-                                                         q_bins: np.ndarray,
-                                                         counts: np.ndarray,
-                                                         min_max_range: np.ndarray):
-    """
-    Computes the error according to the KL-divergence the distributions of the given histogram.
-    The error value is used in the threshold optimization process, for symmetric quantization.
-    Args:
-        error_function: Function to compute the error between the original and quantized histograms.
-        bins: Bins values of the histogram.
-        q_bins: Quantized bins values of the histogram.
-        counts: Bins counts of the original histogram.
-        min_max_range: Quantization range to quantize histogram by.
-
-    Returns: the error between the original and quantized histogram.
-
-    """
-    # compute the number of elements between quantized bin values.
-    q_count, _ = np.histogram(q_bins, bins=bins, weights=np.concatenate([counts.flatten(), np.asarray([0])]))
-    error = error_function(q_bins, q_count, bins, counts, range_min=min_max_range[0], range_max=min_max_range[1])
-    return error
-
-
 def get_init_threshold(min_threshold: float, tensor_max: np.ndarray, per_channel: bool = False) -> np.ndarray:
     """
     Gets an initial value for the threshold optimization process.
@@ -739,6 +721,76 @@ def get_init_threshold(min_threshold: float, tensor_max: np.ndarray, per_channel
     return max(min_threshold, tensor_max)
 
 
+def _get_per_channel_candidates_losses(loss_fn: Callable,
+                                       x: np.ndarray,
+                                       candidates: np.ndarray,
+                                       n_bits: int,
+                                       signed: bool = True,
+                                       max_block_elements: int = None) -> np.ndarray:
+    """
+    Compute the loss of each channel for each candidate of per-channel quantization parameters. Instead of
+    quantizing the tensor with one candidate at a time, a block of candidates is quantized and evaluated at once,
+    where the number of elements of a block of quantized candidates is bounded by max_block_elements.
+    Error functions that compute the error with arithmetic operators only (PerChannelErrorFunction) are evaluated
+    with the active quantization parameters search backend. Other error functions are evaluated with numpy, on the
+    channels of all candidates of a block stacked together.
+
+    Args:
+        loss_fn: Function to compute the error between the original and quantized tensors, per channel.
+        x: Numpy array with tensor's content, reshaped for per-channel search.
+        candidates: Thresholds to quantize the tensor with (shape: [candidates, channels, 1]), or ranges for
+          uniform quantization (shape: [candidates, channels, 2]).
+        n_bits: Number of bits to quantize the tensor.
+        signed: Whether quantization range is signed or not (used only for thresholds).
+        max_block_elements: Maximal number of elements of a block of quantized candidates. If None, the maximal
+          block size of the backend is used.
+
+    Returns:
+        The losses of the candidates (shape: [candidates, channels]).
+    """
+    n_candidates, n_channels = candidates.shape[:2]
+    is_backend_loss = isinstance(loss_fn, PerChannelErrorFunction)
+    backend = get_qparams_search_backend() if is_backend_loss else DEFAULT_QPARAMS_SEARCH_BACKEND
+    block_size = max(1, (max_block_elements or backend.max_block_elements) // max(x.size, 1))
+
+    x_tensor = backend.to_tensor(x)
+    losses = []
+    for i in range(0, n_candidates, block_size):
+        block = candidates[i:i + block_size]
+        block_tensor = backend.to_tensor(block)
+        if block.shape[-1] == 1:
+            q_x = backend.quantize(x_tensor, block_tensor, n_bits, signed)
+        else:
+            q_x = backend.uniform_quantize(x_tensor, block_tensor[..., :1], block_tensor[..., 1:], n_bits)
+
+        if is_backend_loss:
+            losses.append(backend.to_numpy(loss_fn(x_tensor, q_x, block_tensor)))
+        else:
+            q_x = q_x.reshape([-1, x.shape[-1]])
+            block_losses = loss_fn(np.broadcast_to(x, (len(block),) + x.shape).reshape(q_x.shape), q_x,
+                                   block.reshape([q_x.shape[0], -1]))
+            losses.append(np.reshape(block_losses, [len(block), n_channels]))
+
+    return np.concatenate(losses)
+
+
+def _get_per_channel_best_candidates(candidates: np.ndarray, losses: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Select the candidate with the minimal loss for each channel (the first one, if several candidates have the
+    minimal loss).
+
+    Args:
+        candidates: Per-channel candidates (shape: [candidates, channels, params]).
+        losses: Losses of the candidates (shape: [candidates, channels]).
+
+    Returns: Dictionary with the best candidate of each channel and its matching loss.
+
+    """
+    best_idx = np.argmin(np.where(np.isnan(losses), np.inf, losses), axis=0)
+    channels = np.arange(losses.shape[1])
+    return {"param": candidates[best_idx, channels], "loss": losses[best_idx, channels].reshape([-1, 1])}
+
+
 def _error_function_wrapper(error_function: Callable,
                             float_tensor: np.ndarray,
                             q_tensor: np.ndarray,
@@ -0,0 +1,118 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import threading
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+
+from model_compression_toolkit.constants import QPARAMS_SEARCH_BLOCK_ELEMENTS
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor, \
+    uniform_quantize_tensor
+
+
+class QparamsSearchBackend:
+    """
+    Backend to evaluate blocks of quantization parameters candidates with, during the per-channel quantization
+    parameters search. The default backend uses numpy. A framework can implement a backend that evaluates the
+    candidates with its own tensors (for example, on a GPU).
+    """
+
+    # Maximal number of elements of a block of quantized candidates that are evaluated at once.
+    max_block_elements = QPARAMS_SEARCH_BLOCK_ELEMENTS
+
+    def to_tensor(self, x: np.ndarray) -> Any:
+        """
+        Convert a numpy array to a tensor of the backend.
+
+        Args:
+            x: Numpy array to convert.
+
+        Returns:
+            A tensor of the backend.
+        """
+        return x
+
+    def to_numpy(self, x: Any) -> np.ndarray:
+        """
+        Convert a tensor of the backend to a numpy array.
+
+        Args:
+            x: Tensor to convert.
+
+        Returns:
+            A numpy array.
+        """
+        return x
+
+    def quantize(self, x: Any, threshold: Any, n_bits: int, signed: bool) -> Any:
+        """
+        Quantize a tensor with a threshold (see quantize_tensor).
+
+        Args:
+            x: Tensor to quantize.
+            threshold: Threshold for quantization ranges.
+            n_bits: Number of bits to quantize the tensor.
+            signed: Whether the quantization range is signed or not.
+
+        Returns:
+            Quantized tensor.
+        """
+        return quantize_tensor(x, threshold, n_bits, signed)
+
+    def uniform_quantize(self, x: Any, range_min: Any, range_max: Any, n_bits: int) -> Any:
+        """
+        Quantize a tensor with a quantization range (see uniform_quantize_tensor).
+
+        Args:
+            x: Tensor to quantize.
+            range_min: Minimum bound of the quantization range.
+            range_max: Maximum bound of the quantization range.
+            n_bits: Number of bits to quantize the tensor.
+
+        Returns:
+            Quantized tensor.
+        """
+        return uniform_quantize_tensor(x, range_min, range_max, n_bits)
+
+
+DEFAULT_QPARAMS_SEARCH_BACKEND = QparamsSearchBackend()
+
+# The backend that is used by the quantization parameters searches, per thread (so a backend that is set for the
+# searches of one thread is not used by the searches that run concurrently in other threads).
+_active_backend = threading.local()
+
+
+def get_qparams_search_backend() -> QparamsSearchBackend:
+    """
+    Returns: The backend that is used by the quantization parameters searches of the current thread.
+    """
+    return getattr(_active_backend, 'backend', DEFAULT_QPARAMS_SEARCH_BACKEND)
+
+
+@contextmanager
+def qparams_search_backend(backend: QparamsSearchBackend = None):
+    """
+    Context manager to run the quantization parameters searches of the current thread with a backend.
+
+    Args:
+        backend: Backend to evaluate the candidates with. If None, the default numpy backend is used.
+    """
+    prev_backend = get_qparams_search_backend()
+    _active_backend.backend = backend or DEFAULT_QPARAMS_SEARCH_BACKEND
+    try:
+        yield _active_backend.backend
+    finally:
+        _active_backend.backend = prev_backend
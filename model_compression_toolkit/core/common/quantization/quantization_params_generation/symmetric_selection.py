@@ -19,7 +19,7 @@ import model_compression_toolkit.core.common.quantization.quantization_config as
 from model_compression_toolkit.constants import MIN_THRESHOLD, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES, SIGNED
 from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, _kl_error_histogram
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_symmetric_selection_tensor_search, \
     qparams_symmetric_selection_histogram_search, kl_qparams_symmetric_selection_histogram_search
@@ -86,7 +86,8 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
                                                                        p, axis=axis, norm=False, n_bits=n_bits,
                                                                        signed=signed, node=node,
                                                                        hessian_info_service=hessian_info_service,
-                                                                       num_hessian_samples=num_hessian_samples)
+                                                                       num_hessian_samples=num_hessian_samples,
+                                                                       channel_axis=channel_axis)
         threshold, channel_axis = qparams_symmetric_selection_tensor_search(error_function,
                                                                             tensor_data,
                                                                             n_bits,
@@ -134,8 +135,9 @@ def symmetric_selection_histogram(bins: np.ndarray,
         # Resolve is_signed in case it is None.
         signed = (bins<0).any() if is_signed is None else is_signed
     elif quant_error_method == qc.QuantizationErrorMethod.KL:
-        # search for KL error is separated because the error method signature is different from the other error methods.
-        threshold, signed = kl_qparams_symmetric_selection_histogram_search(_kl_error_histogram,
+        # search for KL error is separated because the candidates of each iteration are evaluated in a single batch.
+        error_function = get_threshold_selection_histogram_error_function(QuantizationMethod.SYMMETRIC, quant_error_method, p)
+        threshold, signed = kl_qparams_symmetric_selection_histogram_search(error_function,
                                                                             tensor_max,
                                                                             bins,
                                                                             counts,
@@ -84,7 +84,8 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
         error_function = get_threshold_selection_tensor_error_function(QuantizationMethod.UNIFORM, quant_error_method,
                                                                        p, axis=axis, norm=False, node=node,
                                                                        hessian_info_service=hessian_info_service,
-                                                                       num_hessian_samples=num_hessian_samples)
+                                                                       num_hessian_samples=num_hessian_samples,
+                                                                       channel_axis=channel_axis)
         mm, channel_axis = qparams_uniform_selection_tensor_search(error_function,
                                                                    tensor_data,
                                                                    n_bits,
@@ -0,0 +1,256 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Dict, Any, Tuple, List, Callable, Hashable, NamedTuple
+
+import numpy as np
+from tqdm import tqdm
+
+from model_compression_toolkit.constants import NUM_QPARAM_HESSIAN_SAMPLES
+from model_compression_toolkit.core import QuantizationErrorMethod
+from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.core.common.hessian import HessianInfoService
+from model_compression_toolkit.core.common.quantization.node_quantization_config import \
+    NodeWeightsQuantizationConfig, WeightsAttrQuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_weights_computation \
+    import get_weights_qparams
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QparamsSearchBackend, qparams_search_backend
+from model_compression_toolkit.logger import Logger
+
+
+class WeightsQparamsSearch(NamedTuple):
+    """
+    A unique weights quantization parameters search: a weights attribute tensor and the configuration
+    to search its quantization parameters with.
+    """
+    node: BaseNode
+    attr: str
+    weights_quant_config: NodeWeightsQuantizationConfig
+    attr_quant_config: WeightsAttrQuantizationConfig
+    output_channels_axis: int
+
+
+def _get_fn_key(fn: Callable) -> Hashable:
+    """
+    Get a hashable key of a function, such that equivalent partial functions have the same key.
+
+    Args:
+        fn: Function to get its key.
+
+    Returns:
+        The function's key.
+    """
+    if isinstance(fn, partial):
+        return fn.func, fn.args, tuple(sorted(fn.keywords.items()))
+    return fn
+
+
+def _search_weights_qparams_in_worker(shm_name: str,
+                                      shape: Tuple[int, ...],
+                                      dtype: np.dtype,
+                                      weights_quant_config: NodeWeightsQuantizationConfig,
+                                      attr_quant_config: WeightsAttrQuantizationConfig,
+                                      output_channels_axis: int) -> Tuple[Dict[Any, Any], int]:
+    """
+    Search weights quantization parameters in a worker process, for a weights tensor in shared memory.
+
+    Args:
+        shm_name: Name of the shared memory block of the weights tensor.
+        shape: Shape of the weights tensor.
+        dtype: Data type of the weights tensor.
+        weights_quant_config: Weights quantization configuration to define how the thresholds are computed.
+        attr_quant_config: Weights attribute quantization configuration to get its params.
+        output_channels_axis: Index of the kernel output channels dimension.
+
+    Returns:
+        The quantization parameters and the selected quantization channel axis.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        weights = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        weights.flags.writeable = False
+        results = get_weights_qparams(weights, weights_quant_config, attr_quant_config, output_channels_axis)
+        # Release the view of the shared memory, so it can be closed.
+        del weights
+        return results
+    finally:
+        shm.close()
+
+
+class WeightsQparamsSearchScheduler:
+    """
+    Scheduler of the weights quantization parameters searches of a graph.
+
+    Searches are added per node's candidate weights attribute configuration, and each unique search (same weights
+    attribute of the same node, searched with the same configuration) is computed once, and its results are set to
+    all the attribute configurations that added it. Searches can run in parallel over a pool of worker processes,
+    which access the weights tensors in shared memory. The results are the same as a serial run, since each search
+    is computed independently of the others.
+    Searches that use the HMSE error method always run in the main process, since they require the Hessian
+    information service. When a search backend is set, all the searches run in the main process with it, since
+    the workers can't share the backend's device.
+    """
+
+    def __init__(self,
+                 num_workers: int = 1,
+                 hessian_info_service: HessianInfoService = None,
+                 num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES,
+                 search_backend: QparamsSearchBackend = None):
+        """
+        Args:
+            num_workers: Number of worker processes to run the searches with. If 1, or if a search backend is set, the
+              searches are run in the main process.
+            hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (used only with HMSE
+              error method).
+            num_hessian_samples: Number of samples to approximate Hessian-based scores on (used only with HMSE error
+              method).
+            search_backend: Backend to evaluate the candidates of the searches with. If None, the candidates are
+              evaluated with numpy.
+        """
+        if num_workers > 1 and search_backend is not None:
+            Logger.warning(f'The weights quantization parameters searches run in the main process with the framework '
+                           f'search backend, and not over {num_workers} worker processes.')
+            num_workers = 1
+        self.num_workers = num_workers
+        self.hessian_info_service = hessian_info_service
+        self.num_hessian_samples = num_hessian_samples
+        self.search_backend = search_backend
+
+        self.searches: Dict[Hashable, WeightsQparamsSearch] = {}
+        self.searches_targets: Dict[Hashable, List[WeightsAttrQuantizationConfig]] = {}
+
+    def add_search(self,
+                   node: BaseNode,
+                   attr: str,
+                   weights_quant_config: NodeWeightsQuantizationConfig,
+                   attr_quant_config: WeightsAttrQuantizationConfig,
+                   target_attr_cfg: WeightsAttrQuantizationConfig,
+                   output_channels_axis: int):
+        """
+        Add a weights quantization parameters search.
+
+        Args:
+            node: Node to search the quantization parameters of its weights attribute.
+            attr: Weights attribute name.
+            weights_quant_config: Weights quantization configuration to define how the thresholds are computed.
+            attr_quant_config: Weights attribute quantization configuration to search the parameters with.
+            target_attr_cfg: Weights attribute quantization configuration to set the search results to.
+            output_channels_axis: Index of the kernel output channels dimension.
+        """
+        key = (node.name, attr, _get_fn_key(attr_quant_config.weights_quantization_params_fn),
+               attr_quant_config.l_p_value, attr_quant_config.weights_n_bits,
+               attr_quant_config.weights_per_channel_threshold, attr_quant_config.weights_error_method,
+               weights_quant_config.min_threshold, output_channels_axis)
+        if key not in self.searches:
+            self.searches[key] = WeightsQparamsSearch(node, attr, weights_quant_config, attr_quant_config,
+                                                      output_channels_axis)
+            self.searches_targets[key] = []
+        self.searches_targets[key].append(target_attr_cfg)
+
+    def run(self):
+        """
+        Run the unique searches and set their results to their target attribute configurations.
+        """
+        results = {}
+        parallel_searches = {}
+        for key, search in self.searches.items():
+            if self.num_workers > 1 and self._is_parallelizable(search):
+                parallel_searches[key] = search
+            else:
+                results[key] = None
+
+        with qparams_search_backend(self.search_backend):
+            for key in tqdm(list(results.keys()), "Calculating weights quantization parameters"):
+                search = self.searches[key]
+                results[key] = get_weights_qparams(search.node.get_weights_by_keys(search.attr),
+                                                   search.weights_quant_config,
+                                                   search.attr_quant_config,
+                                                   search.output_channels_axis,
+                                                   node=search.node,
+                                                   hessian_info_service=self.hessian_info_service,
+                                                   num_hessian_samples=self.num_hessian_samples)
+
+        if len(parallel_searches) > 0:
+            results.update(self._run_parallel(parallel_searches))
+
+        for key, targets in self.searches_targets.items():
+            weights_params, output_channels_axis = results[key]
+            for attr_cfg in targets:
+                attr_cfg.weights_channels_axis = (output_channels_axis, attr_cfg.weights_channels_axis[1])
+                attr_cfg.set_weights_quantization_param(copy.deepcopy(weights_params))
+
+    @staticmethod
+    def _is_parallelizable(search: WeightsQparamsSearch) -> bool:
+        """
+        Check whether a search can run in a worker process.
+
+        Args:
+            search: Search to check.
+
+        Returns:
+            Whether the search can run in a worker process.
+        """
+        if search.attr_quant_config.weights_error_method == QuantizationErrorMethod.HMSE:
+            return False
+        try:
+            pickle.dumps((search.weights_quant_config, search.attr_quant_config))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+        return True
+
+    def _run_parallel(self,
+                      searches: Dict[Hashable, WeightsQparamsSearch]) -> Dict[Hashable, Tuple[Dict[Any, Any], int]]:
+        """
+        Run searches over a pool of worker processes. Each weights tensor is copied once to shared memory, and
+        is accessed by the workers of all its searches.
+
+        Args:
+            searches: Searches to run.
+
+        Returns:
+            A dictionary from the searches keys to their results.
+        """
+        shms = {}
+        try:
+            for search in searches.values():
+                tensor_key = (search.node.name, search.attr)
+                if tensor_key not in shms:
+                    weights = np.asarray(search.node.get_weights_by_keys(search.attr))
+                    shm = shared_memory.SharedMemory(create=True, size=max(weights.nbytes, 1))
+                    np.ndarray(weights.shape, dtype=weights.dtype, buffer=shm.buf)[...] = weights
+                    shms[tensor_key] = (shm, weights.shape, weights.dtype)
+
+            # Workers are spawned (and not forked), since forking a process that runs framework threads is unsafe.
+            with ProcessPoolExecutor(max_workers=self.num_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {}
+                for key, search in searches.items():
+                    shm, shape, dtype = shms[(search.node.name, search.attr)]
+                    # The node is not passed to the workers (it's only used by the HMSE error method).
+                    futures[key] = executor.submit(_search_weights_qparams_in_worker, shm.name, shape, dtype,
+                                                   search.weights_quant_config, search.attr_quant_config,
+                                                   search.output_channels_axis)
+                return {key: future.result() for key, future in
+                        tqdm(futures.items(), "Calculating weights quantization parameters (parallel)")}
+        finally:
+            for shm, _, _ in shms.values():
+                shm.close()
+                shm.unlink()
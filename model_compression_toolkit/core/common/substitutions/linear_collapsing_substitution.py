@@ -14,6 +14,7 @@
 # ==============================================================================
 
 from model_compression_toolkit.core import common
+from model_compression_toolkit.core.common.graph.graph_searches import GraphMatchesTracker
 
 
 def linear_collapsing_substitute(graph: common.Graph,
@@ -33,18 +34,20 @@ def linear_collapsing_substitute(graph: common.Graph,
     # TODO: remove this if after adding Op2d-add_const collapse substitution in PyTorch
     if linear_collapsing_substitution is None:
         return graph
-    matched_nodes = graph.filter(linear_collapsing_substitution.matcher_instance)
-    matched_nodes_list = []
-    match_indicator = True
-    while len(matched_nodes) > 0 and match_indicator:
-        match_indicator = False
-        for matched_node in matched_nodes:
-            if matched_node not in matched_nodes_list:
-                # Substitute
-                graph = linear_collapsing_substitution.substitute(graph, matched_node)
-                matched_nodes_list.append(matched_node)
-                match_indicator = True
-                break
-        # Find new matches on the transformed graph
-        matched_nodes = graph.filter(linear_collapsing_substitution.matcher_instance)
+    with GraphMatchesTracker(graph, linear_collapsing_substitution.matcher_instance) as matches_tracker:
+        matched_nodes = matches_tracker.get_matches()
+        matched_nodes_list = []
+        match_indicator = True
+        while len(matched_nodes) > 0 and match_indicator:
+            match_indicator = False
+            for matched_node in matched_nodes:
+                if matched_node not in matched_nodes_list:
+                    # Substitute
+                    graph = linear_collapsing_substitution.substitute(graph, matched_node)
+                    matches_tracker.mark_touched(matched_node)
+                    matched_nodes_list.append(matched_node)
+                    match_indicator = True
+                    break
+            # Find new matches on the transformed graph, by matching again only the touched part of the graph
+            matched_nodes = matches_tracker.get_matches()
     return graph
\ No newline at end of file
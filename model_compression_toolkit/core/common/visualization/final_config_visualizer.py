@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Tuple, List
-from matplotlib import pyplot as plt
-from matplotlib.figure import Figure
+from typing import Tuple, List, TYPE_CHECKING
 
 from model_compression_toolkit.core.common import Graph, BaseNode
 
+if TYPE_CHECKING:    # pragma: no cover
+    from matplotlib.figure import Figure
+
 
 def get_kernel_layer_represent_name(node: BaseNode) -> str:
     """
@@ -57,7 +58,7 @@ class WeightsFinalBitwidthConfigVisualizer:
         self.bar_width = 2
         self.gap = self.bar_width + 3
 
-    def plot_config_bitwidth(self) -> Figure:
+    def plot_config_bitwidth(self) -> 'Figure':
         """
         Plots a bar figure with the layers' bit-width values according to the chosen config.
 
@@ -66,6 +67,8 @@ class WeightsFinalBitwidthConfigVisualizer:
         """
 
         layers_loc = [i for i in range(self.bar_width, self.bar_width + self.gap * len(self.node_reps_names), self.gap)]
+        # Imported here since matplotlib is only needed for the visualization.
+        from matplotlib import pyplot as plt
         fig, ax = plt.subplots(figsize=(20, 10))
         plt.bar(layers_loc, self.node_final_bitwidth, color=self.configs_colors, width=self.bar_width, align='center')
         plt.xticks(layers_loc, self.node_reps_names, rotation='vertical')
@@ -99,7 +102,7 @@ class ActivationFinalBitwidthConfigVisualizer:
         self.bar_width = 1
         self.vis_comp_rates = {4.0: 'tomato', 8.0: 'orange', 12.0: 'limegreen'}
 
-    def plot_config_bitwidth(self) -> Figure:
+    def plot_config_bitwidth(self) -> 'Figure':
         """
         Plots a bar figure with the layers' bit-width values according to the chosen config.
 
@@ -108,6 +111,7 @@ class ActivationFinalBitwidthConfigVisualizer:
         """
 
         layers_loc = [i for i in range(1, len(self.node_final_bitwidth) + 1)]
+        from matplotlib import pyplot as plt
         fig, ax = plt.subplots()
         plt.bar(layers_loc, self.node_final_bitwidth, width=self.bar_width, align='center')
         plt.grid()
@@ -116,7 +120,7 @@ class ActivationFinalBitwidthConfigVisualizer:
         plt.tight_layout()
         return fig
 
-    def plot_tensor_sizes(self, graph: Graph) -> Figure:
+    def plot_tensor_sizes(self, graph: Graph) -> 'Figure':
         """
         Plots a bar figure with the layers' activation tensors sizes.
         Also, adds horizontal line indicators for the max tensor size (in MB) for the defined set of compression rates.
@@ -134,6 +138,7 @@ class ActivationFinalBitwidthConfigVisualizer:
         max_lines = [(rate, max_tensor_size / rate, color) for rate, color in self.vis_comp_rates.items()]
 
         layers_loc = [i for i in range(1, len(self.final_activation_nodes_config) + 1)]
+        from matplotlib import pyplot as plt
         fig, ax = plt.subplots()
         plt.bar(layers_loc, tensors_sizes, width=self.bar_width, align='center')
         plt.grid()
@@ -13,11 +13,9 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import Tuple, List, Callable
+from typing import Tuple, List, Callable, TYPE_CHECKING
 
 import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib.figure import Figure
 
 from model_compression_toolkit.core.common import Graph
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
@@ -27,6 +25,9 @@ from model_compression_toolkit.core.common.model_builder_mode import ModelBuilde
 from model_compression_toolkit.core.common.similarity_analyzer import compute_cs
 from model_compression_toolkit.logger import Logger
 
+if TYPE_CHECKING:    # pragma: no cover
+    from matplotlib.figure import Figure
+
 
 def _get_compare_points(input_graph: Graph) -> Tuple[List[BaseNode], List[str]]:
     """
@@ -114,7 +115,7 @@ class NNVisualizer:
                             input_image: np.ndarray,
                             sample_index: int,
                             distance_fn: Callable = compute_cs,
-                            convert_to_range: Callable = lambda a: a) -> Figure:
+                            convert_to_range: Callable = lambda a: a) -> 'Figure':
         """
         Compare and plot the outputs of the quantized and the float versions
         of a neural network that KerasNNVisualizer has.
@@ -149,6 +150,8 @@ class NNVisualizer:
         distance_array = convert_to_range(distance_array)
 
         # Display the result: distance at every layer's output.
+        # Imported here since matplotlib is only needed for the visualization.
+        from matplotlib import pyplot as plt
         fig = plt.figure()
         plt.plot(list(range(len(distance_array))), distance_array)
         eps = 0.5
@@ -19,7 +19,6 @@ import io
 import os
 import numpy as np
 from PIL import Image
-from matplotlib.figure import Figure
 from tensorboard.compat.proto.attr_value_pb2 import AttrValue
 from tensorboard.compat.proto.config_pb2 import RunMetadata
 from tensorboard.compat.proto.event_pb2 import Event, TaggedRunMetadata
@@ -32,7 +31,7 @@ from tensorboard.compat.proto.tensor_pb2 import TensorProto
 from tensorboard.compat.proto.tensor_shape_pb2 import TensorShapeProto
 from tensorboard.plugins.text.plugin_data_pb2 import TextPluginData
 from tensorboard.summary.writer.event_file_writer import EventFileWriter
-from typing import List, Any, Dict
+from typing import List, Any, Dict, TYPE_CHECKING
 from networkx import topological_sort
 from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.core.common import Graph, BaseNode
@@ -41,6 +40,9 @@ from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.visualization.final_config_visualizer import \
     WeightsFinalBitwidthConfigVisualizer, ActivationFinalBitwidthConfigVisualizer
 
+if TYPE_CHECKING:    # pragma: no cover
+    from matplotlib.figure import Figure
+
 DEVICE_STEP_STATS = "/device:CPU:0"
 
 
@@ -468,7 +470,7 @@ class TensorboardWriter(object):
         self.add_mean(graph, main_tag_name)
 
     def add_figure(self,
-                   figure: Figure,
+                   figure: 'Figure',
                    figure_tag: str,
                    main_tag_name: str = 'figures'):
         """
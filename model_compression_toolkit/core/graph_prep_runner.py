@@ -20,6 +20,7 @@ from model_compression_toolkit.core.common import FrameworkInfo
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.fusion.layer_fusing import fusion
 from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.graph.prepared_graphs_cache import PreparedGraphsCache
 from model_compression_toolkit.core.common.quantization.bit_width_config import BitWidthConfig
 from model_compression_toolkit.core.common.quantization.filter_nodes_candidates import filter_nodes_candidates
 from model_compression_toolkit.core.common.quantization.quantization_config import DEFAULTCONFIG
@@ -42,7 +43,8 @@ def graph_preparation_runner(in_model: Any,
                              bit_width_config: BitWidthConfig = None,
                              tb_w: TensorboardWriter = None,
                              mixed_precision_enable: bool = False,
-                             running_gptq: bool = False) -> Graph:
+                             running_gptq: bool = False,
+                             prepared_graphs_cache: PreparedGraphsCache = None) -> Graph:
     """
     Runs all required preparations in order to build a quantization graph from the given model,
     quantization configuration and target platform specifications.
@@ -50,6 +52,10 @@ def graph_preparation_runner(in_model: Any,
         - Reading and building a graph from the given model.
         - Setting quantization config to each relevant node in the graph.
         - Apply all necessary substitutions to finalize the graph for quantization.
+    If a PreparedGraphsCache is passed, the graphs of the steps are cached in it, so preparing a graph of the same
+    model again with the same cache (e.g., for the mixed precision check and then for the quantization of a single
+    facade call) reuses the shared steps. The cache is scoped to a single run, in which the model and the
+    representative dataset don't change, so the graphs are cached by the configurations they are prepared with.
 
     Args:
         in_model (Any): Model to quantize.
@@ -64,31 +70,71 @@ def graph_preparation_runner(in_model: Any,
         tb_w (TensorboardWriter): TensorboardWriter object for logging.
         mixed_precision_enable (bool): is mixed precision enabled.
         running_gptq (bool): Whether or not a GPTQ optimization is planned to run after the PTQ process.
+        prepared_graphs_cache (PreparedGraphsCache): Cache of the prepared graphs to reuse. If None, the graph is
+            prepared without caching.
 
     Returns:
         An internal graph representation of the input model.
     """
 
-    graph = read_model_to_graph(in_model,
-                                representative_data_gen,
-                                tpc,
-                                fw_info,
-                                fw_impl)
+    # The TPC and the framework info are identified by their ids, so they are kept by the cache.
+    model_key = None if prepared_graphs_cache is None else (type(fw_impl), id(fw_info), id(tpc))
+    kept_objects = [tpc, fw_info]
 
-    if tb_w is not None:
-        tb_w.add_graph(graph, 'initial_graph')
-
-    transformed_graph = get_finalized_graph(graph,
-                                            tpc,
-                                            quantization_config,
-                                            bit_width_config,
-                                            fw_info,
-                                            tb_w,
-                                            fw_impl,
-                                            mixed_precision_enable=mixed_precision_enable,
-                                            running_gptq=running_gptq)
+    def _read_graph() -> Graph:
+        return prepared_graphs_cache.get_or_build(in_model,
+                                                  model_key,
+                                                  lambda: read_model_to_graph(in_model,
+                                                                              representative_data_gen,
+                                                                              tpc,
+                                                                              fw_info,
+                                                                              fw_impl),
+                                                  kept_objects)
 
-    return transformed_graph
+    if model_key is None or tb_w is not None:
+        # When the graphs are not cached, or when the intermediate graphs are logged, the graph is prepared from the
+        # read graph (and not from the cached prepared graphs).
+        graph = read_model_to_graph(in_model, representative_data_gen, tpc, fw_info, fw_impl) \
+            if model_key is None else _read_graph()
+        if tb_w is not None:
+            tb_w.add_graph(graph, 'initial_graph')
+        return get_finalized_graph(graph,
+                                   tpc,
+                                   quantization_config,
+                                   bit_width_config,
+                                   fw_info,
+                                   tb_w,
+                                   fw_impl,
+                                   mixed_precision_enable=mixed_precision_enable,
+                                   running_gptq=running_gptq)
+
+    # The graph after the substitutions depends only on the quantization config, so it's shared by preparations
+    # with different bit-width configurations or mixed precision modes.
+    substituted_graph_key = model_key + (repr(quantization_config),)
+
+    def _substitute_graph() -> Graph:
+        return prepared_graphs_cache.get_or_build(in_model,
+                                                  substituted_graph_key,
+                                                  lambda: _apply_preparation_substitutions(_read_graph(),
+                                                                                           quantization_config,
+                                                                                           fw_info,
+                                                                                           None,
+                                                                                           fw_impl),
+                                                  kept_objects)
+
+    finalized_graph_key = substituted_graph_key + (repr(bit_width_config), mixed_precision_enable, running_gptq)
+    return prepared_graphs_cache.get_or_build(in_model,
+                                              finalized_graph_key,
+                                              lambda: _set_graph_quantization(_substitute_graph(),
+                                                                              tpc,
+                                                                              quantization_config,
+                                                                              bit_width_config,
+                                                                              fw_info,
+                                                                              None,
+                                                                              fw_impl,
+                                                                              mixed_precision_enable,
+                                                                              running_gptq),
+                                              kept_objects)
 
 
 def get_finalized_graph(initial_graph: Graph,
@@ -120,6 +166,38 @@ def get_finalized_graph(initial_graph: Graph,
     Returns: Graph object that represents the model, after applying all required modifications to it.
     """
 
+    graph = _apply_preparation_substitutions(initial_graph, quant_config, fw_info, tb_w, fw_impl)
+    return _set_graph_quantization(graph,
+                                   tpc,
+                                   quant_config,
+                                   bit_width_config,
+                                   fw_info,
+                                   tb_w,
+                                   fw_impl,
+                                   mixed_precision_enable,
+                                   running_gptq)
+
+
+def _apply_preparation_substitutions(initial_graph: Graph,
+                                     quant_config: QuantizationConfig,
+                                     fw_info: FrameworkInfo,
+                                     tb_w: TensorboardWriter,
+                                     fw_impl: FrameworkImplementation) -> Graph:
+    """
+    Applies the graph preparation and pre statistics collection substitutions on the model's graph, and sets the
+    prior info of its nodes.
+
+    Args:
+        initial_graph (Graph): Graph to apply the changes to.
+        quant_config (QuantizationConfig): QuantizationConfig containing parameters of how the model should be
+            quantized.
+        fw_info (FrameworkInfo): Information needed for quantization about the specific framework.
+        tb_w (TensorboardWriter): TensorboardWriter object to use for logging events such as graphs, histograms, etc.
+        fw_impl (FrameworkImplementation): FrameworkImplementation object with a specific framework methods implementation.
+
+    Returns: Graph object after the substitutions.
+    """
+
     ######################################
     # Graph substitution (prepare graph)
     ######################################
@@ -148,6 +226,37 @@ def get_finalized_graph(initial_graph: Graph,
     if tb_w is not None:
         tb_w.add_graph(transformed_graph, 'pre_statistics_collection_substitutions')
 
+    return transformed_graph
+
+
+def _set_graph_quantization(transformed_graph: Graph,
+                            tpc: TargetPlatformCapabilities,
+                            quant_config: QuantizationConfig,
+                            bit_width_config: BitWidthConfig,
+                            fw_info: FrameworkInfo,
+                            tb_w: TensorboardWriter,
+                            fw_impl: FrameworkImplementation,
+                            mixed_precision_enable: bool,
+                            running_gptq: bool) -> Graph:
+    """
+    Sets the quantization configurations to the graph's nodes, fuses layers, applies the channel equalization
+    substitutions and filters the nodes' candidates.
+
+    Args:
+        transformed_graph (Graph): Graph after the preparation substitutions.
+        tpc (TargetPlatformCapabilities): TargetPlatformCapabilities object that describes the desired inference target platform.
+        quant_config (QuantizationConfig): QuantizationConfig containing parameters of how the model should be
+            quantized.
+        bit_width_config (BitWidthConfig): Config for bit-width selection.
+        fw_info (FrameworkInfo): Information needed for quantization about the specific framework.
+        tb_w (TensorboardWriter): TensorboardWriter object to use for logging events such as graphs, histograms, etc.
+        fw_impl (FrameworkImplementation): FrameworkImplementation object with a specific framework methods implementation.
+        mixed_precision_enable: is mixed precision enabled.
+        running_gptq: Whether or not a GPTQ optimization is planned to run after the PTQ process.
+
+    Returns: Graph object that is ready for the quantization process.
+    """
+
     ######################################
     # Add quantization configurations
     ######################################
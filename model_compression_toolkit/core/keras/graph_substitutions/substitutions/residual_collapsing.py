@@ -51,7 +51,7 @@ def residual_collapsing_fn(first_node: BaseNode,
     """
     if first_node.is_match_type(Conv2D):
         # Get nodes attributes
-        kernel = first_node.get_weights_by_keys(kernel_str)
+        kernel = first_node.get_weights_by_keys(kernel_str).copy()
         (kH, kW, Cin, Cout) = kernel.shape
 
         # Collapsing residual by adding "1" to kernel diagonal
@@ -33,6 +33,8 @@ from model_compression_toolkit.exporter.model_wrapper.fw_agnostic.get_inferable_
 from model_compression_toolkit.exporter.model_wrapper.keras.builder.node_to_quantizer import \
     get_weights_quantizer_for_node, get_activations_quantizer_for_node
 from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.core.common.collectors.statistics_collector import ReducedStatistics
+from model_compression_toolkit.core.keras.statistics_reduction import reduce_statistics_keras
 from model_compression_toolkit.core.common.mixed_precision.sensitivity_evaluation import SensitivityEvaluation
 from model_compression_toolkit.core.common.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth
 from model_compression_toolkit.core.common.similarity_analyzer import compute_kl_divergence, compute_cs, compute_mse
@@ -121,6 +123,24 @@ class KerasImplementation(FrameworkImplementation):
         """
         return keras_constants
 
+    def reduce_statistics(self,
+                          tensor: tf.Tensor,
+                          channel_axis: int,
+                          n_bins: int) -> ReducedStatistics:
+        """
+        Reduce a TF tensor to the statistics that are collected by a StatsCollector (histogram,
+        mean per channel and min/max per channel), on the tensor's device.
+
+        Args:
+            tensor: TF tensor to reduce.
+            channel_axis: Index of the channels axis.
+            n_bins: Number of bins in the histogram.
+
+        Returns:
+            The reduced statistics of the tensor.
+        """
+        return reduce_statistics_keras(tensor, channel_axis, n_bins)
+
     def model_reader(self,
                      model: Model,
                      representative_data_gen: Callable) -> Graph:
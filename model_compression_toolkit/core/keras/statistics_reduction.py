@@ -0,0 +1,63 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any
+
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit.constants import LAST_AXIS
+from model_compression_toolkit.core.common.collectors.histogram_collector import get_histogram_bins
+from model_compression_toolkit.core.common.collectors.statistics_collector import ReducedStatistics
+
+
+def reduce_statistics_keras(tensor: Any,
+                            channel_axis: int,
+                            n_bins: int) -> ReducedStatistics:
+    """
+    Reduce a tensor to the statistics that are collected by a StatsCollector (histogram, mean per channel
+    and min/max per channel). The reduction is done on the tensor's device, in float64 precision (same as the
+    collectors' Numpy computation), so only the reduced statistics are copied to the host.
+
+    Args:
+        tensor: Tensor to reduce.
+        channel_axis: Index of the channels axis.
+        n_bins: Number of bins in the histogram.
+
+    Returns:
+        The reduced statistics of the tensor.
+    """
+    x = tf.cast(tf.convert_to_tensor(tensor), tf.float64)
+    if len(x.shape) == 0:
+        x = tf.reshape(x, [1])
+
+    rank = len(x.shape)
+    axis = (rank - 1) if channel_axis == LAST_AXIS else channel_axis
+    transpose_index = [axis, *[i for i in range(rank) if i != axis]]
+    x_per_channel = tf.reshape(tf.transpose(x, transpose_index), [x.shape[axis], -1])
+    max_per_channel = tf.reduce_max(x_per_channel, axis=-1)
+    min_per_channel = tf.reduce_min(x_per_channel, axis=-1)
+
+    # The histogram bins are computed on the host (same as np.histogram), and each value is assigned to the bin
+    # it falls in, where the last bin also includes its right edge.
+    bins = get_histogram_bins(float(tf.reduce_min(min_per_channel)), float(tf.reduce_max(max_per_channel)), n_bins)
+    bins_indices = tf.searchsorted(tf.constant(bins, dtype=tf.float64), tf.reshape(x, [-1]), side='right') - 1
+    counts = tf.math.bincount(tf.clip_by_value(bins_indices, 0, n_bins - 1), minlength=n_bins, maxlength=n_bins,
+                              dtype=tf.int64)
+
+    return ReducedStatistics(histogram_counts=counts.numpy(),
+                             histogram_bins=bins,
+                             mean_per_channel=tf.reduce_mean(x_per_channel, axis=-1).numpy(),
+                             max_per_channel=max_per_channel.numpy(),
+                             min_per_channel=min_per_channel.numpy())
@@ -14,7 +14,7 @@
 # ==============================================================================
 from abc import abstractmethod
 from functools import partial
-from typing import Tuple, Any, Dict, List, Union, Callable
+from typing import Tuple, Any, Dict, List, Union, Callable, NamedTuple, Optional
 
 import torch
 import numpy as np
@@ -37,34 +37,22 @@ from mct_quantizers.common.constants import ACTIVATION_HOLDER_QUANTIZER
 from mct_quantizers import PytorchQuantizationWrapper
 
 
-def _build_input_tensors_list(node: BaseNode,
-                              graph: Graph,
-                              inputs: Tuple[Any],
-                              node_to_output_tensors_dict: Dict[BaseNode, List]) -> List[List]:
+class ExecutionStep(NamedTuple):
     """
-    Given a node, build a list of input tensors the node gets. The list is built based on the
-    node's incoming edges, previous nodes' output tensors.
+    A single operation in the compiled execution plan of a PytorchModel.
+    The output tensors of the step's node are stored in the slot whose index is the node's index in the plan.
 
     Args:
-        node: Node to build its input tensors list.
-        graph: Graph the node is in.
-        inputs: list of input tensors to model.
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
-
-    Returns:
-        A list of the node's input tensors.
+        node: The node to run.
+        input_slots: Slots of the nodes whose outputs are the node's inputs (ordered by the incoming edges' sink
+            index). Each slot contributes all of its output tensors.
+        model_input_index: For a model input node - the index of its tensor in the model's inputs, otherwise None.
+        free_slots: Slots that are no longer needed once the node was run, and can be released.
     """
-    if node.is_match_type(DummyPlaceHolder):
-        input_tensors = [inputs[graph.get_inputs().index(node)]]
-    else:
-        input_tensors = []
-        # Go over a sorted list of the node's incoming edges, and for each source node get its output tensors.
-        # Append them in a result list.
-        for ie in graph.incoming_edges(node, sort_by_attr=EDGE_SINK_INDEX):
-            _input_tensors = node_to_output_tensors_dict[ie.source_node]
-            input_tensors.append(_input_tensors)
-        input_tensors = [tensor for tensor_list in input_tensors for tensor in tensor_list]  # flat list of lists
-    return input_tensors
+    node: BaseNode
+    input_slots: Tuple[int, ...]
+    model_input_index: Optional[int]
+    free_slots: Tuple[int, ...]
 
 
 def _merge_inputs(_node: BaseNode, input_tensors: List, op_call_args: List, op_call_kwargs: Dict,
@@ -166,34 +154,19 @@ def _run_operation(n: BaseNode,
     return out_tensors_of_n, out_tensors_of_n_float
 
 
-def _find_by_node_name(node_to_output_tensors_dict: dict, node_name: str):
+def _generate_outputs(output_slots: List[int],
+                      slot_to_output_tensors: List[Optional[List]]) -> List:
     """
     Args:
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
-        node_name: Node name
-    Returns:
-        Out tensors if found node with name equal to node_name, None if no exist
-    """
-    for node in node_to_output_tensors_dict.keys():
-        if node.name == node_name:
-            return node_to_output_tensors_dict.get(node)
-    return None
-
-
-def _generate_outputs(
-        out_nodes: List[BaseNode],
-        node_to_output_tensors_dict: dict):
-    """
-    Args:
-        out_nodes: List of output nodes.
-        node_to_output_tensors_dict: A dictionary from a node to its output tensors.
+        output_slots: Slots of the output nodes.
+        slot_to_output_tensors: A list from a slot to its node's output tensors.
 
     Returns:
         List of output tensor/s for the model
     """
     output = []
-    for n in out_nodes:
-        out_tensors_of_n = _find_by_node_name(node_to_output_tensors_dict, n.name)
+    for slot in output_slots:
+        out_tensors_of_n = slot_to_output_tensors[slot]
         if len(out_tensors_of_n) > 1:
             output.append(out_tensors_of_n)
         else:
@@ -233,6 +206,7 @@ class PytorchModel(torch.nn.Module):
         self.get_activation_quantizer_holder = get_activation_quantizer_holder_fn
         self.reuse_groups = {}
         self._add_modules()
+        self._compile_execution_plan()
 
     # todo: Move to parent class BaseModelBuilder
     @property
@@ -316,6 +290,46 @@ class PytorchModel(torch.nn.Module):
                     self.node_to_activation_quantization_holder.update(
                         {node.name: node.name + '_' + ACTIVATION_HOLDER_QUANTIZER})
 
+    def _compile_execution_plan(self):
+        """
+        Compile the graph into a flat execution plan, so the forward pass does not need to query the graph.
+        Each node is assigned a slot (its index in the topological order) that holds its output tensors.
+        A slot is released right after its last consumer is run, unless it holds an output of the model.
+        """
+        node_to_slot = {n: i for i, n in enumerate(self.node_sort)}
+        graph_inputs = self.graph.get_inputs()
+
+        name_to_slot = {n.name: i for i, n in enumerate(self.node_sort)}
+        self.output_slots = [name_to_slot[name] for name in self._get_output_nodes_names()]
+        output_slots = set(self.output_slots)
+
+        # A slot is freed after its last consumer, or right after it's computed if it has no consumers.
+        last_use = list(range(len(self.node_sort)))
+        steps_inputs = []
+        for slot, node in enumerate(self.node_sort):
+            if node.is_match_type(DummyPlaceHolder):
+                steps_inputs.append(((), graph_inputs.index(node)))
+            else:
+                input_slots = tuple(node_to_slot[ie.source_node]
+                                    for ie in self.graph.incoming_edges(node, sort_by_attr=EDGE_SINK_INDEX))
+                for input_slot in input_slots:
+                    last_use[input_slot] = max(last_use[input_slot], slot)
+                steps_inputs.append((input_slots, None))
+
+        free_slots_per_step = [[] for _ in self.node_sort]
+        for slot, last_use_slot in enumerate(last_use):
+            if slot not in output_slots:
+                free_slots_per_step[last_use_slot].append(slot)
+
+        self.execution_plan = [ExecutionStep(node=node,
+                                             input_slots=input_slots,
+                                             model_input_index=model_input_index,
+                                             free_slots=tuple(free_slots))
+                               for node, (input_slots, model_input_index), free_slots
+                               in zip(self.node_sort, steps_inputs, free_slots_per_step)]
+        self.slots_last_use = last_use
+        self.configurable_nodes_names = self.graph.get_configurable_sorted_nodes_names(DEFAULT_PYTORCH_INFO)
+
     def forward(self,
                 *args: Any) -> Any:
         """
@@ -324,15 +338,98 @@ class PytorchModel(torch.nn.Module):
         Returns:
             torch Tensor/s which is/are the output of the model logic.
         """
-        node_to_output_tensors_dict = dict()
-        node_to_output_tensors_dict_float = dict()
-        configurable_nodes = self.graph.get_configurable_sorted_nodes_names(DEFAULT_PYTORCH_INFO)
-        for node in self.node_sort:
-            op_func = self._get_op_func(node, configurable_nodes)
-            input_tensors = _build_input_tensors_list(node,
-                                                      self.graph,
-                                                      args,
-                                                      node_to_output_tensors_dict)
+        slot_to_output_tensors, slot_to_output_tensors_float = self._run_nodes(args)
+        return self._get_model_outputs(slot_to_output_tensors, slot_to_output_tensors_float)
+
+    def build_prefix_cache(self,
+                           inputs: List[torch.Tensor],
+                           resume_nodes_names: List[str]) -> Tuple[List[torch.Tensor], List, List]:
+        """
+        Run the model on the given inputs and cache the tensors that are required in order to resume the forward
+        pass from just before each of the given nodes (see resume_forward).
+        The cached tensors are the outputs of nodes that precede a resume node and are consumed by it or by any node
+        that comes after it, together with the outputs of all the model's output nodes.
+
+        Args:
+            inputs: Input tensors to run the model on.
+            resume_nodes_names: Names of nodes from which the forward pass may be resumed.
+
+        Returns:
+            A prefix cache: The model's inputs, and lists from a slot to its cached output tensors
+            (quantized and float).
+        """
+        resume_indices = [self._get_resume_index([name]) for name in resume_nodes_names]
+        retained_slots = {slot for slot, last_use_slot in enumerate(self.slots_last_use)
+                          if any(slot < ri <= last_use_slot for ri in resume_indices)}
+
+        with torch.no_grad():
+            slot_to_output_tensors, slot_to_output_tensors_float = self._run_nodes(inputs,
+                                                                                   retained_slots=retained_slots)
+
+        return inputs, slot_to_output_tensors, slot_to_output_tensors_float
+
+    def resume_forward(self,
+                       prefix_cache: Tuple[List[torch.Tensor], List, List],
+                       changed_nodes_names: List[str]) -> Any:
+        """
+        Run the model from just before the first of the given nodes, taking the outputs of all preceding nodes
+        from a prefix cache (that was built by build_prefix_cache).
+        The result is identical to running the full forward pass, as long as only the given nodes were modified
+        since the prefix cache was built.
+
+        Args:
+            prefix_cache: A prefix cache that was built by build_prefix_cache.
+            changed_nodes_names: Names of nodes that were modified since the prefix cache was built.
+
+        Returns:
+            torch Tensor/s which is/are the output of the model logic.
+        """
+        inputs, cached_output_tensors, cached_output_tensors_float = prefix_cache
+        slot_to_output_tensors, slot_to_output_tensors_float = \
+            self._run_nodes(inputs,
+                            start_index=self._get_resume_index(changed_nodes_names),
+                            slot_to_output_tensors=list(cached_output_tensors),
+                            slot_to_output_tensors_float=list(cached_output_tensors_float))
+        return self._get_model_outputs(slot_to_output_tensors, slot_to_output_tensors_float)
+
+    def _run_nodes(self,
+                   inputs: Tuple[Any],
+                   start_index: int = 0,
+                   slot_to_output_tensors: List[Optional[List]] = None,
+                   slot_to_output_tensors_float: List[Optional[List]] = None,
+                   retained_slots: set = None) -> Tuple[List, List]:
+        """
+        Run the execution plan, starting from the step in the given index.
+        Output tensors are released as soon as they are no longer needed, except for the model's outputs
+        and the given retained slots.
+
+        Args:
+            inputs: Input tensors to model.
+            start_index: Index of the first step to run.
+            slot_to_output_tensors: Output tensors of the slots that precede start_index.
+            slot_to_output_tensors_float: Float output tensors of the output slots that precede start_index.
+            retained_slots: Slots to keep even when they are no longer needed.
+
+        Returns:
+            Two lists from a slot to its output tensors (quantized and float). The float tensors are kept only for
+            the model's output slots, and only if the model returns float outputs.
+        """
+        num_slots = len(self.execution_plan)
+        if slot_to_output_tensors is None:
+            slot_to_output_tensors = [None] * num_slots
+        if slot_to_output_tensors_float is None:
+            slot_to_output_tensors_float = [None] * num_slots
+        output_slots = self.output_slots
+
+        for slot in range(start_index, num_slots):
+            step = self.execution_plan[slot]
+            node = step.node
+            op_func = self._get_op_func(node, self.configurable_nodes_names)
+            if step.model_input_index is not None:
+                input_tensors = [inputs[step.model_input_index]]
+            else:
+                input_tensors = [tensor for input_slot in step.input_slots
+                                 for tensor in slot_to_output_tensors[input_slot]]
             use_activation_quantization, activation_quantization_fn = self._get_activation_quantization_fn(node)
 
             # Run node operation and fetch outputs
@@ -342,19 +439,59 @@ class PytorchModel(torch.nn.Module):
                                                                       quantize_node_activation_fn=activation_quantization_fn,
                                                                       use_activation_quantization=use_activation_quantization)
 
-            node_to_output_tensors_dict.update({node: out_tensors_of_n})
-            node_to_output_tensors_dict_float.update({node: out_tensors_of_n_float})
+            slot_to_output_tensors[slot] = out_tensors_of_n
+            if self.return_float_outputs and slot in output_slots:
+                slot_to_output_tensors_float[slot] = out_tensors_of_n_float
 
-        if self.append2output:
-            outputs = _generate_outputs(self.append2output,
-                                        node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
-        else:
-            outputs = _generate_outputs([ot.node for ot in self.graph.get_outputs()],
-                                        node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
-            if len(outputs) == 1:
-                outputs = outputs[0]
+            # Release tensors that are no longer needed
+            for free_slot in step.free_slots:
+                if retained_slots is None or free_slot not in retained_slots:
+                    slot_to_output_tensors[free_slot] = None
+
+        return slot_to_output_tensors, slot_to_output_tensors_float
+
+    def _get_model_outputs(self,
+                           slot_to_output_tensors: List[Optional[List]],
+                           slot_to_output_tensors_float: List[Optional[List]]) -> Any:
+        """
+        Generate the model's outputs from the output slots.
+
+        Args:
+            slot_to_output_tensors: A list from a slot to its output tensors.
+            slot_to_output_tensors_float: A list from a slot to its float output tensors.
+
+        Returns:
+            torch Tensor/s which is/are the output of the model logic.
+        """
+        outputs = _generate_outputs(self.output_slots,
+                                    slot_to_output_tensors_float if self.return_float_outputs else slot_to_output_tensors)
+        if not self.append2output and len(outputs) == 1:
+            outputs = outputs[0]
         return outputs
 
+    def _get_output_nodes_names(self) -> List[str]:
+        """
+        Returns: Names of the nodes that their outputs are the model's outputs.
+        """
+        if self.append2output:
+            return [n.name for n in self.append2output]
+        return [ot.node.name for ot in self.graph.get_outputs()]
+
+    def _get_resume_index(self, nodes_names: List[str]) -> int:
+        """
+        Get the index (in the execution plan) of the first node that needs to be recomputed when the given
+        nodes are modified. A node that shares its module with other nodes (reused node) affects all of them.
+
+        Args:
+            nodes_names: Names of modified nodes.
+
+        Returns:
+            Index of the first step to run.
+        """
+        reuse_groups = {n.reuse_group for n in self.node_sort if n.name in nodes_names and n.reuse_group}
+        return min(i for i, n in enumerate(self.node_sort)
+                   if n.name in nodes_names or (n.reuse_group and n.reuse_group in reuse_groups))
+
     def _get_op_func(self,
                      node: BaseNode,
                      configurable_nodes_names: List[str]) -> Any:
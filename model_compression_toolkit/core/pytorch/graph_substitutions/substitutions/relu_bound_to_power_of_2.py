@@ -104,6 +104,7 @@ class ReLUBoundToPowerOfTwo(common.BaseSubstitution):
                 return graph
         else:
             Logger.critical(f"Encountered an unexpected non-linearity type not supported for this substitution: {non_linear_node.type}.")
+        graph.reindex_node(non_linear_node)
         Logger.debug(
             f"Node named:{non_linear_node.name} changed "
             f"to:{non_linear_node.type}")
@@ -48,7 +48,7 @@ def residual_collapsing_fn(first_node: BaseNode,
     """
     if first_node.is_match_type(Conv2d):
         # Get nodes attributes
-        kernel = first_node.get_weights_by_keys(kernel_str)
+        kernel = first_node.get_weights_by_keys(kernel_str).copy()
         (Cout, Cin, kH, kW) = kernel.shape
 
         # Collapsing residual by adding "1" to kernel diagonal
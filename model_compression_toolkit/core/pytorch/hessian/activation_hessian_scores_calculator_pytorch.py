@@ -54,33 +54,47 @@ class ActivationHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
                                                                        fw_impl=fw_impl,
                                                                        hessian_scores_request=hessian_scores_request,
                                                                        num_iterations_for_approximation=num_iterations_for_approximation)
+        self.grad_model = None
 
-    def forward_pass(self):
-        model_output_nodes = [ot.node for ot in self.graph.get_outputs()]
+    def _get_grad_model(self) -> torch.nn.Module:
+        """
+        Get the model to compute the gradients with. The model outputs the target nodes' activations followed by
+        the model outputs. It is built once and reused for all the batches the calculator computes scores for.
+
+        Returns:
+            The gradients model.
+        """
+        if self.grad_model is None:
+            model_output_nodes = [ot.node for ot in self.graph.get_outputs()]
 
-        if len([n for n in self.hessian_request.target_nodes if n in model_output_nodes]) > 0:
-            Logger.critical("Activation Hessian approximation cannot be computed for model outputs. "
-                            "Exclude output nodes from Hessian request targets.")
+            if len([n for n in self.hessian_request.target_nodes if n in model_output_nodes]) > 0:
+                Logger.critical("Activation Hessian approximation cannot be computed for model outputs. "
+                                "Exclude output nodes from Hessian request targets.")
 
-        grad_model_outputs = self.hessian_request.target_nodes + model_output_nodes
-        model, _ = FloatPyTorchModelBuilder(graph=self.graph, append2output=grad_model_outputs).build_model()
-        model.eval()
+            grad_model_outputs = self.hessian_request.target_nodes + model_output_nodes
+            self.grad_model, _ = FloatPyTorchModelBuilder(graph=self.graph,
+                                                          append2output=grad_model_outputs).build_model()
+            self.grad_model.eval()
+        return self.grad_model
+
+    def forward_pass(self):
+        model = self._get_grad_model()
 
         # Run model inference
         # Set inputs to track gradients during inference
         for input_tensor in self.input_images:
             input_tensor.requires_grad_()
-            input_tensor.retain_grad()
 
         outputs = model(*self.input_images)
 
-        if len(outputs) != len(grad_model_outputs):  # pragma: no cover
+        num_target_nodes = len(self.hessian_request.target_nodes)
+        num_model_outputs = len(self.graph.get_outputs())
+        if len(outputs) != num_target_nodes + num_model_outputs:  # pragma: no cover
             Logger.critical(f"Mismatch in expected and actual model outputs for activation Hessian approximation. "
-                            f"Expected {len(grad_model_outputs)} outputs, received {len(outputs)}.")
+                            f"Expected {num_target_nodes + num_model_outputs} outputs, received {len(outputs)}.")
 
         # Extracting the intermediate activation tensors and the model real output.
         # Note that we do not allow computing Hessian for output nodes, so there shouldn't be an overlap.
-        num_target_nodes = len(self.hessian_request.target_nodes)
         # Extract activation tensors of nodes for which we want to compute Hessian
         target_activation_tensors = outputs[:num_target_nodes]
         # Extract the model outputs
@@ -113,20 +127,20 @@ class ActivationHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
 
     def _compute_per_tensor(self, output, target_activation_tensors):
         assert self.hessian_request.granularity == HessianScoresGranularity.PER_TENSOR
-        ipts_hessian_approx_scores = [torch.tensor([0.0], requires_grad=True, device=output.device)
+        ipts_hessian_approx_scores = [torch.tensor([0.0], device=output.device)
                                       for _ in range(len(target_activation_tensors))]
         prev_mean_results = None
         for j in tqdm(range(self.num_iterations_for_approximation), "Hessian random iterations"):  # Approximation iterations
             # Getting a random vector
             v = self._generate_random_vectors_batch(output.shape, output.device)
             f_v = torch.sum(v * output)
-            for i, ipt_tensor in enumerate(target_activation_tensors):  # Per Interest point activation tensor
-                # Computing the hessian-approximation scores by getting the gradient of (output * v)
-                hess_v = autograd.grad(outputs=f_v,
-                                       inputs=ipt_tensor,
-                                       retain_graph=True,
-                                       allow_unused=True)[0]
-
+            # Computing the hessian-approximation scores by getting the gradient of (output * v) w.r.t all
+            # the interest points activation tensors at once
+            hess_vs = autograd.grad(outputs=f_v,
+                                    inputs=target_activation_tensors,
+                                    retain_graph=True,
+                                    allow_unused=True)
+            for i, hess_v in enumerate(hess_vs):  # Per Interest point activation tensor
                 if hess_v is None:
                     # In case we have an output node, which is an interest point, but it is not differentiable,
                     # we consider its Hessian to be the initial value 0.
@@ -155,16 +169,17 @@ class ActivationHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
 
     def _compute_per_channel(self, output, target_activation_tensors):
         assert self.hessian_request.granularity == HessianScoresGranularity.PER_OUTPUT_CHANNEL
-        ipts_hessian_approx_scores = [torch.tensor(0.0, requires_grad=True, device=output.device)
+        ipts_hessian_approx_scores = [torch.tensor(0.0, device=output.device)
                                       for _ in range(len(target_activation_tensors))]
 
         for j in tqdm(range(self.num_iterations_for_approximation), "Hessian random iterations"):  # Approximation iterations
             v = self._generate_random_vectors_batch(output.shape, output.device)
             f_v = torch.sum(v * output)
-            for i, ipt_tensor in enumerate(target_activation_tensors):  # Per Interest point activation tensor
-                hess_v = autograd.grad(outputs=f_v,
-                                       inputs=ipt_tensor,
-                                       retain_graph=True)[0]
+            # Compute the gradients w.r.t all the interest points activation tensors at once
+            hess_vs = autograd.grad(outputs=f_v,
+                                    inputs=target_activation_tensors,
+                                    retain_graph=True)
+            for i, hess_v in enumerate(hess_vs):  # Per Interest point activation tensor
                 hessian_approx_scores = hess_v ** 2
                 rank = len(hess_v.shape)
                 if rank > 2:
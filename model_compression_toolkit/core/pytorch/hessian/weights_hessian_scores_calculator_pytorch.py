@@ -55,6 +55,37 @@ class WeightsHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
                                                                     fw_impl=fw_impl,
                                                                     hessian_scores_request=hessian_scores_request,
                                                                     num_iterations_for_approximation=num_iterations_for_approximation)
+        self.grad_model = None
+        self.weights_tensors = None
+
+    def _get_grad_model(self) -> torch.nn.Module:
+        """
+        Get the float model to compute the gradients with, and collect the target nodes' weights tensors.
+        The model is built once and reused for all the batches the calculator computes scores for.
+
+        Returns:
+            The gradients model.
+        """
+        if self.grad_model is None:
+            self.grad_model, _ = FloatPyTorchModelBuilder(graph=self.graph).build_model()
+
+            self.weights_tensors = []
+            for ipt_node in self.hessian_request.target_nodes:  # Per Interest point weights tensor
+                # Check if the target node's layer type is supported.
+                if not DEFAULT_PYTORCH_INFO.is_kernel_op(ipt_node.type):
+                    Logger.critical(f"Hessian information with respect to weights is not supported for "
+                                    f"{ipt_node.type} layers.")  # pragma: no cover
+
+                # Get the weight attributes for the target node type
+                weights_attributes = DEFAULT_PYTORCH_INFO.get_kernel_op_attributes(ipt_node.type)
+
+                # Get the weight tensor for the target node
+                if len(weights_attributes) != 1:  # pragma: no cover
+                    Logger.critical(f"Currently, Hessian scores with respect to weights are supported only for nodes with a "
+                                    f"single weight attribute. {len(weights_attributes)} attributes found.")
+
+                self.weights_tensors.append(getattr(getattr(self.grad_model, ipt_node.name), weights_attributes[0]))
+        return self.grad_model
 
     def compute(self) -> List[np.ndarray]:
         """
@@ -72,53 +103,39 @@ class WeightsHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
         """
 
         # Float model
-        model, _ = FloatPyTorchModelBuilder(graph=self.graph).build_model()
+        model = self._get_grad_model()
 
         # Run model inference
         outputs = model(self.input_images)
         output_tensor = self.concat_tensors(outputs)
         device = output_tensor.device
 
-        ipts_hessian_approx_scores = [torch.tensor([0.0],
-                                                   requires_grad=True,
-                                                   device=device)
-                                     for _ in range(len(self.hessian_request.target_nodes))]
+        # Get the dimensions to reduce the scores over for each target node
+        reduce_axes = []
+        for ipt_node, weights_tensor in zip(self.hessian_request.target_nodes, self.weights_tensors):
+            output_channel_axis, _ = DEFAULT_PYTORCH_INFO.kernel_channels_mapping.get(ipt_node.type)
+            shape_channel_axis = [i for i in range(len(weights_tensor.shape))]
+            if self.hessian_request.granularity == HessianScoresGranularity.PER_OUTPUT_CHANNEL:
+                shape_channel_axis.remove(output_channel_axis)
+            elif self.hessian_request.granularity == HessianScoresGranularity.PER_ELEMENT:
+                shape_channel_axis = ()
+            reduce_axes.append(shape_channel_axis)
+
+        ipts_hessian_approx_scores = [torch.tensor([0.0], device=device)
+                                      for _ in range(len(self.hessian_request.target_nodes))]
 
         prev_mean_results = None
         for j in tqdm(range(self.num_iterations_for_approximation)):
             # Getting a random vector with the same shape as the model output
             v = self._generate_random_vectors_batch(output_tensor.shape, device=device)
             f_v = torch.mean(torch.sum(v * output_tensor, dim=-1))
-            for i, ipt_node in enumerate(self.hessian_request.target_nodes):  # Per Interest point weights tensor
-
-                # Check if the target node's layer type is supported.
-                if not DEFAULT_PYTORCH_INFO.is_kernel_op(ipt_node.type):
-                    Logger.critical(f"Hessian information with respect to weights is not supported for "
-                                    f"{ipt_node.type} layers.")  # pragma: no cover
-
-                # Get the weight attributes for the target node type
-                weights_attributes = DEFAULT_PYTORCH_INFO.get_kernel_op_attributes(ipt_node.type)
-
-                # Get the weight tensor for the target node
-                if len(weights_attributes) != 1:  # pragma: no cover
-                    Logger.critical(f"Currently, Hessian scores with respect to weights are supported only for nodes with a "
-                                    f"single weight attribute. {len(weights_attributes)} attributes found.")
-
-                weights_tensor = getattr(getattr(model, ipt_node.name), weights_attributes[0])
-
-                # Get the output channel index
-                output_channel_axis, _ = DEFAULT_PYTORCH_INFO.kernel_channels_mapping.get(ipt_node.type)
-                shape_channel_axis = [i for i in range(len(weights_tensor.shape))]
-                if self.hessian_request.granularity == HessianScoresGranularity.PER_OUTPUT_CHANNEL:
-                    shape_channel_axis.remove(output_channel_axis)
-                elif self.hessian_request.granularity == HessianScoresGranularity.PER_ELEMENT:
-                    shape_channel_axis = ()
 
-                # Compute gradients of f_v with respect to the weights
-                f_v_grad = autograd.grad(outputs=f_v,
-                                         inputs=weights_tensor,
-                                         retain_graph=True)[0]
+            # Compute gradients of f_v with respect to all the target weights at once
+            f_v_grads = autograd.grad(outputs=f_v,
+                                      inputs=self.weights_tensors,
+                                      retain_graph=True)
 
+            for i, (f_v_grad, shape_channel_axis) in enumerate(zip(f_v_grads, reduce_axes)):
                 # Trace{A^T * A} = sum of all squares values of A
                 approx = f_v_grad ** 2
                 if len(shape_channel_axis) > 0:
@@ -15,6 +15,7 @@
 from typing import Dict, Any, List
 
 from model_compression_toolkit.core.common.mixed_precision.configurable_quant_id import ConfigurableQuantizerIdentifier
+from model_compression_toolkit.core.common.mixed_precision.compact_quantized_weights import CompactQuantizedWeights
 from model_compression_toolkit.core.common.mixed_precision.configurable_quantizer_utils import \
     verify_candidates_descending_order, init_quantized_weights
 from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
@@ -79,13 +80,16 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
                    self.node_q_cfg[0].weights_quantization_cfg.get_attr_config(self.kernel_attr).enable_weights_quantization:
                 Logger.critical("Unsupported configuration: Mixing candidates with differing weights quantization states (enabled/disabled).")  # pragma: no cover
 
-        # Initialize quantized weights for each weight that should be quantized.
+        # Initialize quantized weights for each weight that should be quantized. The weights of a candidate may
+        # be stored compactly, in which case they are decoded when the candidate is used.
         self.quantized_weights = init_quantized_weights(node_q_cfg=self.node_q_cfg,
                                                         float_weights=self.float_weights,
                                                         fw_tensor_convert_func=to_torch_tensor,
                                                         kernel_attr=kernel_attr)
 
         self.active_quantization_config_index = self.max_candidate_idx
+        # The decoded weights of the last used candidate (candidate index, weights tensor).
+        self._decoded_weights_cache = (None, None)
 
     def set_weights_bit_width_index(self,
                                     index: int):
@@ -120,4 +124,12 @@ class ConfigurableWeightsQuantizer(BasePyTorchInferableQuantizer):
                 index that is in active_quantization_config_index the quantizer holds).
         """
 
-        return self.quantized_weights[self.active_quantization_config_index]
+        quantized_weights = self.quantized_weights[self.active_quantization_config_index]
+        if not isinstance(quantized_weights, CompactQuantizedWeights):
+            return quantized_weights
+
+        cached_index, cached_weights = self._decoded_weights_cache
+        if cached_index != self.active_quantization_config_index:
+            cached_weights = to_torch_tensor(quantized_weights.decode())
+            self._decoded_weights_cache = (self.active_quantization_config_index, cached_weights)
+        return cached_weights
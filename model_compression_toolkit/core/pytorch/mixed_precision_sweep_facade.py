@@ -0,0 +1,102 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Callable, List
+
+from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.constants import PYTORCH
+from model_compression_toolkit.target_platform_capabilities.target_platform import TargetPlatformCapabilities
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_sweep import mixed_precision_sweep
+from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import MixedPrecisionQuantizationConfig
+from model_compression_toolkit.verify_packages import FOUND_TORCH
+
+if FOUND_TORCH:
+    from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+    from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+    from model_compression_toolkit.target_platform_capabilities.constants import DEFAULT_TP_MODEL
+    from torch.nn import Module
+
+    from model_compression_toolkit import get_target_platform_capabilities
+
+    PYTORCH_DEFAULT_TPC = get_target_platform_capabilities(PYTORCH, DEFAULT_TP_MODEL)
+
+
+    def pytorch_mixed_precision_sweep(in_model: Module,
+                                      representative_data_gen: Callable,
+                                      target_resource_utilizations: List[ResourceUtilization],
+                                      core_config: CoreConfig = CoreConfig(),
+                                      target_platform_capabilities: TargetPlatformCapabilities = PYTORCH_DEFAULT_TPC
+                                      ) -> List[List[int]]:
+        """
+        Searches a mixed-precision configuration for each of several target resource utilizations.
+        The model's graph is prepared once, and the sensitivity of the configurations, which doesn't depend on the
+        target resource utilization, is computed once and reused by the searches of all the targets.
+        If the mixed precision config sets a sensitivity_cache_dir, the sensitivity is also saved to it and reused
+        by later runs on the same model and data.
+
+        Args:
+            in_model (Module): PyTorch model to quantize.
+            representative_data_gen (Callable): Dataset used for calibration.
+            target_resource_utilizations (List[ResourceUtilization]): Target resource utilizations to search a mixed-precision configuration for.
+            core_config (CoreConfig): CoreConfig containing parameters for quantization and mixed precision.
+            target_platform_capabilities (TargetPlatformCapabilities): TargetPlatformCapabilities to optimize the PyTorch model according to.
+
+        Returns:
+
+            A list with a mixed-precision configuration for each target resource utilization. A configuration can be
+            set as the configuration_overwrite of the MixedPrecisionQuantizationConfig to quantize the model with it.
+
+        Examples:
+
+            Import a Pytorch model:
+
+            >>> from torchvision import models
+            >>> module = models.mobilenet_v2()
+
+            Create a random dataset generator:
+
+            >>> import numpy as np
+            >>> def repr_datagen(): yield [np.random.random((1, 3, 224, 224))]
+
+            Compute the model's resource utilization data, and search configurations for 50% and 75% of its weights memory:
+
+            >>> import model_compression_toolkit as mct
+            >>> ru_data = mct.core.pytorch_resource_utilization_data(module, repr_datagen)
+            >>> targets = [mct.core.ResourceUtilization(weights_memory=ru_data.weights_memory * r) for r in [0.5, 0.75]]
+            >>> configs = mct.core.pytorch_mixed_precision_sweep(module, repr_datagen, targets)
+
+        """
+
+        if not isinstance(core_config.mixed_precision_config, MixedPrecisionQuantizationConfig):
+            Logger.critical("Mixed precision sweep requires a MixedPrecisionQuantizationConfig object. "
+                            "The provided 'mixed_precision_config' is not of this type.")
+
+        fw_impl = PytorchImplementation()
+
+        return mixed_precision_sweep(in_model,
+                                     representative_data_gen,
+                                     core_config,
+                                     target_resource_utilizations,
+                                     DEFAULT_PYTORCH_INFO,
+                                     fw_impl,
+                                     target_platform_capabilities)
+
+else:
+    # If torch is not installed,
+    # we raise an exception when trying to use this function.
+    def pytorch_mixed_precision_sweep(*args, **kwargs):
+        Logger.critical("PyTorch must be installed to use 'pytorch_mixed_precision_sweep'. "
+                        "The 'torch' package is missing.")  # pragma: no cover
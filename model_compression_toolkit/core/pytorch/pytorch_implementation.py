@@ -90,6 +90,7 @@ from model_compression_toolkit.core.pytorch.mixed_precision.configurable_weights
     ConfigurableWeightsQuantizer
 from model_compression_toolkit.core.pytorch.pytorch_node_prior_info import create_node_prior_info
 from model_compression_toolkit.core.pytorch.reader.reader import model_reader
+from model_compression_toolkit.core.pytorch.quantizer.qparams_search_backend import PytorchQparamsSearchBackend
 from model_compression_toolkit.core.pytorch.statistics_correction.apply_second_moment_correction import \
     pytorch_apply_second_moment_correction
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy, set_model
@@ -98,6 +99,8 @@ from model_compression_toolkit.exporter.model_wrapper.fw_agnostic.get_inferable_
 from model_compression_toolkit.exporter.model_wrapper.pytorch.builder.node_to_quantizer import \
     get_weights_quantizer_for_node, get_activations_quantizer_for_node
 from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.core.common.collectors.statistics_collector import ReducedStatistics
+from model_compression_toolkit.core.pytorch.statistics_reduction import reduce_statistics_pytorch
 
 
 class PytorchImplementation(FrameworkImplementation):
@@ -136,6 +139,24 @@ class PytorchImplementation(FrameworkImplementation):
         """
         return to_torch_tensor(tensor)
 
+    def reduce_statistics(self,
+                          tensor: torch.Tensor,
+                          channel_axis: int,
+                          n_bins: int) -> ReducedStatistics:
+        """
+        Reduce a Pytorch tensor to the statistics that are collected by a StatsCollector (histogram,
+        mean per channel and min/max per channel), on the tensor's device.
+
+        Args:
+            tensor: Pytorch tensor to reduce.
+            channel_axis: Index of the channels axis.
+            n_bins: Number of bins in the histogram.
+
+        Returns:
+            The reduced statistics of the tensor.
+        """
+        return reduce_statistics_pytorch(tensor, channel_axis, n_bins)
+
     def model_reader(self,
                      module: Module,
                      representative_data_gen: Callable) -> Graph:
@@ -520,6 +541,54 @@ class PytorchImplementation(FrameworkImplementation):
 
         return model(*inputs)
 
+    def get_qparams_search_backend(self) -> PytorchQparamsSearchBackend:
+        """
+        Returns a backend that evaluates the weights quantization parameters search candidates with torch tensors
+        on the working device.
+
+        Returns:
+            A PytorchQparamsSearchBackend.
+        """
+        return PytorchQparamsSearchBackend()
+
+    def get_sensitivity_eval_prefix_cache(self,
+                                          model: Module,
+                                          inputs: Any,
+                                          resume_nodes_names: List[str]) -> Any:
+        """
+        Run a Pytorch model inference during mixed precision sensitivity evaluation and cache the intermediate
+        tensors that are required in order to resume the inference from just before each of the given nodes.
+
+        Args:
+            model: A Pytorch model (built by a PyTorchModelBuilder) to run inference for.
+            inputs: Input tensors to run inference on.
+            resume_nodes_names: Names of nodes from which the inference may be resumed.
+
+        Returns:
+            A prefix cache of the model for the given inputs.
+        """
+
+        return model.build_prefix_cache(inputs, resume_nodes_names)
+
+    def sensitivity_eval_inference_from_prefix_cache(self,
+                                                     model: Module,
+                                                     prefix_cache: Any,
+                                                     changed_nodes_names: List[str]):
+        """
+        Resume a Pytorch model inference during mixed precision sensitivity evaluation from a prefix cache,
+        recomputing only the nodes that come after the first changed node.
+
+        Args:
+            model: A Pytorch model (built by a PyTorchModelBuilder) to run inference for.
+            prefix_cache: A prefix cache that was built for the model.
+            changed_nodes_names: Names of nodes that were re-configured since the prefix cache was built.
+
+        Returns:
+            The output of the model inference.
+        """
+
+        return model.resume_forward(prefix_cache, changed_nodes_names)
+
     def get_hessian_scores_calculator(self,
                                       graph: Graph,
                                       input_images: List[Any],
@@ -0,0 +1,105 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import torch
+
+from model_compression_toolkit.constants import QPARAMS_SEARCH_GPU_BLOCK_ELEMENTS
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QparamsSearchBackend
+from model_compression_toolkit.core.pytorch.constants import CUDA
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+
+
+class PytorchQparamsSearchBackend(QparamsSearchBackend):
+    """
+    Quantization parameters search backend that evaluates the candidates with torch tensors on the working device.
+    The candidates are computed in double precision, as the numpy backend computes them, such that both backends
+    select the same quantization parameters.
+    """
+
+    def __init__(self):
+        self.device = get_working_device()
+        if self.device.type == CUDA:
+            # Large blocks of candidates utilize the GPU better than the cache-sized blocks of the CPU.
+            self.max_block_elements = QPARAMS_SEARCH_GPU_BLOCK_ELEMENTS
+
+    def to_tensor(self, x: np.ndarray) -> torch.Tensor:
+        """
+        Convert a numpy array to a torch tensor on the working device. The array is copied, since the searched
+        arrays can be read-only (e.g., broadcast views), and torch doesn't support tensors on non-writable memory.
+
+        Args:
+            x: Numpy array to convert.
+
+        Returns:
+            A torch tensor.
+        """
+        return torch.tensor(x, dtype=torch.float64, device=self.device)
+
+    def to_numpy(self, x: torch.Tensor) -> np.ndarray:
+        """
+        Convert a torch tensor to a numpy array.
+
+        Args:
+            x: Tensor to convert.
+
+        Returns:
+            A numpy array.
+        """
+        return x.cpu().numpy()
+
+    def quantize(self, x: torch.Tensor, threshold: torch.Tensor, n_bits: int, signed: bool) -> torch.Tensor:
+        """
+        Quantize a tensor with a threshold (see quantize_tensor).
+
+        Args:
+            x: Tensor to quantize.
+            threshold: Threshold for quantization ranges.
+            n_bits: Number of bits to quantize the tensor.
+            signed: Whether the quantization range is signed or not.
+
+        Returns:
+            Quantized tensor.
+        """
+        delta = threshold / (2 ** (n_bits - int(signed)))
+        return self.uniform_quantize(x, -threshold * int(signed), threshold - delta, n_bits)
+
+    def uniform_quantize(self, x: torch.Tensor, range_min: torch.Tensor, range_max: torch.Tensor,
+                         n_bits: int) -> torch.Tensor:
+        """
+        Quantize a tensor with a quantization range (see uniform_quantize_tensor).
+
+        Args:
+            x: Tensor to quantize.
+            range_min: Minimum bound of the quantization range.
+            range_max: Maximum bound of the quantization range.
+            n_bits: Number of bits to quantize the tensor.
+
+        Returns:
+            Quantized tensor.
+        """
+        # adjusts the quantization range so the quantization grid includes zero (see fix_range_to_include_zero).
+        min_positive = range_min > 0
+        max_negative = range_max < 0
+        mid_range = torch.logical_and(~min_positive, ~max_negative)
+        scale = (range_max - range_min) / (2 ** n_bits - 1)
+        min_range_adj = scale * torch.round(range_min / scale)
+        max_range_adj = range_max - range_min + min_range_adj
+        a = min_range_adj * mid_range + max_negative * range_min
+        b = max_range_adj * mid_range + min_positive * range_max
+
+        delta = (b - a) / (2 ** n_bits - 1)
+        clipped_x = torch.minimum(torch.maximum(x, a), b)
+        return delta * torch.round((clipped_x - a) / delta) + a
@@ -0,0 +1,62 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.constants import LAST_AXIS
+from model_compression_toolkit.core.common.collectors.histogram_collector import get_histogram_bins
+from model_compression_toolkit.core.common.collectors.statistics_collector import ReducedStatistics
+from model_compression_toolkit.core.pytorch.utils import torch_tensor_to_numpy
+
+
+def reduce_statistics_pytorch(tensor: Any,
+                              channel_axis: int,
+                              n_bins: int) -> ReducedStatistics:
+    """
+    Reduce a tensor to the statistics that are collected by a StatsCollector (histogram, mean per channel
+    and min/max per channel). The reduction is done on the tensor's device, in float64 precision (same as the
+    collectors' Numpy computation), so only the reduced statistics are copied to the host.
+
+    Args:
+        tensor: Tensor to reduce.
+        channel_axis: Index of the channels axis.
+        n_bins: Number of bins in the histogram.
+
+    Returns:
+        The reduced statistics of the tensor.
+    """
+    x = tensor if isinstance(tensor, torch.Tensor) else torch.as_tensor(np.asarray(tensor))
+    x = x.detach().to(torch.float64)
+    if x.dim() == 0:
+        x = x.reshape([1])
+
+    axis = (x.dim() - 1) if channel_axis == LAST_AXIS else channel_axis
+    x_per_channel = torch.movedim(x, axis, 0).reshape([x.shape[axis], -1])
+    max_per_channel = torch.amax(x_per_channel, dim=-1)
+    min_per_channel = torch.amin(x_per_channel, dim=-1)
+
+    # The histogram bins are computed on the host (same as np.histogram), and each value is assigned to the bin
+    # it falls in, where the last bin also includes its right edge.
+    bins = get_histogram_bins(torch.min(min_per_channel).item(), torch.max(max_per_channel).item(), n_bins)
+    bins_indices = torch.bucketize(x.flatten(), torch.as_tensor(bins, device=x.device), right=True) - 1
+    counts = torch.bincount(torch.clamp(bins_indices, 0, n_bins - 1), minlength=n_bins)
+
+    return ReducedStatistics(histogram_counts=torch_tensor_to_numpy(counts),
+                             histogram_bins=bins,
+                             mean_per_channel=torch_tensor_to_numpy(torch.mean(x_per_channel, dim=-1)),
+                             max_per_channel=torch_tensor_to_numpy(max_per_channel),
+                             min_per_channel=torch_tensor_to_numpy(min_per_channel))
@@ -67,6 +67,10 @@ def to_torch_tensor(data,
         return tuple(to_torch_tensor(t, dtype) for t in data)
 
     kwargs = {} if dtype is None else {'dtype': dtype}
+    if isinstance(data, np.ndarray) and not data.flags.writeable:
+        # Read-only arrays (e.g. weights shared between copies of a graph) are copied, so that in-place operations
+        # on the returned tensor can't modify them.
+        return torch.tensor(data, device=working_device, **kwargs)
     return torch.as_tensor(data, device=working_device, **kwargs)
 
 
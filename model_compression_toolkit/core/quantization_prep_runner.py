@@ -91,7 +91,9 @@ def quantization_preparation_runner(graph: Graph,
     ######################################
 
     calculate_quantization_params(graph, fw_impl=fw_impl, repr_data_gen_fn=representative_data_gen,
-                                  hessian_info_service=hessian_info_service)
+                                  hessian_info_service=hessian_info_service,
+                                  num_workers=core_config.quantization_config.qparams_search_num_workers,
+                                  use_framework_search_backend=core_config.quantization_config.qparams_search_framework_backend)
 
     if tb_w is not None:
         tb_w.add_graph(graph, 'thresholds_selection')
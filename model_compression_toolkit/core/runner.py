@@ -36,6 +36,7 @@ from model_compression_toolkit.core.quantization_prep_runner import quantization
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.graph.base_graph import Graph
+from model_compression_toolkit.core.common.graph.prepared_graphs_cache import PreparedGraphsCache
 from model_compression_toolkit.core.common.mixed_precision.bit_width_setter import set_bit_widths
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization, RUTarget
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_aggregation_methods import MpRuAggregation
@@ -95,6 +96,10 @@ def core_runner(in_model: Any,
         Logger.warning('representative_data_gen generates a batch size of 1 which can be slow for optimization:'
                        ' consider increasing the batch size')
 
+    # The graphs prepared in this run, so the graph prepared for the mixed precision check is reused for the
+    # quantization (without the check, the graph is prepared once, and there is nothing to reuse).
+    prepared_graphs_cache = None if target_resource_utilization is None else PreparedGraphsCache()
+
     # Checking whether to run mixed precision quantization
     if target_resource_utilization is not None:
         if core_config.mixed_precision_config is None:
@@ -107,7 +112,8 @@ def core_runner(in_model: Any,
                                     core_config,
                                     tpc,
                                     fw_info,
-                                    fw_impl):
+                                    fw_impl,
+                                    prepared_graphs_cache=prepared_graphs_cache):
             core_config.mixed_precision_config.set_mixed_precision_enable()
             Logger.info('Mixed precision enabled.')
 
@@ -120,9 +126,11 @@ def core_runner(in_model: Any,
                                      core_config.bit_width_config,
                                      tb_w,
                                      mixed_precision_enable=core_config.is_mixed_precision_enabled,
-                                     running_gptq=running_gptq)
+                                     running_gptq=running_gptq,
+                                     prepared_graphs_cache=prepared_graphs_cache)
 
-    hessian_info_service = HessianInfoService(graph=graph, fw_impl=fw_impl)
+    hessian_info_service = HessianInfoService(graph=graph, fw_impl=fw_impl,
+                                              cache_config=core_config.hessian_cache_config)
 
     tg = quantization_preparation_runner(graph=graph,
                                          representative_data_gen=representative_data_gen,
@@ -16,11 +16,17 @@
 from model_compression_toolkit.verify_packages import FOUND_TORCHVISION, FOUND_TORCH, FOUND_TF
 from model_compression_toolkit.data_generation.common.data_generation_config import DataGenerationConfig
 from model_compression_toolkit.data_generation.common.enums import ImageGranularity, DataInitType, SchedulerType, BNLayerWeightingType, OutputLossType, BatchNormAlignemntLossType, ImagePipelineType, ImageNormalizationType
+from model_compression_toolkit.data_generation.common.image_shards import ImagesShardsDataset
 
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
+
+_facades = {}
 if FOUND_TF:
-    from model_compression_toolkit.data_generation.keras.keras_data_generation import (
-        keras_data_generation_experimental, get_keras_data_generation_config)
+    _facades.update({'keras_data_generation_experimental': 'model_compression_toolkit.data_generation.keras.keras_data_generation',
+                     'get_keras_data_generation_config': 'model_compression_toolkit.data_generation.keras.keras_data_generation'})
 
 if FOUND_TORCH and FOUND_TORCHVISION:
-    from model_compression_toolkit.data_generation.pytorch.pytorch_data_generation import (
-        pytorch_data_generation_experimental, get_pytorch_data_generation_config)
+    _facades.update({'pytorch_data_generation_experimental': 'model_compression_toolkit.data_generation.pytorch.pytorch_data_generation',
+                     'get_pytorch_data_generation_config': 'model_compression_toolkit.data_generation.pytorch.pytorch_data_generation'})
+
+__getattr__, __dir__ = _lazy_attributes(__name__, attributes=_facades)
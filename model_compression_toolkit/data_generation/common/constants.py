@@ -25,3 +25,9 @@ DEFAULT_DATA_GEN_BS = 32
 
 # Default number of iterations.
 DEFAULT_N_ITER = 500
+
+# Default number of batches that are optimized together and saved as a shard, when streaming the generated images.
+DEFAULT_SHARD_N_BATCHES = 8
+
+# Name of the manifest file of the generated images shards.
+IMAGES_SHARDS_MANIFEST = 'manifest.json'
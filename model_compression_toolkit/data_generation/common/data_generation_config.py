@@ -14,6 +14,7 @@
 # ==============================================================================
 from typing import Any, List, Tuple, Union
 
+from model_compression_toolkit.data_generation.common.constants import DEFAULT_SHARD_N_BATCHES
 from model_compression_toolkit.data_generation.common.enums import SchedulerType, BatchNormAlignemntLossType, \
     DataInitType, BNLayerWeightingType, ImageGranularity, ImagePipelineType, ImageNormalizationType, OutputLossType
 
@@ -39,6 +40,8 @@ class DataGenerationConfig:
                  bn_layer_types: List = [],
                  last_layer_types: List = [],
                  image_clipping: bool = True,
+                 output_dir: str = None,
+                 shard_n_batches: int = DEFAULT_SHARD_N_BATCHES,
                  ):
         """
         Initialize the DataGenerationConfig.
@@ -61,6 +64,8 @@ class DataGenerationConfig:
             bn_layer_types (List): List of BatchNorm layer types. Defaults to [].
             last_layer_types (List): List of layer types. Defaults to [].
             image_clipping (bool): Flag to enable image clipping. Defaults to True.
+            output_dir (str): Directory to stream the generated images to, as shards of images that are optimized together. If None, all the images are optimized together and returned in memory. Defaults to None.
+            shard_n_batches (int): Number of batches that are optimized together and saved as a shard, when output_dir is set. Defaults to DEFAULT_SHARD_N_BATCHES.
         """
         self.n_iter = n_iter
         self.optimizer = optimizer
@@ -79,5 +84,7 @@ class DataGenerationConfig:
         self.last_layer_types = last_layer_types
         self.image_clipping = image_clipping
         self.output_loss_multiplier = output_loss_multiplier
+        self.output_dir = output_dir
+        self.shard_n_batches = shard_n_batches
 
 
@@ -0,0 +1,205 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import tempfile
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+import numpy as np
+
+from model_compression_toolkit.data_generation.common.constants import IMAGES_SHARDS_MANIFEST
+from model_compression_toolkit.logger import Logger
+
+
+class ImagesShardsWriter:
+    """
+    Saves generated images to an output directory as shards ('.npy' files) of a fixed number of images, and keeps
+    a manifest of the completed shards.
+
+    A shard is written to a temporary file that replaces the shard's file once it's complete, and the manifest is
+    updated only after that, so the manifest lists only complete shards. If the output directory already holds a
+    manifest of the same generation (same number of images and images per shard), the writer resumes from the
+    first shard that is missing in it.
+    """
+
+    def __init__(self,
+                 output_dir: str,
+                 n_images: int,
+                 shard_n_images: int):
+        """
+        Args:
+            output_dir: Directory to save the shards and the manifest in. Created if it does not exist.
+            n_images: Total number of images to generate.
+            shard_n_images: Number of images in a shard (the last shard may hold fewer images).
+        """
+        self.output_dir = output_dir
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        self.manifest = {'n_images': n_images,
+                         'shard_n_images': shard_n_images,
+                         'image_shape': None,
+                         'dtype': None,
+                         'shards': []}
+        manifest_path = os.path.join(self.output_dir, IMAGES_SHARDS_MANIFEST)
+        if os.path.isfile(manifest_path):
+            manifest = load_images_shards_manifest(self.output_dir)
+            if manifest['n_images'] != n_images or manifest['shard_n_images'] != shard_n_images:
+                Logger.critical(f"Output directory {self.output_dir} holds images of a different generation "
+                                f"({manifest['n_images']} images, {manifest['shard_n_images']} images per shard) "
+                                f"than requested ({n_images} images, {shard_n_images} images per shard). "
+                                f"Please remove it or set a different output directory.")
+            self.manifest = manifest
+            if len(self.manifest['shards']) > 0:
+                Logger.info(f"Resuming data generation from {self.get_n_completed_images()} generated images "
+                            f"({len(self.manifest['shards'])} shards) in {self.output_dir}.")
+
+    def get_n_completed_images(self) -> int:
+        """
+        Returns:
+            The number of images in the completed shards.
+        """
+        return sum(shard['n_images'] for shard in self.manifest['shards'])
+
+    def get_n_remaining_images(self) -> int:
+        """
+        Returns:
+            The number of images left to generate.
+        """
+        return self.manifest['n_images'] - self.get_n_completed_images()
+
+    def write_shard(self, images: List[Any]):
+        """
+        Save images as the next shard, and add it to the manifest.
+
+        Args:
+            images: List of images to save. Each image is an array (or a tensor that converts to a Numpy array) with
+              a batch dimension of size 1, as returned by the framework's images optimization handler.
+        """
+        image_shape = list(np.asarray(images[0]).shape[1:])
+        if self.manifest['image_shape'] is None:
+            self.manifest['image_shape'] = image_shape
+            self.manifest['dtype'] = np.dtype(np.float32).name
+        elif self.manifest['image_shape'] != image_shape:
+            Logger.critical(f"Generated images of shape {image_shape} do not match the shape "
+                            f"{self.manifest['image_shape']} of the images in {self.output_dir}.")
+
+        shard_file = f"images_shard_{len(self.manifest['shards']):05d}.npy"
+        # Write to a temporary file and replace, so a shard is never partially written.
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix='.tmp')
+        os.close(fd)
+        shard = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=self.manifest['dtype'],
+                                          shape=(len(images), *image_shape))
+        for i, image in enumerate(images):
+            shard[i] = np.asarray(image)[0]
+        shard.flush()
+        del shard
+        os.replace(tmp_path, os.path.join(self.output_dir, shard_file))
+
+        self.manifest['shards'].append({'file': shard_file, 'n_images': len(images)})
+        self._save_manifest()
+
+    def write_shards(self,
+                     init_dataset: Iterable,
+                     shard_n_batches: int,
+                     generate_images_fn: Callable[[Iterable], List[Any]]):
+        """
+        Generate the remaining images shard by shard: each time, the next batches of the initial dataset are
+        optimized together and the generated images are saved as a shard. Only the images of the shard being
+        generated are held in memory.
+
+        Args:
+            init_dataset: Initial dataset of the remaining images to generate, in batches.
+            shard_n_batches: Number of batches in a shard.
+            generate_images_fn: Function that gets an iterable of initial batches, optimizes them and returns the
+              list of generated images.
+        """
+        init_batches = iter(init_dataset)
+        while self.get_n_remaining_images() > 0:
+            images = generate_images_fn(islice(init_batches, shard_n_batches))
+            if len(images) == 0:
+                Logger.critical(f"The initial dataset ran out with {self.get_n_remaining_images()} images left "
+                                f"to generate.")  # pragma: no cover
+            self.write_shard(images)
+
+    def _save_manifest(self):
+        """
+        Save the manifest to the output directory.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.output_dir, IMAGES_SHARDS_MANIFEST))
+
+
+class ImagesShardsDataset:
+    """
+    A representative dataset generator of the images saved by an ImagesShardsWriter.
+
+    The shards are memory-mapped and read lazily, a batch at a time, so the generated images are never loaded to
+    memory all at once. Calling the dataset returns a generator of batches, so it can be passed directly as the
+    representative_data_gen of MCT's quantization facades.
+    """
+
+    def __init__(self,
+                 output_dir: str,
+                 batch_size: int):
+        """
+        Args:
+            output_dir: Directory of the images shards and their manifest.
+            batch_size: Number of images in a batch. Batches do not cross shards, so the last batch of a shard
+              may be smaller.
+        """
+        if batch_size < 1:
+            Logger.critical(f"Batch size must be a positive integer, but got {batch_size}.")
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.manifest = load_images_shards_manifest(output_dir)
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            The number of images in the dataset.
+        """
+        return sum(shard['n_images'] for shard in self.manifest['shards'])
+
+    def __call__(self) -> Iterator[List[np.ndarray]]:
+        """
+        Iterate over the images in batches.
+
+        Returns:
+            A generator of batches, each is a list with a single array of images.
+        """
+        for shard in self.manifest['shards']:
+            images = np.load(os.path.join(self.output_dir, shard['file']), mmap_mode='r')
+            for start in range(0, images.shape[0], self.batch_size):
+                yield [np.array(images[start: start + self.batch_size])]
+
+
+def load_images_shards_manifest(output_dir: str) -> Dict:
+    """
+    Load the manifest of the images shards in a directory.
+
+    Args:
+        output_dir: Directory of the images shards.
+
+    Returns:
+        The manifest.
+    """
+    manifest_path = os.path.join(output_dir, IMAGES_SHARDS_MANIFEST)
+    if not os.path.isfile(manifest_path):
+        Logger.critical(f"No generated images manifest was found in {output_dir}.")
+    with open(manifest_path) as f:
+        return json.load(f)
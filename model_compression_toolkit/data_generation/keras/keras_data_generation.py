@@ -13,13 +13,19 @@
 # limitations under the License.
 # ==============================================================================
 import time
-from typing import Callable, Tuple, List, Dict, Union
+from functools import partial
+from typing import Callable, Tuple, List, Dict, Union, Iterable
+
+import numpy as np
 from tqdm import tqdm
 
 from model_compression_toolkit.verify_packages import FOUND_TF
-from model_compression_toolkit.data_generation.common.constants import DEFAULT_N_ITER, DEFAULT_DATA_GEN_BS
+from model_compression_toolkit.data_generation.common.constants import DEFAULT_N_ITER, DEFAULT_DATA_GEN_BS, \
+    DEFAULT_SHARD_N_BATCHES
 from model_compression_toolkit.data_generation.common.data_generation import get_data_generation_classes
-from model_compression_toolkit.data_generation.common.image_pipeline import image_normalization_dict
+from model_compression_toolkit.data_generation.common.image_pipeline import image_normalization_dict, \
+    BaseImagePipeline
+from model_compression_toolkit.data_generation.common.image_shards import ImagesShardsWriter, ImagesShardsDataset
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.data_generation.common.data_generation_config import DataGenerationConfig, \
     ImageGranularity
@@ -66,6 +72,8 @@ if FOUND_TF:
             extra_pixels: Union[int, Tuple[int, int]] = DEFAULT_KERAS_EXTRA_PIXELS,
             bn_layer_types: List = [BatchNormalization],
             image_clipping: bool = False,
+            output_dir: str = None,
+            shard_n_batches: int = DEFAULT_SHARD_N_BATCHES,
     ) -> DataGenerationConfig:
         """
         Function to create a DataGenerationConfig object with the specified configuration parameters.
@@ -87,6 +95,8 @@ if FOUND_TF:
             extra_pixels (Union[int, Tuple[int, int]]): Extra pixels to add to the input image size. Defaults to 0.
             bn_layer_types (List): List of BatchNorm layer types to be considered for data generation.
             image_clipping (bool): Whether to clip images during optimization.
+            output_dir (str): Directory to stream the generated images to. If set, the images are generated in shards of shard_n_batches batches that are optimized together, each shard is saved to the directory once it's generated, and an interrupted generation resumes from the last saved shard.
+            shard_n_batches (int): Number of batches that are optimized together and saved as a shard, when output_dir is set.
 
         Returns:
             DataGenerationConfig: Data generation configuration object.
@@ -109,17 +119,24 @@ if FOUND_TF:
             image_normalization_type=image_normalization_type,
             extra_pixels=extra_pixels,
             bn_layer_types=bn_layer_types,
-            image_clipping=image_clipping)
+            image_clipping=image_clipping,
+            output_dir=output_dir,
+            shard_n_batches=shard_n_batches)
 
 
     def keras_data_generation_experimental(
             model: tf.keras.Model,
             n_images: int,
             output_image_size: Union[int, Tuple[int, int]],
-            data_generation_config: DataGenerationConfig) -> tf.Tensor:
+            data_generation_config: DataGenerationConfig) -> Union[List[np.ndarray], ImagesShardsDataset]:
         """
         Function to perform data generation using the provided Keras model and data generation configuration.
 
+        If the configuration's output_dir is set, the images are streamed to it: they are generated in shards of
+        batches that are optimized together, and each shard is saved to the directory (as a memory-mapped '.npy'
+        file, listed in a manifest) once it's generated. Calling the function again with the same output_dir
+        resumes the generation from the last saved shard.
+
         Args:
             model (Model): Keras model to generate data for.
             n_images (int): Number of images to generate.
@@ -127,7 +144,7 @@ if FOUND_TF:
             data_generation_config (DataGenerationConfig): Configuration for data generation.
 
         Returns:
-            List[tf.Tensor]: Finalized list containing generated images.
+            Union[List[np.ndarray], ImagesShardsDataset]: Finalized list containing generated images, or, if output_dir is set, a dataset that lazily reads the saved images and can be used directly as a representative dataset generator.
 
         Examples:
 
@@ -163,11 +180,21 @@ if FOUND_TF:
                        f"If you encounter an issue, please open an issue in our GitHub "
                        f"project https://github.com/sony/model_optimization")
 
+        # Create a writer of the images shards, to generate only the images that are not saved yet
+        images_shards_writer = None
+        n_images_to_generate = n_images
+        if data_generation_config.output_dir is not None:
+            images_shards_writer = ImagesShardsWriter(
+                output_dir=data_generation_config.output_dir,
+                n_images=n_images,
+                shard_n_images=data_generation_config.shard_n_batches * data_generation_config.data_gen_batch_size)
+            n_images_to_generate = images_shards_writer.get_n_remaining_images()
+
         # Get Data Generation functions and classes
         image_pipeline, normalization, bn_layer_weighting_fn, bn_alignment_loss_fn, output_loss_fn, \
             init_dataset = get_data_generation_classes(data_generation_config=data_generation_config,
                                                        output_image_size=output_image_size,
-                                                       n_images=n_images,
+                                                       n_images=n_images_to_generate,
                                                        image_pipeline_dict=image_pipeline_dict,
                                                        image_normalization_dict=image_normalization_dict,
                                                        bn_layer_weighting_function_dict=
@@ -201,6 +228,60 @@ if FOUND_TF:
         orig_bn_stats_holder = KerasOriginalBNStatsHolder(model=model,
                                                           bn_layer_types=data_generation_config.bn_layer_types)
 
+        # Optimize the images of an initial dataset and return the finalized images
+        generate_images_fn = partial(keras_optimize_images,
+                                     model=model,
+                                     data_generation_config=data_generation_config,
+                                     image_pipeline=image_pipeline,
+                                     normalization=normalization,
+                                     activation_extractor=activation_extractor,
+                                     orig_bn_stats_holder=orig_bn_stats_holder,
+                                     scheduler=scheduler,
+                                     bn_layer_weighting_fn=bn_layer_weighting_fn,
+                                     bn_alignment_loss_fn=bn_alignment_loss_fn,
+                                     output_loss_fn=output_loss_fn)
+
+        if images_shards_writer is None:
+            # Return a list containing the finalized generated images
+            return generate_images_fn(init_dataset)
+
+        # Generate the images shard by shard, and return a dataset of the saved images
+        images_shards_writer.write_shards(init_dataset=init_dataset,
+                                          shard_n_batches=data_generation_config.shard_n_batches,
+                                          generate_images_fn=generate_images_fn)
+        return ImagesShardsDataset(output_dir=data_generation_config.output_dir,
+                                   batch_size=data_generation_config.data_gen_batch_size)
+
+    def keras_optimize_images(init_dataset: Iterable,
+                              model: tf.keras.Model,
+                              data_generation_config: DataGenerationConfig,
+                              image_pipeline: BaseImagePipeline,
+                              normalization: List[List[float]],
+                              activation_extractor: KerasActivationExtractor,
+                              orig_bn_stats_holder: KerasOriginalBNStatsHolder,
+                              scheduler: Callable,
+                              bn_layer_weighting_fn: Callable,
+                              bn_alignment_loss_fn: Callable,
+                              output_loss_fn: Callable) -> List[np.ndarray]:
+        """
+        Function to optimize the batches of an initial dataset together, and return the finalized images.
+
+        Args:
+            init_dataset (Iterable): The initial batches of images to optimize.
+            model (Model): Keras model to generate data for.
+            data_generation_config (DataGenerationConfig): Configuration for data generation.
+            image_pipeline (BaseImagePipeline): The image pipeline for processing images during optimization.
+            normalization (List[List[float]]): The image normalization values (mean and std).
+            activation_extractor (KerasActivationExtractor): Extractor for layer activations.
+            orig_bn_stats_holder (KerasOriginalBNStatsHolder): Object to hold original BatchNorm statistics.
+            scheduler (Callable): Function for creating the scheduler of a batch optimizer.
+            bn_layer_weighting_fn (Callable): Function to compute layer weighting for the BatchNorm alignment loss.
+            bn_alignment_loss_fn (Callable): Function to compute BatchNorm alignment loss.
+            output_loss_fn (Callable): Function to compute output loss.
+
+        Returns:
+            List[np.ndarray]: Finalized list containing generated images.
+        """
         # Create an ImagesOptimizationHandler object for handling optimization
         all_imgs_opt_handler = KerasImagesOptimizationHandler(
             init_dataset=init_dataset,
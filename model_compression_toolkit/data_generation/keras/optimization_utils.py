@@ -279,7 +279,8 @@ class KerasImagesOptimizationHandler(ImagesOptimizationHandler):
 
             # Apply the image_pipeline's image_output_finalize method to finalize the batch of images
             finalized_batch = self.image_pipeline.image_output_finalize(batch_imgs).numpy()
-            finalized_images += np.split(finalized_batch, indices_or_sections=self.batch_size, axis=BATCH_AXIS)
+            finalized_images += np.split(finalized_batch, indices_or_sections=finalized_batch.shape[BATCH_AXIS],
+                                         axis=BATCH_AXIS)
         return finalized_images
 
 
@@ -15,19 +15,22 @@
 import copy
 
 import time
-from typing import Callable, Any, Tuple, List, Union
+from functools import partial
+from typing import Callable, Any, Tuple, List, Union, Iterable
 
 from tqdm import tqdm
 
 from model_compression_toolkit.verify_packages import FOUND_TORCHVISION, FOUND_TORCH
 from model_compression_toolkit.core.pytorch.utils import set_model
-from model_compression_toolkit.data_generation.common.constants import DEFAULT_N_ITER, DEFAULT_DATA_GEN_BS
+from model_compression_toolkit.data_generation.common.constants import DEFAULT_N_ITER, DEFAULT_DATA_GEN_BS, \
+    DEFAULT_SHARD_N_BATCHES
 from model_compression_toolkit.data_generation.common.data_generation import get_data_generation_classes
 from model_compression_toolkit.data_generation.common.data_generation_config import DataGenerationConfig
 from model_compression_toolkit.data_generation.common.enums import ImageGranularity, SchedulerType, \
     BatchNormAlignemntLossType, DataInitType, BNLayerWeightingType, ImagePipelineType, ImageNormalizationType, \
     OutputLossType
 from model_compression_toolkit.data_generation.common.image_pipeline import image_normalization_dict
+from model_compression_toolkit.data_generation.common.image_shards import ImagesShardsWriter, ImagesShardsDataset
 from model_compression_toolkit.data_generation.pytorch.constants import DEFAULT_PYTORCH_INITIAL_LR, \
     DEFAULT_PYTORCH_BN_LAYER_TYPES, DEFAULT_PYTORCH_LAST_LAYER_TYPES, DEFAULT_PYTORCH_EXTRA_PIXELS, \
     DEFAULT_PYTORCH_OUTPUT_LOSS_MULTIPLIER
@@ -78,6 +81,8 @@ if FOUND_TORCH and FOUND_TORCHVISION:
             bn_layer_types: List = DEFAULT_PYTORCH_BN_LAYER_TYPES,
             last_layer_types: List = DEFAULT_PYTORCH_LAST_LAYER_TYPES,
             image_clipping: bool = True,
+            output_dir: str = None,
+            shard_n_batches: int = DEFAULT_SHARD_N_BATCHES,
     ) -> DataGenerationConfig:
         """
         Function to create a DataGenerationConfig object with the specified configuration parameters.
@@ -100,7 +105,8 @@ if FOUND_TORCH and FOUND_TORCHVISION:
             bn_layer_types (List): List of BatchNorm layer types to be considered for data generation.
             last_layer_types (List): List of layer types to be considered for the output loss.
             image_clipping (bool): Whether to clip images during optimization.
-
+            output_dir (str): Directory to stream the generated images to. If set, the images are generated in shards of shard_n_batches batches that are optimized together, each shard is saved to the directory once it's generated, and an interrupted generation resumes from the last saved shard.
+            shard_n_batches (int): Number of batches that are optimized together and saved as a shard, when output_dir is set.
 
         Returns:
             DataGenerationConfig: Data generation configuration object.
@@ -125,6 +131,8 @@ if FOUND_TORCH and FOUND_TORCHVISION:
             bn_layer_types=bn_layer_types,
             last_layer_types=last_layer_types,
             image_clipping=image_clipping,
+            output_dir=output_dir,
+            shard_n_batches=shard_n_batches,
         )
 
 
@@ -132,10 +140,15 @@ if FOUND_TORCH and FOUND_TORCHVISION:
             model: Module,
             n_images: int,
             output_image_size: Union[int, Tuple[int, int]],
-            data_generation_config: DataGenerationConfig) -> List[Tensor]:
+            data_generation_config: DataGenerationConfig) -> Union[List[Tensor], ImagesShardsDataset]:
         """
         Function to perform data generation using the provided model and data generation configuration.
 
+        If the configuration's output_dir is set, the images are streamed to it: they are generated in shards of
+        batches that are optimized together, and each shard is saved to the directory (as a memory-mapped '.npy'
+        file, listed in a manifest) once it's generated. Calling the function again with the same output_dir
+        resumes the generation from the last saved shard.
+
         Args:
             model (Module): PyTorch model to generate data for.
             n_images (int): Number of images to generate.
@@ -143,7 +156,7 @@ if FOUND_TORCH and FOUND_TORCHVISION:
             data_generation_config (DataGenerationConfig): Configuration for data generation.
 
         Returns:
-            List[Tensor]: Finalized list containing generated images.
+            Union[List[Tensor], ImagesShardsDataset]: Finalized list containing generated images, or, if output_dir is set, a dataset that lazily reads the saved images and can be used directly as a representative dataset generator.
 
         Examples:
 
@@ -181,6 +194,16 @@ if FOUND_TORCH and FOUND_TORCHVISION:
         # get the model device
         device = get_working_device()
 
+        # Create a writer of the images shards, to generate only the images that are not saved yet
+        images_shards_writer = None
+        n_images_to_generate = n_images
+        if data_generation_config.output_dir is not None:
+            images_shards_writer = ImagesShardsWriter(
+                output_dir=data_generation_config.output_dir,
+                n_images=n_images,
+                shard_n_images=data_generation_config.shard_n_batches * data_generation_config.data_gen_batch_size)
+            n_images_to_generate = images_shards_writer.get_n_remaining_images()
+
         # copy model for data generation
         model_for_data_gen = copy.deepcopy(model)
 
@@ -191,7 +214,7 @@ if FOUND_TORCH and FOUND_TORCHVISION:
         image_pipeline, normalization, bn_layer_weighting_fn, bn_alignment_loss_fn, output_loss_fn, \
             init_dataset = get_data_generation_classes(data_generation_config=data_generation_config,
                                                        output_image_size=output_image_size,
-                                                       n_images=n_images,
+                                                       n_images=n_images_to_generate,
                                                        image_pipeline_dict=image_pipeline_dict,
                                                        image_normalization_dict=image_normalization_dict,
                                                        bn_layer_weighting_function_dict=
@@ -228,8 +251,71 @@ if FOUND_TORCH and FOUND_TORCHVISION:
             Logger.critical(
                 f'Data generation requires a model with at least one BatchNorm layer.') # pragma: no cover
 
+        # Optimize the images of an initial dataset and return the finalized images
+        generate_images_fn = partial(optimize_images,
+                                     model=model_for_data_gen,
+                                     data_generation_config=data_generation_config,
+                                     image_pipeline=image_pipeline,
+                                     normalization=normalization,
+                                     activation_extractor=activation_extractor,
+                                     orig_bn_stats_holder=orig_bn_stats_holder,
+                                     scheduler_step_fn=scheduler_step_fn,
+                                     scheduler=scheduler,
+                                     bn_layer_weighting_fn=bn_layer_weighting_fn,
+                                     bn_alignment_loss_fn=bn_alignment_loss_fn,
+                                     output_loss_fn=output_loss_fn,
+                                     device=device)
+
+        if images_shards_writer is None:
+            # Return the list of finalized generated images
+            return generate_images_fn(init_dataset)
+
+        # Generate the images shard by shard, and return a dataset of the saved images
+        images_shards_writer.write_shards(init_dataset=init_dataset,
+                                          shard_n_batches=data_generation_config.shard_n_batches,
+                                          generate_images_fn=generate_images_fn)
+        return ImagesShardsDataset(output_dir=data_generation_config.output_dir,
+                                   batch_size=data_generation_config.data_gen_batch_size)
+
+
+    def optimize_images(
+            init_dataset: Iterable,
+            model: Module,
+            data_generation_config: DataGenerationConfig,
+            image_pipeline: BaseImagePipeline,
+            normalization: List[List[float]],
+            activation_extractor: PytorchActivationExtractor,
+            orig_bn_stats_holder: PytorchOriginalBNStatsHolder,
+            scheduler_step_fn: Callable,
+            scheduler: Any,
+            bn_layer_weighting_fn: Callable,
+            bn_alignment_loss_fn: Callable,
+            output_loss_fn: Callable,
+            device: torch.device
+    ) -> List[Tensor]:
+        """
+        Function to optimize the batches of an initial dataset together, and return the finalized images.
+
+        Args:
+            init_dataset (Iterable): The initial batches of images to optimize.
+            model (Module): PyTorch model to generate data for.
+            data_generation_config (DataGenerationConfig): Configuration for data generation.
+            image_pipeline (BaseImagePipeline): The image pipeline for processing images during optimization.
+            normalization (List[List[float]]): The image normalization values (mean and std).
+            activation_extractor (PytorchActivationExtractor): The activation extractor for the model.
+            orig_bn_stats_holder (PytorchOriginalBNStatsHolder): Object to hold original BatchNorm statistics.
+            scheduler_step_fn (Callable): The function to perform a scheduler step.
+            scheduler (Any): The scheduler responsible for adjusting the learning rate of the optimizer over time.
+            bn_layer_weighting_fn (Callable): Function to compute layer weighting for the BatchNorm alignment loss.
+            bn_alignment_loss_fn (Callable): Function to compute BatchNorm alignment loss.
+            output_loss_fn (Callable): Function to compute output loss.
+            device (torch.device): The current device set for PyTorch operations.
+
+        Returns:
+            List[Tensor]: Finalized list containing generated images.
+        """
         # Create an ImagesOptimizationHandler object for handling optimization
-        all_imgs_opt_handler = PytorchImagesOptimizationHandler(model=model_for_data_gen,
+        all_imgs_opt_handler = PytorchImagesOptimizationHandler(model=model,
                                                                 data_gen_batch_size=data_generation_config.data_gen_batch_size,
                                                                 init_dataset=init_dataset,
                                                                 optimizer=data_generation_config.optimizer,
@@ -244,7 +330,7 @@ if FOUND_TORCH and FOUND_TORCHVISION:
                                                                 device=device)
 
         # Perform data generation and obtain a list of generated images
-        generated_images_list = data_generation(
+        return data_generation(
             data_generation_config=data_generation_config,
             activation_extractor=activation_extractor,
             orig_bn_stats_holder=orig_bn_stats_holder,
@@ -256,8 +342,6 @@ if FOUND_TORCH and FOUND_TORCHVISION:
             output_loss_multiplier=data_generation_config.output_loss_multiplier,
             device=device,
         )
-        # Return the list of finalized generated images
-        return generated_images_list
 
 
     def data_generation(
@@ -17,6 +17,10 @@ from model_compression_toolkit.exporter.model_exporter.keras.export_serializatio
     KerasExportSerializationFormat
 from model_compression_toolkit.exporter.model_exporter.pytorch.export_serialization_format import \
     PytorchExportSerializationFormat
-from model_compression_toolkit.exporter.model_exporter.keras.keras_export_facade import keras_export_model
-from model_compression_toolkit.exporter.model_exporter.pytorch.pytorch_export_facade import pytorch_export_model
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
+
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    attributes={'keras_export_model': 'model_compression_toolkit.exporter.model_exporter.keras.keras_export_facade',
+                'pytorch_export_model': 'model_compression_toolkit.exporter.model_exporter.pytorch.pytorch_export_facade'})
 
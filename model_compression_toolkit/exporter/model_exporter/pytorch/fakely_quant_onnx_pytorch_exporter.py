@@ -12,15 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Callable
+import os
+from typing import Any, Callable
 from io import BytesIO
 
+import numpy as np
 import torch.nn
 
 from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
 from model_compression_toolkit.verify_packages import FOUND_ONNX
 from model_compression_toolkit.logger import Logger
-from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
 from model_compression_toolkit.exporter.model_exporter.pytorch.base_pytorch_exporter import BasePyTorchExporter
 from mct_quantizers import pytorch_quantizers
 
@@ -29,6 +31,9 @@ if FOUND_ONNX:
     import onnx
     from mct_quantizers.pytorch.metadata import add_onnx_metadata
 
+    # Suffix of the external data file that holds the weights of an ONNX model (appended to the model's file name).
+    ONNX_EXTERNAL_DATA_SUFFIX = '.data'
+
     class FakelyQuantONNXPyTorchExporter(BasePyTorchExporter):
         """
         Exporter for fakely-quant PyTorch models.
@@ -43,7 +48,8 @@ if FOUND_ONNX:
                      save_model_path: str,
                      repr_dataset: Callable,
                      onnx_opset_version: int,
-                     use_onnx_custom_quantizer_ops: bool = False):
+                     use_onnx_custom_quantizer_ops: bool = False,
+                     use_onnx_external_data: bool = False):
             """
 
             Args:
@@ -53,6 +59,8 @@ if FOUND_ONNX:
                 repr_dataset: Representative dataset (needed for creating torch script).
                 onnx_opset_version: ONNX opset version to use for exported ONNX model.
                 use_onnx_custom_quantizer_ops: Whether to export quantizers custom ops in ONNX or not.
+                use_onnx_external_data: Whether to save the model's weights to an external data file next to the
+                    exported model, one tensor at a time (for models that are too large to serialize in memory).
             """
 
             super().__init__(model,
@@ -62,6 +70,7 @@ if FOUND_ONNX:
 
             self._use_onnx_custom_quantizer_ops = use_onnx_custom_quantizer_ops
             self._onnx_opset_version = onnx_opset_version
+            self._use_onnx_external_data = use_onnx_external_data
 
         def export(self) -> None:
             """
@@ -89,32 +98,93 @@ if FOUND_ONNX:
             else:
                 Logger.info(f"Exporting fake-quant onnx model: {self.save_model_path}")
 
-            model_input = to_torch_tensor(next(self.repr_dataset()))
+            self._export_onnx_model(to_torch_tensor(next(self.repr_dataset())))
+
+        def _export_onnx_model(self, model_input: Any):
+            """
+            Export the model to an ONNX model in the save path (with the model's metadata, if it has any).
+            The model is exported straight to the file, and the metadata is appended to it, so the serialized
+            model is not loaded back to memory.
+
+            Args:
+                model_input: Input tensor (or list of input tensors) to trace the model with.
+            """
+            if self._use_onnx_external_data:
+                self._export_onnx_model_with_external_data(model_input)
+                return
+
+            self._torch_onnx_export(model_input, self.save_model_path)
+            if hasattr(self.model, 'metadata'):
+                # Protobuf merges concatenated messages, so appending a serialized model that holds only the
+                # metadata adds it to the exported model's metadata.
+                metadata_model = add_onnx_metadata(onnx.ModelProto(), self.model.metadata)
+                with open(self.save_model_path, 'ab') as f:
+                    f.write(metadata_model.SerializeToString())
+
+        def _export_onnx_model_with_external_data(self, model_input: Any):
+            """
+            Export the model to an ONNX model in the save path, where the weights are saved to an external data
+            file next to it. The model graph is exported without the weights, and the weights are then written to the
+            external data file one tensor at a time, so the model size is not limited by the 2GB protobuf limit, and
+            the weights are not copied to memory.
+
+            Args:
+                model_input: Input tensor (or list of input tensors) to trace the model with.
+            """
+            onnx_bytes = BytesIO()
+            self._torch_onnx_export(model_input, onnx_bytes, export_params=False)
+            onnx_model = onnx.load_from_string(onnx_bytes.getvalue())
+
+            # The weights the graph uses are inputs of the graph, named after the model's parameters and buffers.
+            model_tensors = {**dict(self.model.named_parameters()), **dict(self.model.named_buffers())}
+            weights_inputs = [graph_input for graph_input in onnx_model.graph.input if graph_input.name in model_tensors]
+            model_inputs = [graph_input for graph_input in onnx_model.graph.input if graph_input.name not in model_tensors]
+
+            external_data_location = os.path.basename(self.save_model_path) + ONNX_EXTERNAL_DATA_SUFFIX
+            external_data_path = os.path.join(os.path.dirname(self.save_model_path), external_data_location)
+            Logger.info(f"Saving onnx model weights to external data file: {external_data_path}")
+            with open(external_data_path, 'wb') as f:
+                for weights_input in weights_inputs:
+                    weights = torch_tensor_to_numpy(model_tensors[weights_input.name])
+                    weights_tensor = onnx.TensorProto(name=weights_input.name,
+                                                      dims=weights.shape,
+                                                      data_type=onnx.helper.np_dtype_to_tensor_dtype(weights.dtype))
+                    offset = f.tell()
+                    f.write(np.ascontiguousarray(weights).data)
+                    for key, value in [('location', external_data_location),
+                                       ('offset', str(offset)),
+                                       ('length', str(f.tell() - offset))]:
+                        entry = weights_tensor.external_data.add()
+                        entry.key, entry.value = key, value
+                    weights_tensor.data_location = onnx.TensorProto.EXTERNAL
+                    onnx_model.graph.initializer.append(weights_tensor)
+
+            del onnx_model.graph.input[:]
+            onnx_model.graph.input.extend(model_inputs)
 
             if hasattr(self.model, 'metadata'):
-                onnx_bytes = BytesIO()
-                torch.onnx.export(self.model,
-                                  tuple(model_input) if isinstance(model_input, list) else model_input,
-                                  onnx_bytes,
-                                  opset_version=self._onnx_opset_version,
-                                  verbose=False,
-                                  input_names=['input'],
-                                  output_names=['output'],
-                                  dynamic_axes={'input': {0: 'batch_size'},
-                                                'output': {0: 'batch_size'}})
-                onnx_model = onnx.load_from_string(onnx_bytes.getvalue())
                 onnx_model = add_onnx_metadata(onnx_model, self.model.metadata)
-                onnx.save_model(onnx_model, self.save_model_path)
-            else:
-                torch.onnx.export(self.model,
-                                  tuple(model_input) if isinstance(model_input, list) else model_input,
-                                  self.save_model_path,
-                                  opset_version=self._onnx_opset_version,
-                                  verbose=False,
-                                  input_names=['input'],
-                                  output_names=['output'],
-                                  dynamic_axes={'input': {0: 'batch_size'},
-                                                'output': {0: 'batch_size'}})
+            onnx.save_model(onnx_model, self.save_model_path)
+
+        def _torch_onnx_export(self, model_input: Any, f: Any, export_params: bool = True):
+            """
+            Export the model to ONNX using torch.
+
+            Args:
+                model_input: Input tensor (or list of input tensors) to trace the model with.
+                f: File path or file-like object to export the model to.
+                export_params: Whether to export the model's weights. If False, the weights are inputs of the graph.
+            """
+            torch.onnx.export(self.model,
+                              tuple(model_input) if isinstance(model_input, list) else model_input,
+                              f,
+                              export_params=export_params,
+                              opset_version=self._onnx_opset_version,
+                              verbose=False,
+                              input_names=['input'],
+                              output_names=['output'],
+                              dynamic_axes={'input': {0: 'batch_size'},
+                                            'output': {0: 'batch_size'}})
 
         def _enable_onnx_custom_ops_export(self):
             """
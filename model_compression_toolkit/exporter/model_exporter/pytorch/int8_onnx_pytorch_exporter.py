@@ -0,0 +1,324 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+import torch.nn
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+from mct_quantizers import pytorch_quantizers
+from model_compression_toolkit.verify_packages import FOUND_ONNX, FOUND_ONNXRUNTIME
+from model_compression_toolkit.logger import Logger
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
+from model_compression_toolkit.exporter.model_exporter.pytorch.fakely_quant_onnx_pytorch_exporter import \
+    FakelyQuantONNXPyTorchExporter
+
+# Minimal ONNX opset version that supports per-channel QuantizeLinear/DequantizeLinear.
+MIN_QDQ_ONNX_OPSET_VERSION = 13
+
+# Maximal mean absolute error of the exported model's outputs in the onnxruntime parity check, relative to the
+# outputs' mean absolute value. Integer kernels may round differently than the quantized model, so a few outputs
+# may differ by a quantization step.
+ONNXRUNTIME_PARITY_TOLERANCE = 1e-2
+
+INT8_RANGE = (-2 ** 7, 2 ** 7 - 1)
+UINT8_RANGE = (0, 2 ** 8 - 1)
+
+
+def _get_quantizer_params(quantizer: pytorch_quantizers.BasePyTorchInferableQuantizer) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the scales and zero points of an MCT inferable quantizer.
+
+    Args:
+        quantizer: A uniform, symmetric or power-of-two inferable quantizer.
+
+    Returns:
+        The quantizer's scales and zero points (a single value for a per-tensor quantizer, and a value per channel for
+        a per-channel quantizer).
+    """
+    if isinstance(quantizer, pytorch_quantizers.ActivationUniformInferableQuantizer):
+        scales, zero_points = quantizer.scale, quantizer.zero_point
+    elif isinstance(quantizer, (pytorch_quantizers.WeightsSymmetricInferableQuantizer,
+                                pytorch_quantizers.WeightsUniformInferableQuantizer,
+                                pytorch_quantizers.ActivationSymmetricInferableQuantizer)):
+        scales, zero_points = quantizer.scales, quantizer.zero_points
+    else:
+        Logger.critical(f'Exporting {type(quantizer).__name__} to an INT8 ONNX model is not supported. '
+                        f'Only uniform, symmetric and power-of-two quantizers can be exported with '
+                        f'QuantizationFormat.INT8.')
+
+    scales = np.asarray(torch_tensor_to_numpy(scales) if isinstance(scales, torch.Tensor) else scales)
+    zero_points = np.asarray(torch_tensor_to_numpy(zero_points) if isinstance(zero_points, torch.Tensor) else zero_points)
+    return scales.astype(np.float32).flatten(), zero_points.astype(np.int64).flatten()
+
+
+def _get_integer_dtype(quantizer: pytorch_quantizers.BasePyTorchInferableQuantizer) -> torch.dtype:
+    """
+    Get the 8-bit integer data type of a quantizer's quantized values.
+
+    Args:
+        quantizer: A uniform, symmetric or power-of-two inferable quantizer.
+
+    Returns:
+        torch.int8 for a signed quantization range, and torch.uint8 otherwise.
+    """
+    signed = quantizer.min_quantized_domain < 0
+    dtype_min, dtype_max = INT8_RANGE if signed else UINT8_RANGE
+    if quantizer.min_quantized_domain < dtype_min or quantizer.max_quantized_domain > dtype_max:
+        Logger.critical(f'Exporting a {quantizer.num_bits}-bit quantizer to an INT8 ONNX model is not supported. '
+                        f'Only quantizers with up to 8 bits can be exported with QuantizationFormat.INT8.')
+    return torch.int8 if signed else torch.uint8
+
+
+class QuantizeDequantizeF(torch.autograd.Function):
+    """
+    Per-tensor fake quantization that is exported to ONNX as a QuantizeLinear-DequantizeLinear pair.
+    """
+
+    @staticmethod
+    def forward(ctx, inputs: torch.Tensor, scale: float, zero_point: int, quant_min: int, quant_max: int,
+                dtype: torch.dtype) -> torch.Tensor:
+        return torch.fake_quantize_per_tensor_affine(inputs, scale, zero_point, quant_min, quant_max)
+
+    @staticmethod
+    def symbolic(g, inputs, scale, zero_point, quant_min, quant_max, dtype):
+        scale_const = g.op('Constant', value_t=torch.tensor(scale, dtype=torch.float32))
+        zero_point_const = g.op('Constant', value_t=torch.tensor(zero_point, dtype=dtype))
+        outputs = g.op('DequantizeLinear',
+                       g.op('QuantizeLinear', inputs, scale_const, zero_point_const),
+                       scale_const, zero_point_const)
+
+        # QuantizeLinear saturates to the data type's range, so a quantization range of fewer than 8 bits is
+        # applied by clipping the dequantized values.
+        dtype_min, dtype_max = INT8_RANGE if dtype == torch.int8 else UINT8_RANGE
+        if quant_min > dtype_min or quant_max < dtype_max:
+            scale_tensor = torch.tensor(scale, dtype=torch.float32)
+            min_value = torch.tensor(quant_min - zero_point, dtype=torch.float32) * scale_tensor
+            max_value = torch.tensor(quant_max - zero_point, dtype=torch.float32) * scale_tensor
+            outputs = g.op('Clip', outputs, g.op('Constant', value_t=min_value), g.op('Constant', value_t=max_value))
+        return outputs
+
+
+class DequantizeF(torch.autograd.Function):
+    """
+    Dequantization of integer weights that is exported to ONNX as a DequantizeLinear of the integer weights.
+    """
+
+    @staticmethod
+    def forward(ctx, quantized_weights: torch.Tensor, scales: torch.Tensor, zero_points: torch.Tensor,
+                axis: int) -> torch.Tensor:
+        if scales.ndim > 0:
+            shape = [1] * quantized_weights.ndim
+            shape[axis] = -1
+            scales, zero_points = scales.reshape(shape), zero_points.reshape(shape)
+        return (quantized_weights.float() - zero_points.float()) * scales
+
+    @staticmethod
+    def symbolic(g, quantized_weights, scales, zero_points, axis):
+        if axis is None:
+            return g.op('DequantizeLinear', quantized_weights, scales, zero_points)
+        return g.op('DequantizeLinear', quantized_weights, scales, zero_points, axis_i=axis)
+
+
+class QDQActivationQuantizer:
+    """
+    Activation quantizer that is exported to ONNX as a QuantizeLinear-DequantizeLinear pair.
+    """
+
+    def __init__(self, quantizer: pytorch_quantizers.BasePyTorchInferableQuantizer):
+        """
+        Args:
+            quantizer: The uniform, symmetric or power-of-two activation quantizer to export.
+        """
+        self.dtype = _get_integer_dtype(quantizer)
+        scales, zero_points = _get_quantizer_params(quantizer)
+        self.scale, self.zero_point = float(scales[0]), int(zero_points[0])
+        self.quant_min, self.quant_max = quantizer.min_quantized_domain, quantizer.max_quantized_domain
+
+    def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
+        return QuantizeDequantizeF.apply(inputs, self.scale, self.zero_point, self.quant_min, self.quant_max,
+                                         self.dtype)
+
+
+class QDQWeightsQuantizer:
+    """
+    Weights quantizer that holds the integer weights, and is exported to ONNX as a DequantizeLinear of the weights
+    (so the exported model stores the weights as 8-bit integers).
+    """
+
+    def __init__(self, quantizer: pytorch_quantizers.BasePyTorchInferableQuantizer, weights: torch.Tensor):
+        """
+        Args:
+            quantizer: The uniform, symmetric or power-of-two weights quantizer to export.
+            weights: The float weights the quantizer quantizes.
+        """
+        dtype = _get_integer_dtype(quantizer)
+        scales, zero_points = _get_quantizer_params(quantizer)
+        self.axis = quantizer.channel_axis if quantizer.per_channel else None
+        if self.axis is None:
+            scales, zero_points = scales[0], zero_points[0]
+
+        self.scales = to_torch_tensor(scales)
+        self.zero_points = to_torch_tensor(zero_points, dtype=None).to(dtype)
+
+        # The integer weights are recovered from the fake-quantized weights, so they dequantize to the exact same
+        # values the quantized model uses.
+        with torch.no_grad():
+            fake_quantized_weights = quantizer(weights.detach())
+            shape = [1] * weights.ndim
+            if self.axis is not None:
+                shape[self.axis] = -1
+            integer_weights = torch.round(fake_quantized_weights / self.scales.reshape(shape)) + \
+                              self.zero_points.reshape(shape).float()
+            self.quantized_weights = integer_weights.to(dtype)
+
+    def initialize_quantization(self, tensor_shape: Any, name: str, layer: torch.nn.Module):
+        """
+        The quantizer holds its integer weights, so it has nothing to initialize in the wrapper.
+        """
+        return {}
+
+    def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
+        return DequantizeF.apply(self.quantized_weights, self.scales, self.zero_points, self.axis)
+
+
+if FOUND_ONNX:
+
+    class INT8ONNXPyTorchExporter(FakelyQuantONNXPyTorchExporter):
+        """
+        Exporter for INT8 ONNX PyTorch models.
+        The exporter expects to receive an exportable model (where each layer's full quantization parameters
+        can be retrieved), and exports it in the QDQ format: the weights are stored as 8-bit integers followed by
+        DequantizeLinear ops, and the activations are quantized using QuantizeLinear-DequantizeLinear pairs, so
+        runtimes such as onnxruntime can run the model with integer kernels.
+        """
+
+        def __init__(self,
+                     model: torch.nn.Module,
+                     is_layer_exportable_fn: Callable,
+                     save_model_path: str,
+                     repr_dataset: Callable,
+                     onnx_opset_version: int,
+                     use_onnx_external_data: bool = False):
+            """
+
+            Args:
+                model: Model to export.
+                is_layer_exportable_fn: Callable to check whether a layer can be exported or not.
+                save_model_path: Path to save the exported model.
+                repr_dataset: Representative dataset (needed for creating torch script).
+                onnx_opset_version: ONNX opset version to use for exported ONNX model.
+                use_onnx_external_data: Whether to save the model's weights to an external data file next to the
+                    exported model, one tensor at a time (for models that are too large to serialize in memory).
+            """
+            if onnx_opset_version < MIN_QDQ_ONNX_OPSET_VERSION:
+                Logger.critical(f'Exporting an INT8 ONNX model requires ONNX opset version '
+                                f'{MIN_QDQ_ONNX_OPSET_VERSION} or higher, but {onnx_opset_version} was given.')
+
+            super().__init__(model,
+                             is_layer_exportable_fn,
+                             save_model_path,
+                             repr_dataset,
+                             onnx_opset_version=onnx_opset_version,
+                             use_onnx_external_data=use_onnx_external_data)
+
+        def export(self) -> None:
+            """
+            Convert an exportable (fully-quantized) PyTorch model to an INT8 ONNX model, where the quantizers
+            are replaced by QuantizeLinear and DequantizeLinear ops.
+            If onnxruntime is installed, the exported model's outputs are compared to the quantized model's outputs.
+            """
+            for layer in self.model.children():
+                self.is_layer_exportable_fn(layer)
+
+            model_input = to_torch_tensor(next(self.repr_dataset()))
+            inputs = model_input if isinstance(model_input, list) else [model_input]
+
+            # The reference outputs are computed with the model's original quantizers, before they are replaced
+            # by the QDQ quantizers, so the parity check covers the substitution as well.
+            reference_outputs = self._get_model_outputs(inputs) if FOUND_ONNXRUNTIME else None
+
+            self._substitute_qdq_quantizers()
+
+            Logger.info(f"Exporting INT8 onnx model: {self.save_model_path}")
+            self._export_onnx_model(model_input)
+
+            if FOUND_ONNXRUNTIME:
+                self._check_onnxruntime_parity(inputs, reference_outputs)
+
+        def _substitute_qdq_quantizers(self):
+            """
+            Replace the quantizers of the model with quantizers that are exported as QuantizeLinear and
+            DequantizeLinear ops. The integer weights are registered as buffers of the wrapper, so they are exported
+            as initializers named after the weights.
+            """
+            for m in self.model.modules():
+                if isinstance(m, PytorchActivationQuantizationHolder):
+                    m.activation_holder_quantizer = QDQActivationQuantizer(m.activation_holder_quantizer)
+
+                if isinstance(m, PytorchQuantizationWrapper):
+                    qdq_quantizers = {}
+                    for name, weights, quantizer in m.get_weights_vars():
+                        qdq_quantizers[name] = QDQWeightsQuantizer(quantizer, weights)
+                        m.register_buffer(f'{name}_quantized', qdq_quantizers[name].quantized_weights)
+                    m.weights_quantizers = qdq_quantizers
+                    # Reset the wrapper's weights variables to use the new quantizers.
+                    m._set_weights_vars(False)
+
+        def _get_model_outputs(self, inputs: List[torch.Tensor]) -> List[np.ndarray]:
+            """
+            Run the model on the inputs.
+
+            Args:
+                inputs: List of input tensors.
+
+            Returns:
+                List of the model's outputs, as numpy arrays.
+            """
+            with torch.no_grad():
+                outputs = self.model(*inputs)
+            if isinstance(outputs, torch.Tensor):
+                outputs = [outputs]
+            return [torch_tensor_to_numpy(output) for output in outputs]
+
+        def _check_onnxruntime_parity(self, inputs: List[torch.Tensor], reference_outputs: List[np.ndarray]):
+            """
+            Run the exported model with onnxruntime and compare its outputs to the quantized model's outputs.
+            A warning is logged if they mismatch.
+
+            Args:
+                inputs: List of input tensors to compare the outputs on.
+                reference_outputs: Outputs of the quantized model (with its original quantizers) on the inputs.
+            """
+            import onnxruntime as ort
+
+            session = ort.InferenceSession(self.save_model_path, providers=['CPUExecutionProvider'])
+            ort_outputs = session.run(None, {ort_input.name: torch_tensor_to_numpy(x) for ort_input, x in
+                                             zip(session.get_inputs(), inputs)})
+
+            error = 0.
+            for ort_output, torch_output in zip(ort_outputs, reference_outputs):
+                output_scale = max(np.mean(np.abs(torch_output)), np.finfo(np.float32).eps)
+                error = max(error, np.mean(np.abs(ort_output - torch_output)) / output_scale)
+
+            Logger.info(f'INT8 onnx model relative error from the quantized model on onnxruntime: {error}')
+            if error > ONNXRUNTIME_PARITY_TOLERANCE:
+                Logger.warning(f'The outputs of the exported INT8 onnx model on onnxruntime differ from the quantized '
+                               f'model outputs by a mean relative error of {error}.')
+
+else:
+    def INT8ONNXPyTorchExporter(*args, **kwargs):
+        Logger.critical("ONNX must be installed to use 'INT8ONNXPyTorchExporter'. "
+                        "The 'onnx' package is missing.")  # pragma: no cover
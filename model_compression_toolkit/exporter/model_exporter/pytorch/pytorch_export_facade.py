@@ -28,11 +28,13 @@ if FOUND_TORCH:
     import torch.nn
     from model_compression_toolkit.exporter.model_exporter.pytorch.fakely_quant_onnx_pytorch_exporter import FakelyQuantONNXPyTorchExporter
     from model_compression_toolkit.exporter.model_exporter.pytorch.fakely_quant_torchscript_pytorch_exporter import FakelyQuantTorchScriptPyTorchExporter
+    from model_compression_toolkit.exporter.model_exporter.pytorch.int8_onnx_pytorch_exporter import INT8ONNXPyTorchExporter
     from model_compression_toolkit.exporter.model_wrapper.pytorch.validate_layer import is_pytorch_layer_exportable
 
     supported_serialization_quantization_export_dict = {
         PytorchExportSerializationFormat.TORCHSCRIPT: [QuantizationFormat.FAKELY_QUANT],
-        PytorchExportSerializationFormat.ONNX: [QuantizationFormat.FAKELY_QUANT, QuantizationFormat.MCTQ]
+        PytorchExportSerializationFormat.ONNX: [QuantizationFormat.FAKELY_QUANT, QuantizationFormat.MCTQ,
+                                                QuantizationFormat.INT8]
     }
 
     def pytorch_export_model(model: torch.nn.Module,
@@ -41,14 +43,17 @@ if FOUND_TORCH:
                              is_layer_exportable_fn: Callable = is_pytorch_layer_exportable,
                              serialization_format: PytorchExportSerializationFormat = PytorchExportSerializationFormat.ONNX,
                              quantization_format: QuantizationFormat = QuantizationFormat.MCTQ,
-                             onnx_opset_version=DEFAULT_ONNX_OPSET_VERSION) -> None:
+                             onnx_opset_version=DEFAULT_ONNX_OPSET_VERSION,
+                             use_onnx_external_data: bool = False) -> None:
         """
         Export a PyTorch quantized model to a torchscript or onnx model.
         The model will be saved to the path in save_model_path.
-        Currently, pytorch_export_model supports only QuantizationFormat.FAKELY_QUANT (where weights
+        Currently, pytorch_export_model supports QuantizationFormat.FAKELY_QUANT (where weights
         and activations are float fakely-quantized values) and PytorchExportSerializationFormat.TORCHSCRIPT
         (where the model will be saved to TorchScript model) or PytorchExportSerializationFormat.ONNX
-        (where the model will be saved to ONNX model).
+        (where the model will be saved to ONNX model). ONNX models can also be exported with QuantizationFormat.MCTQ
+        (where quantizers are mct_quantizers custom ops) or QuantizationFormat.INT8 (where weights are stored as
+        8-bit integers, and quantizers are QuantizeLinear and DequantizeLinear ops).
 
         Args:
             model: Model to export.
@@ -59,6 +64,9 @@ if FOUND_TORCH:
             PytorchExportSerializationFormat.ONNX).
             quantization_format: Format of how quantizers are exported (fakely-quant, int8, MCTQ quantizers).
             onnx_opset_version: ONNX opset version to use for exported ONNX model.
+            use_onnx_external_data: Whether to save the weights of an exported ONNX model to an external data file
+            next to it ('<save_model_path>.data'). The weights are written one tensor at a time, so large models
+            (including models larger than 2GB) can be exported without serializing them in memory.
 
         """
 
@@ -80,14 +88,23 @@ if FOUND_TORCH:
                                                           is_layer_exportable_fn,
                                                           save_model_path,
                                                           repr_dataset,
-                                                          onnx_opset_version=onnx_opset_version)
+                                                          onnx_opset_version=onnx_opset_version,
+                                                          use_onnx_external_data=use_onnx_external_data)
             elif quantization_format == QuantizationFormat.MCTQ:
                 exporter = FakelyQuantONNXPyTorchExporter(model,
                                                           is_layer_exportable_fn,
                                                           save_model_path,
                                                           repr_dataset,
                                                           use_onnx_custom_quantizer_ops=True,
-                                                          onnx_opset_version=onnx_opset_version)
+                                                          onnx_opset_version=onnx_opset_version,
+                                                          use_onnx_external_data=use_onnx_external_data)
+            elif quantization_format == QuantizationFormat.INT8:
+                exporter = INT8ONNXPyTorchExporter(model,
+                                                   is_layer_exportable_fn,
+                                                   save_model_path,
+                                                   repr_dataset,
+                                                   onnx_opset_version=onnx_opset_version,
+                                                   use_onnx_external_data=use_onnx_external_data)
             else:
                 Logger.critical(
                     f'Unsupported quantization {quantization_format} for '
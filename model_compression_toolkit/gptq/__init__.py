@@ -18,15 +18,21 @@ from model_compression_toolkit.gptq.common.gptq_config import (
     RoundingType,
     GPTQHessianScoresConfig,
     GradualActivationQuantizationConfig,
-    QFractionLinearAnnealingConfig
+    QFractionLinearAnnealingConfig,
+    GPTQTeacherOutputsCacheConfig,
+    GPTQBlockwiseConfig
 )
 
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
 from model_compression_toolkit.verify_packages import FOUND_TF, FOUND_TORCH
 
+_facades = {}
 if FOUND_TF:
-    from model_compression_toolkit.gptq.keras.quantization_facade import keras_gradient_post_training_quantization
-    from model_compression_toolkit.gptq.keras.quantization_facade import get_keras_gptq_config
+    _facades.update({'keras_gradient_post_training_quantization': 'model_compression_toolkit.gptq.keras.quantization_facade',
+                     'get_keras_gptq_config': 'model_compression_toolkit.gptq.keras.quantization_facade'})
 
 if FOUND_TORCH:
-    from model_compression_toolkit.gptq.pytorch.quantization_facade import pytorch_gradient_post_training_quantization
-    from model_compression_toolkit.gptq.pytorch.quantization_facade import get_pytorch_gptq_config
\ No newline at end of file
+    _facades.update({'pytorch_gradient_post_training_quantization': 'model_compression_toolkit.gptq.pytorch.quantization_facade',
+                     'get_pytorch_gptq_config': 'model_compression_toolkit.gptq.pytorch.quantization_facade'})
+
+__getattr__, __dir__ = _lazy_attributes(__name__, attributes=_facades)
\ No newline at end of file
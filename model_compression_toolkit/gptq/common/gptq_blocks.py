@@ -0,0 +1,209 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+from typing import List, NamedTuple, Dict, Set
+
+from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.logger import Logger
+
+BLOCK_INPUT_SUFFIX = '_block_input'
+
+
+class GPTQBlock(NamedTuple):
+    """
+    A block of consecutive nodes of a graph, that is trained separately in block-wise GPTQ.
+
+    Args:
+        nodes: Names of the block's nodes, in topological order.
+        input_tensors: Names of the nodes outside the block whose outputs are inputs of the block.
+        output_tensors: Names of the nodes in the block whose outputs are inputs of following blocks.
+        compare_points: Names of the block's compare points.
+    """
+    nodes: List[str]
+    input_tensors: List[str]
+    output_tensors: List[str]
+    compare_points: List[str]
+
+
+def _get_sorted_nodes(graph: Graph) -> List[BaseNode]:
+    """
+    Sort the graph's nodes topologically, with the graph's inputs first so all of them are in the first block.
+
+    Args:
+        graph: Graph to sort its nodes.
+
+    Returns:
+        A list of the graph's nodes.
+    """
+    inputs = graph.get_inputs()
+    inputs_set = set(inputs)
+    return list(inputs) + [n for n in graph.get_topo_sorted_nodes() if n not in inputs_set]
+
+
+def _is_valid_cut(graph: Graph,
+                  sorted_nodes: List[BaseNode],
+                  position: int,
+                  last_sink_position: Dict[BaseNode, int],
+                  reuse_groups_spans: Dict[str, List[int]]) -> bool:
+    """
+    Check whether the graph can be cut before a node. A cut is invalid if it separates nodes of the same
+    reuse group, or if a tensor that crosses it is an output of a node with multiple outputs (which is passed
+    between nodes as a list of tensors).
+
+    Args:
+        graph: Graph to cut.
+        sorted_nodes: The graph's nodes in topological order.
+        position: Position of the first node after the cut.
+        last_sink_position: A mapping from a node to the position of the last node that consumes its outputs.
+        reuse_groups_spans: A mapping from a reuse group to the positions of its first and last nodes.
+
+    Returns:
+        Whether the graph can be cut before the node in the given position.
+    """
+    if any(first < position <= last for first, last in reuse_groups_spans.values()):
+        return False
+    for n in sorted_nodes[:position]:
+        if last_sink_position.get(n, -1) >= position and len(n.output_shape) != 1:
+            return False
+    return True
+
+
+def partition_graph_to_blocks(graph: Graph,
+                              compare_points_names: List[str],
+                              compare_points_per_block: int) -> List[GPTQBlock]:
+    """
+    Partition a graph to blocks of consecutive nodes for block-wise GPTQ. A new block starts before a compare point,
+    once the current block holds compare_points_per_block compare points, and the cut is valid (see _is_valid_cut).
+    Nodes that follow the last compare point are added to the last block.
+
+    Args:
+        graph: Graph to partition.
+        compare_points_names: Names of the graph's compare points.
+        compare_points_per_block: Number of compare points in each block.
+
+    Returns:
+        A list of the graph's blocks, in topological order.
+    """
+    if compare_points_per_block < 1:
+        Logger.critical(f'The number of compare points per block must be positive, '
+                        f'but got {compare_points_per_block}.')  # pragma: no cover
+
+    sorted_nodes = _get_sorted_nodes(graph)
+    position = {n: i for i, n in enumerate(sorted_nodes)}
+    last_sink_position = {n: max(position[e.sink_node] for e in graph.out_edges(n))
+                          for n in sorted_nodes if len(graph.out_edges(n)) > 0}
+    reuse_groups_spans = {}
+    for i, n in enumerate(sorted_nodes):
+        if n.reuse_group is not None:
+            reuse_groups_spans.setdefault(n.reuse_group, [i, i])[1] = i
+
+    compare_points_set = set(compare_points_names)
+    blocks_nodes = [[]]
+    num_compare_points = 0
+    for i, n in enumerate(sorted_nodes):
+        if n.name in compare_points_set:
+            if num_compare_points >= compare_points_per_block and \
+                    _is_valid_cut(graph, sorted_nodes, i, last_sink_position, reuse_groups_spans):
+                blocks_nodes.append([])
+                num_compare_points = 0
+            num_compare_points += 1
+        blocks_nodes[-1].append(n)
+
+    blocks = []
+    for nodes in blocks_nodes:
+        nodes_set = set(nodes)
+        input_tensors, output_tensors = [], []
+        for n in nodes:
+            for e in graph.incoming_edges(n, sort_by_attr='sink_index'):
+                if e.source_node not in nodes_set and e.source_node.name not in input_tensors:
+                    input_tensors.append(e.source_node.name)
+            if any(e.sink_node not in nodes_set for e in graph.out_edges(n)):
+                output_tensors.append(n.name)
+        blocks.append(GPTQBlock(nodes=[n.name for n in nodes],
+                                input_tensors=input_tensors,
+                                output_tensors=output_tensors,
+                                compare_points=[n.name for n in nodes if n.name in compare_points_set]))
+    return blocks
+
+
+def _get_block_input_node(graph: Graph, source: BaseNode) -> BaseNode:
+    """
+    Create an input node for a block, that replaces the output of a node outside the block. The node is a copy of
+    the graph's input node, with the source node's output shape. The activation quantization of the node is disabled,
+    since the block's inputs are already quantized by the source node.
+
+    Args:
+        graph: Graph the block is taken from.
+        source: The node whose output is replaced by the input node.
+
+    Returns:
+        An input node.
+    """
+    input_node = copy.deepcopy(graph.get_inputs()[0])
+    input_node.name = source.name + BLOCK_INPUT_SUFFIX
+    input_node.output_shape = [source.output_shape[0]]
+    if input_node.final_activation_quantization_cfg is not None:
+        input_node.final_activation_quantization_cfg.enable_activation_quantization = False
+    for candidate in input_node.candidates_quantization_cfg or []:
+        candidate.activation_quantization_cfg.enable_activation_quantization = False
+    return input_node
+
+
+def build_block_graph(graph: Graph, block: GPTQBlock, block_index: int = 0) -> Graph:
+    """
+    Build a graph of a block. The block's nodes are shared with the original graph (and are not copied), the outputs
+    of nodes outside the block are replaced by new input nodes, and the outputs of the block's nodes that are used
+    outside the block are added to the graph's outputs.
+
+    Args:
+        graph: Graph the block is taken from.
+        block: Block to build its graph.
+        block_index: Index of the block, used for the graph's name.
+
+    Returns:
+        The block's graph.
+    """
+    name_to_node = {n.name: n for n in graph.nodes}
+    nodes = [name_to_node[name] for name in block.nodes]
+    nodes_set = set(nodes)
+
+    input_nodes = [n for n in graph.get_inputs() if n in nodes_set]
+    source_to_input_node = {name: _get_block_input_node(graph, name_to_node[name]) for name in block.input_tensors}
+    input_nodes.extend(source_to_input_node.values())
+
+    edges = []
+    for n in nodes:
+        for e in graph.incoming_edges(n):
+            if e.source_node in nodes_set:
+                edges.append(e)
+            else:
+                edges.append(Edge(source_to_input_node[e.source_node.name], n, 0, e.sink_index))
+
+    output_nodes = [OutTensor(name_to_node[name], 0) for name in block.output_tensors]
+    output_nodes.extend([ot for ot in graph.get_outputs() if ot.node in nodes_set and ot not in output_nodes])
+
+    block_graph = Graph(f'{graph.name}_block_{block_index}',
+                        nodes + list(source_to_input_node.values()),
+                        input_nodes,
+                        output_nodes,
+                        edges,
+                        fw_info=graph.fw_info)
+    block_graph.set_tpc(graph.tpc)
+    if len(block.input_tensors) == 0:
+        # The first block gets the model's inputs.
+        block_graph.user_info = copy.deepcopy(graph.user_info)
+    return block_graph
@@ -100,6 +100,43 @@ class GradualActivationQuantizationConfig:
     )
 
 
+@dataclass
+class GPTQTeacherOutputsCacheConfig:
+    """
+    Configuration for caching the outputs of the float (teacher) model at the compare points during GPTQ training.
+    The outputs are computed once and are reused in all the epochs, so the cache is used only when the training
+    samples are the same in all the epochs: when per sample Hessian attention is used (PyTorch), or when
+    fix_representative_dataset is set.
+
+    Args:
+        max_memory_mb (float): Maximal size (in MB) of the outputs to keep in memory (on the working device).
+          If the outputs are larger, they are saved to memory-mapped files.
+        cache_dir (str|None): Directory to save the memory-mapped files in. If None, a temporary directory is used.
+        fix_representative_dataset (bool): Whether to read the representative dataset once and train on the same
+          samples in all the epochs, so the outputs are cached also when per sample attention is not used.
+    """
+    max_memory_mb: float = 1024
+    cache_dir: Optional[str] = None
+    fix_representative_dataset: bool = False
+
+
+@dataclass
+class GPTQBlockwiseConfig:
+    """
+    Configuration for block-wise GPTQ reconstruction. The graph is partitioned to blocks of consecutive compare
+    points, and the blocks are trained one after the other. Each block is trained on the outputs of the already
+    trained (quantized) preceding blocks, which are saved to memory-mapped files, so only a single block's models
+    are kept in memory during the training.
+
+    Args:
+        compare_points_per_block (int): Number of compare points (layers with trainable weights) in each block.
+        activations_dir (str|None): Directory to save the blocks' outputs in. If None, the system's temporary
+          directory is used.
+    """
+    compare_points_per_block: int = 1
+    activations_dir: Optional[str] = None
+
+
 @dataclass
 class GradientPTQConfig:
     """
@@ -121,6 +158,9 @@ class GradientPTQConfig:
             Hessian scores for the GPTQ loss.
         gradual_activation_quantization_config: A configuration for Gradual Activation Quantization.
         gptq_quantizer_params_override: A dictionary of parameters to override in GPTQ quantizer instantiation.
+        teacher_outputs_cache_config: A configuration for caching the float model outputs. If None, the float model
+            runs in every training step.
+        blockwise_config: A configuration for block-wise reconstruction. If None, the whole model is trained at once.
     """
     n_epochs: int
     optimizer: Any
@@ -136,3 +176,6 @@ class GradientPTQConfig:
     hessian_weights_config: GPTQHessianScoresConfig = field(default_factory=GPTQHessianScoresConfig)
     gradual_activation_quantization_config: Optional[GradualActivationQuantizationConfig] = None
     gptq_quantizer_params_override: Dict[str, Any] = field(default_factory=dict)
+    teacher_outputs_cache_config: Optional[GPTQTeacherOutputsCacheConfig] = field(
+        default_factory=GPTQTeacherOutputsCacheConfig)
+    blockwise_config: Optional[GPTQBlockwiseConfig] = None
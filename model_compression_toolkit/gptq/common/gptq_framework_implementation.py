@@ -16,6 +16,7 @@
 from abc import abstractmethod
 
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.logger import Logger
 
 
 class GPTQFrameworkImplemantation(FrameworkImplementation):
@@ -29,4 +30,10 @@ class GPTQFrameworkImplemantation(FrameworkImplementation):
         Returns: GPTQTrainer object
         """
         raise NotImplemented(f'{self.__class__.__name__} have to implement the '
-                             f'framework\'s get_gptq_trainer method.')  # pragma: no cover
\ No newline at end of file
+                             f'framework\'s get_gptq_trainer method.')  # pragma: no cover
+
+    def get_gptq_blockwise_trainer_obj(self):
+        """
+        Returns: Block-wise GPTQ trainer object
+        """
+        Logger.critical(f'Block-wise GPTQ is not supported for {self.__class__.__name__}.')  # pragma: no cover
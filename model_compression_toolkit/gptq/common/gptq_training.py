@@ -248,7 +248,10 @@ def gptq_training(graph_float: Graph,
 
     """
     # Get GPTQ object and initialize it
-    gptq_trainer_obj = fw_impl.get_gptq_trainer_obj()
+    if gptq_config.blockwise_config is not None:
+        gptq_trainer_obj = fw_impl.get_gptq_blockwise_trainer_obj()
+    else:
+        gptq_trainer_obj = fw_impl.get_gptq_trainer_obj()
 
     gptq_trainer = gptq_trainer_obj(graph_float,
                                     graph_quant,
@@ -0,0 +1,199 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import shutil
+import tempfile
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
+import numpy as np
+
+from model_compression_toolkit.gptq.common.gptq_config import GPTQTeacherOutputsCacheConfig
+from model_compression_toolkit.logger import Logger
+
+
+class TeacherOutputsCache(ABC):
+    """
+    Cache of the float (teacher) model outputs at the compare points, for a fixed dataset of samples.
+
+    The outputs are added batch by batch in the order of the dataset samples, and are fetched by the samples
+    indices (in any order). If all the outputs fit in the configured memory budget, they are kept as tensors on
+    the working device. Otherwise, each output is saved to a memory-mapped file (one row per sample), and the
+    fetched samples are copied to the working device.
+    """
+
+    def __init__(self, num_samples: int, cache_config: GPTQTeacherOutputsCacheConfig):
+        """
+        Args:
+            num_samples: Number of samples in the dataset.
+            cache_config: Configuration of the cache.
+        """
+        self.num_samples = num_samples
+        self.cache_config = cache_config
+        self.num_added_samples = 0
+
+        # Outputs on the working device: a list of batches per output (concatenated when the cache is full).
+        self._device_outputs: Optional[List[Any]] = None
+        # Outputs in memory-mapped files, when exceeding the memory budget.
+        self._mmap_outputs: Optional[List[np.memmap]] = None
+        self._cache_dir = None
+        self._finalizer = None
+
+    def add(self, outputs: List[Any]):
+        """
+        Add the outputs of the next batch of the dataset samples.
+
+        Args:
+            outputs: List of the float model outputs (framework tensors) of the batch.
+        """
+        batch_size = outputs[0].shape[0]
+        if self.num_added_samples + batch_size > self.num_samples:
+            Logger.critical(f'Cannot add {batch_size} samples to a teacher outputs cache of {self.num_samples} '
+                            f'samples with {self.num_added_samples} samples.')  # pragma: no cover
+
+        if self._device_outputs is None and self._mmap_outputs is None:
+            self._allocate(outputs, batch_size)
+
+        if self._mmap_outputs is not None:
+            for mm, output in zip(self._mmap_outputs, outputs):
+                mm[self.num_added_samples: self.num_added_samples + batch_size] = self.to_numpy(output)
+        else:
+            for batches, output in zip(self._device_outputs, outputs):
+                batches.append(output)
+        self.num_added_samples += batch_size
+
+        if self.num_added_samples == self.num_samples and self._device_outputs is not None:
+            self._device_outputs = [self.concat(batches) for batches in self._device_outputs]
+
+    def get(self, indices: np.ndarray) -> List[Any]:
+        """
+        Get the cached outputs of samples.
+
+        Args:
+            indices: Indices of the samples in the dataset.
+
+        Returns:
+            List of the float model outputs (framework tensors on the working device) of the samples.
+        """
+        if self.num_added_samples != self.num_samples:
+            Logger.critical(f'Teacher outputs cache is incomplete: {self.num_added_samples} out of '
+                            f'{self.num_samples} samples were added.')  # pragma: no cover
+        indices = np.asarray(indices)
+        if self._mmap_outputs is not None:
+            return [self.to_tensor(mm[indices]) for mm in self._mmap_outputs]
+        return [self.gather(output, indices) for output in self._device_outputs]
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        """
+        Whether the outputs are saved to memory-mapped files.
+        """
+        return self._mmap_outputs is not None
+
+    def close(self):
+        """
+        Release the cached outputs and remove the memory-mapped files.
+        """
+        self._device_outputs = None
+        self._mmap_outputs = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def _allocate(self, outputs: List[Any], batch_size: int):
+        """
+        Allocate the storage of the outputs, by the size of the first batch outputs.
+
+        Args:
+            outputs: List of the float model outputs of the first batch.
+            batch_size: Number of samples in the first batch.
+        """
+        sample_shapes = [tuple(output.shape[1:]) for output in outputs]
+        dtypes = [self.to_numpy(output[:1]).dtype for output in outputs]
+        total_bytes = sum(int(np.prod(shape)) * dtype.itemsize * self.num_samples
+                          for shape, dtype in zip(sample_shapes, dtypes))
+
+        if total_bytes <= self.cache_config.max_memory_mb * 2 ** 20:
+            self._device_outputs = [[] for _ in outputs]
+            return
+
+        Logger.info(f'Teacher outputs ({total_bytes / 2 ** 20:.1f} MB) exceed the memory budget of '
+                    f'{self.cache_config.max_memory_mb} MB, saving them to memory-mapped files.')
+        if self.cache_config.cache_dir is None:
+            self._cache_dir = tempfile.mkdtemp(prefix='mct_gptq_teacher_')
+        else:
+            os.makedirs(self.cache_config.cache_dir, exist_ok=True)
+            self._cache_dir = tempfile.mkdtemp(prefix='mct_gptq_teacher_', dir=self.cache_config.cache_dir)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self._cache_dir, ignore_errors=True)
+        self._mmap_outputs = [np.lib.format.open_memmap(os.path.join(self._cache_dir, f'output_{i}.npy'),
+                                                        mode='w+', dtype=dtype, shape=(self.num_samples, *shape))
+                              for i, (shape, dtype) in enumerate(zip(sample_shapes, dtypes))]
+
+    @abstractmethod
+    def to_numpy(self, tensor: Any) -> np.ndarray:
+        """
+        Convert a framework's tensor to a Numpy array.
+
+        Args:
+            tensor: Framework's tensor.
+
+        Returns:
+            Numpy array.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
+                                  f'to_numpy method.')  # pragma: no cover
+
+    @abstractmethod
+    def to_tensor(self, array: np.ndarray) -> Any:
+        """
+        Convert a Numpy array to a framework's tensor on the working device.
+
+        Args:
+            array: Numpy array.
+
+        Returns:
+            Framework's tensor.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
+                                  f'to_tensor method.')  # pragma: no cover
+
+    @abstractmethod
+    def concat(self, tensors: List[Any]) -> Any:
+        """
+        Concatenate framework's tensors along the batch axis.
+
+        Args:
+            tensors: List of framework's tensors.
+
+        Returns:
+            The concatenated tensor.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
+                                  f'concat method.')  # pragma: no cover
+
+    @abstractmethod
+    def gather(self, tensor: Any, indices: np.ndarray) -> Any:
+        """
+        Gather samples of a framework's tensor along the batch axis.
+
+        Args:
+            tensor: Framework's tensor.
+            indices: Indices of the samples.
+
+        Returns:
+            Framework's tensor of the gathered samples.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
+                                  f'gather method.')  # pragma: no cover
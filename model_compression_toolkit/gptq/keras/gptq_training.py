@@ -30,6 +30,7 @@ from model_compression_toolkit.gptq.common.gradual_activation_quantization impor
     get_gradual_activation_quantizer_wrapper_factory
 from model_compression_toolkit.gptq.common.regularization_factory import get_regularization
 from model_compression_toolkit.gptq.keras.quantizer.quantization_builder import quantization_builder
+from model_compression_toolkit.gptq.keras.teacher_outputs_cache import KerasTeacherOutputsCache
 from model_compression_toolkit.logger import Logger
 from mct_quantizers import KerasActivationQuantizationHolder
 from model_compression_toolkit.trainable_infrastructure.common.util import get_total_grad_steps
@@ -132,6 +133,11 @@ class KerasGPTQTrainer(GPTQTrainer):
 
         self.weights_for_average_loss = self._get_compare_points_loss_weights()
 
+        # The float model outputs are cached when the training samples are the same in all the epochs.
+        cache_config = self.gptq_config.teacher_outputs_cache_config
+        self.cache_teacher_outputs = cache_config is not None and cache_config.fix_representative_dataset
+        self.teacher_outputs_cache = None
+
         self.reg_func = get_regularization(self.gptq_config,
                                            _get_total_grad_steps,
                                            SoftQuantizerRegularization,
@@ -279,14 +285,43 @@ class KerasGPTQTrainer(GPTQTrainer):
         # Training loop
         # ----------------------------------------------
         if self.has_params_to_train:
-            self.micro_training_loop(self.representative_data_gen_fn,
-                                     compute_gradients,
-                                     self.optimizer_with_param,
-                                     self.gptq_config.n_epochs,
-                                     True)
+            data_function = self.representative_data_gen_fn
+            if self.cache_teacher_outputs:
+                # the samples are read once, so the same samples are used in all the epochs
+                fixed_batches = list(self.representative_data_gen_fn())
+                data_function = lambda: iter(fixed_batches)
+                self.teacher_outputs_cache = self._compute_teacher_outputs_cache(fixed_batches)
+            try:
+                self.micro_training_loop(data_function,
+                                         compute_gradients,
+                                         self.optimizer_with_param,
+                                         self.gptq_config.n_epochs,
+                                         True)
+            finally:
+                if self.teacher_outputs_cache is not None:
+                    self.teacher_outputs_cache.close()
+                    self.teacher_outputs_cache = None
+
+    def _compute_teacher_outputs_cache(self, batches: List[List[np.ndarray]]) -> KerasTeacherOutputsCache:
+        """
+        Compute the float model outputs of fixed batches once, to reuse them in all the epochs.
+
+        Args:
+            batches: The fixed batches of the representative dataset.
+
+        Returns:
+            Cache of the float model outputs by the samples indices.
+        """
+        num_samples = sum(batch[0].shape[0] for batch in batches)
+        cache = KerasTeacherOutputsCache(num_samples, self.gptq_config.teacher_outputs_cache_config)
+        for data in tqdm(batches, "Computing float model outputs"):
+            y_float = self.float_model([d * self.input_scale for d in data])
+            cache.add(y_float if isinstance(y_float, (list, tuple)) else [y_float])
+        return cache
 
     @tf.function
-    def nano_training_step(self, input_data, in_compute_gradients, in_optimizer_with_param, is_training):
+    def nano_training_step(self, input_data, in_compute_gradients, in_optimizer_with_param, is_training,
+                           y_float=None):
         """
         This function run part of the training step, wrapped by a tf.function for acceleration.
         Args:
@@ -294,6 +329,7 @@ class KerasGPTQTrainer(GPTQTrainer):
             in_compute_gradients: A callable function that compute the gradients.
             in_optimizer_with_param: A list of optimizer classes to update with the corresponding parameters.
             is_training: A boolean flag stating if the network is running in training mode.
+            y_float: Cached outputs of the float model for the input data. If None, the float model is run.
 
         Returns:
             loss value and gradients
@@ -301,7 +337,8 @@ class KerasGPTQTrainer(GPTQTrainer):
         """
 
         # run float model
-        y_float = self.float_model(input_data)
+        if y_float is None:
+            y_float = self.float_model(input_data)
         # rung quantized model and calculate loss & gradients
         loss_value_step, grads = in_compute_gradients(y_float, input_data, in_optimizer_with_param,
                                                       training=is_training)
@@ -327,12 +364,22 @@ class KerasGPTQTrainer(GPTQTrainer):
         """
         with tqdm(range(n_epochs), "Running GPTQ optimization") as epochs_pbar:
             for _ in epochs_pbar:
+                sample_index = 0
                 with tqdm(data_function(), position=1, leave=False) as data_pbar:
                     for data in data_pbar:
                         input_data = [d * self.input_scale for d in data]
 
+                        y_float = None
+                        if self.teacher_outputs_cache is not None:
+                            batch_size = input_data[0].shape[0]
+                            y_float = self.teacher_outputs_cache.get(np.arange(sample_index,
+                                                                               sample_index + batch_size))
+                            y_float = y_float if len(self.compare_points) > 1 else y_float[0]
+                            sample_index += batch_size
+
                         loss_value_step, grads = self.nano_training_step(input_data, in_compute_gradients,
-                                                                         in_optimizer_with_param, is_training)
+                                                                         in_optimizer_with_param, is_training,
+                                                                         y_float)
                         # Run one step of gradient descent by updating
                         # the value of the variables to minimize the loss.
                         for i, (o, p) in enumerate(in_optimizer_with_param):
@@ -30,6 +30,7 @@ from model_compression_toolkit.core.common.mixed_precision.resource_utilization_
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import MixedPrecisionQuantizationConfig
 from model_compression_toolkit.core import CoreConfig
 from model_compression_toolkit.core.runner import core_runner
+from model_compression_toolkit.core.common.calibration_data.calibration_data_store import get_calibration_data_gen
 from model_compression_toolkit.gptq.runner import gptq_runner
 from model_compression_toolkit.core.analyzer import analyzer_model_quantization
 from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework import TargetPlatformCapabilities
@@ -220,6 +221,11 @@ if FOUND_TF:
 
         fw_impl = GPTQKerasImplemantation()
 
+        # Materialize the representative dataset once, if configured, so all the stages read the same batches.
+        representative_data_gen = get_calibration_data_gen(representative_data_gen,
+                                                           core_config.calibration_data_config,
+                                                           fw_impl)
+
         tg, bit_widths_config, hessian_info_service, scheduling_info = core_runner(in_model=in_model,
                                                                                    representative_data_gen=representative_data_gen,
                                                                                    core_config=core_config,
@@ -0,0 +1,42 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List
+
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit.gptq.common.teacher_outputs_cache import TeacherOutputsCache
+
+
+class KerasTeacherOutputsCache(TeacherOutputsCache):
+    """
+    Keras cache of the float (teacher) model outputs at the compare points.
+    """
+
+    def to_numpy(self, tensor: tf.Tensor) -> np.ndarray:
+        """ Convert a TF tensor to a Numpy array. """
+        return tensor.numpy()
+
+    def to_tensor(self, array: np.ndarray) -> tf.Tensor:
+        """ Convert a Numpy array to a TF tensor (of the same type). """
+        return tf.convert_to_tensor(array)
+
+    def concat(self, tensors: List[tf.Tensor]) -> tf.Tensor:
+        """ Concatenate TF tensors along the batch axis. """
+        return tf.concat(tensors, axis=0)
+
+    def gather(self, tensor: tf.Tensor, indices: np.ndarray) -> tf.Tensor:
+        """ Gather samples of a TF tensor along the batch axis. """
+        return tf.gather(tensor, indices, axis=0)
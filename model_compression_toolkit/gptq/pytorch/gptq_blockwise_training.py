@@ -0,0 +1,226 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+from dataclasses import replace
+from typing import Callable, Dict, Set, Tuple
+
+import torch
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.calibration_data.calibration_data_store import CalibrationDataStore
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.framework_info import FrameworkInfo
+from model_compression_toolkit.core.common.hessian import HessianInfoService
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, set_model, torch_tensor_to_numpy
+from model_compression_toolkit.gptq.common.gptq_blocks import GPTQBlock, partition_graph_to_blocks, \
+    build_block_graph
+from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
+from model_compression_toolkit.gptq.common.gptq_graph import get_compare_points
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+from model_compression_toolkit.logger import Logger
+
+
+class PytorchBlockwiseGPTQTrainer:
+    """
+    Pytorch block-wise GPTQ training class. The graph is partitioned to blocks of consecutive compare points, and each
+    block is fine-tuned separately with PytorchGPTQTrainer. The inputs of a block are the outputs of the preceding
+    blocks after their fine-tuning, for both the float and the quantized block models, so each block learns to
+    reconstruct its float outputs given the quantized inputs. The blocks' outputs are saved to memory-mapped files
+    and are removed once no following block uses them.
+    """
+
+    def __init__(self,
+                 graph_float: Graph,
+                 graph_quant: Graph,
+                 gptq_config: GradientPTQConfig,
+                 fw_impl: FrameworkImplementation,
+                 fw_info: FrameworkInfo,
+                 representative_data_gen: Callable,
+                 hessian_info_service: HessianInfoService = None):
+        """
+        Args:
+            graph_float: Graph to build the float blocks from.
+            graph_quant: Graph to build the quantized blocks from.
+            gptq_config: GradientPTQConfig with parameters about the tuning process.
+            fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+            fw_info: Framework information.
+            representative_data_gen: Dataset to use for inputs of the models.
+            hessian_info_service: HessianInfoService of the whole float graph. It is not used, since the
+              Hessian-based weights are computed per block, w.r.t. the block's outputs.
+        """
+        self.graph_float = graph_float
+        self.graph_quant = copy.deepcopy(graph_quant)
+        self.gptq_config = gptq_config
+        self.fw_impl = fw_impl
+        self.fw_info = fw_info
+        self.representative_data_gen = representative_data_gen
+
+        _, compare_points_names, _, _ = get_compare_points(self.graph_float)
+        self.blocks = partition_graph_to_blocks(self.graph_float,
+                                                compare_points_names,
+                                                gptq_config.blockwise_config.compare_points_per_block)
+        Logger.info(f'Block-wise GPTQ: training {len(self.blocks)} blocks.')
+
+    def train(self):
+        """
+        Train the blocks one after the other.
+        """
+        # A mapping from a node name to the store that holds its outputs, and their index in the store's batches.
+        tensors_stores: Dict[str, Tuple[CalibrationDataStore, int]] = {}
+        try:
+            for i, block in enumerate(self.blocks):
+                data_gen = self._get_block_data_gen(block, tensors_stores)
+                if len(block.compare_points) > 0:
+                    self._train_block(i, block, data_gen)
+
+                if len(block.output_tensors) > 0:
+                    store = self._store_block_outputs(i, block, data_gen)
+                    tensors_stores.update({name: (store, j) for j, name in enumerate(block.output_tensors)})
+
+                needed_tensors = {name for b in self.blocks[i + 1:] for name in b.input_tensors}
+                self._close_stores(tensors_stores, needed_tensors)
+        finally:
+            self._close_stores(tensors_stores, set())
+
+    def _train_block(self, block_index: int, block: GPTQBlock, data_gen: Callable):
+        """
+        Fine-tune a block and update the quantized graph's nodes with the results.
+
+        Args:
+            block_index: Index of the block.
+            block: Block to train.
+            data_gen: Dataset of the block's inputs.
+        """
+        float_block_graph = build_block_graph(self.graph_float, block, block_index)
+        quant_block_graph = build_block_graph(self.graph_quant, block, block_index)
+
+        gptq_config = self.gptq_config
+        if len(block.compare_points) == 1 and not gptq_config.hessian_weights_config.per_sample:
+            # The loss of a single compare point does not need weighting (and the normalized log weight of a single
+            # compare point is zero). Per sample attention weights are used also for a single compare point.
+            gptq_config = replace(gptq_config, use_hessian_based_weights=False)
+
+        hessian_info_service = None
+        if gptq_config.use_hessian_based_weights:
+            hessian_info_service = HessianInfoService(graph=float_block_graph, fw_impl=self.fw_impl)
+
+        trainer = PytorchGPTQTrainer(float_block_graph,
+                                     quant_block_graph,
+                                     gptq_config,
+                                     self.fw_impl,
+                                     self.fw_info,
+                                     data_gen,
+                                     hessian_info_service=hessian_info_service)
+        trainer.train()
+        trained_block_graph = trainer.update_graph()
+
+        # The trainer works on a copy of the block's graph, so the results are copied to the quantized graph.
+        name_to_trained_node = {n.name: n for n in trained_block_graph.nodes}
+        for node in self.graph_quant.nodes:
+            if node.name in name_to_trained_node and node.name in block.nodes:
+                trained_node = name_to_trained_node[node.name]
+                node.weights = trained_node.weights
+                node.final_weights_quantization_cfg = trained_node.final_weights_quantization_cfg
+                node.final_activation_quantization_cfg = trained_node.final_activation_quantization_cfg
+
+    def _get_block_data_gen(self,
+                            block: GPTQBlock,
+                            tensors_stores: Dict[str, Tuple[CalibrationDataStore, int]]) -> Callable:
+        """
+        Get the dataset of a block's inputs.
+
+        Args:
+            block: Block to get its dataset.
+            tensors_stores: A mapping from a node name to the store that holds its outputs, and their index in
+              the store's batches.
+
+        Returns:
+            A representative dataset generator of the block's inputs.
+        """
+        if len(block.input_tensors) == 0:
+            return self.representative_data_gen
+
+        stores = []
+        # Position of each input of the block in the zipped stores' batches.
+        inputs_indices = []
+        for name in block.input_tensors:
+            store, tensor_index = tensors_stores[name]
+            if store not in stores:
+                stores.append(store)
+            inputs_indices.append((stores.index(store), tensor_index))
+
+        def data_gen():
+            for stores_batches in zip(*[store() for store in stores]):
+                yield [stores_batches[store_index][tensor_index] for store_index, tensor_index in inputs_indices]
+
+        return data_gen
+
+    def _store_block_outputs(self,
+                             block_index: int,
+                             block: GPTQBlock,
+                             data_gen: Callable) -> CalibrationDataStore:
+        """
+        Run the quantized block on its dataset and save its outputs that are used by the following blocks.
+
+        Args:
+            block_index: Index of the block.
+            block: Block to run.
+            data_gen: Dataset of the block's inputs.
+
+        Returns:
+            A store of the block's outputs, with a tensor per name in the block's output_tensors.
+        """
+        quant_block_graph = quantize_graph_weights(build_block_graph(self.graph_quant, block, block_index))
+        output_nodes = [n for name in block.output_tensors for n in quant_block_graph.find_node_by_name(name)]
+        model, user_info = self.fw_impl.model_builder(quant_block_graph,
+                                                      mode=ModelBuilderMode.QUANTIZED,
+                                                      append2output=output_nodes,
+                                                      fw_info=self.fw_info)
+        set_model(model)
+
+        def outputs_gen():
+            for data in data_gen():
+                with torch.no_grad():
+                    outputs = model(*to_torch_tensor([d * user_info.input_scale for d in data]))
+                yield outputs
+
+        return CalibrationDataStore(outputs_gen,
+                                    to_numpy=torch_tensor_to_numpy,
+                                    store_dir=self.gptq_config.blockwise_config.activations_dir)
+
+    @staticmethod
+    def _close_stores(tensors_stores: Dict[str, Tuple[CalibrationDataStore, int]], needed_tensors: Set[str]):
+        """
+        Remove the tensors that are not needed anymore, and close the stores that hold none of the needed tensors.
+
+        Args:
+            tensors_stores: A mapping from a node name to the store that holds its outputs, and their index in
+              the store's batches.
+            needed_tensors: Names of the tensors to keep.
+        """
+        for name in list(tensors_stores):
+            if name not in needed_tensors:
+                store, _ = tensors_stores.pop(name)
+                if all(store is not s for s, _ in tensors_stores.values()):
+                    store.close()
+
+    def update_graph(self) -> Graph:
+        """
+        Returns:
+            The quantized graph, updated with the blocks' training results.
+        """
+        return self.graph_quant
@@ -17,6 +17,7 @@ from typing import Type
 
 from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
 from model_compression_toolkit.gptq.common.gptq_framework_implementation import GPTQFrameworkImplemantation
+from model_compression_toolkit.gptq.pytorch.gptq_blockwise_training import PytorchBlockwiseGPTQTrainer
 from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
 
 
@@ -26,4 +27,10 @@ class GPTQPytorchImplemantation(GPTQFrameworkImplemantation, PytorchImplementati
         """
         Returns:  Pytorch object of GPTQTrainer
         """
-        return PytorchGPTQTrainer
\ No newline at end of file
+        return PytorchGPTQTrainer
+
+    def get_gptq_blockwise_trainer_obj(self) -> Type[PytorchBlockwiseGPTQTrainer]:
+        """
+        Returns:  Pytorch object of block-wise GPTQ trainer
+        """
+        return PytorchBlockwiseGPTQTrainer
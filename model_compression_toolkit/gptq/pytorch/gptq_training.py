@@ -39,6 +39,7 @@ from model_compression_toolkit.gptq.common.gptq_graph import get_kernel_attribut
 from model_compression_toolkit.gptq.common.gptq_training import GPTQTrainer
 from model_compression_toolkit.gptq.pytorch.graph_info import get_gptq_trainable_parameters, get_weights_for_loss
 from model_compression_toolkit.gptq.pytorch.quantizer.quantization_builder import quantization_builder
+from model_compression_toolkit.gptq.pytorch.teacher_outputs_cache import PytorchTeacherOutputsCache
 
 from mct_quantizers import PytorchQuantizationWrapper, PytorchActivationQuantizationHolder
 from model_compression_toolkit.trainable_infrastructure.common.util import get_total_grad_steps
@@ -117,6 +118,12 @@ class PytorchGPTQTrainer(GPTQTrainer):
         hessian_cfg = self.gptq_config.hessian_weights_config
 
         self.use_sample_layer_attention = hessian_cfg.per_sample
+        # The float model outputs are cached when the training samples are the same in all the epochs.
+        cache_config = self.gptq_config.teacher_outputs_cache_config
+        self.cache_teacher_outputs = cache_config is not None and (self.use_sample_layer_attention or
+                                                                   cache_config.fix_representative_dataset)
+        self.fixed_dataset = None
+        self.teacher_outputs_cache = None
         if self.use_sample_layer_attention:
             # normalization is currently not supported, make sure the config reflects it.
             if hessian_cfg.norm_scores or hessian_cfg.log_norm or hessian_cfg.scale_log_norm:
@@ -139,6 +146,7 @@ class PytorchGPTQTrainer(GPTQTrainer):
               weights for regularization.
         """
         fixed_dataset = FixedDatasetFromGenerator(data_gen_fn)
+        self.fixed_dataset = fixed_dataset
         orig_batch_size = fixed_dataset.orig_batch_size
         # compute hessians for the whole dataset
         hess_data_loader = DataLoader(fixed_dataset,
@@ -156,7 +164,9 @@ class PytorchGPTQTrainer(GPTQTrainer):
         hessians_tensor = torch.stack([layers_hessians[layer.name] for layer in self.compare_points], dim=1)    # samples X layers
         assert hessians_tensor.shape[1] == len(self.compare_points)
         loss_weights = list(hessians_tensor)
-        sla_train_dataset = FixedSampleInfoDataset(fixed_dataset.samples, loss_weights)
+        # the samples indices are added to fetch the cached float model outputs
+        samples_info = [loss_weights, range(len(fixed_dataset))] if self.cache_teacher_outputs else [loss_weights]
+        sla_train_dataset = FixedSampleInfoDataset(fixed_dataset.samples, *samples_info)
 
         reg_weights = hessians_tensor.mean(dim=0)
         # use collate to add a single value to each batch
@@ -175,7 +185,12 @@ class PytorchGPTQTrainer(GPTQTrainer):
             PyTorch dataloader yielding three outputs - samples, weights for the distillation loss and
               weights for regularization.
         """
-        dataset = IterableDatasetFromGenerator(data_gen_fn)
+        if self.cache_teacher_outputs:
+            # the samples are read once, so the same samples are used in all the epochs
+            dataset = FixedDatasetFromGenerator(data_gen_fn)
+            self.fixed_dataset = dataset
+        else:
+            dataset = IterableDatasetFromGenerator(data_gen_fn)
         num_nodes = len(self.compare_points)
 
         if self.gptq_config.use_hessian_based_weights:
@@ -184,12 +199,17 @@ class PytorchGPTQTrainer(GPTQTrainer):
         else:
             loss_weights = torch.ones(num_nodes) / num_nodes
 
-        train_dataset = IterableSampleWithConstInfoDataset(dataset, loss_weights)
-
         reg_weights = torch.ones(num_nodes)
         # use collate to add a single value to each batch
         collate_fn = get_collate_fn_with_extra_outputs(reg_weights)
 
+        if self.cache_teacher_outputs:
+            # the samples indices are added to fetch the cached float model outputs
+            train_dataset = FixedSampleInfoDataset(dataset.samples, [loss_weights] * len(dataset), range(len(dataset)))
+            return DataLoader(train_dataset, batch_size=dataset.orig_batch_size, collate_fn=collate_fn)
+
+        train_dataset = IterableSampleWithConstInfoDataset(dataset, loss_weights)
+
         # NOTE: Don't just increase num_workers! With iterable dataset each worker fetches a full pass, so having
         # more workers will result in multiple passes within the same epoch. Special handling is needed either
         # in dataset or in worker_init_fn passed to dataloader, and it might not speed anything up anyway.
@@ -288,10 +308,33 @@ class PytorchGPTQTrainer(GPTQTrainer):
         set_model(self.fxp_model, True)
         self._set_requires_grad()
 
+        if self.cache_teacher_outputs:
+            self.teacher_outputs_cache = self._compute_teacher_outputs_cache()
+
         # ----------------------------------------------
         # Training loop
         # ----------------------------------------------
-        self.micro_training_loop(self.gptq_config.n_epochs)
+        try:
+            self.micro_training_loop(self.gptq_config.n_epochs)
+        finally:
+            if self.teacher_outputs_cache is not None:
+                self.teacher_outputs_cache.close()
+                self.teacher_outputs_cache = None
+
+    def _compute_teacher_outputs_cache(self) -> PytorchTeacherOutputsCache:
+        """
+        Compute the float model outputs of the fixed dataset samples once, to reuse them in all the epochs.
+
+        Returns:
+            Cache of the float model outputs by the samples indices.
+        """
+        cache = PytorchTeacherOutputsCache(len(self.fixed_dataset), self.gptq_config.teacher_outputs_cache_config)
+        with torch.no_grad():
+            for data in tqdm(DataLoader(self.fixed_dataset, batch_size=self.fixed_dataset.orig_batch_size),
+                             "Computing float model outputs"):
+                input_tensor = to_torch_tensor([d * self.input_scale for d in data])
+                cache.add(self.float_model(input_tensor))
+        return cache
 
     def compute_gradients(self,
                           y_float: List[torch.Tensor],
@@ -347,10 +390,17 @@ class PytorchGPTQTrainer(GPTQTrainer):
             for _ in epochs_pbar:
                 with tqdm(self.train_dataloader, position=1, leave=False) as data_pbar:
                     for sample in data_pbar:
-                        data, loss_weight, reg_weight = to_torch_tensor(sample)
+                        if self.teacher_outputs_cache is not None:
+                            data, loss_weight, samples_indices, reg_weight = sample
+                            data, loss_weight, reg_weight = to_torch_tensor([data, loss_weight, reg_weight])
+                        else:
+                            data, loss_weight, reg_weight = to_torch_tensor(sample)
                         input_data = [d * self.input_scale for d in data]
                         input_tensor = to_torch_tensor(input_data)
-                        y_float = self.float_model(input_tensor)  # running float model
+                        if self.teacher_outputs_cache is not None:
+                            y_float = self.teacher_outputs_cache.get(torch_tensor_to_numpy(samples_indices))
+                        else:
+                            y_float = self.float_model(input_tensor)  # running float model
                         loss_value, grads = self.compute_gradients(y_float, input_tensor, loss_weight, reg_weight)
                         # Run one step of gradient descent by updating the value of the variables to minimize the loss.
                         for (optimizer, _) in self.optimizer_with_param:
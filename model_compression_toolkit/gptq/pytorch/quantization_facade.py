@@ -24,6 +24,7 @@ from model_compression_toolkit.core.common.mixed_precision.resource_utilization_
     ResourceUtilization
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import init_tensorboard_writer
 from model_compression_toolkit.core.runner import core_runner
+from model_compression_toolkit.core.common.calibration_data.calibration_data_store import get_calibration_data_gen
 from model_compression_toolkit.gptq.common.gptq_config import (
     GradientPTQConfig, GPTQHessianScoresConfig, GradualActivationQuantizationConfig)
 from model_compression_toolkit.gptq.common.gptq_constants import REG_DEFAULT, LR_DEFAULT, LR_REST_DEFAULT, \
@@ -204,6 +205,11 @@ if FOUND_TORCH:
 
         fw_impl = GPTQPytorchImplemantation()
 
+        # Materialize the representative dataset once, if configured, so all the stages read the same batches.
+        representative_data_gen = get_calibration_data_gen(representative_data_gen,
+                                                           core_config.calibration_data_config,
+                                                           fw_impl)
+
         # ---------------------- #
         # Core Runner
         # ---------------------- #
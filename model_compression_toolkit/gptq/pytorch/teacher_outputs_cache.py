@@ -0,0 +1,43 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import List
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
+from model_compression_toolkit.gptq.common.teacher_outputs_cache import TeacherOutputsCache
+
+
+class PytorchTeacherOutputsCache(TeacherOutputsCache):
+    """
+    Pytorch cache of the float (teacher) model outputs at the compare points.
+    """
+
+    def to_numpy(self, tensor: torch.Tensor) -> np.ndarray:
+        """ Convert a torch tensor to a Numpy array. """
+        return torch_tensor_to_numpy(tensor)
+
+    def to_tensor(self, array: np.ndarray) -> torch.Tensor:
+        """ Convert a Numpy array to a torch tensor (of the same type) on the working device. """
+        return to_torch_tensor(array, dtype=None)
+
+    def concat(self, tensors: List[torch.Tensor]) -> torch.Tensor:
+        """ Concatenate torch tensors along the batch axis. """
+        return torch.cat(tensors, dim=0)
+
+    def gather(self, tensor: torch.Tensor, indices: np.ndarray) -> torch.Tensor:
+        """ Gather samples of a torch tensor along the batch axis. """
+        return tensor[torch.as_tensor(indices, device=tensor.device)]
@@ -0,0 +1,58 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(package_name: str,
+                    attributes: Dict[str, str] = None,
+                    submodules: List[str] = None) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create the module-level __getattr__ and __dir__ functions (PEP 562) of a package, that import the package's
+    attributes on their first access. This way, importing the package does not import the frameworks (and other
+    heavy dependencies) of attributes that are not used.
+
+    Args:
+        package_name: Name of the package (its __name__).
+        attributes: A mapping from an attribute name to the name of the module to import it from. If the module has
+          no such attribute, the attribute is imported as a submodule of the module.
+        submodules: Names of the package's submodules to import on their first access.
+
+    Returns:
+        The __getattr__ and __dir__ functions of the package.
+    """
+    attributes = attributes or {}
+    submodules = submodules or []
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            module = importlib.import_module(attributes[name])
+            try:
+                value = getattr(module, name)
+            except AttributeError:
+                value = importlib.import_module(f'{attributes[name]}.{name}')
+        elif name in submodules:
+            value = importlib.import_module(f'{package_name}.{name}')
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        # Set the attribute in the package, so the next accesses do not call __getattr__.
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(attributes) | set(submodules))
+
+    return __getattr__, __dir__
@@ -15,6 +15,10 @@
 
 from model_compression_toolkit.core.common.pruning.pruning_info import PruningInfo
 from model_compression_toolkit.core.common.pruning.pruning_config import ImportanceMetric, PruningConfig, ChannelsFilteringStrategy
-from model_compression_toolkit.pruning.keras.pruning_facade import keras_pruning_experimental
-from model_compression_toolkit.pruning.pytorch.pruning_facade import pytorch_pruning_experimental
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
+
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    attributes={'keras_pruning_experimental': 'model_compression_toolkit.pruning.keras.pruning_facade',
+                'pytorch_pruning_experimental': 'model_compression_toolkit.pruning.pytorch.pruning_facade'})
 
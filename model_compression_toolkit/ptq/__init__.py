@@ -13,5 +13,9 @@
 # limitations under the License.
 # ==============================================================================
 
-from model_compression_toolkit.ptq.pytorch.quantization_facade import pytorch_post_training_quantization
-from model_compression_toolkit.ptq.keras.quantization_facade import keras_post_training_quantization
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
+
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    attributes={'pytorch_post_training_quantization': 'model_compression_toolkit.ptq.pytorch.quantization_facade',
+                'keras_post_training_quantization': 'model_compression_toolkit.ptq.keras.quantization_facade'})
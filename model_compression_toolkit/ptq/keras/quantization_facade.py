@@ -28,6 +28,7 @@ from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quant
     MixedPrecisionQuantizationConfig
 from model_compression_toolkit.target_platform_capabilities.target_platform.targetplatform2framework import TargetPlatformCapabilities
 from model_compression_toolkit.core.runner import core_runner
+from model_compression_toolkit.core.common.calibration_data.calibration_data_store import get_calibration_data_gen
 from model_compression_toolkit.ptq.runner import ptq_runner
 from model_compression_toolkit.metadata import create_model_metadata
 
@@ -134,6 +135,11 @@ if FOUND_TF:
 
         fw_impl = KerasImplementation()
 
+        # Materialize the representative dataset once, if configured, so all the stages read the same batches.
+        representative_data_gen = get_calibration_data_gen(representative_data_gen,
+                                                           core_config.calibration_data_config,
+                                                           fw_impl)
+
         # Ignore returned hessian service as PTQ does not use it
         tg, bit_widths_config, _, scheduling_info = core_runner(in_model=in_model,
                                                                 representative_data_gen=representative_data_gen,
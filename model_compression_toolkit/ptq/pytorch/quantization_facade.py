@@ -26,6 +26,7 @@ from model_compression_toolkit.core import CoreConfig
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import \
     MixedPrecisionQuantizationConfig
 from model_compression_toolkit.core.runner import core_runner
+from model_compression_toolkit.core.common.calibration_data.calibration_data_store import get_calibration_data_gen
 from model_compression_toolkit.ptq.runner import ptq_runner
 from model_compression_toolkit.core.analyzer import analyzer_model_quantization
 from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
@@ -107,6 +108,11 @@ if FOUND_TORCH:
 
         fw_impl = PytorchImplementation()
 
+        # Materialize the representative dataset once, if configured, so all the stages read the same batches.
+        representative_data_gen = get_calibration_data_gen(representative_data_gen,
+                                                           core_config.calibration_data_config,
+                                                           fw_impl)
+
         # Ignore hessian info service as it is not used here yet.
         tg, bit_widths_config, _, scheduling_info = core_runner(in_model=in_module,
                                                                 representative_data_gen=representative_data_gen,
@@ -13,6 +13,12 @@
 # limitations under the License.
 # ==============================================================================
 from model_compression_toolkit.qat.common.qat_config import QATConfig
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
 
-from model_compression_toolkit.qat.keras.quantization_facade import keras_quantization_aware_training_init_experimental, keras_quantization_aware_training_finalize_experimental
-from model_compression_toolkit.qat.pytorch.quantization_facade import pytorch_quantization_aware_training_init_experimental, pytorch_quantization_aware_training_finalize_experimental
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    attributes={
+        'keras_quantization_aware_training_init_experimental': 'model_compression_toolkit.qat.keras.quantization_facade',
+        'keras_quantization_aware_training_finalize_experimental': 'model_compression_toolkit.qat.keras.quantization_facade',
+        'pytorch_quantization_aware_training_init_experimental': 'model_compression_toolkit.qat.pytorch.quantization_facade',
+        'pytorch_quantization_aware_training_finalize_experimental': 'model_compression_toolkit.qat.pytorch.quantization_facade'})
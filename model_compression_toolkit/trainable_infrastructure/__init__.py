@@ -15,11 +15,24 @@
 
 from model_compression_toolkit.trainable_infrastructure.common.trainable_quantizer_config import TrainableQuantizerWeightsConfig, TrainableQuantizerActivationConfig
 from model_compression_toolkit.trainable_infrastructure.common.training_method import TrainingMethod
+from model_compression_toolkit.lazy_loader import lazy_attributes as _lazy_attributes
 from model_compression_toolkit.verify_packages import FOUND_TORCH, FOUND_TF
+
+_framework_attributes = {}
 if FOUND_TF:
-    from model_compression_toolkit.trainable_infrastructure.keras.base_keras_quantizer import BaseKerasTrainableQuantizer
-    from model_compression_toolkit.trainable_infrastructure.keras.quantize_wrapper import KerasTrainableQuantizationWrapper
+    _framework_attributes.update({
+        'BaseKerasTrainableQuantizer': 'model_compression_toolkit.trainable_infrastructure.keras.base_keras_quantizer',
+        'KerasTrainableQuantizationWrapper': 'model_compression_toolkit.trainable_infrastructure.keras.quantize_wrapper'})
 
 if FOUND_TORCH:
-    from model_compression_toolkit.trainable_infrastructure.pytorch.base_pytorch_quantizer import BasePytorchTrainableQuantizer
-    from model_compression_toolkit.trainable_infrastructure.pytorch.activation_quantizers import *
+    _framework_attributes['BasePytorchTrainableQuantizer'] = \
+        'model_compression_toolkit.trainable_infrastructure.pytorch.base_pytorch_quantizer'
+    # Importing any of the activation quantizers imports (and registers) all of them.
+    _framework_attributes.update({name: 'model_compression_toolkit.trainable_infrastructure.pytorch.activation_quantizers'
+                                  for name in ['BasePytorchActivationTrainableQuantizer',
+                                               'STESymmetricActivationTrainableQuantizer',
+                                               'STEUniformActivationTrainableQuantizer',
+                                               'LSQSymmetricActivationTrainableQuantizer',
+                                               'LSQUniformActivationTrainableQuantizer']})
+
+__getattr__, __dir__ = _lazy_attributes(__name__, attributes=_framework_attributes)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import importlib
 from typing import Any
 
 import mct_quantizers
@@ -42,6 +43,10 @@ if FOUND_TF:
 
         """
 
+        # The QAT and GPTQ quantizers are collected as subclasses of BaseKerasTrainableQuantizer, so their modules
+        # are imported (they are not imported with model_compression_toolkit, see lazy_attributes).
+        importlib.import_module('model_compression_toolkit.qat.keras.quantizer')
+        importlib.import_module('model_compression_toolkit.gptq.keras.quantizer')
         qi_trainable_custom_objects = {subclass.__name__: subclass for subclass in
                                        get_all_subclasses(BaseKerasTrainableQuantizer)}
         qi_trainable_custom_objects.update({
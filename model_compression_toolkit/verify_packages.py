@@ -14,16 +14,38 @@
 # ==============================================================================
 
 import importlib
+import importlib.metadata
 from packaging import version
 
 from model_compression_toolkit.constants import TENSORFLOW
 
+# Names of the distributions that install the tensorflow package.
+TENSORFLOW_DISTRIBUTIONS = ['tensorflow', 'tensorflow-cpu', 'tensorflow-gpu', 'tensorflow-macos', 'tensorflow-intel',
+                            'tf-nightly']
+
+
+def _get_tensorflow_version() -> str:
+    """
+    Get the version of the installed TensorFlow from its distribution's metadata, so TensorFlow is not imported
+    (which takes a few seconds) just to check its version. If the distribution is not found, TensorFlow is imported.
+
+    Returns:
+        The version of the installed TensorFlow.
+    """
+    for distribution in TENSORFLOW_DISTRIBUTIONS:
+        try:
+            return importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    import tensorflow as tf  # pragma: no cover
+    return tf.__version__  # pragma: no cover
+
+
 FOUND_TF = importlib.util.find_spec(TENSORFLOW) is not None
 
 if FOUND_TF:
-    import tensorflow as tf
     # MCT doesn't support TensorFlow version 2.16 or higher
-    if version.parse(tf.__version__) >= version.parse("2.16"):
+    if version.parse(_get_tensorflow_version()) >= version.parse("2.16"):
         FOUND_TF = False
 
 FOUND_TORCH = importlib.util.find_spec("torch") is not None
@@ -19,6 +19,66 @@ from abc import ABC, abstractmethod
 from model_compression_toolkit.logger import Logger
 
 
+class ActivationsCaptureSession:
+    """
+    A session for extracting the activations of a float and a quantized model over multiple batches.
+    A session can hold resources (e.g., hooks registered on the models) that are reused across batches,
+    and released when the session is closed. Use it as a context manager to make sure it is closed:
+
+        with model_analyzer.activations_capture_session(float_model, quantized_model, float_name2quant_name) as session:
+            for data in dataset():
+                float_activations, quant_activations = session.extract_model_activations(data)
+
+    By default, activations are extracted using the ModelAnalyzer's extract_model_activations.
+    """
+
+    def __init__(self,
+                 model_analyzer: 'ModelAnalyzer',
+                 float_model: Any,
+                 quantized_model: Any,
+                 float_name2quant_name: Dict[str, str]):
+        """
+        Args:
+            model_analyzer: The model analyzer to extract the activations with.
+            float_model: The float model.
+            quantized_model: The quantized model.
+            float_name2quant_name: A mapping from float model layer names to quantized model layer
+            names.
+        """
+        self.model_analyzer = model_analyzer
+        self.float_model = float_model
+        self.quantized_model = quantized_model
+        self.float_name2quant_name = float_name2quant_name
+
+    def extract_model_activations(self, data: List[Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Extracts activations from both the float and quantized models for a batch.
+
+        Args:
+            data: Input data for which to compute activations.
+
+        Returns:
+                - Dictionary of activations for the float model.
+                - Dictionary of activations for the quantized model.
+        """
+        return self.model_analyzer.extract_model_activations(self.float_model,
+                                                             self.quantized_model,
+                                                             self.float_name2quant_name,
+                                                             data)
+
+    def close(self):
+        """
+        Releases the resources held by the session.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class ModelAnalyzer(ABC):
     """
     This class provides abstract methods for analyzing a model, specifically for
@@ -48,6 +108,25 @@ class ModelAnalyzer(ABC):
         Logger.critical("This method should be implemented by the framework-specific ModelAnalyzer.")  # pragma: no cover
 
 
+    def activations_capture_session(self,
+                                    float_model: Any,
+                                    quantized_model: Any,
+                                    float_name2quant_name: Dict[str, str]) -> ActivationsCaptureSession:
+        """
+        Creates a session for extracting activations from both the float and quantized models over
+        multiple batches.
+
+        Args:
+            float_model: The float model.
+            quantized_model: The quantized model.
+            float_name2quant_name: A mapping from float model layer names to quantized model layer
+            names.
+
+        Returns:
+            ActivationsCaptureSession: The activations capture session, to be used as a context manager.
+        """
+        return ActivationsCaptureSession(self, float_model, quantized_model, float_name2quant_name)
+
     @abstractmethod
     def identify_quantized_compare_points(self, quantized_model: Any) -> List[str]:
         """
@@ -151,44 +151,51 @@ class SimilarityCalculator:
         float_name2quant_name = self._get_float_to_quantized_compare_points(float_model=float_model,
                                                                             quantized_model=quantized_model)
 
-        # Initialize dictionaries to store similarity metrics.
-        output_similarity_metrics = {key: [] for key in similarity_metrics_to_compute.keys()}
-        intermediate_similarity_metrics = {layer: {key: [] for key in similarity_metrics_to_compute.keys()} for layer in
+        # Initialize dictionaries to accumulate the similarity metrics over the dataset batches. The metrics are
+        # reduced to their sum while iterating, so no per-batch values are kept.
+        output_similarity_metrics = {key: 0 for key in similarity_metrics_to_compute.keys()}
+        intermediate_similarity_metrics = {layer: {key: 0 for key in similarity_metrics_to_compute.keys()} for layer in
                                            float_name2quant_name.values()}
-
-        # Iterate over the dataset and compute similarity metrics.
-        for x in dataset():
-            # Extract activations and predictions from both models.
-            float_activations, quant_activations = (
-                self.model_analyzer_utils.extract_model_activations(
-                float_model, quantized_model, float_name2quant_name, x))
-
-            float_predictions = float_activations[MODEL_OUTPUT_KEY]
-            quant_predictions = quant_activations[MODEL_OUTPUT_KEY]
-
-            # Compute similarity metrics for the output predictions.
-            output_results = self.compute_tensors_similarity((float_predictions, quant_predictions),
-                                                             similarity_metrics_to_compute)
-            for key in output_similarity_metrics:
-                output_similarity_metrics[key].append(output_results[key])
-
-            # Compute similarity metrics for each intermediate layer.
-            for float_layer, quant_layer in float_name2quant_name.items():
-                intermediate_results = self.compute_tensors_similarity(
-                    (float_activations[float_layer], quant_activations[quant_layer]),
-                    similarity_metrics_to_compute)
-                for key in intermediate_similarity_metrics[quant_layer]:
-                    intermediate_similarity_metrics[quant_layer][key].append(intermediate_results[key])
+        num_batches = 0
+
+        # Iterate over the dataset and compute similarity metrics. The capture session is reused across the
+        # batches, and releases its resources (e.g., hooks registered on the models) when done.
+        with self.model_analyzer_utils.activations_capture_session(float_model,
+                                                                   quantized_model,
+                                                                   float_name2quant_name) as capture_session:
+            for x in dataset():
+                # Extract activations and predictions from both models.
+                float_activations, quant_activations = capture_session.extract_model_activations(x)
+
+                float_predictions = float_activations[MODEL_OUTPUT_KEY]
+                quant_predictions = quant_activations[MODEL_OUTPUT_KEY]
+
+                # Compute similarity metrics for the output predictions.
+                output_results = self.compute_tensors_similarity((float_predictions, quant_predictions),
+                                                                 similarity_metrics_to_compute)
+                for key in output_similarity_metrics:
+                    output_similarity_metrics[key] += output_results[key]
+
+                # Compute similarity metrics for each intermediate layer.
+                for float_layer, quant_layer in float_name2quant_name.items():
+                    intermediate_results = self.compute_tensors_similarity(
+                        (float_activations[float_layer], quant_activations[quant_layer]),
+                        similarity_metrics_to_compute)
+                    for key in intermediate_similarity_metrics[quant_layer]:
+                        intermediate_similarity_metrics[quant_layer][key] += intermediate_results[key]
+
+                num_batches += 1
+
+        if num_batches == 0:
+            Logger.critical(f"Can not average similarities of an empty list.")
 
         # Aggregate the output similarity metrics.
-        aggregated_output_similarity_metrics = {key: sum(value) / len(value) for key, value in
+        aggregated_output_similarity_metrics = {key: float(value / num_batches) for key, value in
                                                 output_similarity_metrics.items()}
 
         # Aggregate the intermediate similarity metrics for each layer.
         for layer_name, layer_similarity_metrics in intermediate_similarity_metrics.items():
-            for similarity_name, similarity_values_list in layer_similarity_metrics.items():
-                if len(similarity_values_list) == 0:
-                    Logger.critical(f"Can not average similarities of an empty list.")
-                intermediate_similarity_metrics[layer_name][similarity_name] = sum(similarity_values_list) / len(similarity_values_list)
+            for similarity_name, similarity_values_sum in layer_similarity_metrics.items():
+                intermediate_similarity_metrics[layer_name][similarity_name] = float(similarity_values_sum / num_batches)
 
         return aggregated_output_similarity_metrics, intermediate_similarity_metrics
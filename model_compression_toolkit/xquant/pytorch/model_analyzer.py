@@ -12,49 +12,68 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #  ==============================================================================
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Iterable
 
 import torch
 from mct_quantizers.pytorch.quantize_wrapper import PytorchQuantizationWrapper
 from model_compression_toolkit.xquant.common.constants import MODEL_OUTPUT_KEY
 
-from model_compression_toolkit.xquant.common.model_analyzer import ModelAnalyzer
+from model_compression_toolkit.xquant.common.model_analyzer import ModelAnalyzer, ActivationsCaptureSession
 
 
-class PytorchModelAnalyzer(ModelAnalyzer):
+class PytorchActivationsCaptureSession(ActivationsCaptureSession):
     """
-    This class provides utilities for analyzing Pytorch models, specifically for
-    extracting activations and comparing float and quantized models.
+    A session for extracting the activations of a float and a quantized Pytorch models over multiple batches.
+    Forward hooks are registered on the compared layers once, when the session is created, and are removed
+    when the session is closed.
     """
 
-    def extract_model_activations(self,
-                                  float_model: torch.nn.Module,
-                                  quantized_model: torch.nn.Module,
-                                  float_name2quant_name: Dict[str, str],
-                                  data: List[torch.Tensor]) -> Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]:
+    def __init__(self,
+                 model_analyzer: ModelAnalyzer,
+                 float_model: torch.nn.Module,
+                 quantized_model: torch.nn.Module,
+                 float_name2quant_name: Dict[str, str]):
         """
-        Extracts activations from both the float and quantized models.
-
         Args:
+            model_analyzer (ModelAnalyzer): The model analyzer that created the session.
             float_model (torch.nn.Module): The float model.
             quantized_model (torch.nn.Module): The quantized model.
             float_name2quant_name (Dict[str, str]): A mapping from float model layer names to quantized model layer
             names.
-            data (List[torch.Tensor]): Input data for which to compute activations.
+        """
+        super().__init__(model_analyzer, float_model, quantized_model, float_name2quant_name)
+
+        # Dictionaries to store the activations of the current batch for both models.
+        self._activations_float = {}
+        self._activations_quant = {}
+
+        self._hooks_handles = []
+        try:
+            self._register_hooks(float_model, float_name2quant_name.keys(), self._activations_float)
+            self._register_hooks(quantized_model, float_name2quant_name.values(), self._activations_quant)
+        except Exception:
+            self.close()
+            raise
+
+    def _register_hooks(self,
+                        model: torch.nn.Module,
+                        layers_names: Iterable[str],
+                        activations: Dict[str, torch.Tensor]):
+        """
+        Registers hooks that capture the activations of layers of a model.
 
-        Returns:
-            Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]:
-                - Dictionary of activations for the float model.
-                - Dictionary of activations for the quantized model.
+        Args:
+            model (torch.nn.Module): The model to register the hooks on.
+            layers_names (Iterable[str]): Names of the layers to capture their activations.
+            activations (Dict[str, torch.Tensor]): The dictionary to store the activations.
         """
 
-        def _compute_activations(name: str, activations: dict):
+        def _compute_activations(name: str):
             """
             Creates a hook function to capture the activations of a layer.
 
             Args:
                 name (str): The name of the layer.
-                activations (dict): The dictionary to store the activations.
 
             Returns:
                 hook (function): The hook function to register with the layer.
@@ -64,30 +83,101 @@ class PytorchModelAnalyzer(ModelAnalyzer):
 
             return hook
 
-        # Initialize dictionaries to store activations for both models
-        activations_float = {}
-        activations_quant = {}
+        named_modules = dict(model.named_modules())
+        for layer_name in layers_names:
+            self._hooks_handles.append(named_modules[layer_name].register_forward_hook(_compute_activations(layer_name)))
 
-        # Register hooks for all layers in the float model
-        for layer_name in float_name2quant_name.keys():
-            layer = dict([*float_model.named_modules()])[layer_name]
-            layer.register_forward_hook(_compute_activations(layer_name, activations_float))
+    def extract_model_activations(self, data: List[torch.Tensor]) -> Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]:
+        """
+        Extracts activations from both the float and quantized models for a batch.
 
-        # Register hooks for all layers in the quantized model
-        for layer_name in float_name2quant_name.values():
-            layer = dict([*quantized_model.named_modules()])[layer_name]
-            layer.register_forward_hook(_compute_activations(layer_name, activations_quant))
+        Args:
+            data (List[torch.Tensor]): Input data for which to compute activations.
+
+        Returns:
+            Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]:
+                - Dictionary of activations for the float model.
+                - Dictionary of activations for the quantized model.
+        """
+        self._activations_float.clear()
+        self._activations_quant.clear()
 
         # Perform a forward pass with the input data and capture activations
         with torch.no_grad():
-            float_predictions = float_model(*data)
-            quant_predictions = quantized_model(*data)
+            float_predictions = self.float_model(*data)
+            quant_predictions = self.quantized_model(*data)
 
+        activations_float = dict(self._activations_float)
+        activations_quant = dict(self._activations_quant)
         activations_float[MODEL_OUTPUT_KEY] = float_predictions
         activations_quant[MODEL_OUTPUT_KEY] = quant_predictions
 
+        # Release the session's references to the batch activations.
+        self._activations_float.clear()
+        self._activations_quant.clear()
+
         return activations_float, activations_quant
 
+    def close(self):
+        """
+        Removes the hooks registered by the session.
+        """
+        for handle in self._hooks_handles:
+            handle.remove()
+        self._hooks_handles = []
+
+
+class PytorchModelAnalyzer(ModelAnalyzer):
+    """
+    This class provides utilities for analyzing Pytorch models, specifically for
+    extracting activations and comparing float and quantized models.
+    """
+
+    def extract_model_activations(self,
+                                  float_model: torch.nn.Module,
+                                  quantized_model: torch.nn.Module,
+                                  float_name2quant_name: Dict[str, str],
+                                  data: List[torch.Tensor]) -> Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]:
+        """
+        Extracts activations from both the float and quantized models.
+        To extract activations for multiple batches, use activations_capture_session, which registers
+        the hooks on the models once.
+
+        Args:
+            float_model (torch.nn.Module): The float model.
+            quantized_model (torch.nn.Module): The quantized model.
+            float_name2quant_name (Dict[str, str]): A mapping from float model layer names to quantized model layer
+            names.
+            data (List[torch.Tensor]): Input data for which to compute activations.
+
+        Returns:
+            Tuple[Dict[str, torch.Tensor], Dict[str, torch.Tensor]]:
+                - Dictionary of activations for the float model.
+                - Dictionary of activations for the quantized model.
+        """
+        with self.activations_capture_session(float_model, quantized_model, float_name2quant_name) as session:
+            return session.extract_model_activations(data)
+
+    def activations_capture_session(self,
+                                    float_model: torch.nn.Module,
+                                    quantized_model: torch.nn.Module,
+                                    float_name2quant_name: Dict[str, str]) -> PytorchActivationsCaptureSession:
+        """
+        Creates a session for extracting activations from both the float and quantized models over
+        multiple batches. The session registers forward hooks on the compared layers, which are removed
+        when the session is closed.
+
+        Args:
+            float_model (torch.nn.Module): The float model.
+            quantized_model (torch.nn.Module): The quantized model.
+            float_name2quant_name (Dict[str, str]): A mapping from float model layer names to quantized model layer
+            names.
+
+        Returns:
+            PytorchActivationsCaptureSession: The activations capture session, to be used as a context manager.
+        """
+        return PytorchActivationsCaptureSession(self, float_model, quantized_model, float_name2quant_name)
+
     def identify_quantized_compare_points(self,
                                           quantized_model: torch.nn.Module) -> List[str]:
         """
@@ -14,6 +14,9 @@
 #  ==============================================================================
 
 
+from typing import Dict, Callable
+
+from model_compression_toolkit.xquant.common.constants import CS_SIMILARITY_METRIC_NAME, SQNR_SIMILARITY_METRIC_NAME, MSE_SIMILARITY_METRIC_NAME
 from model_compression_toolkit.xquant.common.similarity_functions import SimilarityFunctions
 import torch
 
@@ -31,8 +34,7 @@ class PytorchSimilarityFunctions(SimilarityFunctions):
         Returns:
             Mean Squared Error as a float.
         """
-        mse = torch.nn.functional.mse_loss(x, y)
-        return mse.item()
+        return PytorchSimilarityFunctions._compute_mse_tensor(x, y).item()
 
     @staticmethod
     def compute_cs(x: torch.Tensor, y: torch.Tensor) -> float:
@@ -46,8 +48,7 @@ class PytorchSimilarityFunctions(SimilarityFunctions):
         Returns:
             Cosine Similarity as a float.
         """
-        cs = torch.nn.functional.cosine_similarity(x.flatten(), y.flatten(), dim=0)
-        return cs.item()
+        return PytorchSimilarityFunctions._compute_cs_tensor(x, y).item()
 
     @staticmethod
     def compute_sqnr(x: torch.Tensor, y: torch.Tensor) -> float:
@@ -61,8 +62,43 @@ class PytorchSimilarityFunctions(SimilarityFunctions):
         Returns:
             Signal-to-Quantization-Noise Ratio as a float.
         """
+        return PytorchSimilarityFunctions._compute_sqnr_tensor(x, y).item()
+
+    @staticmethod
+    def _compute_mse_tensor(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        """
+        Computes Mean Squared Error between two tensors, as a tensor on their device.
+        """
+        return torch.nn.functional.mse_loss(x, y)
+
+    @staticmethod
+    def _compute_cs_tensor(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        """
+        Computes Cosine Similarity between two tensors, as a tensor on their device.
+        """
+        return torch.nn.functional.cosine_similarity(x.flatten(), y.flatten(), dim=0)
+
+    @staticmethod
+    def _compute_sqnr_tensor(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        """
+        Computes Signal-to-Quantization-Noise Ratio between two tensors, as a tensor on their device.
+        """
         signal_power = torch.mean(x ** 2)
         noise_power = torch.mean((x - y) ** 2)
-        sqnr = signal_power / noise_power
-        return sqnr.item()
+        return signal_power / noise_power
+
+    def get_default_similarity_metrics(self) -> Dict[str, Callable]:
+        """
+        Get the default similarity metrics to compute. The metrics are computed as tensors on the
+        tensors' device, so their values can be accumulated over batches without synchronizing
+        with the device for each batch and layer.
+
+        Returns:
+            Dict[str, Callable]: A dictionary where the keys are similarity metric names and the values are the corresponding functions.
+        """
+        return {
+            MSE_SIMILARITY_METRIC_NAME: self._compute_mse_tensor,
+            CS_SIMILARITY_METRIC_NAME: self._compute_cs_tensor,
+            SQNR_SIMILARITY_METRIC_NAME: self._compute_sqnr_tensor
+        }
 
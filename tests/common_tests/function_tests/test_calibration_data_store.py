@@ -0,0 +1,93 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core import CalibrationDataConfig
+from model_compression_toolkit.core.common.calibration_data.calibration_data_store import CalibrationDataStore, \
+    get_calibration_data_gen
+
+
+class CountingDataGen:
+    def __init__(self, batch_sizes):
+        self.batches = [[np.random.randn(b, 4, 4, 3).astype(np.float32), np.random.randint(0, 10, (b, 2))]
+                        for b in batch_sizes]
+        self.num_iterations = 0
+
+    def __call__(self):
+        self.num_iterations += 1
+        for batch in self.batches:
+            yield batch
+
+
+class TestCalibrationDataStore(unittest.TestCase):
+
+    def test_store_yields_generator_batches(self):
+        data_gen = CountingDataGen([3, 3, 2])
+        store = CalibrationDataStore(data_gen, to_numpy=np.asarray)
+        self.assertEqual(data_gen.num_iterations, 1)
+        self.assertEqual(store.num_samples, 8)
+
+        for _ in range(3):
+            batches = list(store())
+            self.assertEqual(len(batches), len(data_gen.batches))
+            for batch, expected_batch in zip(batches, data_gen.batches):
+                self.assertEqual(len(batch), 2)
+                for x, expected_x in zip(batch, expected_batch):
+                    self.assertEqual(x.dtype, expected_x.dtype)
+                    self.assertTrue(np.array_equal(x, expected_x))
+        # The generator is not iterated again.
+        self.assertEqual(data_gen.num_iterations, 1)
+
+        # Modifying a batch does not modify the store.
+        batch = next(store())
+        batch[0][...] = 0
+        self.assertTrue(np.array_equal(next(store())[0], data_gen.batches[0][0]))
+
+    def test_store_files_are_removed(self):
+        with tempfile.TemporaryDirectory() as store_dir:
+            store = CalibrationDataStore(CountingDataGen([2, 2]), to_numpy=np.asarray, store_dir=store_dir)
+            self.assertEqual(len(os.listdir(store_dir)), 1)
+            store.close()
+            self.assertEqual(len(os.listdir(store_dir)), 0)
+
+            store = CalibrationDataStore(CountingDataGen([2, 2]), to_numpy=np.asarray, store_dir=store_dir)
+            del store
+            self.assertEqual(len(os.listdir(store_dir)), 0)
+
+    def test_inconsistent_batches(self):
+        def data_gen():
+            yield [np.zeros((2, 4))]
+            yield [np.zeros((2, 5))]
+
+        with self.assertRaises(Exception) as e:
+            CalibrationDataStore(data_gen, to_numpy=np.asarray)
+        self.assertIn('same samples shapes and types', str(e.exception))
+
+    def test_get_calibration_data_gen(self):
+        class FwImpl:
+            to_numpy = staticmethod(np.asarray)
+
+        data_gen = CountingDataGen([2])
+        self.assertIs(get_calibration_data_gen(data_gen, CalibrationDataConfig(), FwImpl()), data_gen)
+        store = get_calibration_data_gen(data_gen, CalibrationDataConfig(materialize=True), FwImpl())
+        self.assertIsInstance(store, CalibrationDataStore)
+
+
+if __name__ == '__main__':
+    unittest.main()
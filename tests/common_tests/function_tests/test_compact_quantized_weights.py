@@ -0,0 +1,62 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common.mixed_precision.compact_quantized_weights import CompactQuantizedWeights
+
+
+def _quantize(weights: np.ndarray, n_bits: int, channel_axis) -> np.ndarray:
+    """
+    Symmetric uniform fake-quantization of weights with a threshold per channel.
+    """
+    reduce_axes = None if channel_axis is None else \
+        tuple(a for a in range(weights.ndim) if a != channel_axis)
+    threshold = np.max(np.abs(weights), axis=reduce_axes, keepdims=True)
+    delta = threshold / 2 ** (n_bits - 1)
+    return (np.clip(np.round(weights / delta), -2 ** (n_bits - 1), 2 ** (n_bits - 1) - 1) * delta).astype(np.float32)
+
+
+class TestCompactQuantizedWeights(unittest.TestCase):
+
+    def test_round_trip(self):
+        weights = np.random.randn(3, 3, 16, 32).astype(np.float32)
+        for n_bits in range(1, 9):
+            for channel_axis in [None, 0, 3]:
+                q_weights = _quantize(weights, n_bits, channel_axis)
+                compact = CompactQuantizedWeights.from_quantized_weights(q_weights, n_bits, channel_axis)
+                self.assertIsNotNone(compact)
+                decoded = compact.decode()
+                self.assertEqual(decoded.dtype, q_weights.dtype)
+                self.assertTrue(np.array_equal(decoded, q_weights), f'n_bits={n_bits}, channel_axis={channel_axis}')
+                if n_bits <= 4:
+                    # With more bits, the codebooks of small channels may outweigh the codes' saving.
+                    self.assertLess(compact.nbytes, q_weights.nbytes)
+
+    def test_lut_values_round_trip(self):
+        codebook = np.array([-0.7, -0.1, 0.05, 0.9], dtype=np.float32)
+        q_weights = np.random.choice(codebook, size=(8, 4, 3, 3))
+        compact = CompactQuantizedWeights.from_quantized_weights(q_weights, 2, 0)
+        self.assertTrue(np.array_equal(compact.decode(), q_weights))
+
+    def test_not_encodable(self):
+        weights = np.random.randn(4, 64).astype(np.float32)
+        self.assertIsNone(CompactQuantizedWeights.from_quantized_weights(weights, 4, 0))
+        self.assertIsNone(CompactQuantizedWeights.from_quantized_weights(_quantize(weights, 16, 0), 16, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import copy
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.graph.edge import Edge
+
+
+class Conv:
+    pass
+
+
+def _build_graph():
+    nodes = [BaseNode(name=f'conv{i}', framework_attr={'groups': 1}, input_shape=(), output_shape=(),
+                      weights={'kernel': np.random.randn(8, 8, 3, 3), 'bias': np.random.randn(8)},
+                      layer_class=Conv) for i in range(3)]
+    edges = [Edge(nodes[i], nodes[i + 1], 0, 0) for i in range(2)]
+    return Graph('test', nodes, [nodes[0]], [], edges)
+
+
+class TestGraphDeepcopy(unittest.TestCase):
+
+    def test_deepcopy_shares_weights(self):
+        graph = _build_graph()
+        graph_copy = copy.deepcopy(graph)
+        for n, n_copy in zip(graph.get_topo_sorted_nodes(), graph_copy.get_topo_sorted_nodes()):
+            self.assertIsNot(n, n_copy)
+            self.assertIsNot(n.weights, n_copy.weights)
+            self.assertIsNot(n.framework_attr, n_copy.framework_attr)
+            for k, w in n.weights.items():
+                self.assertIs(n_copy.weights[k], w)
+                self.assertFalse(w.flags.writeable)
+
+    def test_set_weights_of_copy(self):
+        graph = _build_graph()
+        node = graph.get_topo_sorted_nodes()[0]
+        kernel = node.get_weights_by_keys('kernel')
+        node_copy = copy.deepcopy(graph).get_topo_sorted_nodes()[0]
+
+        # Shared weights can't be modified in place, but can be replaced in a single copy.
+        with self.assertRaises(ValueError):
+            node_copy.get_weights_by_keys('kernel')[0] += 1
+        node_copy.set_weights_by_keys('kernel', kernel + 1)
+        self.assertTrue(np.array_equal(node_copy.get_weights_by_keys('kernel'), kernel + 1))
+        self.assertIs(node.get_weights_by_keys('kernel'), kernel)
+
+
+if __name__ == '__main__':
+    unittest.main()
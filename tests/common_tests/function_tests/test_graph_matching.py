@@ -0,0 +1,109 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.graph.base_node import BaseNode
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.core.common.graph.graph_matchers import NodeOperationMatcher, EdgeMatcher, WalkMatcher
+from model_compression_toolkit.core.common.graph.graph_searches import GraphMatchesTracker
+from model_compression_toolkit.core.common.matchers.node_matcher import NodeAnyMatcher
+
+
+class Conv:
+    pass
+
+
+class ReLU:
+    pass
+
+
+class Add:
+    pass
+
+
+def _node(name, layer_class):
+    return BaseNode(name=name, framework_attr={}, input_shape=(), output_shape=(), weights={},
+                    layer_class=layer_class)
+
+
+def _build_graph(num_blocks=20, seed=0):
+    """
+    Build a chain of random conv/relu blocks with some residual connections.
+    """
+    rng = np.random.default_rng(seed)
+    nodes = [_node('in', Conv)]
+    edges = []
+    for i in range(num_blocks):
+        node = _node(f'n{i}', [Conv, ReLU, Add][rng.integers(3)])
+        edges.append(Edge(nodes[-1], node, 0, 0))
+        if node.type is Add and len(nodes) > 2:
+            edges.append(Edge(nodes[-3], node, 0, 1))
+        nodes.append(node)
+    return Graph('test', nodes, [nodes[0]], [], edges)
+
+
+def _full_scan_filter(graph, matcher):
+    """
+    Reference filter that applies the matcher from every node in the graph (without the node type index).
+    """
+    if isinstance(matcher, WalkMatcher):
+        return [m for n in graph.nodes for m in graph._walk_matches_from(n, matcher.matcher_list, {})]
+    if isinstance(matcher, EdgeMatcher):
+        return [e for e in graph.edges if matcher.apply(e)]
+    return [n for n in graph.nodes if matcher.apply(n)]
+
+
+class TestGraphMatching(unittest.TestCase):
+
+    def setUp(self):
+        conv, relu, add = NodeOperationMatcher(Conv), NodeOperationMatcher(ReLU), NodeOperationMatcher(Add)
+        self.matchers = [conv, conv | add, conv & NodeAnyMatcher(), NodeAnyMatcher(),
+                         EdgeMatcher(conv, relu), EdgeMatcher(NodeAnyMatcher(), add),
+                         WalkMatcher([conv, relu]), WalkMatcher([relu, conv, add]), WalkMatcher([conv, conv])]
+
+    def test_indexed_filter_matches_full_scan(self):
+        graph = _build_graph()
+        for matcher in self.matchers:
+            self.assertEqual(graph.filter(matcher), _full_scan_filter(graph, matcher))
+
+    def test_index_after_node_type_change(self):
+        graph = _build_graph()
+        node = graph.filter(NodeOperationMatcher(ReLU))[0]
+        node.layer_class = Add
+        graph.reindex_node(node)
+        self.assertNotIn(node, graph.filter(NodeOperationMatcher(ReLU)))
+        self.assertIn(node, graph.filter(NodeOperationMatcher(Add)))
+        for matcher in self.matchers:
+            self.assertEqual(graph.filter(matcher), _full_scan_filter(graph, matcher))
+
+    def test_tracked_matches_after_graph_edits(self):
+        rng = np.random.default_rng(1)
+        for matcher in self.matchers:
+            graph = _build_graph(seed=2)
+            with GraphMatchesTracker(graph, matcher) as tracker:
+                for i in range(10):
+                    # Replace a random node with a new node of a random type
+                    node = list(graph.nodes)[rng.integers(1, len(graph.nodes))]
+                    graph.replace_node(node, _node(f'new{i}', [Conv, ReLU, Add][rng.integers(3)]))
+                    self.assertEqual(tracker.get_matches(), graph.filter(matcher))
+            self.assertEqual(graph._edits_records, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
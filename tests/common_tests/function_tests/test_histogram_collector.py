@@ -19,6 +19,16 @@ import numpy as np
 from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector, interpolate_histogram
 
 
+def lazy_merge_histograms(histograms, n_bins):
+    # Reference merge of all histograms at once, as done before the streaming merge.
+    min_value = min(b[0] for _, b in histograms)
+    max_value = max(b[-1] for _, b in histograms)
+    bin_width = (max_value - min_value) / n_bins
+    bins = np.arange(min_value, max_value + bin_width, bin_width)
+    counts = np.sum([interpolate_histogram(bins, b, c) for c, b in histograms], axis=0)
+    return bins, counts
+
+
 class TestHistogramCollector(unittest.TestCase):
 
     def test_same(self):
@@ -47,6 +57,41 @@ class TestHistogramCollector(unittest.TestCase):
         self.assertTrue(hc.max() == 1.0)
         self.assertTrue(hc.min() == 1.0)
 
+    def test_streaming_merge_matches_lazy_merge(self):
+        n_bins = 2048
+        rng = np.random.default_rng(0)
+        for batches in [[rng.normal(size=1000) for _ in range(1000)],
+                        [rng.normal(scale=1 + i / 100, size=1000) for i in range(1000)],
+                        [rng.standard_t(df=2, size=1000) for _ in range(1000)]]:
+            hc = HistogramCollector(n_bins)
+            histograms = []
+            for x in batches:
+                hc.update(x)
+                histograms.append(np.histogram(x, bins=n_bins))
+
+            bins, counts = hc.get_histogram()
+            lazy_bins, lazy_counts = lazy_merge_histograms(histograms, n_bins)
+            self.assertTrue(np.array_equal(bins, lazy_bins))
+            self.assertTrue(np.isclose(counts.sum(), lazy_counts.sum()))
+            cdf_error = np.max(np.abs(np.cumsum(counts) - np.cumsum(lazy_counts))) / lazy_counts.sum()
+            self.assertLess(cdf_error, 5e-3)
+
+    def test_streaming_merge_memory_is_bounded(self):
+        # Stream thousands of batches through the merge: the collector's state must not grow with the
+        # number of batches.
+        n_bins = 2048
+        hc = HistogramCollector(n_bins)
+        rng = np.random.default_rng(0)
+        for i in range(5000):
+            hc.update(rng.normal(scale=1 + i / 1000, size=256))
+            if i == 0:
+                state_size = sum(v.nbytes for v in vars(hc).values() if isinstance(v, np.ndarray))
+        self.assertEqual(sum(v.nbytes for v in vars(hc).values() if isinstance(v, np.ndarray)), state_size)
+
+        bins, counts = hc.get_histogram()
+        self.assertEqual(len(bins), n_bins + 1)
+        self.assertTrue(np.isclose(counts.sum(), 5000 * 256))
+
     def test_inter_histogram(self):
         x = np.random.rand(1, 2, 3, 4)
         bins = np.linspace(-2, 2, num=100)
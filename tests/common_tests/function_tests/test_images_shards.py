@@ -0,0 +1,114 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from model_compression_toolkit.data_generation.common.constants import IMAGES_SHARDS_MANIFEST
+from model_compression_toolkit.data_generation.common.image_shards import ImagesShardsWriter, ImagesShardsDataset
+
+
+class GenerateImagesFn:
+    """
+    Mock of a framework's images generation: returns the initial images as single-image arrays, and fails
+    after a given number of calls.
+    """
+    def __init__(self, fail_after: int = None):
+        self.fail_after = fail_after
+        self.n_calls = 0
+
+    def __call__(self, init_dataset):
+        if self.fail_after is not None and self.n_calls == self.fail_after:
+            raise RuntimeError('Generation interrupted')
+        self.n_calls += 1
+        return [image[np.newaxis] for batch in init_dataset for image in batch]
+
+
+def get_init_dataset(n_images, batch_size, first_image=0):
+    images = np.arange(first_image, n_images, dtype=np.float32)[:, None, None, None] * np.ones((1, 2, 2, 3))
+    return [images[i: i + batch_size] for i in range(0, len(images), batch_size)]
+
+
+class TestImagesShards(unittest.TestCase):
+
+    def test_write_and_read_shards(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            writer = ImagesShardsWriter(output_dir, n_images=10, shard_n_images=4)
+            generate_images_fn = GenerateImagesFn()
+            writer.write_shards(get_init_dataset(10, 2), shard_n_batches=2, generate_images_fn=generate_images_fn)
+            self.assertEqual(generate_images_fn.n_calls, 3)
+            self.assertEqual(writer.get_n_remaining_images(), 0)
+
+            with open(os.path.join(output_dir, IMAGES_SHARDS_MANIFEST)) as f:
+                manifest = json.load(f)
+            self.assertEqual([s['n_images'] for s in manifest['shards']], [4, 4, 2])
+            self.assertEqual(manifest['image_shape'], [2, 2, 3])
+            self.assertEqual(sorted(os.listdir(output_dir)), sorted([IMAGES_SHARDS_MANIFEST] +
+                                                                    [s['file'] for s in manifest['shards']]))
+
+            dataset = ImagesShardsDataset(output_dir, batch_size=3)
+            self.assertEqual(len(dataset), 10)
+            batches = list(dataset())
+            # Batches do not cross shards.
+            self.assertEqual([b[0].shape[0] for b in batches], [3, 1, 3, 1, 2])
+            images = np.concatenate([b[0] for b in batches])
+            self.assertEqual(images.dtype, np.float32)
+            self.assertTrue(np.array_equal(images[:, 0, 0, 0], np.arange(10)))
+            # The dataset can be iterated more than once.
+            self.assertEqual(len(list(dataset())), len(batches))
+
+    def test_resume_after_interruption(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            writer = ImagesShardsWriter(output_dir, n_images=10, shard_n_images=4)
+            with self.assertRaises(RuntimeError):
+                writer.write_shards(get_init_dataset(10, 2), shard_n_batches=2,
+                                    generate_images_fn=GenerateImagesFn(fail_after=2))
+            self.assertEqual(len(ImagesShardsDataset(output_dir, batch_size=4)), 8)
+
+            # A new writer resumes from the completed shards, and generates only the remaining images.
+            writer = ImagesShardsWriter(output_dir, n_images=10, shard_n_images=4)
+            self.assertEqual(writer.get_n_remaining_images(), 2)
+            generate_images_fn = GenerateImagesFn()
+            writer.write_shards(get_init_dataset(10, 2, first_image=8), shard_n_batches=2,
+                                generate_images_fn=generate_images_fn)
+            self.assertEqual(generate_images_fn.n_calls, 1)
+
+            images = np.concatenate([b[0] for b in ImagesShardsDataset(output_dir, batch_size=4)()])
+            self.assertTrue(np.array_equal(images[:, 0, 0, 0], np.arange(10)))
+            self.assertFalse(any(f.endswith('.tmp') for f in os.listdir(output_dir)))
+
+    def test_mismatching_generation(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            writer = ImagesShardsWriter(output_dir, n_images=10, shard_n_images=4)
+            writer.write_shard([np.zeros((1, 2, 2, 3))] * 4)
+            with self.assertRaises(Exception) as e:
+                ImagesShardsWriter(output_dir, n_images=20, shard_n_images=4)
+            self.assertIn('holds images of a different generation', str(e.exception))
+            with self.assertRaises(Exception) as e:
+                writer.write_shard([np.zeros((1, 4, 4, 3))] * 4)
+            self.assertIn('do not match the shape', str(e.exception))
+
+    def test_missing_manifest(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            with self.assertRaises(Exception) as e:
+                ImagesShardsDataset(output_dir, batch_size=4)
+            self.assertIn('No generated images manifest was found', str(e.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
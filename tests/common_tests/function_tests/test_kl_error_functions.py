@@ -0,0 +1,173 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from model_compression_toolkit.constants import SYMMETRIC_HISTOGRAM_N_INTERVALS, SYMMETRIC_HISTOGRAM_N_ITER, \
+    SYMMETRIC_HISTOGRAM_DEC_FREQ
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import error_functions
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
+    _kl_error_histogram, _kl_error_histograms, _kl_error_function_wrapper, _get_histograms, KLHistogramErrorFunction
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
+    qparams_selection_histogram_search, kl_qparams_symmetric_selection_histogram_search, \
+    qparams_uniform_selection_histogram_search, qparams_symmetric_iterative_minimization
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import uniform_quantize_tensor
+from model_compression_toolkit.target_platform_capabilities.target_platform import QuantizationMethod
+
+
+def _smooth_distribution_reference(probability):
+    smoothing_term = np.min(probability[probability != 0]) / (2.0 * len(probability))
+    zeros_indices = (probability == 0).astype(np.float32)
+    nonzeros_indices = (probability != 0).astype(np.float32)
+    reduce_to_fix = smoothing_term * float(probability.size - nonzeros_indices.sum()) / float(nonzeros_indices.sum())
+    hist = probability.astype(np.float32)
+    hist += smoothing_term * zeros_indices + (-reduce_to_fix) * nonzeros_indices
+    return hist
+
+
+def _kl_error_histogram_reference(q_bins, bins, counts, range_min, range_max):
+    """
+    Loop-based KL-divergence of a histogram and its quantized version (the non-vectorized implementation).
+    """
+    if not (np.any(bins >= range_min) and np.any(bins < range_max)):
+        return np.inf
+    first_bin_idx = max(np.where(bins >= range_min)[0].min() - 1, 0)
+    last_bin_idx = np.where(bins < range_max)[0].max()
+    if first_bin_idx == last_bin_idx:
+        return 0.0
+    counts_subset = counts[first_bin_idx:last_bin_idx].copy()
+    q_bins_subset = q_bins[first_bin_idx:last_bin_idx + 1]
+    if not counts_subset.any():
+        return np.inf
+
+    counts_acc = counts_subset.copy()
+    counts_acc[0] += np.sum(counts[:first_bin_idx])
+    counts_acc[-1] += np.sum(counts[last_bin_idx:])
+
+    qbc = np.zeros(counts_subset.shape)
+    for qbvui in np.unique(q_bins_subset):
+        q_status = q_bins_subset[:-1] == qbvui
+        positive_bins = (counts_subset[q_status] > 0).astype(np.float32)
+        qbc[q_status] = np.sum(counts_subset[q_status]) / (np.sum(positive_bins) + 1e-6) * positive_bins
+
+    p_fxp = _smooth_distribution_reference(qbc / np.sum(qbc))
+    p_float = _smooth_distribution_reference(counts_acc / np.sum(counts_acc))
+    return np.sum(p_float * np.log(p_float / p_fxp))
+
+
+def _kl_error_function_reference(x, range_min, range_max, n_bits):
+    if range_max <= range_min:
+        return np.inf
+    counts, bins = np.histogram(x, bins=2048)
+    q_bins = uniform_quantize_tensor(bins, range_min, range_max, n_bits)
+    return _kl_error_histogram_reference(q_bins, bins, counts, range_min, range_max)
+
+
+class TestKLErrorFunctions(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+
+    def test_histograms(self):
+        x = np.random.randn(8, 500).astype(np.float32)
+        x[3] = 1.5
+        counts, bins = _get_histograms(x, 2048)
+        for c in range(x.shape[0]):
+            expected_counts, expected_bins = np.histogram(x[c], bins=2048)
+            self.assertTrue(np.array_equal(counts[c], expected_counts))
+            self.assertTrue(np.array_equal(bins[c], expected_bins))
+
+    def test_histogram_error_parity(self):
+        counts, bins = np.histogram(np.random.randn(10000) * 2, bins=2048)
+        for n_bits in [2, 4, 8]:
+            for range_max in [0.01, 0.5, 2., 5., 20.]:
+                for range_min in [-range_max, 0., range_max / 2, range_max + 1]:
+                    q_bins = uniform_quantize_tensor(bins, range_min, range_max, n_bits)
+                    error = _kl_error_histogram(q_bins, None, bins, counts, range_min, range_max)
+                    expected = np.inf if range_min >= range_max else \
+                        _kl_error_histogram_reference(q_bins, bins, counts, range_min, range_max)
+                    self.assertTrue(np.isclose(error, expected, rtol=1e-4, atol=1e-6),
+                                    f'{error} != {expected} (range: [{range_min}, {range_max}], n_bits: {n_bits})')
+
+    def test_batched_histograms_error(self):
+        counts, bins = np.histogram(np.random.randn(10000), bins=2048)
+        range_max = np.linspace(0.1, 4, 20)
+        range_min = -range_max
+        q_bins = uniform_quantize_tensor(bins, range_min[:, None], range_max[:, None], 8)
+        errors = _kl_error_histograms(q_bins, np.broadcast_to(bins, q_bins.shape),
+                                      np.broadcast_to(counts, (20, len(counts))), range_min, range_max)
+        expected = [_kl_error_histogram_reference(q, bins, counts, mn, mx)
+                    for q, mn, mx in zip(q_bins, range_min, range_max)]
+        self.assertTrue(np.allclose(errors, expected, rtol=1e-4, atol=1e-6))
+
+    def test_tensor_error_parity(self):
+        x = np.random.randn(16, 3, 3, 8).astype(np.float32)
+        x[5] = 0.3
+        range_max = np.abs(x).reshape(16, -1).max(axis=1) * np.random.uniform(0.2, 1.2, 16)
+        for range_min in [-range_max, np.zeros(16)]:
+            errors = _kl_error_function_wrapper(x, range_min, range_max, n_bits=4, per_channel=True)
+            expected = [_kl_error_function_reference(x[c], range_min[c], range_max[c], 4) for c in range(16)]
+            self.assertEqual(errors.shape, (16,))
+            self.assertTrue(np.allclose(errors, expected, rtol=1e-4, atol=1e-6))
+
+        error = _kl_error_function_wrapper(x, -range_max[0], range_max[0], per_channel=False)
+        self.assertEqual(error.shape, (1,))
+        self.assertTrue(np.isclose(error[0], _kl_error_function_reference(x, -range_max[0], range_max[0], 8),
+                                   rtol=1e-4, atol=1e-6))
+
+        # A scalar range_min is broadcast to all channels.
+        self.assertTrue(np.array_equal(_kl_error_function_wrapper(x, 0, range_max, per_channel=True),
+                                       _kl_error_function_wrapper(x, np.zeros(16), range_max, per_channel=True)))
+
+    def test_histogram_searches_candidates_batch(self):
+        for data in [np.random.randn(10000) * 2, np.abs(np.random.randn(10000)), np.random.laplace(size=10000) + 0.5]:
+            counts, bins = np.histogram(data, bins=2048)
+
+            # Power-of-two search: all the candidates are evaluated with a single call.
+            error_function = KLHistogramErrorFunction(QuantizationMethod.POWER_OF_TWO)
+            with patch.object(error_functions, '_kl_error_histograms',
+                              wraps=error_functions._kl_error_histograms) as kl_mock:
+                threshold, signed = qparams_selection_histogram_search(error_function, bins, counts, n_bits=8)
+            self.assertEqual(kl_mock.call_count, 1)
+            # Wrapping the error function hides its type, so the search evaluates one candidate at a time.
+            self.assertEqual((threshold, signed), qparams_selection_histogram_search(
+                lambda *args: error_function(*args), bins, counts, n_bits=8))
+
+            # Symmetric search, compared with a per-tensor search that evaluates one candidate at a time.
+            tensor_max = np.max(np.abs(bins)[1:][counts > 0])
+            threshold, signed = kl_qparams_symmetric_selection_histogram_search(
+                KLHistogramErrorFunction(QuantizationMethod.SYMMETRIC), tensor_max, bins, counts, n_bits=8)
+            self.assertEqual(signed, np.any(bins[:-1][counts != 0] < 0))
+            expected = qparams_symmetric_iterative_minimization(
+                x0=tensor_max, x=bins,
+                loss_fn=lambda x, q_x, t: _kl_error_histogram(q_x, None, bins, counts, -t if signed else 0, t),
+                n_bits=8, signed=signed, n_intervals=SYMMETRIC_HISTOGRAM_N_INTERVALS,
+                n_iter=SYMMETRIC_HISTOGRAM_N_ITER, dec_freq=SYMMETRIC_HISTOGRAM_DEC_FREQ)['param']
+            self.assertTrue(np.isclose(threshold, expected))
+
+            # Uniform search.
+            error_function = KLHistogramErrorFunction(QuantizationMethod.UNIFORM)
+            tensor_min_max = np.array([bins[:-1][counts > 0].min(), bins[1:][counts > 0].max()])
+            q_range = qparams_uniform_selection_histogram_search(error_function, tensor_min_max, bins, counts, 8)
+            expected = qparams_uniform_selection_histogram_search(lambda *args: error_function(*args),
+                                                                  tensor_min_max, bins, counts, 8)
+            self.assertEqual(q_range.shape, (2,))
+            self.assertTrue(np.allclose(q_range, expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
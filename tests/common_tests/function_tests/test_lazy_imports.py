@@ -0,0 +1,67 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import subprocess
+import sys
+import unittest
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.verify_packages import FOUND_TORCH
+
+HEAVY_MODULES = ['torch', 'tensorflow', 'sklearn', 'scipy', 'matplotlib', 'onnx', 'mct_quantizers']
+
+
+def _get_imported_modules(statement: str):
+    """
+    Run a statement in a new process and return the heavy modules it imported.
+    """
+    code = f'import sys\n{statement}\nprint(",".join(m for m in {HEAVY_MODULES} if m in sys.modules))'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return [m for m in output.strip().split(',') if m]
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_import_does_not_import_frameworks(self):
+        self.assertEqual(_get_imported_modules('import model_compression_toolkit'), [])
+
+    def test_config_access_does_not_import_heavy_dependencies(self):
+        imported = _get_imported_modules('import model_compression_toolkit as mct\nmct.core.CoreConfig')
+        self.assertNotIn('sklearn', imported)
+        self.assertNotIn('matplotlib', imported)
+
+    @unittest.skipUnless(FOUND_TORCH, 'torch is not installed')
+    def test_facade_access_imports_framework(self):
+        imported = _get_imported_modules('from model_compression_toolkit.ptq import pytorch_post_training_quantization')
+        self.assertIn('torch', imported)
+
+    def test_lazy_attributes(self):
+        self.assertIn('pytorch_post_training_quantization', dir(mct.ptq))
+        self.assertIn('gptq', dir(mct))
+        self.assertIs(mct.ptq.pytorch_post_training_quantization,
+                      sys.modules['model_compression_toolkit.ptq.pytorch.quantization_facade'].pytorch_post_training_quantization)
+        self.assertIn('pytorch_post_training_quantization', vars(mct.ptq))
+        self.assertIs(mct.target_platform, sys.modules['model_compression_toolkit.target_platform_capabilities.target_platform'])
+        with self.assertRaises(AttributeError):
+            mct.ptq.missing_facade
+
+
+    def test_lazy_loader_is_not_exported(self):
+        for package in [mct, mct.core, mct.ptq, mct.gptq, mct.qat, mct.exporter, mct.pruning, mct.data_generation,
+                        mct.trainable_infrastructure]:
+            self.assertNotIn('lazy_attributes', dir(package), package.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
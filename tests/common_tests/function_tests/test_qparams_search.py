@@ -0,0 +1,104 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import threading
+import unittest
+
+import numpy as np
+
+import model_compression_toolkit.core.common.quantization.quantization_config as qc
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
+    PerChannelErrorFunction, _kl_error_function_wrapper
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
+    _get_per_channel_candidates_losses
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QparamsSearchBackend, qparams_search_backend, get_qparams_search_backend, DEFAULT_QPARAMS_SEARCH_BACKEND
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor, \
+    uniform_quantize_tensor
+from model_compression_toolkit.core.common.similarity_analyzer import compute_mse, compute_mae, compute_lp_norm
+
+
+class TestQparamsSearch(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        self.x = np.random.randn(16, 50).astype(np.float32)
+        max_abs = np.abs(self.x).max(axis=1)
+        self.thresholds = np.linspace(0.5, 1.1, 7).reshape([-1, 1, 1]) * max_abs.reshape([1, -1, 1])
+        self.ranges = np.stack([-self.thresholds[..., 0], 0.8 * self.thresholds[..., 0]], axis=-1)
+
+    def _get_expected_losses(self, loss_fn, candidates, n_bits=8):
+        losses = []
+        for c in candidates:
+            if c.shape[-1] == 1:
+                q_x = quantize_tensor(self.x, c, n_bits, True)
+            else:
+                q_x = uniform_quantize_tensor(self.x, c[:, :1], c[:, 1:], n_bits)
+            losses.append(np.reshape(loss_fn(self.x, q_x, c), [-1]))
+        return np.stack(losses)
+
+    def test_per_channel_error_function(self):
+        q_x = quantize_tensor(self.x, self.thresholds[2], 4, True)
+        weights = np.random.rand(*self.x.shape)
+        for norm in [False, True]:
+            self.assertTrue(np.allclose(PerChannelErrorFunction(qc.QuantizationErrorMethod.MSE, norm=norm)(self.x, q_x),
+                                        compute_mse(self.x, q_x, norm=norm, axis=-1)))
+            self.assertTrue(np.allclose(PerChannelErrorFunction(qc.QuantizationErrorMethod.MAE, norm=norm)(self.x, q_x),
+                                        compute_mae(self.x, q_x, norm=norm, axis=-1)))
+            self.assertTrue(np.allclose(PerChannelErrorFunction(qc.QuantizationErrorMethod.LP, p=3, norm=norm)(self.x, q_x),
+                                        compute_lp_norm(self.x, q_x, p=3, norm=norm, axis=-1)))
+            self.assertTrue(np.allclose(PerChannelErrorFunction(qc.QuantizationErrorMethod.HMSE, norm=norm,
+                                                                weights=weights)(self.x, q_x),
+                                        compute_mse(self.x, q_x, norm=norm, axis=-1, weights=weights)))
+
+    def test_blocked_candidates_losses(self):
+        loss_fns = [PerChannelErrorFunction(qc.QuantizationErrorMethod.MSE),
+                    lambda x, q_x, t: compute_mae(x, q_x, axis=-1)]
+        for loss_fn in loss_fns:
+            for candidates in [self.thresholds, self.ranges]:
+                expected = self._get_expected_losses(loss_fn, candidates)
+                for max_block_elements in [1, 3 * self.x.size, None]:
+                    losses = _get_per_channel_candidates_losses(loss_fn, self.x, candidates, 8,
+                                                                max_block_elements=max_block_elements)
+                    self.assertEqual(losses.shape, candidates.shape[:2])
+                    self.assertTrue(np.allclose(losses, expected))
+
+    def test_blocked_kl_candidates_losses(self):
+        loss_fn = lambda x, q_x, t: _kl_error_function_wrapper(x, -t, t, per_channel=True)
+        expected = self._get_expected_losses(loss_fn, self.thresholds)
+        losses = _get_per_channel_candidates_losses(loss_fn, self.x, self.thresholds, 8,
+                                                    max_block_elements=4 * self.x.size)
+        self.assertTrue(np.allclose(losses, expected))
+
+    def test_search_backend_context(self):
+        backend = QparamsSearchBackend()
+        self.assertIs(get_qparams_search_backend(), DEFAULT_QPARAMS_SEARCH_BACKEND)
+        with qparams_search_backend(backend):
+            self.assertIs(get_qparams_search_backend(), backend)
+            with qparams_search_backend(None):
+                self.assertIs(get_qparams_search_backend(), DEFAULT_QPARAMS_SEARCH_BACKEND)
+            self.assertIs(get_qparams_search_backend(), backend)
+        self.assertIs(get_qparams_search_backend(), DEFAULT_QPARAMS_SEARCH_BACKEND)
+
+    def test_search_backend_is_per_thread(self):
+        thread_backends = []
+        thread = threading.Thread(target=lambda: thread_backends.append(get_qparams_search_backend()))
+        with qparams_search_backend(QparamsSearchBackend()):
+            thread.start()
+            thread.join()
+        self.assertEqual(thread_backends, [DEFAULT_QPARAMS_SEARCH_BACKEND])
+
+
+if __name__ == '__main__':
+    unittest.main()
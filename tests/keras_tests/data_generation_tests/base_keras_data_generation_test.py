@@ -20,6 +20,7 @@ from keras.layers import ReLU
 from tensorflow.keras.optimizers.legacy import Optimizer, Adam
 from tensorflow.keras.layers import Conv2D, Input, BatchNormalization, Dense, GlobalAveragePooling2D
 
+from model_compression_toolkit.data_generation.common.constants import DEFAULT_SHARD_N_BATCHES
 from model_compression_toolkit.data_generation import keras_data_generation_experimental, \
     get_keras_data_generation_config
 from model_compression_toolkit.data_generation.common.enums import (SchedulerType,
@@ -70,7 +71,9 @@ class BaseKerasDataGenerationTest:
                  image_normalization_type: ImageNormalizationType = ImageNormalizationType.KERAS_APPLICATIONS,
                  extra_pixels: int = 0,
                  image_clipping: bool = False,
-                 bn_layer_types: List = [BatchNormalization]
+                 bn_layer_types: List = [BatchNormalization],
+                 output_dir: str = None,
+                 shard_n_batches: int = DEFAULT_SHARD_N_BATCHES
                  ):
         self.unit_test = unit_test
         self.model = model
@@ -95,6 +98,8 @@ class BaseKerasDataGenerationTest:
         self.extra_pixels = extra_pixels
         self.image_clipping = image_clipping
         self.bn_layer_types = bn_layer_types
+        self.output_dir = output_dir
+        self.shard_n_batches = shard_n_batches
 
     def run_test(self):
         data_generation_config = get_keras_data_generation_config(
@@ -111,10 +116,17 @@ class BaseKerasDataGenerationTest:
             extra_pixels=self.extra_pixels,
             image_clipping=self.image_clipping,
             output_loss_type=self.output_loss_type,
-            output_loss_multiplier=self.output_loss_multiplier)
+            output_loss_multiplier=self.output_loss_multiplier,
+            output_dir=self.output_dir,
+            shard_n_batches=self.shard_n_batches)
 
         data_loader = keras_data_generation_experimental(
             model=self.model,
             n_images=self.n_images,
             output_image_size=self.output_image_size,
             data_generation_config=data_generation_config)
+        if self.output_dir is not None:
+            # The images are streamed to the output directory, and read back in batches of the data generation
+            self.unit_test.assertEqual(len(data_loader), self.n_images)
+            for batch in data_loader():
+                self.unit_test.assertEqual(batch[0].shape[1:], (*self.output_image_size, 3))
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import tempfile
 import unittest
 
 from model_compression_toolkit.data_generation.common.enums import SchedulerType, BatchNormAlignemntLossType, \
@@ -58,6 +59,12 @@ class KerasDataGenerationTestRunner(unittest.TestCase):
         BaseKerasDataGenerationTest(self, output_loss_type=OutputLossType.INVERSE_MIN_MAX_DIFF, output_loss_multiplier=0.1).run_test()
         BaseKerasDataGenerationTest(self, output_loss_type=OutputLossType.REGULARIZED_MIN_MAX_DIFF, output_loss_multiplier=0.1).run_test()
 
+    def test_keras_stream_to_output_dir(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            BaseKerasDataGenerationTest(self, n_images=20, output_dir=output_dir, shard_n_batches=2).run_test()
+            # Running again resumes from the saved shards.
+            BaseKerasDataGenerationTest(self, n_images=20, output_dir=output_dir, shard_n_batches=2).run_test()
+
     def test_keras_no_bn(self):
         with self.assertRaises(Exception) as e:
             BaseKerasDataGenerationTest(self, model=NoBNDataGenerationModel()).run_test()
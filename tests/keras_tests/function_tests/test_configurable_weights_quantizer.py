@@ -0,0 +1,99 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import keras
+import numpy as np
+import tensorflow as tf
+from keras import Input
+from keras.layers import Conv2D
+from mct_quantizers import KerasActivationQuantizationHolder, KerasQuantizationWrapper
+
+from model_compression_toolkit.core.common.mixed_precision.compact_quantized_weights import CompactQuantizedWeights
+from model_compression_toolkit.core.common.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.keras.constants import KERNEL
+from model_compression_toolkit.core.keras.default_framework_info import DEFAULT_KERAS_INFO
+from model_compression_toolkit.core.keras.keras_implementation import KerasImplementation
+from model_compression_toolkit.core.keras.mixed_precision.configurable_activation_quantizer import \
+    ConfigurableActivationQuantizer
+from model_compression_toolkit.core.keras.mixed_precision.configurable_weights_quantizer import \
+    ConfigurableWeightsQuantizer
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.keras_tests.exporter_tests.tflite_int8.imx500_int8_tp_model import get_op_quantization_configs
+from tests.keras_tests.tpc_keras import get_weights_only_mp_tpc_keras
+
+
+def base_model(input_shape):
+    inputs = Input(shape=input_shape)
+    x = Conv2D(16, 3)(inputs)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
+def representative_dataset():
+    yield [np.random.randn(1, 8, 8, 3).astype(np.float32)]
+
+
+class TestKerasConfigurableWeightsQuantizer(unittest.TestCase):
+
+    def test_switch_compact_candidates(self):
+        base_config, _, default_config = get_op_quantization_configs()
+        tpc = get_weights_only_mp_tpc_keras(
+            base_config=base_config,
+            default_config=default_config,
+            mp_bitwidth_candidates_list=[(8, 8), (4, 8), (2, 8)],
+            name='configurable_quantizer_test_tpc')
+
+        graph = prepare_graph_with_quantization_parameters(base_model((8, 8, 3)), KerasImplementation(),
+                                                           DEFAULT_KERAS_INFO, representative_dataset,
+                                                           lambda x, y: tpc, input_shape=(1, 8, 8, 3),
+                                                           mixed_precision_enabled=True)
+        node = graph.get_topo_sorted_nodes()[1]
+
+        model_mp, _, conf_node2layers = KerasImplementation().model_builder(graph,
+                                                                            mode=ModelBuilderMode.MIXEDPRECISION,
+                                                                            fw_info=DEFAULT_KERAS_INFO)
+        wrapper_layer = [l for l in conf_node2layers[node.name] if isinstance(l, KerasQuantizationWrapper)][0]
+        quantizer = wrapper_layer.weights_quantizers[KERNEL]
+        self.assertTrue(all(isinstance(w, CompactQuantizedWeights) for w in quantizer.quantized_weights[1:]))
+
+        float_weights = node.get_weights_by_keys(KERNEL)
+        inputs = next(representative_dataset())
+        outputs = {}
+        for bitwidth_idx in [1, 2, 1, 0, 2]:
+            set_layer_to_bitwidth(wrapper_layer, bitwidth_idx=bitwidth_idx,
+                                  weights_quantizer_type=ConfigurableWeightsQuantizer,
+                                  activation_quantizer_type=ConfigurableActivationQuantizer,
+                                  weights_quant_layer_type=KerasQuantizationWrapper,
+                                  activation_quant_layer_type=KerasActivationQuantizationHolder)
+
+            # The quantizer is called both while tracing a graph and eagerly.
+            output = tf.function(model_mp)(inputs).numpy()
+            self.assertTrue(np.array_equal(model_mp(inputs).numpy(), output))
+            attr_cfg = node.candidates_quantization_cfg[bitwidth_idx].weights_quantization_cfg.get_attr_config(KERNEL)
+            expected_weights = attr_cfg.weights_quantization_fn(float_weights, attr_cfg.weights_n_bits, True,
+                                                                attr_cfg.weights_quantization_params,
+                                                                attr_cfg.weights_per_channel_threshold,
+                                                                attr_cfg.weights_channels_axis[0])
+            self.assertTrue(np.array_equal(np.asarray(quantizer(None)), np.asarray(expected_weights, np.float32)))
+            if bitwidth_idx in outputs:
+                self.assertTrue(np.array_equal(output, outputs[bitwidth_idx]))
+            outputs[bitwidth_idx] = output
+
+        self.assertFalse(np.array_equal(outputs[0], outputs[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import tensorflow as tf
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.gptq import GPTQTeacherOutputsCacheConfig
+from model_compression_toolkit.gptq.keras.teacher_outputs_cache import KerasTeacherOutputsCache
+
+N_BATCHES = 3
+N_EPOCHS = 4
+
+
+def get_model():
+    inputs = tf.keras.layers.Input(shape=(8, 8, 3))
+    x = tf.keras.layers.Conv2D(4, 3)(inputs)
+    x = tf.keras.layers.ReLU()(x)
+    outputs = tf.keras.layers.Conv2D(4, 3)(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(N_BATCHES):
+        yield [np.random.randn(2, 8, 8, 3).astype(np.float32)]
+
+
+class TestKerasGPTQTeacherOutputsCache(unittest.TestCase):
+
+    def _run_gptq(self, model, teacher_outputs_cache_config):
+        gptq_config = mct.gptq.get_keras_gptq_config(n_epochs=N_EPOCHS, use_hessian_based_weights=False)
+        gptq_config.teacher_outputs_cache_config = teacher_outputs_cache_config
+        q_model, _ = mct.gptq.keras_gradient_post_training_quantization(model, representative_dataset,
+                                                                        gptq_config=gptq_config)
+        return q_model
+
+    def test_cached_outputs_training_matches_uncached(self):
+        model = get_model()
+        q_model = self._run_gptq(model, None)
+        with patch.object(KerasTeacherOutputsCache, 'get', autospec=True,
+                          side_effect=KerasTeacherOutputsCache.get) as cache_get:
+            cached_q_model = self._run_gptq(model, GPTQTeacherOutputsCacheConfig(fix_representative_dataset=True,
+                                                                                 max_memory_mb=1e-4))
+        self.assertEqual(cache_get.call_count, N_EPOCHS * N_BATCHES)
+
+        for w, cached_w in zip(q_model.weights, cached_q_model.weights):
+            self.assertTrue(np.allclose(w.numpy(), cached_w.numpy(), atol=1e-5), f'Mismatch in {w.name}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -79,6 +79,19 @@ def expanding_model(input_shape):
     return keras.Model(inputs=inputs, outputs=concat)
 
 
+def wide_model(input_shape, n_blocks, n_branches):
+    """
+    This is a model with many residual blocks of parallel branches, which produces many candidate cuts
+    in each step of the astar search.
+    """
+    inputs = Input(shape=input_shape)
+    x = Conv2D(8, 1)(inputs)
+    for _ in range(n_blocks):
+        branches = [ReLU()(Conv2D(8, 1)(Conv2D(2 + i, 1)(x))) for i in range(n_branches)]
+        x = Add()([x] + branches)
+    return keras.Model(inputs=inputs, outputs=x)
+
+
 class TestGraphMaxCut(unittest.TestCase):
 
     def test_graph_max_cut_plain_graph_simple(self):
@@ -140,3 +153,15 @@ class TestGraphMaxCut(unittest.TestCase):
         self.assertIsNotNone(cuts)
         self.assertTrue(len(cuts) > 0)
         self.assertTrue(max_cut_size >= memory_graph.memory_lbound_single_op)
+
+    def test_graph_max_cut_large_graph(self):
+        # Max cut of a large graph with many parallel branches.
+        model = wide_model((8, 8, 4), n_blocks=16, n_branches=3)
+        graph = model_reader(model)
+        memory_graph = MemoryGraph(graph)
+
+        schedule, max_cut_size, cuts = compute_graph_max_cut(memory_graph, astar_n_iter=10000)
+        self.assertIsNotNone(schedule)
+        self.assertEqual(len(schedule), len(graph.nodes))
+        self.assertTrue(len(cuts) > 0)
+        self.assertTrue(max_cut_size >= memory_graph.memory_lbound_single_op)
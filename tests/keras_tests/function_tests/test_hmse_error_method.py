@@ -27,6 +27,10 @@ from model_compression_toolkit.core.common.hessian import HessianInfoService, He
 from model_compression_toolkit.core.common.model_collector import ModelCollector
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
     calculate_quantization_params
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
+    qparams_symmetric_selection_tensor_search
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import \
+    reshape_tensor_for_per_channel_search
 from model_compression_toolkit.core.keras.constants import KERNEL, GAMMA
 from model_compression_toolkit.target_platform_capabilities.constants import KERNEL_ATTR, BIAS_ATTR, KERAS_KERNEL, BIAS
 from model_compression_toolkit.target_platform_capabilities.target_platform import AttributeQuantizationConfig
@@ -143,6 +147,35 @@ class TestParamSelectionWithHMSE(unittest.TestCase):
                                       hessian_info_service=self.his, num_hessian_samples=1)
         self._verify_params_calculation_execution(THRESHOLD)
 
+    def test_symmetric_threshold_selection_hmse_per_channel_error(self):
+
+        self._setup_with_args(quant_method=mct.target_platform.QuantizationMethod.SYMMETRIC, per_channel=True)
+        calculate_quantization_params(self.graph, fw_impl=self.keras_impl, repr_data_gen_fn=representative_dataset,
+                                      hessian_info_service=self.his, num_hessian_samples=1)
+
+        # The selected thresholds should minimize the Hessian-weighted MSE of each channel separately, with the
+        # Hessian-based scores of the channel.
+        for node_type in [layers.Conv2D, layers.Dense]:
+            node = [n for n in self.graph.nodes if n.type == node_type][0]
+            attr_cfg = node.candidates_quantization_cfg[0].weights_quantization_cfg.get_attr_config(KERNEL)
+            channel_axis = attr_cfg.weights_channels_axis[0]
+            hessian_request = HessianScoresRequest(mode=HessianMode.WEIGHTS,
+                                                   granularity=HessianScoresGranularity.PER_ELEMENT,
+                                                   data_loader=None,
+                                                   n_samples=1,
+                                                   target_nodes=[node])
+            hessian_scores = np.sqrt(np.mean(self.his.fetch_hessian(hessian_request)[node.name], axis=0))
+            weights = reshape_tensor_for_per_channel_search(hessian_scores, channel_axis)
+
+            # The search may stack the channels of several candidates in the tensors it passes to the error function.
+            expected_threshold, _ = qparams_symmetric_selection_tensor_search(
+                lambda x, y, threshold: np.mean((weights * (x - y).reshape((-1,) + weights.shape)) ** 2,
+                                                axis=-1).reshape(-1),
+                node.get_weights_by_keys(KERNEL), attr_cfg.weights_n_bits, per_channel=True,
+                channel_axis=channel_axis, min_threshold=self.qc.min_threshold)
+            self.assertTrue(np.array_equal(attr_cfg.weights_quantization_params[THRESHOLD], expected_threshold),
+                            f"Unexpected HMSE thresholds for {node_type} node.")
+
     def test_symmetric_threshold_selection_hmse_per_tensor(self):
 
         self._setup_with_args(quant_method=mct.target_platform.QuantizationMethod.SYMMETRIC, per_channel=False)
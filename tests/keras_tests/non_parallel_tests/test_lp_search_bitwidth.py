@@ -71,6 +71,7 @@ class MockMixedPrecisionSearchManager:
         self.max_ru_config = [0]
         self.config_reconstruction_helper = MockReconstructionHelper()
         self.non_conf_ru_dict = None
+        self.layer_to_metrics_mapping = None
 
     def compute_resource_utilization_matrix(self, target):
         # minus 1 is normalization by the minimal resource utilization (which is always 1 in this test)
@@ -22,6 +22,7 @@ from torch.optim import Optimizer, RAdam
 from torch.optim.lr_scheduler import StepLR
 import torch.nn.functional as F
 
+from model_compression_toolkit.data_generation.common.constants import DEFAULT_SHARD_N_BATCHES
 from model_compression_toolkit.data_generation.common.data_generation_config import DataGenerationConfig
 from model_compression_toolkit.data_generation.common.enums import SchedulerType, BatchNormAlignemntLossType, \
     DataInitType, BNLayerWeightingType, ImageGranularity, ImagePipelineType, ImageNormalizationType, OutputLossType
@@ -67,7 +68,9 @@ class BasePytorchDataGenerationTest:
                  image_normalization_type: ImageNormalizationType = ImageNormalizationType.TORCHVISION,
                  extra_pixels: int = 0,
                  image_clipping: bool = True,
-                 bn_layer_types: List = [torch.nn.BatchNorm2d]
+                 bn_layer_types: List = [torch.nn.BatchNorm2d],
+                 output_dir: str = None,
+                 shard_n_batches: int = DEFAULT_SHARD_N_BATCHES
                  ):
         self.unit_test = unit_test
         self.model = BaseDataGenerationModel()
@@ -90,6 +93,8 @@ class BasePytorchDataGenerationTest:
         self.extra_pixels = extra_pixels
         self.image_clipping = image_clipping
         self.bn_layer_types = bn_layer_types
+        self.output_dir = output_dir
+        self.shard_n_batches = shard_n_batches
 
 
     def get_data_generation_config(self):
@@ -109,7 +114,9 @@ class BasePytorchDataGenerationTest:
             image_normalization_type=self.image_normalization_type,
             extra_pixels=self.extra_pixels,
             image_clipping=self.image_clipping,
-            bn_layer_types=self.bn_layer_types)
+            bn_layer_types=self.bn_layer_types,
+            output_dir=self.output_dir,
+            shard_n_batches=self.shard_n_batches)
 
     def run_test(self):
         data_generation_config = self.get_data_generation_config()
@@ -118,3 +125,8 @@ class BasePytorchDataGenerationTest:
             n_images=self.n_images,
             output_image_size=self.output_image_size,
             data_generation_config=data_generation_config)
+        if self.output_dir is not None:
+            # The images are streamed to the output directory, and read back in batches of the data generation
+            self.unit_test.assertEqual(len(data_loader), self.n_images)
+            for batch in data_loader():
+                self.unit_test.assertEqual(batch[0].shape[1:], (3, self.output_image_size, self.output_image_size))
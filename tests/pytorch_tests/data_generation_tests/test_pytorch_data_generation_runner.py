@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import tempfile
 import unittest
 
 from torch.optim.lr_scheduler import StepLR, ReduceLROnPlateau
@@ -62,5 +63,11 @@ class PytorchDataGenerationTestRunner(unittest.TestCase):
         BasePytorchDataGenerationTest(self, output_loss_type=OutputLossType.INVERSE_MIN_MAX_DIFF, output_loss_multiplier=0.1).run_test()
         BasePytorchDataGenerationTest(self, output_loss_type=OutputLossType.REGULARIZED_MIN_MAX_DIFF, output_loss_multiplier=0.1).run_test()
 
+    def test_pytorch_stream_to_output_dir(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            BasePytorchDataGenerationTest(self, n_images=20, output_dir=output_dir, shard_n_batches=2).run_test()
+            # Running again resumes from the saved shards.
+            BasePytorchDataGenerationTest(self, n_images=20, output_dir=output_dir, shard_n_batches=2).run_test()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,118 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import onnx
+import onnxruntime
+import torch
+from onnx import numpy_helper
+
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper, QuantizationMethod
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.pytorch.utils import torch_tensor_to_numpy
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
+    generate_pytorch_tpc
+from tests.common_tests.helpers.generate_test_tp_model import generate_test_tp_model
+from tests.pytorch_tests.exporter_tests.base_pytorch_onnx_export_test import BasePytorchONNXExportTest
+
+
+class ConvLinearModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3)
+        self.conv2 = torch.nn.Conv2d(8, 16, kernel_size=3)
+        self.fc = torch.nn.Linear(16, 10)
+
+    def forward(self, x):
+        x = torch.relu(self.conv1(x))
+        x = torch.relu(self.conv2(x))
+        return self.fc(x.mean((2, 3)))
+
+
+class TestExportINT8ONNX(BasePytorchONNXExportTest):
+
+    def get_model(self):
+        return ConvLinearModel()
+
+    def get_input_shapes(self):
+        return [(4, 3, 16, 16)]
+
+    def get_quantization_format(self):
+        return mct.exporter.QuantizationFormat.INT8
+
+    def get_integer_onnx_dtype(self):
+        return onnx.TensorProto.INT8
+
+    def infer(self, model, inputs):
+        # INT8 models use standard ONNX ops only, so they run without the mct_quantizers custom ops.
+        ort_session = onnxruntime.InferenceSession(model.SerializeToString(), providers=['CPUExecutionProvider'])
+        return {ort_output.name: ort_output_value for ort_output, ort_output_value in zip(
+            ort_session.get_outputs(),
+            ort_session.run(None, {ort_input.name: torch_tensor_to_numpy(x) for ort_input, x in
+                                   zip(ort_session.get_inputs(), inputs)}))}
+
+    def compare(self, exported_model, quantized_model, quantization_info):
+        const_values = {init.name: numpy_helper.to_array(init) for init in exported_model.graph.initializer}
+        const_values.update({n.output[0]: numpy_helper.to_array(n.attribute[0].t) for n in exported_model.graph.node
+                             if n.op_type == 'Constant'})
+        dq_nodes = {n.input[0]: n for n in self._get_onnx_node_by_type(exported_model, 'DequantizeLinear')}
+        initializers = {init.name: init for init in exported_model.graph.initializer}
+
+        for name, module in quantized_model.named_modules():
+            if isinstance(module, PytorchQuantizationWrapper):
+                for attr, quantized_weights in module.get_quantized_weights().items():
+                    # The weights are stored as 8-bit integers, and the float weights are not exported.
+                    weights_name = f'{name}.{attr}_quantized'
+                    assert initializers[weights_name].data_type == self.get_integer_onnx_dtype()
+                    assert f'{name}.{attr}' not in initializers and f'{name}.layer.{attr}' not in initializers
+
+                    # The dequantized weights are the quantized model's weights.
+                    dq_node = dq_nodes[weights_name]
+                    scales, zero_points = const_values[dq_node.input[1]], const_values[dq_node.input[2]]
+                    shape = [1] * quantized_weights.ndim
+                    axis = self._get_onnx_node_attributes(dq_node).get('axis')
+                    if axis is not None:
+                        shape[axis] = -1
+                    dequantized_weights = (const_values[weights_name].astype(np.float32) -
+                                           zero_points.reshape(shape).astype(np.float32)) * scales.reshape(shape)
+                    assert np.array_equal(dequantized_weights, torch_tensor_to_numpy(quantized_weights))
+
+        # The exported model's outputs match the quantized model's outputs, up to integer kernels rounding
+        # differences of a quantization step.
+        inputs = next(self.get_dataset())
+        onnx_outputs = list(self.infer(exported_model, inputs).values())
+        with torch.no_grad():
+            torch_output = torch_tensor_to_numpy(quantized_model(*inputs))
+        output_quantizer = [m for m in quantized_model.modules()
+                            if isinstance(m, PytorchActivationQuantizationHolder)][-1].activation_holder_quantizer
+        output_scale = getattr(output_quantizer, 'scale', getattr(output_quantizer, 'scales', None))
+        assert np.max(np.abs(onnx_outputs[0] - torch_output)) <= 2 * output_scale + 1e-6
+
+
+class TestExportINT8ONNXUniform4Bits(TestExportINT8ONNX):
+
+    def get_tpc(self):
+        tp = generate_test_tp_model({'activation_n_bits': 4,
+                                     'weights_n_bits': 4,
+                                     'weights_quantization_method': QuantizationMethod.UNIFORM,
+                                     'activation_quantization_method': QuantizationMethod.UNIFORM})
+        return generate_pytorch_tpc(name="test_int8_onnx_uniform_4bit", tp_model=tp)
+
+    def get_integer_onnx_dtype(self):
+        return onnx.TensorProto.UINT8
+
+    def compare(self, exported_model, quantized_model, quantization_info):
+        super().compare(exported_model, quantized_model, quantization_info)
+        # The 4-bit activations range is narrower than the 8-bit integer range, so it's applied by clipping.
+        assert len(self._get_onnx_node_by_type(exported_model, 'Clip')) > 0
@@ -0,0 +1,125 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import multiprocessing
+import os
+import resource
+import tempfile
+
+import numpy as np
+import onnx
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.exporter.model_exporter.pytorch.fakely_quant_onnx_pytorch_exporter import \
+    FakelyQuantONNXPyTorchExporter, ONNX_EXTERNAL_DATA_SUFFIX
+from model_compression_toolkit.exporter.model_exporter.pytorch.pytorch_export_facade import DEFAULT_ONNX_OPSET_VERSION
+from tests.pytorch_tests.exporter_tests.base_pytorch_onnx_export_test import BasePytorchONNXExportTest
+
+
+class TestExportONNXExternalData(BasePytorchONNXExportTest):
+
+    def get_model(self):
+        class Model(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3, padding=1)
+                self.conv2 = torch.nn.Conv2d(8, 4, kernel_size=3, padding=1)
+
+            def forward(self, x):
+                return self.conv2(torch.relu(self.conv1(x)))
+
+        return Model()
+
+    def get_tmp_filepath(self):
+        return os.path.join(tempfile.mkdtemp(), 'model.onnx')
+
+    def run_export(self, quantized_model, onnx_opset_version=DEFAULT_ONNX_OPSET_VERSION):
+        super().run_export(quantized_model, onnx_opset_version)
+        self.inline_filepath = self.filepath
+
+        self.filepath = self.get_tmp_filepath()
+        mct.exporter.pytorch_export_model(quantized_model,
+                                          self.filepath,
+                                          self.get_dataset,
+                                          serialization_format=self.get_serialization_format(),
+                                          quantization_format=self.get_quantization_format(),
+                                          onnx_opset_version=onnx_opset_version,
+                                          use_onnx_external_data=True)
+
+    def compare(self, loaded_model, quantized_model, quantization_info):
+        # All the weights are saved in the external data file next to the model.
+        assert os.listdir(os.path.dirname(self.filepath)) == ['model.onnx', 'model.onnx' + ONNX_EXTERNAL_DATA_SUFFIX]
+        model_without_weights = onnx.load(self.filepath, load_external_data=False)
+        assert len(model_without_weights.graph.initializer) > 0
+        assert all([init.data_location == onnx.TensorProto.EXTERNAL for init in model_without_weights.graph.initializer])
+        assert [i.name for i in model_without_weights.graph.input] == ['input']
+
+        # The model is the same as a model that is exported with its weights.
+        inline_model = self.load_exported_model(self.inline_filepath)
+        assert ({init.name for init in loaded_model.graph.initializer} ==
+                {init.name for init in inline_model.graph.initializer})
+        inputs = next(self.get_dataset())
+        for output, inline_output in zip(self.infer(loaded_model, inputs).values(),
+                                         self.infer(inline_model, inputs).values()):
+            assert np.array_equal(output, inline_output)
+
+
+class LargeLinearModel(torch.nn.Module):
+    def __init__(self, num_layers: int = 8, num_features: int = 2048):
+        super().__init__()
+        self.layers = torch.nn.Sequential(*[torch.nn.Linear(num_features, num_features) for _ in range(num_layers)])
+
+    def forward(self, x):
+        return self.layers(x)
+
+
+def _export_large_model(use_onnx_external_data, results_queue):
+    """
+    Export a large float model to ONNX, and report the increase of the process's peak memory during the export,
+    relative to the size of the model's weights.
+    """
+    torch.set_grad_enabled(False)
+    model = LargeLinearModel()
+
+    def representative_dataset():
+        yield [np.random.randn(1, 2048).astype(np.float32)]
+
+    exporter = FakelyQuantONNXPyTorchExporter(model,
+                                              lambda layer: True,
+                                              os.path.join(tempfile.mkdtemp(), 'model.onnx'),
+                                              representative_dataset,
+                                              onnx_opset_version=DEFAULT_ONNX_OPSET_VERSION,
+                                              use_onnx_external_data=use_onnx_external_data)
+    peak_memory_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    exporter.export()
+    peak_memory_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is measured in kilobytes.
+    weights_size = sum([p.numel() * p.element_size() for p in model.parameters()])
+    results_queue.put((peak_memory_after - peak_memory_before) * 1024 / weights_size)
+
+
+def get_export_peak_memory_ratio(use_onnx_external_data: bool) -> float:
+    """
+    Get the increase of peak memory during the ONNX export of a large model, relative to its weights size.
+    The export runs in a new process, so the peak memory of previous tests doesn't hide it.
+    """
+    context = multiprocessing.get_context('spawn')
+    results_queue = context.Queue()
+    process = context.Process(target=_export_large_model, args=(use_onnx_external_data, results_queue))
+    process.start()
+    process.join()
+    assert process.exitcode == 0, f'Exporting the model failed with exit code {process.exitcode}'
+    return results_queue.get()
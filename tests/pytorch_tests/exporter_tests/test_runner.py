@@ -24,6 +24,10 @@ from tests.pytorch_tests.exporter_tests.custom_ops_tests.test_export_symmetric_o
     TestExportONNXWeightSymmetric2BitsQuantizers
 from tests.pytorch_tests.exporter_tests.custom_ops_tests.test_export_uniform_onnx_quantizers import \
     TestExportONNXWeightUniform2BitsQuantizers
+from tests.pytorch_tests.exporter_tests.test_export_int8_onnx import TestExportINT8ONNX, \
+    TestExportINT8ONNXUniform4Bits
+from tests.pytorch_tests.exporter_tests.test_onnx_external_data import TestExportONNXExternalData, \
+    get_export_peak_memory_ratio
 from tests.pytorch_tests.exporter_tests.test_onnx_multiple_inputs import TestExportONNXMultipleInputs
 from tests.pytorch_tests.exporter_tests.test_onnx_multiple_inputs_and_outputs import \
     TestExportONNXMultipleInputsAndOutputs
@@ -68,3 +72,21 @@ class PytorchExporterTestsRunner(unittest.TestCase):
     def test_multiple_inputs_and_outputs_onnx(self):
         TestExportONNXMultipleInputsAndOutputs().run_test()
 
+    def test_external_data_onnx(self):
+        TestExportONNXExternalData().run_test()
+
+    def test_external_data_onnx_peak_memory(self):
+        # The weights are written to the external data file one tensor at a time, so the export doesn't hold
+        # a serialized copy of the model in memory.
+        self.assertLess(get_export_peak_memory_ratio(use_onnx_external_data=True), 0.5)
+
+    #########################
+    # Exporting INT8 ONNX models
+    #########################
+    def test_int8_onnx(self):
+        TestExportINT8ONNX().run_test()
+        TestExportINT8ONNX(onnx_opset_version=16).run_test()
+
+    def test_int8_uniform4bits_onnx(self):
+        TestExportINT8ONNXUniform4Bits().run_test()
+
@@ -0,0 +1,68 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+
+
+class Model(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv = torch.nn.Conv2d(3, 8, kernel_size=3)
+        self.bn = torch.nn.BatchNorm2d(8)
+        self.linear = torch.nn.Linear(8, 4)
+
+    def forward(self, x):
+        x = torch.relu(self.bn(self.conv(x)))
+        return self.linear(torch.mean(x, dim=(2, 3)))
+
+
+class TestPytorchCalibrationDataStore(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = [np.random.randn(4, 3, 16, 16).astype(np.float32) for _ in range(3)]
+        self.num_iterations = 0
+
+    def representative_data_gen(self):
+        self.num_iterations += 1
+        for batch in self.batches:
+            yield [torch.from_numpy(batch)]
+
+    def _run_ptq(self, calibration_data_config):
+        core_config = mct.core.CoreConfig(calibration_data_config=calibration_data_config)
+        q_model, _ = mct.ptq.pytorch_post_training_quantization(Model().eval(), self.representative_data_gen,
+                                                                core_config=core_config)
+        return q_model
+
+    def test_ptq_with_materialized_data(self):
+        torch.manual_seed(0)
+        q_model = self._run_ptq(mct.core.CalibrationDataConfig())
+        self.assertGreater(self.num_iterations, 1)
+
+        self.num_iterations = 0
+        torch.manual_seed(0)
+        materialized_q_model = self._run_ptq(mct.core.CalibrationDataConfig(materialize=True))
+        self.assertEqual(self.num_iterations, 1)
+
+        x = to_torch_tensor(self.batches[0])
+        self.assertTrue(torch.equal(q_model(x), materialized_q_model(x)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+from mct_quantizers import PytorchQuantizationWrapper, PytorchActivationQuantizationHolder
+from torch.nn import Conv2d
+
+from model_compression_toolkit.core.common.mixed_precision.compact_quantized_weights import CompactQuantizedWeights
+from model_compression_toolkit.core.common.mixed_precision.set_layer_to_bitwidth import set_layer_to_bitwidth
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.constants import KERNEL
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.mixed_precision.configurable_activation_quantizer import \
+    ConfigurableActivationQuantizer
+from model_compression_toolkit.core.pytorch.mixed_precision.configurable_weights_quantizer import \
+    ConfigurableWeightsQuantizer
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import get_op_quantization_configs
+from tests.common_tests.helpers.generate_test_tp_model import generate_mixed_precision_test_tp_model
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.tpc_pytorch import get_pytorch_test_tpc_dict
+
+
+class base_model(torch.nn.Module):
+
+    def __init__(self):
+        super(base_model, self).__init__()
+        self.conv1 = Conv2d(3, 16, kernel_size=(3, 3))
+
+    def forward(self, inp):
+        return self.conv1(inp)
+
+
+def representative_dataset():
+    yield [np.random.randn(1, 3, 8, 8).astype(np.float32)]
+
+
+class TestPytorchConfigurableWeightsQuantizer(unittest.TestCase):
+
+    def test_switch_compact_candidates(self):
+        base_config, _, default_config = get_op_quantization_configs()
+        tpc = get_pytorch_test_tpc_dict(
+            tp_model=generate_mixed_precision_test_tp_model(
+                base_cfg=base_config,
+                default_config=default_config,
+                mp_bitwidth_candidates_list=[(8, 8), (4, 8), (2, 8)]),
+            test_name='configurable_quantizer_test',
+            ftp_name='configurable_quantizer_test')['configurable_quantizer_test']
+
+        fw_impl = PytorchImplementation()
+        graph = prepare_graph_with_quantization_parameters(base_model(), fw_impl, DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset, lambda x, y: tpc,
+                                                           input_shape=(1, 3, 8, 8),
+                                                           mixed_precision_enabled=True)
+        node = graph.get_topo_sorted_nodes()[1]
+
+        model_mp, _, conf_node2layers = fw_impl.model_builder(graph,
+                                                              mode=ModelBuilderMode.MIXEDPRECISION,
+                                                              fw_info=DEFAULT_PYTORCH_INFO)
+        wrapper_layer = [l for l in conf_node2layers[node.name] if isinstance(l, PytorchQuantizationWrapper)][0]
+        quantizer = wrapper_layer.weights_quantizers[KERNEL]
+        self.assertTrue(all(isinstance(w, CompactQuantizedWeights) for w in quantizer.quantized_weights[1:]))
+
+        float_weights = node.get_weights_by_keys(KERNEL)
+        inputs = to_torch_tensor(next(representative_dataset()))
+        outputs = {}
+        for bitwidth_idx in [1, 2, 1, 0, 2]:
+            set_layer_to_bitwidth(wrapper_layer, bitwidth_idx=bitwidth_idx,
+                                  weights_quantizer_type=ConfigurableWeightsQuantizer,
+                                  activation_quantizer_type=ConfigurableActivationQuantizer,
+                                  weights_quant_layer_type=PytorchQuantizationWrapper,
+                                  activation_quant_layer_type=PytorchActivationQuantizationHolder)
+
+            output = torch_tensor_to_numpy(fw_impl.sensitivity_eval_inference(model_mp, inputs))
+
+            attr_cfg = node.candidates_quantization_cfg[bitwidth_idx].weights_quantization_cfg.get_attr_config(KERNEL)
+            expected_weights = attr_cfg.weights_quantization_fn(float_weights, attr_cfg.weights_n_bits, True,
+                                                                attr_cfg.weights_quantization_params,
+                                                                attr_cfg.weights_per_channel_threshold,
+                                                                attr_cfg.weights_channels_axis[0])
+            self.assertTrue(np.array_equal(torch_tensor_to_numpy(quantizer(None)),
+                                           np.asarray(expected_weights, np.float32)))
+            if bitwidth_idx in outputs:
+                self.assertTrue(np.array_equal(output, outputs[bitwidth_idx]))
+            outputs[bitwidth_idx] = output
+
+        self.assertFalse(np.array_equal(outputs[0], outputs[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
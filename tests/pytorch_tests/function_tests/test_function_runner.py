@@ -30,7 +30,7 @@ from tests.pytorch_tests.function_tests.set_layer_to_bitwidth_test import TestSe
 from tests.pytorch_tests.function_tests.test_hessian_service import FetchActivationHessianTest, FetchWeightsHessianTest, \
     FetchHessianNotEnoughSamplesThrowTest, FetchHessianNotEnoughSamplesSmallBatchThrowTest, \
     FetchComputeBatchLargerThanReprBatchTest, FetchHessianRequiredZeroTest, FetchHessianMultipleNodesTest, \
-    DoubleFetchHessianTest
+    DoubleFetchHessianTest, FetchHessianReuseGradModelTest, PersistentHessianCacheTest
 from tests.pytorch_tests.function_tests.test_lut_activation_quanitzer_fake_quant import TestLUTQuantizerFakeQuantSigned, \
     TestLUTQuantizerFakeQuantUnsigned
 from tests.pytorch_tests.function_tests.test_sensitivity_eval_non_supported_output import \
@@ -140,6 +140,8 @@ class FunctionTestRunner(unittest.TestCase):
         FetchHessianRequiredZeroTest(self).run_test()
         FetchHessianMultipleNodesTest(self).run_test()
         DoubleFetchHessianTest(self).run_test()
+        FetchHessianReuseGradModelTest(self).run_test()
+        PersistentHessianCacheTest(self).run_test()
 
     def test_layer_fusing(self):
         """
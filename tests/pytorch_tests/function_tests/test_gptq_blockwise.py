@@ -0,0 +1,122 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.graph_prep_runner import read_model_to_graph
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.gptq import GPTQBlockwiseConfig
+from model_compression_toolkit.gptq.common.gptq_blocks import partition_graph_to_blocks, build_block_graph
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+
+
+class SkipConnectionModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 4, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(4, 4, kernel_size=3, padding=1)
+        self.conv3 = torch.nn.Conv2d(4, 2, kernel_size=1)
+
+    def forward(self, x):
+        x = torch.relu(self.conv1(x))
+        x = x + self.conv2(x)
+        return self.conv3(x)
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(2):
+        yield [np.random.randn(2, 3, 8, 8).astype(np.float32)]
+
+
+class TestGPTQBlocks(unittest.TestCase):
+
+    def setUp(self):
+        tpc = mct.get_target_platform_capabilities('pytorch', 'default')
+        self.graph = read_model_to_graph(SkipConnectionModel(), representative_dataset, tpc,
+                                         DEFAULT_PYTORCH_INFO, PytorchImplementation())
+
+    def test_partition_graph_to_blocks(self):
+        blocks = partition_graph_to_blocks(self.graph, ['conv1', 'conv2', 'conv3'], compare_points_per_block=1)
+        self.assertEqual([b.compare_points for b in blocks], [['conv1'], ['conv2'], ['conv3']])
+        self.assertEqual(blocks[0].nodes, ['x', 'conv1', 'relu'])
+        self.assertEqual(blocks[0].input_tensors, [])
+        self.assertEqual(blocks[0].output_tensors, ['relu'])
+        self.assertEqual(blocks[1].input_tensors, ['relu'])
+        self.assertEqual(blocks[1].output_tensors, ['add'])
+        self.assertEqual(blocks[2].input_tensors, ['add'])
+
+        blocks = partition_graph_to_blocks(self.graph, ['conv1', 'conv2', 'conv3'], compare_points_per_block=2)
+        self.assertEqual([b.compare_points for b in blocks], [['conv1', 'conv2'], ['conv3']])
+
+    def test_build_block_graph(self):
+        blocks = partition_graph_to_blocks(self.graph, ['conv1', 'conv2', 'conv3'], compare_points_per_block=1)
+        block_graph = build_block_graph(self.graph, blocks[1], 1)
+        input_node = block_graph.get_inputs()[0]
+        self.assertEqual(input_node.name, 'relu_block_input')
+        self.assertEqual(input_node.output_shape, self.graph.find_node_by_name('relu')[0].output_shape)
+        self.assertEqual({e.sink_node.name for e in block_graph.out_edges(input_node)}, {'conv2', 'add'})
+        self.assertEqual([ot.node.name for ot in block_graph.get_outputs()], ['add'])
+        # The block's nodes are shared with the original graph.
+        self.assertIs(block_graph.find_node_by_name('conv2')[0], self.graph.find_node_by_name('conv2')[0])
+
+
+class TestBlockwiseGPTQ(unittest.TestCase):
+
+    def _run_gptq(self, compare_points_per_block):
+        model = SkipConnectionModel()
+        activations_dir = tempfile.mkdtemp()
+        gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=2)
+        gptq_config.hessian_weights_config.hessians_num_samples = 4
+        gptq_config.blockwise_config = GPTQBlockwiseConfig(compare_points_per_block=compare_points_per_block,
+                                                           activations_dir=activations_dir)
+        trained_blocks = []
+        orig_train = PytorchGPTQTrainer.train
+
+        def train(trainer):
+            trained_blocks.append([n.name for n in trainer.compare_points])
+            return orig_train(trainer)
+
+        with patch.object(PytorchGPTQTrainer, 'train', train):
+            quantized_model, _ = mct.gptq.pytorch_gradient_post_training_quantization(
+                model, representative_dataset, gptq_config=gptq_config)
+
+        # The blocks' outputs are removed once the training is done.
+        self.assertEqual(os.listdir(activations_dir), [])
+
+        x = torch.from_numpy(next(representative_dataset())[0])
+        device = next(quantized_model.parameters()).device
+        with torch.no_grad():
+            float_out = model.to(device)(x.to(device))
+            quant_out = quantized_model(x.to(device))
+        self.assertTrue(np.corrcoef(float_out.cpu().numpy().flatten(), quant_out.cpu().numpy().flatten())[0, 1] > 0.9)
+        return trained_blocks
+
+    def test_blockwise_gptq(self):
+        self.assertEqual(self._run_gptq(1), [['conv1'], ['conv2'], ['conv3']])
+
+    def test_blockwise_gptq_multiple_compare_points_per_block(self):
+        self.assertEqual(self._run_gptq(2), [['conv1', 'conv2'], ['conv3']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+from model_compression_toolkit.gptq import GPTQTeacherOutputsCacheConfig
+from model_compression_toolkit.gptq.pytorch.gptq_loss import sample_layer_attention_loss
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+from model_compression_toolkit.gptq.pytorch.teacher_outputs_cache import PytorchTeacherOutputsCache
+
+N_BATCHES = 3
+N_EPOCHS = 4
+
+
+class ConvsModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 4, kernel_size=3)
+        self.conv2 = torch.nn.Conv2d(4, 4, kernel_size=3)
+
+    def forward(self, x):
+        return self.conv2(torch.relu(self.conv1(x)))
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(N_BATCHES):
+        yield [np.random.randn(2, 3, 8, 8).astype(np.float32)]
+
+
+class TestPytorchTeacherOutputsCache(unittest.TestCase):
+
+    def _test_cache(self, cache_config, expect_memory_mapped):
+        outputs = [to_torch_tensor(np.random.randn(10, 3, 4).astype(np.float32)),
+                   to_torch_tensor(np.random.randn(10, 5).astype(np.float32))]
+        cache = PytorchTeacherOutputsCache(10, cache_config)
+        for i in range(0, 10, 4):
+            cache.add([o[i: i + 4] for o in outputs])
+        self.assertEqual(cache.is_memory_mapped, expect_memory_mapped)
+
+        indices = np.array([7, 0, 3, 3, 9])
+        for cached, output in zip(cache.get(indices), outputs):
+            self.assertEqual(cached.device, output.device)
+            self.assertTrue(torch.equal(cached, output[indices]))
+        cache.close()
+
+    def test_device_cache(self):
+        self._test_cache(GPTQTeacherOutputsCacheConfig(), expect_memory_mapped=False)
+
+    def test_memory_mapped_cache(self):
+        self._test_cache(GPTQTeacherOutputsCacheConfig(max_memory_mb=1e-4), expect_memory_mapped=True)
+
+
+class TestGPTQTeacherOutputsCache(unittest.TestCase):
+
+    def _count_float_model_runs(self, teacher_outputs_cache_config, **gptq_config_kwargs):
+        gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=N_EPOCHS, **gptq_config_kwargs)
+        gptq_config.teacher_outputs_cache_config = teacher_outputs_cache_config
+        float_model_runs = []
+
+        orig_init = PytorchGPTQTrainer.__init__
+
+        def init(trainer, *args, **kwargs):
+            orig_init(trainer, *args, **kwargs)
+            orig_forward = trainer.float_model.forward
+
+            def forward(*f_args, **f_kwargs):
+                float_model_runs.append(1)
+                return orig_forward(*f_args, **f_kwargs)
+            trainer.float_model.forward = forward
+
+        with patch.object(PytorchGPTQTrainer, '__init__', init):
+            mct.gptq.pytorch_gradient_post_training_quantization(ConvsModel(), representative_dataset,
+                                                                 gptq_config=gptq_config)
+        return len(float_model_runs)
+
+    def test_float_model_runs_once_per_batch_with_sample_layer_attention(self):
+        kwargs = dict(use_hessian_sample_attention=True, loss=sample_layer_attention_loss)
+        self.assertEqual(self._count_float_model_runs(None, **kwargs), N_EPOCHS * N_BATCHES)
+        self.assertEqual(self._count_float_model_runs(GPTQTeacherOutputsCacheConfig(), **kwargs), N_BATCHES)
+
+    def test_fixed_representative_dataset(self):
+        kwargs = dict(use_hessian_based_weights=False)
+        # The representative dataset is not fixed by default, so the outputs are not cached.
+        self.assertEqual(self._count_float_model_runs(GPTQTeacherOutputsCacheConfig(), **kwargs),
+                         N_EPOCHS * N_BATCHES)
+        self.assertEqual(self._count_float_model_runs(
+            GPTQTeacherOutputsCacheConfig(fix_representative_dataset=True, max_memory_mb=1e-4), **kwargs), N_BATCHES)
+
+
+if __name__ == '__main__':
+    unittest.main()
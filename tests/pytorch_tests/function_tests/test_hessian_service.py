@@ -13,15 +13,21 @@
 # limitations under the License.
 # ==============================================================================
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from torch import nn
 import numpy as np
 
 from model_compression_toolkit.core.common.hessian import HessianInfoService, HessianScoresRequest, HessianMode, \
-    HessianScoresGranularity
+    HessianScoresGranularity, HessianCacheConfig
+from model_compression_toolkit.core.pytorch.constants import KERNEL
 from model_compression_toolkit.core.pytorch.data_util import data_gen_to_dataloader
 from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.hessian import activation_hessian_scores_calculator_pytorch, \
+    weights_hessian_scores_calculator_pytorch
 from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
 from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
 from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
@@ -311,3 +317,101 @@ class DoubleFetchHessianTest(BaseHessianServiceTest):
         self.unit_test.assertEqual(len(hessian), 1, "Expecting returned Hessian list to include one list of "
                                           "approximation, for the single target node.")
         self.unit_test.assertEqual(hessian[target_node.name].shape[0], 2, "Expecting 2 Hessian scores.")
+
+
+class FetchHessianReuseGradModelTest(BaseHessianServiceTest):
+    def __init__(self, unit_test):
+        super().__init__(unit_test, model=MultipleActNodesModel, compute_hessian=False)
+        self.num_nodes = 2
+        self.num_scores = 4
+
+    def run_test(self, seed=0):
+        self.graph = prepare_graph_with_configs(self.float_model,
+                                                self.pytorch_impl,
+                                                DEFAULT_PYTORCH_INFO,
+                                                representative_dataset,
+                                                generate_pytorch_tpc)
+        data_loader = data_gen_to_dataloader(representative_dataset, batch_size=1)
+        for mode, calculator_module in [(HessianMode.ACTIVATION, activation_hessian_scores_calculator_pytorch),
+                                        (HessianMode.WEIGHTS, weights_hessian_scores_calculator_pytorch)]:
+            target_nodes = [n for n in self.graph.get_topo_sorted_nodes() if n.type == nn.Conv2d]
+            self.request = HessianScoresRequest(mode=mode,
+                                                granularity=HessianScoresGranularity.PER_TENSOR,
+                                                target_nodes=target_nodes[:1] if mode == HessianMode.ACTIVATION
+                                                else target_nodes,
+                                                data_loader=data_loader,
+                                                n_samples=self.num_scores)
+            self.num_nodes = len(self.request.target_nodes)
+
+            # The gradients model should be built once for all the batches of the request.
+            with patch.object(calculator_module, 'FloatPyTorchModelBuilder',
+                              wraps=calculator_module.FloatPyTorchModelBuilder) as model_builder:
+                self.compute_hessian = True
+                super().run_test()
+            self.unit_test.assertEqual(model_builder.call_count, 1)
+
+
+class PersistentHessianCacheTest(BaseHessianServiceTest):
+    def __init__(self, unit_test):
+        super().__init__(unit_test, model=BasicModel, compute_hessian=False, run_verification=False)
+        self.num_nodes = 1
+        self.num_scores = 2
+
+    def _fetch_hessian(self, cache_config, data_loader):
+        hessian_service = HessianInfoService(graph=self.graph, fw_impl=self.pytorch_impl, cache_config=cache_config)
+        request = self.request.clone(data_loader=data_loader)
+        with patch.object(self.pytorch_impl, 'get_hessian_scores_calculator',
+                          wraps=self.pytorch_impl.get_hessian_scores_calculator) as get_calculator:
+            hessian = hessian_service.fetch_hessian(request)
+        return hessian, get_calculator.call_count > 0
+
+    def run_test(self, seed=0):
+        self.graph = prepare_graph_with_configs(self.float_model,
+                                                self.pytorch_impl,
+                                                DEFAULT_PYTORCH_INFO,
+                                                representative_dataset,
+                                                generate_pytorch_tpc)
+        data = [np.random.randn(1, 3, 16, 16).astype(np.float32) for _ in range(2)]
+        data_loader = data_gen_to_dataloader(lambda: ([x] for x in data), batch_size=1)
+        self.request = HessianScoresRequest(mode=HessianMode.ACTIVATION,
+                                            granularity=HessianScoresGranularity.PER_TENSOR,
+                                            target_nodes=[list(self.graph.get_topo_sorted_nodes())[0]],
+                                            data_loader=data_loader,
+                                            n_samples=self.num_scores)
+        super().run_test()
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_config = HessianCacheConfig(cache_dir=cache_dir)
+            hessian, computed = self._fetch_hessian(cache_config, data_loader)
+            self.unit_test.assertTrue(computed)
+            self.unit_test.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # A new service (e.g. in a new run) on the same model and data loads the hessians from the cache.
+            same_data_loader = data_gen_to_dataloader(lambda: ([x] for x in data), batch_size=1)
+            cached_hessian, computed = self._fetch_hessian(cache_config, same_data_loader)
+            self.unit_test.assertFalse(computed)
+            for node_name, hess in hessian.items():
+                self.unit_test.assertTrue(np.array_equal(hess, cached_hessian[node_name]))
+
+            # The cached hessians are invalidated when the data or the model changes.
+            _, computed = self._fetch_hessian(cache_config, data_gen_to_dataloader(representative_dataset,
+                                                                                   batch_size=1))
+            self.unit_test.assertTrue(computed)
+            self.unit_test.assertEqual(len(os.listdir(cache_dir)), 2)
+            # A change in any of the batches the hessians are computed on invalidates them, not only in the first.
+            _, computed = self._fetch_hessian(cache_config, data_gen_to_dataloader(
+                lambda: ([x] for x in [data[0], data[1] + 1]), batch_size=1))
+            self.unit_test.assertTrue(computed)
+            self.unit_test.assertEqual(len(os.listdir(cache_dir)), 3)
+            node = self.graph.get_topo_sorted_nodes()[1]
+            node.set_weights_by_keys(KERNEL, node.get_weights_by_keys(KERNEL) + 1)
+            _, computed = self._fetch_hessian(cache_config, same_data_loader)
+            self.unit_test.assertTrue(computed)
+            self.unit_test.assertEqual(len(os.listdir(cache_dir)), 4)
+
+            # When the cache exceeds its size, the least recently used hessians are evicted.
+            shard_size_mb = os.path.getsize(os.path.join(cache_dir, os.listdir(cache_dir)[0])) / 2 ** 20
+            _, computed = self._fetch_hessian(HessianCacheConfig(cache_dir=cache_dir, max_size_mb=shard_size_mb),
+                                              data_gen_to_dataloader(representative_dataset, batch_size=1))
+            self.unit_test.assertTrue(computed)
+            self.unit_test.assertEqual(len(os.listdir(cache_dir)), 1)
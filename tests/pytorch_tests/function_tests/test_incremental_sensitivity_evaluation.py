@@ -0,0 +1,90 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfig
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+
+
+class ResidualModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 4, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(4, 4, kernel_size=3, padding=1)
+        self.conv3 = torch.nn.Conv2d(4, 4, kernel_size=1)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        y = self.relu(self.conv2(x))
+        y = self.conv3(y + x)
+        return y
+
+
+def representative_dataset():
+    for _ in range(2):
+        yield [np.random.randn(2, 3, 8, 8).astype(np.float32)]
+
+
+class TestIncrementalSensitivityEvaluation(unittest.TestCase):
+
+    def _get_sensitivity_evaluator(self, graph, incremental):
+        np.random.seed(0)
+        return PytorchImplementation().get_sensitivity_evaluator(
+            graph,
+            MixedPrecisionQuantizationConfig(num_of_images=4, incremental_sensitivity_evaluation=incremental),
+            representative_dataset,
+            DEFAULT_PYTORCH_INFO)
+
+    def test_incremental_metric_equals_full_metric(self):
+        np.random.seed(0)
+        graph = prepare_graph_with_quantization_parameters(ResidualModel(),
+                                                           PytorchImplementation(),
+                                                           DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset,
+                                                           generate_pytorch_tpc,
+                                                           input_shape=(1, 3, 8, 8),
+                                                           mixed_precision_enabled=True)
+
+        full_se = self._get_sensitivity_evaluator(graph, incremental=False)
+        incremental_se = self._get_sensitivity_evaluator(graph, incremental=True)
+
+        max_config = graph.get_max_candidates_config(DEFAULT_PYTORCH_INFO)
+        min_config = graph.get_min_candidates_config(DEFAULT_PYTORCH_INFO)
+        self.assertTrue(len(max_config) > 1)
+        self.assertEqual(full_se.compute_metric(max_config), incremental_se.compute_metric(max_config))
+
+        for node_idx in range(len(max_config)):
+            mp_config = list(max_config)
+            mp_config[node_idx] = min_config[node_idx]
+            full_metric = full_se.compute_metric(mp_config, [node_idx], max_config)
+            incremental_metric = incremental_se.compute_metric(mp_config, [node_idx], max_config)
+            self.assertTrue(np.isclose(full_metric, incremental_metric, rtol=1e-6),
+                            f'Incremental metric {incremental_metric} differs from full metric {full_metric} '
+                            f'for configurable node {node_idx}')
+
+        self.assertTrue(incremental_se.use_prefix_cache)
+        self.assertEqual(incremental_se.prefix_cache_configuration, list(max_config))
+        self.assertEqual(len(incremental_se.prefix_caches_list), len(incremental_se.images_batches))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+from mct_quantizers import PytorchActivationQuantizationHolder, PytorchQuantizationWrapper
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common.similarity_analyzer import compute_mse
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
+    get_op_quantization_configs
+from tests.common_tests.helpers.generate_test_tp_model import generate_tp_model_with_activation_mp
+from tests.pytorch_tests.tpc_pytorch import get_mp_activation_pytorch_tpc_dict
+
+
+class SweepModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3)
+        self.conv2 = torch.nn.Conv2d(8, 16, kernel_size=3)
+        self.conv3 = torch.nn.Conv2d(16, 16, kernel_size=1)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        y = self.relu(self.conv2(x))
+        return self.conv3(y) + y
+
+
+data = np.random.RandomState(0).randn(2, 3, 12, 12).astype(np.float32)
+
+
+def representative_dataset():
+    yield [data]
+
+
+def get_tpc():
+    base_config, _, default_config = get_op_quantization_configs()
+    tp_model = generate_tp_model_with_activation_mp(base_cfg=base_config,
+                                                    default_config=default_config,
+                                                    mp_bitwidth_candidates_list=[(8, 8), (8, 4), (8, 2),
+                                                                                 (4, 8), (4, 4), (4, 2),
+                                                                                 (2, 8), (2, 4), (2, 2)])
+    return get_mp_activation_pytorch_tpc_dict(tpc_model=tp_model,
+                                              test_name='mp_sweep_test',
+                                              tpc_name='mp_sweep_test')['mp_sweep_test']
+
+
+def get_core_config(num_of_images=1, **kwargs):
+    return mct.core.CoreConfig(mixed_precision_config=mct.core.MixedPrecisionQuantizationConfig(
+        num_of_images=num_of_images, **kwargs))
+
+
+def get_model_bit_widths(model):
+    bit_widths = []
+    for name, module in model.named_modules():
+        if isinstance(module, PytorchQuantizationWrapper):
+            bit_widths.extend([(name, attr, q.num_bits) for attr, q in module.weights_quantizers.items()])
+        elif isinstance(module, PytorchActivationQuantizationHolder):
+            bit_widths.append((name, module.activation_holder_quantizer.num_bits))
+    return bit_widths
+
+
+class TestMixedPrecisionSweep(unittest.TestCase):
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.model = SweepModel()
+        self.tpc = get_tpc()
+        self.ru_data = mct.core.pytorch_resource_utilization_data(self.model, representative_dataset,
+                                                                  core_config=get_core_config(),
+                                                                  target_platform_capabilities=self.tpc)
+
+    def _run_sweep(self, targets, core_config, dataset=representative_dataset):
+        get_sensitivity_evaluator = PytorchImplementation.get_sensitivity_evaluator
+        with patch.object(PytorchImplementation, 'get_sensitivity_evaluator', autospec=True,
+                          side_effect=get_sensitivity_evaluator) as se_mock:
+            configs = mct.core.pytorch_mixed_precision_sweep(self.model, dataset, targets,
+                                                             core_config=core_config,
+                                                             target_platform_capabilities=self.tpc)
+        return configs, se_mock.call_count
+
+    def test_sweep_matches_separate_searches(self):
+        targets = [mct.core.ResourceUtilization(weights_memory=self.ru_data.weights_memory * 0.5),
+                   mct.core.ResourceUtilization(weights_memory=self.ru_data.weights_memory * 0.75),
+                   mct.core.ResourceUtilization(activation_memory=self.ru_data.activation_memory * 0.6),
+                   mct.core.ResourceUtilization(weights_memory=self.ru_data.weights_memory * 0.6,
+                                                activation_memory=self.ru_data.activation_memory * 0.7)]
+        configs, num_sensitivity_evaluations = self._run_sweep(targets, get_core_config())
+        self.assertEqual(len(configs), len(targets))
+        # The two weights-only targets search the same candidates, so they share the sensitivity evaluation.
+        self.assertEqual(num_sensitivity_evaluations, 3)
+
+        for target, config in zip(targets, configs):
+            searched_model, _ = mct.ptq.pytorch_post_training_quantization(
+                self.model, representative_dataset, target_resource_utilization=target,
+                core_config=get_core_config(), target_platform_capabilities=self.tpc)
+            overwritten_model, _ = mct.ptq.pytorch_post_training_quantization(
+                self.model, representative_dataset, target_resource_utilization=target,
+                core_config=get_core_config(configuration_overwrite=config), target_platform_capabilities=self.tpc)
+            self.assertEqual(get_model_bit_widths(searched_model), get_model_bit_widths(overwritten_model))
+
+    def test_sensitivity_cache_dir(self):
+        targets = [mct.core.ResourceUtilization(weights_memory=self.ru_data.weights_memory * 0.6,
+                                                activation_memory=self.ru_data.activation_memory * 0.7)]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            configs, num_sensitivity_evaluations = self._run_sweep(targets,
+                                                                   get_core_config(sensitivity_cache_dir=cache_dir))
+            self.assertEqual(num_sensitivity_evaluations, 1)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # A new run loads the sensitivity from the cache directory.
+            cached_configs, num_sensitivity_evaluations = self._run_sweep(
+                targets, get_core_config(sensitivity_cache_dir=cache_dir))
+            self.assertEqual(num_sensitivity_evaluations, 0)
+            self.assertEqual(cached_configs, configs)
+
+            # The cached sensitivity is not used for a different mixed precision configuration.
+            _, num_sensitivity_evaluations = self._run_sweep(
+                targets, get_core_config(sensitivity_cache_dir=cache_dir, use_hessian_based_scores=True))
+            self.assertEqual(num_sensitivity_evaluations, 1)
+
+    def test_sensitivity_cache_data_fingerprint(self):
+        targets = [mct.core.ResourceUtilization(weights_memory=self.ru_data.weights_memory * 0.6)]
+
+        def get_dataset(batches):
+            return lambda: ([b] for b in batches)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            core_config = get_core_config(num_of_images=2, sensitivity_cache_dir=cache_dir)
+            _, num_sensitivity_evaluations = self._run_sweep(targets, core_config, get_dataset([data[:1], data[1:]]))
+            self.assertEqual(num_sensitivity_evaluations, 1)
+
+            # A change in any of the evaluated batches (not only the first one) invalidates the cached sensitivity.
+            _, num_sensitivity_evaluations = self._run_sweep(targets, core_config,
+                                                             get_dataset([data[:1], data[1:] * 1.001]))
+            self.assertEqual(num_sensitivity_evaluations, 1)
+
+    def test_sensitivity_cache_distance_fn(self):
+        targets = [mct.core.ResourceUtilization(weights_memory=self.ru_data.weights_memory * 0.6)]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # A function defined at the top level of a module is identified between runs.
+            for expected_num_sensitivity_evaluations in [1, 0]:
+                _, num_sensitivity_evaluations = self._run_sweep(
+                    targets, get_core_config(sensitivity_cache_dir=cache_dir, compute_distance_fn=compute_mse))
+                self.assertEqual(num_sensitivity_evaluations, expected_num_sensitivity_evaluations)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # Lambdas can't be told apart between runs, so their sensitivity is not saved, and a different lambda
+            # doesn't reuse it.
+            for scale in [1., 2.]:
+                _, num_sensitivity_evaluations = self._run_sweep(
+                    targets, get_core_config(sensitivity_cache_dir=cache_dir,
+                                             compute_distance_fn=lambda x, y, **kwargs: scale * compute_mse(x, y,
+                                                                                                            **kwargs)))
+                self.assertEqual(num_sensitivity_evaluations, 1)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfig, ResourceUtilization
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_manager import \
+    MixedPrecisionSearchManager
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import \
+    RUTarget
+from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.ru_functions_mapping import \
+    ru_functions_mapping
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import \
+    get_op_quantization_configs
+from tests.common_tests.helpers.generate_test_tp_model import generate_tp_model_with_activation_mp
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_quantization_parameters
+from tests.pytorch_tests.tpc_pytorch import get_mp_activation_pytorch_tpc_dict
+
+
+class ResidualModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 4, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(4, 8, kernel_size=3, padding=1)
+        self.conv3 = torch.nn.Conv2d(8, 4, kernel_size=1)
+        self.relu = torch.nn.ReLU()
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        y = self.relu(self.conv2(x))
+        y = self.conv3(y) + x
+        return y
+
+
+def representative_dataset():
+    yield [np.random.randn(1, 3, 8, 8).astype(np.float32)]
+
+
+def get_tpc():
+    base_config, _, default_config = get_op_quantization_configs()
+    tp_model = generate_tp_model_with_activation_mp(base_cfg=base_config,
+                                                    default_config=default_config,
+                                                    mp_bitwidth_candidates_list=[(8, 8), (8, 4), (8, 2),
+                                                                                 (4, 8), (4, 4), (4, 2),
+                                                                                 (2, 8), (2, 4), (2, 2)])
+    return get_mp_activation_pytorch_tpc_dict(tpc_model=tp_model,
+                                              test_name='mp_ru_table_test',
+                                              tpc_name='mp_ru_table_test')['mp_ru_table_test']
+
+
+class TestMixedPrecisionRUTable(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        graph = prepare_graph_with_quantization_parameters(ResidualModel(),
+                                                           PytorchImplementation(),
+                                                           DEFAULT_PYTORCH_INFO,
+                                                           representative_dataset,
+                                                           lambda name, tp_model: get_tpc(),
+                                                           input_shape=(1, 3, 8, 8),
+                                                           mixed_precision_enabled=True)
+        se = PytorchImplementation().get_sensitivity_evaluator(graph,
+                                                              MixedPrecisionQuantizationConfig(num_of_images=1),
+                                                              representative_dataset,
+                                                              DEFAULT_PYTORCH_INFO)
+        self.search_manager = MixedPrecisionSearchManager(graph,
+                                                          DEFAULT_PYTORCH_INFO,
+                                                          PytorchImplementation(),
+                                                          se,
+                                                          ru_functions_mapping,
+                                                          ResourceUtilization(weights_memory=100,
+                                                                              activation_memory=100,
+                                                                              total_memory=200))
+        self.num_conf_nodes = len(self.search_manager.min_ru_config)
+        self.assertTrue(self.num_conf_nodes > 1)
+
+    def test_ru_matrix_matches_metric_functions(self):
+        sm = self.search_manager
+        for target in [RUTarget.WEIGHTS, RUTarget.ACTIVATION, RUTarget.TOTAL]:
+            ru_metric = sm.compute_ru_functions[target][0]
+            min_ru = ru_metric(sm.min_ru_config, sm.graph, sm.fw_info, sm.fw_impl)
+            self.assertTrue(np.array_equal(sm.min_ru[target], min_ru))
+
+            expected_matrix = []
+            for c, n in enumerate(sm.graph.get_configurable_sorted_nodes(sm.fw_info)):
+                for candidate_idx in range(len(n.candidates_quantization_cfg)):
+                    mp_cfg = sm.replace_config_in_index(sm.min_ru_config, c, candidate_idx)
+                    expected_matrix.append(ru_metric(mp_cfg, sm.graph, sm.fw_info, sm.fw_impl) - min_ru)
+            expected_matrix = np.moveaxis(np.array(expected_matrix), source=0, destination=-1)
+
+            self.assertTrue(np.array_equal(sm.compute_resource_utilization_matrix(target), expected_matrix),
+                            f'Resource utilization matrix mismatch for target {target}')
+
+    def test_config_ru_tracker_matches_full_computation(self):
+        sm = self.search_manager
+        configurable_nodes = sm.graph.get_configurable_sorted_nodes(sm.fw_info)
+        mp_cfg = list(sm.min_ru_config)
+        ru_tracker = sm.get_config_ru_tracker(mp_cfg)
+        self._assert_memory_ru_equal(ru_tracker.get_resource_utilization(),
+                                     sm.compute_resource_utilization_for_config(mp_cfg))
+
+        for _ in range(3):
+            for node_idx, n in enumerate(configurable_nodes):
+                for candidate_idx in range(len(n.candidates_quantization_cfg)):
+                    expected_ru = sm.compute_resource_utilization_for_config(
+                        sm.replace_config_in_index(mp_cfg, node_idx, candidate_idx))
+                    self._assert_memory_ru_equal(ru_tracker.compute_ru_with_candidate(node_idx, candidate_idx),
+                                                 expected_ru)
+
+            # Move the tracked configuration to a random configuration, one node at a time
+            for node_idx, n in enumerate(configurable_nodes):
+                mp_cfg[node_idx] = np.random.randint(len(n.candidates_quantization_cfg))
+                ru_tracker.update(node_idx, mp_cfg[node_idx])
+            self._assert_memory_ru_equal(ru_tracker.get_resource_utilization(),
+                                         sm.compute_resource_utilization_for_config(mp_cfg))
+
+    def _assert_memory_ru_equal(self, tracked_ru, expected_ru):
+        self.assertEqual(tracked_ru.weights_memory, expected_ru.weights_memory)
+        self.assertEqual(tracked_ru.activation_memory, expected_ru.activation_memory)
+        self.assertEqual(tracked_ru.total_memory, expected_ru.total_memory)
+
+
+if __name__ == '__main__':
+    unittest.main()
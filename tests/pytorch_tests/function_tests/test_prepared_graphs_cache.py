@@ -0,0 +1,113 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common.graph.prepared_graphs_cache import PreparedGraphsCache
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+
+
+class ConvBNModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3)
+        self.bn = torch.nn.BatchNorm2d(8)
+        self.conv2 = torch.nn.Conv2d(8, 8, kernel_size=3)
+
+    def forward(self, x):
+        x = torch.relu(self.bn(self.conv1(x)))
+        return self.conv2(x)
+
+
+def representative_dataset():
+    np.random.seed(0)
+    for _ in range(2):
+        yield [np.random.randn(2, 3, 16, 16).astype(np.float32)]
+
+
+def get_mp_core_config():
+    return mct.core.CoreConfig(mixed_precision_config=mct.core.MixedPrecisionQuantizationConfig(num_of_images=1))
+
+
+def uncached_get_or_build(cache, model, key, build_fn, kept_objects=None):
+    return build_fn()
+
+
+class TestPreparedGraphsCache(unittest.TestCase):
+
+    def _get_target_ru(self, model):
+        ru = mct.core.pytorch_resource_utilization_data(model, representative_dataset)
+        return mct.core.ResourceUtilization(weights_memory=ru.weights_memory * 0.5)
+
+    def test_model_is_read_once_per_mixed_precision_run(self):
+        model = ConvBNModel()
+        target_ru = self._get_target_ru(model)
+        with patch.object(PytorchImplementation, 'model_reader', autospec=True,
+                          side_effect=PytorchImplementation.model_reader) as model_reader:
+            mct.ptq.pytorch_post_training_quantization(model, representative_dataset,
+                                                       target_resource_utilization=target_ru,
+                                                       core_config=get_mp_core_config())
+            self.assertEqual(model_reader.call_count, 1)
+
+            # Graphs are not shared between runs.
+            mct.ptq.pytorch_post_training_quantization(model, representative_dataset,
+                                                       target_resource_utilization=target_ru,
+                                                       core_config=get_mp_core_config())
+            self.assertEqual(model_reader.call_count, 2)
+
+    def test_no_cache_without_target_resource_utilization(self):
+        # Without a target resource utilization the graph is prepared once, so it is not cached.
+        with patch.object(PreparedGraphsCache, 'get_or_build', autospec=True,
+                          side_effect=PreparedGraphsCache.get_or_build) as get_or_build:
+            mct.ptq.pytorch_post_training_quantization(ConvBNModel(), representative_dataset)
+        self.assertEqual(get_or_build.call_count, 0)
+
+    def test_in_place_modification_between_runs(self):
+        model = ConvBNModel()
+        q_model, _ = mct.ptq.pytorch_post_training_quantization(model, representative_dataset)
+        # Modify the weights in place without bumping the tensors versions.
+        model.conv2.weight.data *= 10
+        modified_q_model, _ = mct.ptq.pytorch_post_training_quantization(model, representative_dataset)
+        expected_q_model, _ = mct.ptq.pytorch_post_training_quantization(copy.deepcopy(model), representative_dataset)
+
+        x = torch.from_numpy(next(representative_dataset())[0])
+        with torch.no_grad():
+            self.assertTrue(torch.equal(modified_q_model(x), expected_q_model(x)))
+            self.assertFalse(torch.equal(modified_q_model(x), q_model(x)))
+
+    def test_cached_graph_quantization_matches_uncached(self):
+        model = ConvBNModel()
+        target_ru = self._get_target_ru(model)
+        cached_q_model, _ = mct.ptq.pytorch_post_training_quantization(model, representative_dataset,
+                                                                       target_resource_utilization=target_ru,
+                                                                       core_config=get_mp_core_config())
+        with patch.object(PreparedGraphsCache, 'get_or_build', uncached_get_or_build):
+            q_model, _ = mct.ptq.pytorch_post_training_quantization(model, representative_dataset,
+                                                                    target_resource_utilization=target_ru,
+                                                                    core_config=get_mp_core_config())
+
+        cached_state, state = cached_q_model.state_dict(), q_model.state_dict()
+        self.assertEqual(cached_state.keys(), state.keys())
+        for k in state:
+            self.assertTrue(torch.equal(cached_state[k], state[k]), f'Mismatch in {k}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
+
+
+class BranchesModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 4, kernel_size=3, padding=1)
+        self.conv2 = torch.nn.Conv2d(4, 4, kernel_size=3, padding=1)
+        self.conv3 = torch.nn.Conv2d(4, 4, kernel_size=1)
+
+    def forward(self, x):
+        x = torch.relu(self.conv1(x))
+        y = torch.relu(self.conv2(x))
+        z = self.conv3(x)
+        return y + z, torch.sigmoid(z)
+
+
+def representative_dataset():
+    for _ in range(2):
+        yield [np.random.randn(2, 3, 8, 8).astype(np.float32)]
+
+
+class TestPytorchModelExecutionPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.float_model = BranchesModel().eval()
+        self.graph = prepare_graph_with_configs(self.float_model,
+                                                PytorchImplementation(),
+                                                DEFAULT_PYTORCH_INFO,
+                                                representative_dataset,
+                                                generate_pytorch_tpc)
+
+    def test_outputs_match_float_model(self):
+        model, _ = FloatPyTorchModelBuilder(self.graph).build_model()
+        x = to_torch_tensor(next(representative_dataset())[0])
+        outputs = model(x)
+        expected_outputs = self.float_model.to(x.device)(x)
+        self.assertEqual(len(outputs), len(expected_outputs))
+        for out, expected_out in zip(outputs, expected_outputs):
+            self.assertTrue(np.allclose(torch_tensor_to_numpy(out), torch_tensor_to_numpy(expected_out), atol=1e-5))
+
+    def test_intermediate_tensors_are_released(self):
+        model, _ = FloatPyTorchModelBuilder(self.graph).build_model()
+        x = to_torch_tensor(next(representative_dataset())[0])
+        slot_to_output_tensors, _ = model._run_nodes([x])
+
+        self.assertEqual(len(model.execution_plan), len(model.node_sort))
+        for slot, tensors in enumerate(slot_to_output_tensors):
+            if slot in model.output_slots:
+                self.assertIsNotNone(tensors)
+            else:
+                self.assertIsNone(tensors, f'Output of {model.execution_plan[slot].node.name} was not released')
+
+    def test_append2output_slots(self):
+        sorted_nodes = self.graph.get_topo_sorted_nodes()
+        model, _ = FloatPyTorchModelBuilder(self.graph, append2output=sorted_nodes).build_model()
+        self.assertEqual(model.output_slots, list(range(len(sorted_nodes))))
+        outputs = model(to_torch_tensor(next(representative_dataset())[0]))
+        self.assertEqual(len(outputs), len(sorted_nodes))
+
+
+if __name__ == '__main__':
+    unittest.main()
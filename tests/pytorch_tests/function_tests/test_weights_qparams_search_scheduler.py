@@ -0,0 +1,143 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.model_collector import ModelCollector
+from model_compression_toolkit.core.common.quantization.quantization_config import DEFAULTCONFIG
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import \
+    weights_qparams_search_scheduler
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
+    calculate_quantization_params
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.quantizer.qparams_search_backend import PytorchQparamsSearchBackend
+from model_compression_toolkit.target_platform_capabilities.tpc_models.imx500_tpc.latest import generate_pytorch_tpc, \
+    get_op_quantization_configs
+from tests.common_tests.helpers.generate_test_tp_model import generate_tp_model_with_activation_mp
+from tests.common_tests.helpers.prep_graph_for_func_test import prepare_graph_with_configs
+
+
+class ConvsModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, kernel_size=3)
+        self.conv2 = torch.nn.Conv2d(8, 8, kernel_size=3)
+        self.linear = torch.nn.Linear(8, 4)
+
+    def forward(self, x):
+        x = torch.relu(self.conv1(x))
+        x = torch.relu(self.conv2(x))
+        return self.linear(torch.mean(x, dim=(2, 3)))
+
+
+def representative_dataset():
+    for _ in range(2):
+        yield [np.random.randn(2, 3, 16, 16).astype(np.float32)]
+
+
+def get_tpc(name, _):
+    base_config, _, default_config = get_op_quantization_configs()
+    tp_model = generate_tp_model_with_activation_mp(base_cfg=base_config,
+                                                    default_config=default_config,
+                                                    mp_bitwidth_candidates_list=[(8, 8), (8, 4), (4, 8), (4, 4)])
+    return generate_pytorch_tpc(name=name, tp_model=tp_model)
+
+
+def get_weights_params(graph):
+    return {(n.name, i, attr): c.weights_quantization_cfg.get_attr_config(attr).weights_quantization_params
+            for n in graph.nodes for i, c in enumerate(n.candidates_quantization_cfg)
+            for attr in n.get_node_weights_attributes() if n.is_weights_quantization_enabled(attr)}
+
+
+class TestWeightsQparamsSearchScheduler(unittest.TestCase):
+
+    def setUp(self):
+        fw_impl = PytorchImplementation()
+        self.graph = prepare_graph_with_configs(ConvsModel(), fw_impl, DEFAULT_PYTORCH_INFO, representative_dataset,
+                                                get_tpc, mixed_precision_enabled=True)
+        mi = ModelCollector(self.graph, fw_impl=fw_impl, fw_info=DEFAULT_PYTORCH_INFO, qc=DEFAULTCONFIG)
+        for data in representative_dataset():
+            mi.infer(data)
+        self.fw_impl = fw_impl
+
+    def test_unique_searches_are_computed_once(self):
+        with patch.object(weights_qparams_search_scheduler, 'get_weights_qparams',
+                          wraps=weights_qparams_search_scheduler.get_weights_qparams) as get_weights_qparams:
+            calculate_quantization_params(self.graph, fw_impl=self.fw_impl, repr_data_gen_fn=representative_dataset)
+
+        weights_params = get_weights_params(self.graph)
+        unique_searches = {(n.name, attr, c.weights_quantization_cfg.get_attr_config(attr).weights_n_bits)
+                           for n in self.graph.nodes for c in n.candidates_quantization_cfg
+                           for attr in n.get_node_weights_attributes() if n.is_weights_quantization_enabled(attr)}
+        # The MP candidates combine weights and activation bit-widths, so weights searches are shared.
+        self.assertLess(len(unique_searches), len(weights_params))
+        self.assertEqual(get_weights_qparams.call_count, len(unique_searches))
+        for params in weights_params.values():
+            self.assertTrue(len(params) > 0)
+
+    def test_parallel_search_matches_serial_search(self):
+        parallel_graph = copy.deepcopy(self.graph)
+        calculate_quantization_params(self.graph, fw_impl=self.fw_impl, repr_data_gen_fn=representative_dataset)
+        calculate_quantization_params(parallel_graph, fw_impl=self.fw_impl, repr_data_gen_fn=representative_dataset,
+                                      num_workers=2)
+
+        serial_params = get_weights_params(self.graph)
+        parallel_params = get_weights_params(parallel_graph)
+        self.assertEqual(serial_params.keys(), parallel_params.keys())
+        for key, params in serial_params.items():
+            self.assertEqual(params.keys(), parallel_params[key].keys())
+            for param_name, value in params.items():
+                self.assertTrue(np.array_equal(value, parallel_params[key][param_name]), f'Mismatch in {key}')
+
+    def test_framework_backend_search_matches_numpy_search(self):
+        backend_graph = copy.deepcopy(self.graph)
+        calculate_quantization_params(self.graph, fw_impl=self.fw_impl, repr_data_gen_fn=representative_dataset)
+        with patch.object(PytorchQparamsSearchBackend, 'uniform_quantize',
+                          autospec=True, side_effect=PytorchQparamsSearchBackend.uniform_quantize) as uniform_quantize:
+            calculate_quantization_params(backend_graph, fw_impl=self.fw_impl,
+                                          repr_data_gen_fn=representative_dataset,
+                                          use_framework_search_backend=True)
+        self.assertGreater(uniform_quantize.call_count, 0)
+
+        numpy_params = get_weights_params(self.graph)
+        backend_params = get_weights_params(backend_graph)
+        for key, params in numpy_params.items():
+            for param_name, value in params.items():
+                self.assertTrue(np.allclose(value, backend_params[key][param_name], rtol=1e-6), f'Mismatch in {key}')
+
+    def test_framework_backend_search_runs_in_main_process(self):
+        with patch.object(weights_qparams_search_scheduler, 'ProcessPoolExecutor') as executor, \
+                patch.object(PytorchQparamsSearchBackend, 'uniform_quantize', autospec=True,
+                             side_effect=PytorchQparamsSearchBackend.uniform_quantize) as uniform_quantize:
+            calculate_quantization_params(self.graph, fw_impl=self.fw_impl, repr_data_gen_fn=representative_dataset,
+                                          num_workers=2, use_framework_search_backend=True)
+        self.assertEqual(executor.call_count, 0)
+        self.assertGreater(uniform_quantize.call_count, 0)
+
+    def test_framework_backend_copies_read_only_arrays(self):
+        x = np.broadcast_to(np.arange(4, dtype=np.float64), (2, 4))
+        tensor = PytorchQparamsSearchBackend().to_tensor(x)
+        tensor += 1
+        self.assertTrue(np.array_equal(x[0], np.arange(4)))
+        self.assertTrue(np.array_equal(PytorchQparamsSearchBackend().to_numpy(tensor), x + 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
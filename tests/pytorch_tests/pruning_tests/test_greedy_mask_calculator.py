@@ -0,0 +1,126 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.constants import FP32_BYTES_PER_PARAMETER
+from model_compression_toolkit.core import DEFAULTCONFIG
+from model_compression_toolkit.core.common.pruning.greedy_mask_calculator import GreedyMaskCalculator
+from model_compression_toolkit.core.common.pruning.mask.per_channel_mask import MaskIndicator
+from model_compression_toolkit.core.common.quantization.set_node_quantization_config import \
+    set_quantization_configuration_to_graph
+from model_compression_toolkit.core.graph_prep_runner import read_model_to_graph
+from model_compression_toolkit.core.pytorch.default_framework_info import DEFAULT_PYTORCH_INFO
+from model_compression_toolkit.core.pytorch.pruning.pruning_pytorch_implementation import \
+    PruningPytorchImplementation
+from tests.common_tests.pruning.random_importance_metric import RandomImportanceMetric
+
+
+class ResidualModel(torch.nn.Module):
+    def __init__(self, num_blocks=3, width=48):
+        super().__init__()
+        self.stem = torch.nn.Conv2d(3, width, kernel_size=3, padding=1)
+        self.blocks = torch.nn.ModuleList([torch.nn.Sequential(torch.nn.Conv2d(width, width, kernel_size=3, padding=1),
+                                                               torch.nn.BatchNorm2d(width),
+                                                               torch.nn.ReLU(),
+                                                               torch.nn.Conv2d(width, 2 * width, kernel_size=1),
+                                                               torch.nn.ReLU(),
+                                                               torch.nn.Conv2d(2 * width, width, kernel_size=1))
+                                           for _ in range(num_blocks)])
+        self.linear = torch.nn.Linear(width, 10)
+
+    def forward(self, x):
+        x = self.stem(x)
+        for block in self.blocks:
+            x = x + block(x)
+        return self.linear(torch.mean(x, dim=(2, 3)))
+
+
+def representative_dataset():
+    yield [np.random.randn(1, 3, 8, 8).astype(np.float32)]
+
+
+def compute_reference_mask(mask_calculator):
+    """
+    Greedy mask computation that recomputes the memory of the whole graph after each unpruned SIMD group
+    and scans all the nodes for the most sensitive group.
+    """
+    oc_mask = mask_calculator.oc_pruning_mask
+    target_memory = mask_calculator.target_resource_utilization.weights_memory
+
+    def get_memory():
+        return mask_calculator.memory_calculator.get_pruned_graph_memory(
+            masks=oc_mask.get_mask(), include_padded_channels=mask_calculator.tpc.is_simd_padding)
+
+    current_memory = get_memory()
+    while current_memory < target_memory and oc_mask.has_pruned_channel():
+        best_score, best_node, best_group_idx = -np.inf, None, -1
+        for node, mask in oc_mask.get_mask_simd().items():
+            group_idx = int(np.argmax(mask == 0))
+            if group_idx != 0 and mask_calculator.simd_groups_scores[node][group_idx] > best_score:
+                best_score = mask_calculator.simd_groups_scores[node][group_idx]
+                best_node, best_group_idx = node, group_idx
+        oc_mask.set_mask_value_for_simd_group(best_node, best_group_idx, MaskIndicator.REMAINED)
+        current_memory = get_memory()
+
+    if current_memory > target_memory:
+        oc_mask.set_mask_value_for_simd_group(best_node, best_group_idx, MaskIndicator.PRUNED)
+
+
+class TestGreedyMaskCalculator(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        self.fw_impl = PruningPytorchImplementation()
+        self.tpc = mct.get_target_platform_capabilities('pytorch', 'imx500')
+        float_graph = read_model_to_graph(ResidualModel(), representative_dataset, self.tpc, DEFAULT_PYTORCH_INFO,
+                                          self.fw_impl)
+        self.graph = set_quantization_configuration_to_graph(float_graph, quant_config=DEFAULTCONFIG,
+                                                             mixed_precision_enable=False)
+        self.entry_nodes = self.graph.get_pruning_sections_entry_nodes(self.fw_impl)
+        importance_metric = RandomImportanceMetric(self.graph, representative_dataset, self.fw_impl,
+                                                   mct.pruning.PruningConfig(), DEFAULT_PYTORCH_INFO)
+        self.simd_scores, self.simd_groups_indices = importance_metric.get_entry_node_to_simd_score(self.entry_nodes)
+        self.dense_memory = sum(w.size for n in self.graph.nodes for w in n.weights.values()) * FP32_BYTES_PER_PARAMETER
+
+    def _get_mask_calculator(self, target_memory):
+        return GreedyMaskCalculator(self.entry_nodes, DEFAULT_PYTORCH_INFO, self.simd_scores,
+                                    mct.core.ResourceUtilization(weights_memory=target_memory), self.graph,
+                                    self.fw_impl, self.tpc, self.simd_groups_indices)
+
+    def test_incremental_mask_matches_reference_mask(self):
+        for ratio in [0.6, 0.75, 0.9]:
+            target_memory = self.dense_memory * ratio
+            mask_calculator = self._get_mask_calculator(target_memory)
+            mask_calculator.compute_mask()
+            reference_mask_calculator = self._get_mask_calculator(target_memory)
+            compute_reference_mask(reference_mask_calculator)
+
+            mask = mask_calculator.get_mask()
+            reference_mask = reference_mask_calculator.get_mask()
+            self.assertEqual(mask.keys(), reference_mask.keys())
+            for node in mask:
+                self.assertTrue(np.array_equal(mask[node], reference_mask[node]), f'Mismatch in {node.name}')
+
+            memory = mask_calculator.memory_calculator.get_pruned_graph_memory(
+                masks=mask, include_padded_channels=self.tpc.is_simd_padding)
+            self.assertLessEqual(memory, target_memory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,9 +17,11 @@ from functools import partial
 import unittest
 from model_compression_toolkit.core.pytorch.utils import get_working_device, to_torch_tensor
 
+from model_compression_toolkit.xquant.common.constants import MODEL_OUTPUT_KEY
 from model_compression_toolkit.xquant.pytorch.model_analyzer import PytorchModelAnalyzer
 from tests.pytorch_tests.xquant_tests.test_xquant_end2end import random_data_gen
 import model_compression_toolkit as mct
+import torch
 from torch import nn
 class TestPytorchModelAnalyzer(unittest.TestCase):
 
@@ -65,6 +67,25 @@ class TestPytorchModelAnalyzer(unittest.TestCase):
         self.assertEqual(len(quant_activations), 2)  # conv + output
         self.assertIn('conv', float_activations)
         self.assertIn('conv', quant_activations)
+        # Hooks are removed after the extraction.
+        self.assertEqual(len(self.float_model.conv._forward_hooks), 0)
+        self.assertEqual(len(self.quantized_model.conv._forward_hooks), 0)
+
+    def test_activations_capture_session(self):
+        with self.analyzer.activations_capture_session(self.float_model, self.quantized_model,
+                                                       self.float_name2quant_name) as session:
+            for data in self.repr_dataset():
+                float_activations, quant_activations = session.extract_model_activations(to_torch_tensor(data))
+                # Hooks are registered once for all the batches.
+                self.assertEqual(len(self.float_model.conv._forward_hooks), 1)
+                self.assertEqual(len(self.quantized_model.conv._forward_hooks), 1)
+                self.assertEqual(float_activations.keys(), {'conv', MODEL_OUTPUT_KEY})
+                self.assertEqual(quant_activations.keys(), {'conv', MODEL_OUTPUT_KEY})
+                expected_float_activation = self.float_model.conv(to_torch_tensor(data)[0])
+                self.assertTrue(torch.allclose(float_activations['conv'], expected_float_activation))
+
+        self.assertEqual(len(self.float_model.conv._forward_hooks), 0)
+        self.assertEqual(len(self.quantized_model.conv._forward_hooks), 0)
 
     def test_identify_quantized_compare_points(self):
         compare_points = self.analyzer.identify_quantized_compare_points(self.quantized_model)
@@ -0,0 +1,50 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from model_compression_toolkit.core.common import StatsCollector
+from model_compression_toolkit.core.keras.statistics_reduction import reduce_statistics_keras
+
+
+@pytest.mark.parametrize('shape, axis', [((4, 8, 8, 3), -1), ((4, 16, 5), 1), ((7,), 0)])
+def test_reduced_statistics_match_numpy_statistics(shape, axis):
+    rng = np.random.default_rng(0)
+    batches = [rng.normal(loc=i, scale=i + 1, size=shape).astype(np.float32) for i in range(3)]
+
+    numpy_sc = StatsCollector(out_channel_axis=axis)
+    reduced_sc = StatsCollector(out_channel_axis=axis)
+    for x in batches:
+        numpy_sc.update_statistics(x)
+        reduced_sc.update_reduced_statistics(reduce_statistics_keras(tf.constant(x), axis, reduced_sc.hc.n_bins))
+
+    numpy_bins, numpy_counts = numpy_sc.hc.get_histogram()
+    reduced_bins, reduced_counts = reduced_sc.hc.get_histogram()
+    assert np.allclose(numpy_bins, reduced_bins)
+    assert np.allclose(numpy_counts, reduced_counts)
+    assert np.allclose(numpy_sc.get_mean(), reduced_sc.get_mean())
+    assert np.array_equal(numpy_sc.mpcc.max_per_channel, reduced_sc.mpcc.max_per_channel)
+    assert np.array_equal(numpy_sc.mpcc.min_per_channel, reduced_sc.mpcc.min_per_channel)
+    assert numpy_sc.get_min_max_values() == reduced_sc.get_min_max_values()
+
+
+def test_reduced_statistics_of_constant_tensor():
+    x = tf.fill((2, 4, 3), 5.)
+    reduced = reduce_statistics_keras(x, -1, 16)
+    counts, bins = np.histogram(x.numpy().astype(np.float64), bins=16)
+    assert np.array_equal(reduced.histogram_counts, counts)
+    assert np.array_equal(reduced.histogram_bins, bins)
+    assert np.array_equal(reduced.max_per_channel, np.full(3, 5.))
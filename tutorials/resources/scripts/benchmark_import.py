@@ -0,0 +1,77 @@
+# Copyright 2024 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Measure the startup cost of MCT: the time and the peak RSS of importing MCT and accessing some of its attributes,
+in new processes.
+
+Usage:
+    python benchmark_import.py [--repeats 5] ["<statement>" ...]
+
+Each statement is run after 'import model_compression_toolkit as mct', e.g. "mct.ptq.pytorch_post_training_quantization".
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+DEFAULT_STATEMENTS = ['pass',
+                      'mct.core.CoreConfig',
+                      'mct.ptq.pytorch_post_training_quantization',
+                      'mct.ptq.keras_post_training_quantization']
+
+MEASURE_CODE = '''
+import resource, sys, time
+start = time.perf_counter()
+import model_compression_toolkit as mct
+{statement}
+elapsed = time.perf_counter() - start
+rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+frameworks = [m for m in ['torch', 'tensorflow'] if m in sys.modules]
+print(elapsed, rss_mb, ','.join(frameworks))
+'''
+
+
+def measure(statement: str, repeats: int):
+    """
+    Run a statement in new processes and measure its import time and peak RSS.
+
+    Args:
+        statement: Statement to run after importing MCT.
+        repeats: Number of processes to run.
+
+    Returns:
+        The median time (seconds), the median peak RSS (MB) and the imported frameworks.
+    """
+    times, rss = [], []
+    frameworks = ''
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, '-c', MEASURE_CODE.format(statement=statement)],
+                                capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+        rss.append(float(output[1]))
+        frameworks = output[2] if len(output) > 2 else ''
+    return statistics.median(times), statistics.median(rss), frameworks
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='MCT import time and memory benchmark')
+    parser.add_argument('statements', nargs='*', default=DEFAULT_STATEMENTS)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{"statement":<50}{"time [s]":>10}{"RSS [MB]":>10}  frameworks')
+    for statement in args.statements:
+        elapsed, rss_mb, frameworks = measure(statement, args.repeats)
+        print(f'{statement:<50}{elapsed:>10.2f}{rss_mb:>10.0f}  {frameworks}')